@@ -9,7 +9,7 @@ import json
 import os
 import sys
 from pathlib import Path
-from typing import Any, Optional
+from typing import Annotated, Any, Optional
 
 try:
     import typer
@@ -20,6 +20,9 @@ except ImportError:
     print("Error: typer and rich are required. Install with: pip install typer rich")
     sys.exit(1)
 
+from ....domain.models.ids import set_id_version
+from ....infrastructure.config.settings import StorageSettings
+from ...secondary.supabase.query_stats import SORT_KEYS, load_report
 from .formatters import (
     EntityFormatter,
     RelationshipFormatter,
@@ -45,12 +48,14 @@ relationship_app = typer.Typer(help="Manage relationships")
 workflow_app = typer.Typer(help="Manage workflows")
 workspace_app = typer.Typer(help="Manage workspaces")
 config_app = typer.Typer(help="Manage configuration")
+admin_app = typer.Typer(help="Server diagnostics")
 
 app.add_typer(entity_app, name="entity")
 app.add_typer(relationship_app, name="relationship")
 app.add_typer(workflow_app, name="workflow")
 app.add_typer(workspace_app, name="workspace")
 app.add_typer(config_app, name="config")
+app.add_typer(admin_app, name="admin")
 
 
 # Initialize handlers
@@ -360,6 +365,41 @@ def config_show() -> None:
     console.print(f"SUPABASE_KEY: {'***' if os.getenv('SUPABASE_KEY') else '[red]Not set[/red]'}")
 
 
+# Admin Commands
+@admin_app.command("queries")
+def admin_queries(
+    stats_file: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--file",
+            envvar="SUPABASE_QUERY_STATS_PATH",
+            help="Query stats file exported by the server (SUPABASE_QUERY_STATS_PATH)",
+        ),
+    ] = None,
+    top: int = typer.Option(10, "--top", "-n", help="Number of query shapes to show"),
+    sort_by: str = typer.Option("total_time", "--sort", "-s", help=f"Sort key ({', '.join(SORT_KEYS)})"),
+    output_format: str = typer.Option("table", "--format", "-f", help="Output format (table, json, yaml, csv)"),
+) -> None:
+    """Show the most expensive Supabase query shapes of a running server."""
+    if stats_file is None:
+        console.print("[red]Error:[/red] No stats file; pass --file or set SUPABASE_QUERY_STATS_PATH")
+        raise typer.Exit(1)
+
+    try:
+        result = load_report(stats_file, limit=top, sort_by=sort_by)
+
+        formatter = StatsFormatter()
+        output = formatter.format_query_stats(result, output_format)
+        console.print(output)
+
+    except FileNotFoundError as e:
+        console.print(f"[red]Error:[/red] {stats_file} not found; has the server exported query stats yet?")
+        raise typer.Exit(1) from e
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from e
+
+
 @app.command()
 def version() -> None:
     """Show version information."""
@@ -368,6 +408,8 @@ def version() -> None:
 
 def main() -> None:
     """Main entry point for CLI."""
+    # ID generation is process-wide, so choose it once at startup
+    set_id_version(StorageSettings().id_version)
     app()
 
 
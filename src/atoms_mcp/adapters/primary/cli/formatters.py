@@ -339,6 +339,59 @@ class StatsFormatter(BaseFormatter):
 
         return table
 
+    def format_query_stats(
+        self, data: dict[str, Any], output_format: str = "table"
+    ) -> Union[str, Table]:
+        """Format a query stats report."""
+        if output_format == "json":
+            return self._format_json(data)
+        elif output_format == "yaml":
+            return self._format_yaml(data)
+        elif output_format == "csv":
+            return self._format_csv(
+                [{k: v for k, v in shape.items() if k != "histogram"} for shape in data.get("shapes", [])]
+            )
+        else:
+            return self._format_query_stats_table(data)
+
+    def _format_query_stats_table(self, data: dict[str, Any]) -> Table:
+        """Format query shapes as table."""
+        if Table is None:
+            raise ImportError("rich is required for table output")
+
+        table = Table(title=f"Top Query Shapes by {data.get('sort_by', 'total_time')}", show_header=True)
+        table.add_column("Shape", style="cyan")
+        table.add_column("Count", justify="right")
+        table.add_column("Errors", justify="right")
+        table.add_column("Slow", justify="right")
+        table.add_column("Total (s)", justify="right")
+        table.add_column("Mean (ms)", justify="right")
+        table.add_column("p95 (ms)", justify="right")
+        table.add_column("Max (ms)", justify="right")
+        table.add_column("Rows/query", justify="right")
+        table.add_column("KB", justify="right")
+
+        for shape in data.get("shapes", []):
+            table.add_row(
+                shape.get("shape", ""),
+                str(shape.get("count", 0)),
+                str(shape.get("errors", 0)),
+                str(shape.get("slow", 0)),
+                f"{shape.get('total_time', 0):.2f}",
+                f"{shape.get('mean_time', 0) * 1000:.1f}",
+                f"{shape.get('p95', 0) * 1000:.1f}",
+                f"{shape.get('max_time', 0) * 1000:.1f}",
+                f"{shape.get('mean_rows', 0):.1f}",
+                f"{shape.get('bytes', 0) / 1024:.1f}",
+            )
+
+        table.caption = (
+            f"{data.get('queries', 0)} queries, {data.get('slow_queries', 0)} slower than "
+            f"{data.get('slow_threshold', 0) * 1000:.0f} ms, {data.get('shape_count', 0)} shapes "
+            f"since {data.get('since', '?')}"
+        )
+        return table
+
     def _format_table_single(self, data: dict[str, Any]) -> Table:
         """Not used for stats formatter."""
         return self._format_workspace_stats_table(data)
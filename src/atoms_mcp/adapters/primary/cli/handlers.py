@@ -31,6 +31,7 @@ from ....application.queries import (
 )
 from ....domain.models.entity import Entity
 from ....domain.models.relationship import Relationship
+from ....domain.ports.repository import CountMode
 from ....infrastructure.cache.provider import InMemoryCacheProvider
 from ....infrastructure.logging.logger import StdLibLogger
 from ....adapters.secondary.supabase.repository import SupabaseRepository
@@ -179,9 +180,11 @@ class CLIHandlers:
         limit: int = 20,
     ) -> dict[str, Any]:
         """List entities with filtering."""
+        # The total only feeds the "Showing N of M" caption; an estimate will do
         query = ListEntitiesQuery(
             filters=filters or {},
             limit=limit,
+            count_mode=CountMode.PLANNED.value,
         )
 
         result = self.entity_query_handler.handle_list_entities(query)
@@ -0,0 +1,93 @@
+"""
+Request middleware for the Atoms MCP server.
+
+Every tool call runs inside a ``consistency_session`` keyed by the MCP
+client session, so a client that has just written keeps reading its own
+writes from the primary while other clients read from replicas. It also
+runs inside a DI ``Scope``, the request scope whose entity loaders batch
+and memoize get-by-ID reads for the duration of the call.
+
+The consistency token of a write is returned to the client in the
+``consistency_token`` field of the tool result. Clients that reconnect
+to another server process send it back in the request ``_meta`` under
+the same key to keep the pin.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from fastmcp.tools.tool import ToolResult
+
+from ....infrastructure.di.container import Container
+from ...secondary.supabase.routing import consistency_session, current_consistency_token
+
+# Key of the consistency token in request ``_meta`` and tool results
+CONSISTENCY_TOKEN_KEY = "consistency_token"
+
+
+class RequestScopeMiddleware(Middleware):
+    """Run each tool call inside the per-request scope of the caller's session."""
+
+    def __init__(self, container: Optional[Container] = None):
+        """
+        Initialize middleware.
+
+        Args:
+            container: Container the request scopes are created from
+                (default: a new container)
+        """
+        self.container = container or Container()
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[Any],
+        call_next: CallNext[Any, ToolResult],
+    ) -> ToolResult:
+        """
+        Call the tool inside a consistency session and a request scope.
+
+        Args:
+            context: Middleware context of the tool call
+            call_next: Next handler in the middleware chain
+
+        Returns:
+            Tool result, with the consistency token added after a write
+        """
+        session_id, token = _session_of(context)
+        with consistency_session(session_id, token=token):
+            async with self.container.create_scope():
+                result = await call_next(context)
+            written = current_consistency_token()
+
+        if written is None or not isinstance(result.structured_content, dict):
+            return result
+        return ToolResult(
+            structured_content={**result.structured_content, CONSISTENCY_TOKEN_KEY: written.encode()}
+        )
+
+
+def _session_of(context: MiddlewareContext[Any]) -> tuple[Optional[str], Optional[str]]:
+    """
+    Read the client session ID and consistency token of a request.
+
+    Args:
+        context: Middleware context of the request
+
+    Returns:
+        Session ID and token, each None when unavailable
+    """
+    ctx = context.fastmcp_context
+    if ctx is None:
+        return None, None
+    try:
+        session_id = ctx.session_id
+        meta = ctx.request_context.meta
+    except (RuntimeError, ValueError):
+        # No active MCP request (e.g. a tool called directly in-process)
+        return None, None
+
+    extra = (getattr(meta, "model_extra", None) or {}) if meta is not None else {}
+    token = extra.get(CONSISTENCY_TOKEN_KEY)
+    return session_id, token if isinstance(token, str) else None
@@ -11,7 +11,8 @@ import sys
 from typing import Any, Optional
 
 from fastmcp import FastMCP
-from fastmcp.exceptions import RequestError, ToolError
+from fastmcp.exceptions import ToolError
+from mcp.shared.exceptions import McpError
 
 from ....application.commands import (
     EntityCommandHandler,
@@ -24,11 +25,26 @@ from ....application.queries import (
     RelationshipQueryHandler,
 )
 from ....domain.models.entity import Entity
+from ....domain.models.ids import set_id_version
 from ....domain.models.relationship import Relationship
-from ....infrastructure.adapters.cache_adapter import InMemoryCache
-from ....infrastructure.adapters.logger_adapter import PythonLogger
-from ....infrastructure.adapters.repository_adapter import SupabaseRepository
-from .tools import entity_tools, query_tools, relationship_tools, workflow_tools
+from ....domain.models.workflow import Workflow
+from ....domain.ports.async_repository import AsyncRepository
+from ....infrastructure.config.settings import RepositoryBackend, StorageSettings
+from ....infrastructure.logging.logger import StdLibLogger
+from ...secondary.cache.adapters.memory import MemoryCache
+from ...secondary.memory import InMemoryRepository
+from ...secondary.sqlite import SqliteConnectionPool, SqliteRepository
+from ...secondary.supabase.async_repository import AsyncSupabaseRepository
+from ...secondary.supabase.repository import SupabaseRepository
+from ...secondary.supabase.connection import (
+    configure_existence_filters,
+    configure_query_stats,
+    configure_read_routing,
+    get_existence_filter,
+    start_health_monitor,
+)
+from .middleware import RequestScopeMiddleware
+from .tools import admin_tools, entity_tools, query_tools, relationship_tools, workflow_tools
 
 # Configure logging
 logging.basicConfig(
@@ -67,17 +83,20 @@ class AtomsServer:
         self.supabase_url = supabase_url or os.getenv("SUPABASE_URL")
         self.supabase_key = supabase_key or os.getenv("SUPABASE_KEY")
 
-        if not self.supabase_url or not self.supabase_key:
+        self.storage = StorageSettings()
+        if self.storage.backend == RepositoryBackend.SUPABASE and (
+            not self.supabase_url or not self.supabase_key
+        ):
             logger.warning(
                 "Supabase credentials not provided. Using in-memory repositories."
             )
 
         # Setup logging
         logging.getLogger().setLevel(getattr(logging, log_level.upper()))
-        self.logger = PythonLogger("atoms-mcp")
+        self.logger = StdLibLogger("atoms-mcp")
 
         # Setup cache
-        self.cache = InMemoryCache() if use_cache else None
+        self.cache = MemoryCache() if use_cache else None
 
         # Initialize repositories
         self._init_repositories()
@@ -91,6 +110,9 @@ class AtomsServer:
             version="0.1.0",
             dependencies=["fastmcp>=2.13.0.1"],
         )
+        # Each tool call runs in its own request scope and the consistency
+        # session of its client
+        self.mcp.add_middleware(RequestScopeMiddleware())
 
         # Register tools
         self._register_tools()
@@ -99,30 +121,71 @@ class AtomsServer:
 
     def _init_repositories(self) -> None:
         """Initialize repositories for entities and relationships."""
-        if self.supabase_url and self.supabase_key:
-            # Use Supabase repositories
+        # Native async repositories; handlers fall back to running the
+        # sync repositories in worker threads when these stay None.
+        self.entity_async_repository: Optional[AsyncRepository[Entity]] = None
+        self.relationship_async_repository: Optional[AsyncRepository[Relationship]] = None
+
+        if self.storage.backend == RepositoryBackend.SQLITE:
+            # Use a local SQLite database shared by both repositories
+            pool = SqliteConnectionPool(
+                self.storage.sqlite_path,
+                size=self.storage.sqlite_pool_size,
+                busy_timeout=self.storage.sqlite_busy_timeout,
+            )
+            self.entity_repository = SqliteRepository[Entity](
+                "entities", Entity, pool=pool, logger=self.logger
+            )
+            self.relationship_repository = SqliteRepository[Relationship](
+                "relationships", Relationship, pool=pool, logger=self.logger
+            )
+            self.workflow_repository = SqliteRepository[Workflow](
+                "workflows", Workflow, pool=pool, logger=self.logger
+            )
+        elif (
+            self.storage.backend == RepositoryBackend.SUPABASE
+            and self.supabase_url
+            and self.supabase_key
+        ):
+            # Use Supabase repositories; the sync and async repositories of
+            # a table share its existence filter, if the table keeps one
+            configure_existence_filters()
             self.entity_repository = SupabaseRepository[Entity](
-                supabase_url=self.supabase_url,
-                supabase_key=self.supabase_key,
                 table_name="entities",
-                logger=self.logger,
+                entity_type=Entity,
+                existence_filter=get_existence_filter("entities"),
             )
             self.relationship_repository = SupabaseRepository[Relationship](
-                supabase_url=self.supabase_url,
-                supabase_key=self.supabase_key,
                 table_name="relationships",
-                logger=self.logger,
+                entity_type=Relationship,
+                existence_filter=get_existence_filter("relationships"),
             )
+            self.workflow_repository = SupabaseRepository[Workflow](
+                table_name="workflows",
+                entity_type=Workflow,
+                existence_filter=get_existence_filter("workflows"),
+            )
+            self.entity_async_repository = AsyncSupabaseRepository[Entity](
+                table_name="entities",
+                entity_type=Entity,
+                existence_filter=get_existence_filter("entities"),
+            )
+            self.relationship_async_repository = AsyncSupabaseRepository[Relationship](
+                table_name="relationships",
+                entity_type=Relationship,
+                existence_filter=get_existence_filter("relationships"),
+            )
+            # Connection health is probed in the background, not per request
+            start_health_monitor()
+            configure_read_routing()
+            configure_query_stats()
         else:
             # Use in-memory repositories for development
-            from ....infrastructure.adapters.repository_adapter import (
-                InMemoryRepository,
-            )
-
             self.entity_repository = InMemoryRepository[Entity](logger=self.logger)
             self.relationship_repository = InMemoryRepository[Relationship](
                 logger=self.logger
             )
+            self.workflow_repository = InMemoryRepository[Workflow](logger=self.logger)
 
     def _init_handlers(self) -> None:
         """Initialize command and query handlers."""
@@ -131,16 +194,18 @@ class AtomsServer:
             repository=self.entity_repository,
             logger=self.logger,
             cache=self.cache,
+            async_repository=self.entity_async_repository,
         )
         self.relationship_command_handler = RelationshipCommandHandler(
             repository=self.relationship_repository,
             logger=self.logger,
             cache=self.cache,
+            async_repository=self.relationship_async_repository,
         )
         self.workflow_command_handler = WorkflowCommandHandler(
-            entity_repository=self.entity_repository,
-            relationship_repository=self.relationship_repository,
+            repository=self.workflow_repository,
             logger=self.logger,
+            cache=self.cache,
         )
 
         # Query handlers
@@ -148,15 +213,16 @@ class AtomsServer:
             repository=self.entity_repository,
             logger=self.logger,
             cache=self.cache,
+            async_repository=self.entity_async_repository,
         )
         self.relationship_query_handler = RelationshipQueryHandler(
             repository=self.relationship_repository,
             logger=self.logger,
             cache=self.cache,
+            async_repository=self.relationship_async_repository,
         )
         self.analytics_query_handler = AnalyticsQueryHandler(
-            entity_repository=self.entity_repository,
-            relationship_repository=self.relationship_repository,
+            repository=self.entity_repository,
             logger=self.logger,
             cache=self.cache,
         )
@@ -177,9 +243,10 @@ class AtomsServer:
         # Register workflow tools
         workflow_tools.register_workflow_tools(self.mcp, self)
 
-        logger.info(
-            f"Registered {len(self.mcp.list_tools())} tools successfully"
-        )
+        # Register admin tools
+        admin_tools.register_admin_tools(self.mcp, self)
+
+        logger.info("Registered MCP tools successfully")
 
     def run(self, transport: str = "stdio") -> None:
         """
@@ -217,11 +284,11 @@ class AtomsServer:
                 "message": str(error),
                 "details": getattr(error, "details", {}),
             }
-        elif isinstance(error, RequestError):
+        elif isinstance(error, McpError):
             return {
                 "error": "request_error",
                 "message": str(error),
-                "code": getattr(error, "code", "unknown"),
+                "code": getattr(error.error, "code", "unknown"),
             }
         else:
             logger.exception("Unexpected error in MCP server")
@@ -267,6 +334,9 @@ def main() -> None:
     log_level = os.getenv("LOG_LEVEL", "INFO")
     use_cache = os.getenv("USE_CACHE", "true").lower() == "true"
 
+    # ID generation is process-wide, so choose it once at startup
+    set_id_version(StorageSettings().id_version)
+
     # Create and run server
     try:
         server = create_server(
@@ -6,11 +6,13 @@ This package contains all FastMCP tool definitions organized by domain:
 - relationship_tools: Relationship management
 - query_tools: Search and analytics
 - workflow_tools: Workflow execution
+- admin_tools: Server diagnostics
 """
 
-from . import entity_tools, query_tools, relationship_tools, workflow_tools
+from . import admin_tools, entity_tools, query_tools, relationship_tools, workflow_tools
 
 __all__ = [
+    "admin_tools",
     "entity_tools",
     "relationship_tools",
     "query_tools",
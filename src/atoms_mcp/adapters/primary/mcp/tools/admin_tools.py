@@ -0,0 +1,96 @@
+"""
+MCP admin tools for server diagnostics.
+
+This module defines FastMCP tools reporting on the server itself rather
+than on workspace data, such as the Supabase query-shape statistics and
+the connection health and existence filter metrics.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+from ....secondary.supabase.connection import get_connection_metrics, get_query_recorder
+from ....secondary.supabase.repository import SupabaseEntityMapper
+
+if TYPE_CHECKING:
+    from ..server import AtomsServer
+
+
+def register_admin_tools(mcp: Any, server: "AtomsServer") -> None:
+    """
+    Register all admin tools with the MCP server.
+
+    Args:
+        mcp: FastMCP server instance
+        server: AtomsServer instance with handlers
+    """
+
+    @mcp.tool()
+    async def get_query_stats(
+        limit: int = 10,
+        sort_by: str = "total_time",
+        reset: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Report the most expensive Supabase query shapes of this server.
+
+        A shape is a query without its values: table, operation, filtered
+        columns and operators, order and selected columns.
+
+        Args:
+            limit: Number of shapes to return
+            sort_by: Ranking key: total_time, mean_time, p95, max_time,
+                count, errors, rows or bytes
+            reset: Whether to clear the statistics after reporting them
+
+        Returns:
+            Query totals since the last reset, the slow-query threshold
+            (seconds), the top shapes with their counts, latencies
+            (seconds), rows, bytes and latency histogram, and the database
+            functions found missing (their callers use slower fallbacks)
+
+        Example:
+            ```
+            get_query_stats(limit=5, sort_by="p95")
+            ```
+        """
+        recorder = get_query_recorder()
+        report = recorder.report(limit=limit, sort_by=sort_by)
+        report["backend"] = server.storage.backend.value
+        repositories = (
+            server.entity_repository,
+            server.relationship_repository,
+            server.entity_async_repository,
+            server.relationship_async_repository,
+        )
+        report["missing_functions"] = sorted(
+            {
+                function
+                for repository in repositories
+                if isinstance(repository, SupabaseEntityMapper)
+                for function in repository.missing_functions
+            }
+        )
+        if reset:
+            recorder.reset()
+        return report
+
+    @mcp.tool()
+    async def get_connection_stats() -> dict[str, Any]:
+        """
+        Report the health of this server's Supabase connection.
+
+        Returns:
+            Whether the client is connected, the circuit breaker, health
+            monitor and read routing metrics, and per table the metrics of
+            its existence filter: lookups answered without a request
+            (definite_misses), the observed and estimated false-positive
+            rates, and sizing and rebuild counters
+
+        Example:
+            ```
+            get_connection_stats()
+            ```
+        """
+        report = get_connection_metrics()
+        report["backend"] = server.storage.backend.value
+        return report
@@ -7,8 +7,6 @@ and deleting entities.
 
 from typing import TYPE_CHECKING, Any, Optional
 
-from fastmcp import Tool
-
 from .....application.commands.entity_commands import (
     ArchiveEntityCommand,
     CreateEntityCommand,
@@ -88,7 +86,7 @@ def register_entity_tools(mcp: Any, server: "AtomsServer") -> None:
             created_by=created_by,
         )
 
-        result = server.entity_command_handler.handle_create_entity(command)
+        result = await server.entity_command_handler.handle_create_entity_async(command)
 
         if result.is_error:
             raise Exception(result.error)
@@ -99,6 +97,7 @@ def register_entity_tools(mcp: Any, server: "AtomsServer") -> None:
     async def get_entity(
         entity_id: str,
         use_cache: bool = True,
+        columns: Optional[list[str]] = None,
     ) -> dict[str, Any]:
         """
         Get an entity by ID.
@@ -106,6 +105,7 @@ def register_entity_tools(mcp: Any, server: "AtomsServer") -> None:
         Args:
             entity_id: ID of entity to retrieve
             use_cache: Whether to use cached data
+            columns: Only return these columns (the ID is always included)
 
         Returns:
             Entity details
@@ -113,10 +113,11 @@ def register_entity_tools(mcp: Any, server: "AtomsServer") -> None:
         Example:
             ```
             get_entity(entity_id="ent_123")
+            get_entity(entity_id="ent_123", columns=["status", "updated_at"])
             ```
         """
-        query = GetEntityQuery(entity_id=entity_id, use_cache=use_cache)
-        result = server.entity_query_handler.handle_get_entity(query)
+        query = GetEntityQuery(entity_id=entity_id, use_cache=use_cache, columns=columns)
+        result = await server.entity_query_handler.handle_get_entity_async(query)
 
         if result.is_error:
             raise Exception(result.error)
@@ -131,10 +132,20 @@ def register_entity_tools(mcp: Any, server: "AtomsServer") -> None:
         order_by: Optional[str] = None,
         page: int = 1,
         page_size: int = 20,
+        keyset: bool = False,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        columns: Optional[list[str]] = None,
+        count_mode: str = "exact",
     ) -> dict[str, Any]:
         """
         List entities with optional filtering and pagination.
 
+        For large collections prefer cursor pagination: pass
+        ``keyset=True`` for the first page, then feed ``next_cursor``
+        from each result back as ``after``. Pages stay fast at any depth
+        and do not shift when entities are added concurrently.
+
         Args:
             filters: Filter criteria (e.g., {"entity_type": "project", "status": "active"})
             limit: Maximum number of results
@@ -142,9 +153,18 @@ def register_entity_tools(mcp: Any, server: "AtomsServer") -> None:
             order_by: Field to order by
             page: Page number (1-indexed)
             page_size: Number of items per page
+            keyset: Use cursor pagination for the first page
+            after: Continue after this cursor (``next_cursor`` of a result)
+            before: Go back from this cursor (``prev_cursor`` of a result)
+            columns: Only return these columns (the ID is always included);
+                not available with cursor pagination
+            count_mode: How total_count is computed: "exact" (default),
+                "planned" (planner estimate, cheaper on large tables) or
+                "cached" (exact, reused for a short time)
 
         Returns:
-            Paginated list of entities
+            Paginated list of entities, with next_cursor/prev_cursor when
+            cursor pagination is used
 
         Examples:
             List all projects:
@@ -160,6 +180,12 @@ def register_entity_tools(mcp: Any, server: "AtomsServer") -> None:
                 page_size=10
             )
             ```
+
+            Walk all tasks with cursors:
+            ```
+            list_entities(filters={"entity_type": "task"}, keyset=True)
+            list_entities(filters={"entity_type": "task"}, after="<next_cursor>")
+            ```
         """
         query = ListEntitiesQuery(
             filters=filters or {},
@@ -168,9 +194,14 @@ def register_entity_tools(mcp: Any, server: "AtomsServer") -> None:
             order_by=order_by,
             page=page,
             page_size=page_size,
+            keyset=keyset,
+            after=after,
+            before=before,
+            columns=columns,
+            count_mode=count_mode,
         )
 
-        result = server.entity_query_handler.handle_list_entities(query)
+        result = await server.entity_query_handler.handle_list_entities_async(query)
 
         if result.is_error:
             raise Exception(result.error)
@@ -182,6 +213,7 @@ def register_entity_tools(mcp: Any, server: "AtomsServer") -> None:
         entity_id: str,
         updates: dict[str, Any],
         validate_updates: bool = True,
+        expected_revision: Optional[int] = None,
     ) -> dict[str, Any]:
         """
         Update an existing entity.
@@ -190,6 +222,8 @@ def register_entity_tools(mcp: Any, server: "AtomsServer") -> None:
             entity_id: ID of entity to update
             updates: Dictionary of field updates
             validate_updates: Whether to validate updates
+            expected_revision: Revision read before editing; the update
+                fails with a conflict if the entity changed since
 
         Returns:
             Updated entity details
@@ -215,9 +249,10 @@ def register_entity_tools(mcp: Any, server: "AtomsServer") -> None:
             entity_id=entity_id,
             updates=updates,
             validate_updates=validate_updates,
+            expected_revision=expected_revision,
         )
 
-        result = server.entity_command_handler.handle_update_entity(command)
+        result = await server.entity_command_handler.handle_update_entity_async(command)
 
         if result.is_error:
             raise Exception(result.error)
@@ -258,7 +293,7 @@ def register_entity_tools(mcp: Any, server: "AtomsServer") -> None:
             deleted_by=deleted_by,
         )
 
-        result = server.entity_command_handler.handle_delete_entity(command)
+        result = await server.entity_command_handler.handle_delete_entity_async(command)
 
         if result.is_error:
             raise Exception(result.error)
@@ -290,7 +325,7 @@ def register_entity_tools(mcp: Any, server: "AtomsServer") -> None:
             archived_by=archived_by,
         )
 
-        result = server.entity_command_handler.handle_archive_entity(command)
+        result = await server.entity_command_handler.handle_archive_entity_async(command)
 
         if result.is_error:
             raise Exception(result.error)
@@ -322,7 +357,7 @@ def register_entity_tools(mcp: Any, server: "AtomsServer") -> None:
             restored_by=restored_by,
         )
 
-        result = server.entity_command_handler.handle_restore_entity(command)
+        result = await server.entity_command_handler.handle_restore_entity_async(command)
 
         if result.is_error:
             raise Exception(result.error)
@@ -337,17 +372,24 @@ def register_entity_tools(mcp: Any, server: "AtomsServer") -> None:
         limit: Optional[int] = None,
         page: int = 1,
         page_size: int = 20,
+        columns: Optional[list[str]] = None,
+        mode: str = "auto",
     ) -> dict[str, Any]:
         """
-        Search entities using text search.
+        Search entities using text search, most relevant first.
 
         Args:
             query: Search query string
             fields: Fields to search in (default: all fields)
-            filters: Additional filters to apply
+            filters: Additional filters; values may be operator maps such as
+                {"created_at": {"gte": "2024-01-01"}}
             limit: Maximum number of results
             page: Page number (1-indexed)
             page_size: Number of items per page
+            columns: Only return these columns (the ID and filtered fields
+                are always included)
+            mode: Matching mode: "auto" (ranked full-text, trigram for short
+                queries), "fulltext", "trigram" or "substring"
 
         Returns:
             Search results with matching entities
@@ -374,9 +416,11 @@ def register_entity_tools(mcp: Any, server: "AtomsServer") -> None:
             limit=limit,
             page=page,
             page_size=page_size,
+            columns=columns,
+            mode=mode,
         )
 
-        result = server.entity_query_handler.handle_search_entities(search_query)
+        result = await server.entity_query_handler.handle_search_entities_async(search_query)
 
         if result.is_error:
             raise Exception(result.error)
@@ -386,12 +430,15 @@ def register_entity_tools(mcp: Any, server: "AtomsServer") -> None:
     @mcp.tool()
     async def count_entities(
         filters: Optional[dict[str, Any]] = None,
+        count_mode: str = "exact",
     ) -> dict[str, Any]:
         """
         Count entities matching filters.
 
         Args:
             filters: Filter criteria
+            count_mode: "exact" (default), "planned" (planner estimate) or
+                "cached" (exact, reused for a short time)
 
         Returns:
             Count of matching entities
@@ -407,8 +454,8 @@ def register_entity_tools(mcp: Any, server: "AtomsServer") -> None:
             count_entities(filters={"entity_type": "task", "status": "active"})
             ```
         """
-        query = CountEntitiesQuery(filters=filters or {})
-        result = server.entity_query_handler.handle_count_entities(query)
+        query = CountEntitiesQuery(filters=filters or {}, count_mode=count_mode)
+        result = await server.entity_query_handler.handle_count_entities_async(query)
 
         if result.is_error:
             raise Exception(result.error)
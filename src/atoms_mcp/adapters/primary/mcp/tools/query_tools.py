@@ -5,6 +5,8 @@ This module defines FastMCP tools for searching entities and
 retrieving analytics and statistics.
 """
 
+import asyncio
+from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional
 
 from .....application.queries.analytics_queries import (
@@ -34,6 +36,7 @@ def register_query_tools(mcp: Any, server: "AtomsServer") -> None:
         filters: Optional[dict[str, Any]] = None,
         limit: int = 20,
         use_cache: bool = True,
+        mode: str = "auto",
     ) -> dict[str, Any]:
         """
         Search entities across multiple types using text search.
@@ -42,9 +45,12 @@ def register_query_tools(mcp: Any, server: "AtomsServer") -> None:
             query: Search query string
             entity_types: Types of entities to search (default: all types)
             fields: Fields to search in (default: all fields)
-            filters: Additional filters to apply
+            filters: Additional filters; values may be operator maps such as
+                {"created_at": {"gte": "2024-01-01"}}
             limit: Maximum number of results
             use_cache: Whether to use cached results
+            mode: Matching mode: "auto" (ranked full-text, trigram for short
+                queries), "fulltext", "trigram" or "substring"
 
         Returns:
             Search results with matching entities
@@ -79,9 +85,10 @@ def register_query_tools(mcp: Any, server: "AtomsServer") -> None:
             fields=fields,
             filters={**(filters or {}), **{"entity_type": entity_types}} if entity_types else (filters or {}),
             limit=limit,
+            mode=mode,
         )
 
-        result = server.entity_query_handler.handle_search_entities(search_query)
+        result = await server.entity_query_handler.handle_search_entities_async(search_query)
 
         if result.is_error:
             raise Exception(result.error)
@@ -103,10 +110,13 @@ def register_query_tools(mcp: Any, server: "AtomsServer") -> None:
         """
         Get analytics and aggregated statistics.
 
+        Counts are computed by the database with one grouped query.
+
         Args:
             entity_type: Type of entity to analyze (default: all types)
-            aggregation: Type of aggregation (count, sum, avg, min, max)
-            group_by: Field to group by
+            aggregation: Type of aggregation (only "count" is supported)
+            group_by: Field to group by: entity_type (default), status,
+                workspace_id or project_id
             filters: Filters to apply
             start_date: Start date for time-based analysis (ISO format)
             end_date: End date for time-based analysis (ISO format)
@@ -140,15 +150,21 @@ def register_query_tools(mcp: Any, server: "AtomsServer") -> None:
             )
             ```
         """
+        if aggregation != "count":
+            raise Exception(f"Unsupported aggregation: {aggregation}")
+
         # Use EntityCountQuery for analytics
         query = EntityCountQuery(
-            entity_type=entity_type,
+            group_by="type" if group_by in (None, "entity_type") else group_by,
             filters=filters or {},
-            start_date=start_date,
-            end_date=end_date,
+            entity_type=entity_type,
+            start_date=datetime.fromisoformat(start_date) if start_date else None,
+            end_date=datetime.fromisoformat(end_date) if end_date else None,
         )
 
-        result = server.analytics_query_handler.handle_entity_count(query)
+        result = await asyncio.to_thread(
+            server.analytics_query_handler.handle_entity_count, query
+        )
 
         if result.is_error:
             raise Exception(result.error)
@@ -184,7 +200,9 @@ def register_query_tools(mcp: Any, server: "AtomsServer") -> None:
             include_archived=include_archived,
         )
 
-        result = server.analytics_query_handler.handle_workspace_stats(query)
+        result = await asyncio.to_thread(
+            server.analytics_query_handler.handle_workspace_stats, query
+        )
 
         if result.is_error:
             raise Exception(result.error)
@@ -219,7 +237,9 @@ def register_query_tools(mcp: Any, server: "AtomsServer") -> None:
             entity_id=entity_id,
             days=days,
         )
-        result = server.analytics_query_handler.handle_activity(query)
+        result = await asyncio.to_thread(
+            server.analytics_query_handler.handle_activity, query
+        )
 
         if result.is_error:
             raise Exception(result.error)
@@ -270,7 +290,7 @@ def register_query_tools(mcp: Any, server: "AtomsServer") -> None:
             relationship_type=relationship_type,
         )
 
-        result = server.relationship_query_handler.handle_get_relationships(query)
+        result = await server.relationship_query_handler.handle_get_relationships_async(query)
 
         if result.is_error:
             raise Exception(result.error)
@@ -5,6 +5,7 @@ This module defines FastMCP tools for creating, reading, and managing
 relationships between entities.
 """
 
+import asyncio
 from typing import TYPE_CHECKING, Any, Optional
 
 from .....application.commands.relationship_commands import (
@@ -92,7 +93,7 @@ def register_relationship_tools(mcp: Any, server: "AtomsServer") -> None:
             created_by=created_by,
         )
 
-        result = server.relationship_command_handler.handle_create_relationship(command)
+        result = await server.relationship_command_handler.handle_create_relationship_async(command)
 
         if result.is_error:
             raise Exception(result.error)
@@ -154,7 +155,7 @@ def register_relationship_tools(mcp: Any, server: "AtomsServer") -> None:
             deleted_by=deleted_by,
         )
 
-        result = server.relationship_command_handler.handle_delete_relationship(command)
+        result = await server.relationship_command_handler.handle_delete_relationship_async(command)
 
         if result.is_error:
             raise Exception(result.error)
@@ -189,7 +190,9 @@ def register_relationship_tools(mcp: Any, server: "AtomsServer") -> None:
             properties=properties,
         )
 
-        result = server.relationship_command_handler.handle_update_relationship(command)
+        result = await asyncio.to_thread(
+            server.relationship_command_handler.handle_update_relationship, command
+        )
 
         if result.is_error:
             raise Exception(result.error)
@@ -246,7 +249,7 @@ def register_relationship_tools(mcp: Any, server: "AtomsServer") -> None:
             relationship_type=relationship_type,
         )
 
-        result = server.relationship_query_handler.handle_get_relationships(query)
+        result = await server.relationship_query_handler.handle_get_relationships_async(query)
 
         if result.is_error:
             raise Exception(result.error)
@@ -297,7 +300,7 @@ def register_relationship_tools(mcp: Any, server: "AtomsServer") -> None:
             max_depth=max_depth,
         )
 
-        result = server.relationship_query_handler.handle_find_path(query)
+        result = await server.relationship_query_handler.handle_find_path_async(query)
 
         if result.is_error:
             raise Exception(result.error)
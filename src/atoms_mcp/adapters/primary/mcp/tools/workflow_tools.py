@@ -4,6 +4,7 @@ MCP tools for workflow operations.
 This module defines FastMCP tools for creating and executing workflows.
 """
 
+import asyncio
 from typing import TYPE_CHECKING, Any, Optional
 
 from .....application.commands.workflow_commands import (
@@ -82,7 +83,9 @@ def register_workflow_tools(mcp: Any, server: "AtomsServer") -> None:
             created_by=created_by,
         )
 
-        result = server.workflow_command_handler.handle_create_workflow(command)
+        result = await asyncio.to_thread(
+            server.workflow_command_handler.handle_create_workflow, command
+        )
 
         if result.is_error:
             raise Exception(result.error)
@@ -132,7 +135,9 @@ def register_workflow_tools(mcp: Any, server: "AtomsServer") -> None:
             executed_by=executed_by,
         )
 
-        result = server.workflow_command_handler.handle_execute_workflow(command)
+        result = await asyncio.to_thread(
+            server.workflow_command_handler.handle_execute_workflow, command
+        )
 
         if result.is_error:
             raise Exception(result.error)
@@ -5,6 +5,8 @@ This module provides implementations of outbound ports for external
 services and infrastructure:
 
 - Supabase: Database repository implementation
+- Memory: Indexed in-memory repository implementation
+- SQLite: Local persistent repository implementation (WAL mode)
 - Vertex AI: Google Cloud AI services (embeddings, LLM)
 - Pheno SDK: Optional logging and tunneling (graceful fallback)
 - Cache: In-memory and Redis cache implementations
@@ -23,6 +25,16 @@ from atoms_mcp.adapters.secondary.supabase import (
     reset_connection,
 )
 
+# In-memory exports
+from atoms_mcp.adapters.secondary.memory import InMemoryRepository
+
+# SQLite exports
+from atoms_mcp.adapters.secondary.sqlite import (
+    SqliteConnectionError,
+    SqliteConnectionPool,
+    SqliteRepository,
+)
+
 # Vertex AI exports
 from atoms_mcp.adapters.secondary.vertex import (
     ConversationManager,
@@ -65,6 +77,12 @@ __all__ = [
     "get_client_with_retry",
     "get_connection",
     "reset_connection",
+    # Memory
+    "InMemoryRepository",
+    # SQLite
+    "SqliteConnectionError",
+    "SqliteConnectionPool",
+    "SqliteRepository",
     # Vertex AI
     "VertexAIClient",
     "VertexAIClientError",
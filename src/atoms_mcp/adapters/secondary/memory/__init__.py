@@ -0,0 +1,21 @@
+"""
+In-memory adapter module.
+
+This module provides an indexed in-memory implementation of the
+repository pattern for development, tests and single-node deployments.
+"""
+
+from atoms_mcp.adapters.secondary.memory.indexes import HashIndex, SortedIndex
+from atoms_mcp.adapters.secondary.memory.repository import (
+    DEFAULT_INDEXES,
+    DEFAULT_SORTED_INDEXES,
+    InMemoryRepository,
+)
+
+__all__ = [
+    "DEFAULT_INDEXES",
+    "DEFAULT_SORTED_INDEXES",
+    "HashIndex",
+    "InMemoryRepository",
+    "SortedIndex",
+]
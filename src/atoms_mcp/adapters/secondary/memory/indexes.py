@@ -0,0 +1,307 @@
+"""
+Secondary indexes for the in-memory repository.
+
+A ``HashIndex`` maps each distinct value of a field to the IDs holding it
+and answers equality and ``in`` conditions with dictionary lookups. A
+``SortedIndex`` keeps ``(value, id)`` pairs in order and answers range
+conditions and ordered listings with binary search. Both index the value
+returned by ``field_value`` (attribute, falling back to metadata) with
+enums unwrapped to their values, and both remember which IDs hold NULL.
+
+Lookups follow the comparison rules of filter expressions: an ISO string
+operand is parsed when the field holds dates. An index whose field holds
+values of several types cannot answer lookups; it returns None and the
+repository falls back to scanning.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from datetime import date, datetime
+from enum import Enum
+from itertools import chain
+from operator import itemgetter
+from typing import Any, Iterable, Iterator, Optional
+
+# Operand sentinels: the index cannot answer / the answer is empty
+_SCAN = object()
+_NO_MATCH = object()
+
+# Marks an open end of a range
+UNBOUNDED = object()
+
+_value_of = itemgetter(0)
+
+
+def index_value(value: Any) -> Any:
+    """
+    Normalize a field value for indexing.
+
+    Args:
+        value: Raw attribute or column value
+
+    Returns:
+        The value, with enums unwrapped to their values
+    """
+    return value.value if isinstance(value, Enum) else value
+
+
+def _kind(value: Any) -> type:
+    """Comparison family of a value; numbers of any type compare together."""
+    if isinstance(value, (bool, int, float)):
+        return float
+    return type(value)
+
+
+class _Index:
+    """State shared by hash and sorted indexes: NULL IDs and value types."""
+
+    def __init__(self, field: str):
+        self.field = field
+        self._nulls: set[str] = set()
+        self._kinds: Counter[type] = Counter()
+
+    def _track(self, value: Any, delta: int) -> None:
+        kind = _kind(value)
+        self._kinds[kind] += delta
+        if self._kinds[kind] <= 0:
+            del self._kinds[kind]
+
+    def nulls(self) -> set[str]:
+        """IDs whose value is NULL (the returned set must not be modified)."""
+        return self._nulls
+
+    def _operand(self, value: Any) -> Any:
+        """
+        Coerce a lookup operand to the type of the indexed values.
+
+        Returns:
+            The coerced operand, ``_NO_MATCH`` when no indexed value can
+            equal it, or ``_SCAN`` when the index cannot decide
+        """
+        if len(self._kinds) > 1:
+            return _SCAN
+        value = index_value(value)
+        if value is None or not self._kinds:
+            # Like SQL, comparisons with NULL never match
+            return _NO_MATCH
+        kind = next(iter(self._kinds))
+        if _kind(value) is kind:
+            return value
+        if kind in (datetime, date) and isinstance(value, str):
+            try:
+                return kind.fromisoformat(value)
+            except ValueError:
+                return _NO_MATCH
+        if kind is str and isinstance(value, (datetime, date)):
+            # Stored strings are parsed per row when compared with dates
+            return _SCAN
+        return _NO_MATCH
+
+
+class HashIndex(_Index):
+    """Value -> IDs mapping answering equality lookups."""
+
+    def __init__(self, field: str):
+        """
+        Initialize an empty index.
+
+        Args:
+            field: Indexed field name
+        """
+        super().__init__(field)
+        self._ids: dict[Any, set[str]] = {}
+        # IDs whose value cannot be hashed (dicts, lists)
+        self._unhashable: set[str] = set()
+
+    def add(self, entity_id: str, value: Any) -> None:
+        """
+        Index an entity's value.
+
+        Args:
+            entity_id: Entity ID
+            value: Normalized value (see ``index_value``)
+        """
+        if value is None:
+            self._nulls.add(entity_id)
+            return
+        self._track(value, 1)
+        try:
+            self._ids.setdefault(value, set()).add(entity_id)
+        except TypeError:
+            self._unhashable.add(entity_id)
+
+    def remove(self, entity_id: str, value: Any) -> None:
+        """
+        Remove an entity's value from the index.
+
+        Args:
+            entity_id: Entity ID
+            value: Value the entity was indexed with
+        """
+        if value is None:
+            self._nulls.discard(entity_id)
+            return
+        self._track(value, -1)
+        try:
+            ids = self._ids.get(value)
+        except TypeError:
+            self._unhashable.discard(entity_id)
+            return
+        if ids is not None:
+            ids.discard(entity_id)
+            if not ids:
+                del self._ids[value]
+
+    def lookup(self, values: Iterable[Any]) -> Optional[set[str]]:
+        """
+        Find the IDs whose value equals one of ``values``.
+
+        Args:
+            values: Operands of an equality or ``in`` condition
+
+        Returns:
+            Matching IDs (the set must not be modified), or None if the
+            index cannot answer
+        """
+        if self._unhashable:
+            return None
+        found: list[set[str]] = []
+        for value in values:
+            operand = self._operand(value)
+            if operand is _SCAN:
+                return None
+            if operand is _NO_MATCH:
+                continue
+            try:
+                ids = self._ids.get(operand)
+            except TypeError:
+                return None
+            if ids:
+                found.append(ids)
+        if len(found) == 1:
+            return found[0]
+        return set().union(*found)
+
+    def __len__(self) -> int:
+        """Number of distinct non-NULL values."""
+        return len(self._ids)
+
+
+class SortedIndex(_Index):
+    """Ordered ``(value, id)`` pairs answering range lookups and ordered scans."""
+
+    def __init__(self, field: str):
+        """
+        Initialize an empty index.
+
+        Args:
+            field: Indexed field name
+        """
+        super().__init__(field)
+        self._keys: list[tuple[Any, str]] = []
+        # Set when values stop being mutually comparable
+        self._broken = False
+
+    def add(self, entity_id: str, value: Any) -> None:
+        """
+        Index an entity's value.
+
+        Args:
+            entity_id: Entity ID
+            value: Normalized value (see ``index_value``)
+        """
+        if value is None:
+            self._nulls.add(entity_id)
+            return
+        self._track(value, 1)
+        if self._broken:
+            return
+        try:
+            insort(self._keys, (value, entity_id))
+        except TypeError:
+            self._broken = True
+            self._keys = []
+
+    def remove(self, entity_id: str, value: Any) -> None:
+        """
+        Remove an entity's value from the index.
+
+        Args:
+            entity_id: Entity ID
+            value: Value the entity was indexed with
+        """
+        if value is None:
+            self._nulls.discard(entity_id)
+            return
+        self._track(value, -1)
+        if self._broken:
+            return
+        key = (value, entity_id)
+        position = bisect_left(self._keys, key)
+        if position < len(self._keys) and self._keys[position] == key:
+            del self._keys[position]
+
+    def range(
+        self,
+        lower: Any = UNBOUNDED,
+        upper: Any = UNBOUNDED,
+        lower_inclusive: bool = True,
+        upper_inclusive: bool = True,
+    ) -> Optional[set[str]]:
+        """
+        Find the IDs whose value lies within bounds.
+
+        Args:
+            lower: Lower bound (``UNBOUNDED`` = none)
+            upper: Upper bound (``UNBOUNDED`` = none)
+            lower_inclusive: Whether values equal to ``lower`` match
+            upper_inclusive: Whether values equal to ``upper`` match
+
+        Returns:
+            Matching IDs, or None if the index cannot answer
+        """
+        if self._broken:
+            return None
+        bounds = []
+        for bound in (lower, upper):
+            operand = bound if bound is UNBOUNDED else self._operand(bound)
+            if operand is _SCAN:
+                return None
+            if operand is _NO_MATCH:
+                return set()
+            bounds.append(operand)
+
+        keys = self._keys
+        try:
+            start = 0
+            if bounds[0] is not UNBOUNDED:
+                start = (bisect_left if lower_inclusive else bisect_right)(keys, bounds[0], key=_value_of)
+            end = len(keys)
+            if bounds[1] is not UNBOUNDED:
+                end = (bisect_right if upper_inclusive else bisect_left)(keys, bounds[1], key=_value_of)
+        except TypeError:
+            return None
+        return {entity_id for _, entity_id in keys[start:end]}
+
+    def ordered(self, descending: bool = False) -> Optional[Iterator[str]]:
+        """
+        Iterate over the indexed IDs in value order, ties broken by ID.
+
+        The iterator reads the live index, so it must be consumed before
+        the index changes. NULL values come last in ascending order and first in descending
+        order, like Postgres.
+
+        Args:
+            descending: Whether to iterate from the largest value
+
+        Returns:
+            ID iterator, or None if the index cannot order its values
+        """
+        if self._broken or len(self._kinds) > 1:
+            return None
+        nulls = sorted(self._nulls, reverse=descending)
+        if descending:
+            return chain(nulls, (entity_id for _, entity_id in reversed(self._keys)))
+        return chain((entity_id for _, entity_id in self._keys), nulls)
@@ -0,0 +1,743 @@
+"""
+In-memory repository with secondary indexes.
+
+Entities live in a dictionary keyed by ID, so ``get``, ``exists`` and the
+batch reads are hash lookups. Hash indexes on foreign keys and status
+answer equality filters, and sorted indexes on timestamps answer range
+filters and ordered listings, so ``list`` and ``count`` only visit the
+matching entities instead of the whole store. Conditions on fields
+without an index are evaluated on the candidates left by the indexed
+ones, or on every entity when none is indexed.
+
+Deletes follow the Supabase adapter: they are soft by default, which
+hides the entity from reads while keeping its ID reserved. Entities are
+stored by reference; changes to a stored entity reach the indexes when
+it is saved again. Every write of an existing entity, soft deletes
+included, increments its revision.
+"""
+
+from __future__ import annotations
+
+import threading
+from itertools import count as counter
+from itertools import islice
+from typing import Any, Generic, Iterable, Iterator, Optional, TypeVar
+
+from atoms_mcp.domain.ports.aggregation import Metric, TimeBucket, aggregate_items
+from atoms_mcp.domain.ports.filters import AllOf, AnyOf, FilterExpr, FilterOp, and_, eq, field_value
+from atoms_mcp.domain.ports.logger import Logger
+from atoms_mcp.domain.ports.pagination import (
+    DEFAULT_SCAN_PAGE_SIZE,
+    KeysetPage,
+    keyset_value,
+    paginate_keyset,
+    parse_order_by,
+)
+from atoms_mcp.domain.ports.projection import validate_column
+from atoms_mcp.domain.ports.repository import (
+    Repository,
+    RepositoryError,
+    WriteBatch,
+    WriteMode,
+    apply_patch,
+    bump_revision,
+    check_write_mode,
+    require_update_filter,
+)
+
+from .indexes import HashIndex, SortedIndex, index_value
+
+T = TypeVar("T")
+
+# Fields with a hash index unless configured otherwise
+DEFAULT_INDEXES = (
+    "workspace_id",
+    "project_id",
+    "source_id",
+    "target_id",
+    "relationship_type",
+    "workflow_id",
+    "entity_type",
+    "status",
+)
+
+# Fields with a sorted index unless configured otherwise
+DEFAULT_SORTED_INDEXES = ("created_at", "updated_at")
+
+
+class InMemoryRepository(Repository[T], Generic[T]):
+    """
+    Indexed in-memory implementation of the Repository port.
+
+    Suitable for development, tests, offline benchmarks and single-node
+    deployments. All operations are thread-safe.
+
+    Type parameter T represents the entity type managed by this repository.
+    """
+
+    def __init__(
+        self,
+        logger: Optional[Logger] = None,
+        id_field: str = "id",
+        indexes: Iterable[str] = DEFAULT_INDEXES,
+        sorted_indexes: Iterable[str] = DEFAULT_SORTED_INDEXES,
+    ) -> None:
+        """
+        Initialize an empty repository.
+
+        Args:
+            logger: Logger for index diagnostics (optional)
+            id_field: Name of the ID field (default: "id")
+            indexes: Fields answered by hash indexes (equality, ``in``)
+            sorted_indexes: Fields answered by sorted indexes (ranges, ordering)
+
+        Raises:
+            ValueError: If an index field name is invalid
+        """
+        self.logger = logger
+        self.id_field = id_field
+        self._lock = threading.RLock()
+        self._rows: dict[str, T] = {}
+        # Soft-deleted entities: hidden from reads, IDs stay taken
+        self._deleted: dict[str, T] = {}
+        # Insertion sequence numbers, used to return candidates in store order
+        self._positions: dict[str, int] = {}
+        self._sequence = counter()
+        # Values each entity was indexed with, so stale entries can be removed
+        self._indexed: dict[str, dict[str, Any]] = {}
+        self._hash_indexes: dict[str, HashIndex] = {}
+        self._sorted_indexes: dict[str, SortedIndex] = {}
+
+        for field in indexes:
+            self.create_index(field)
+        for field in sorted_indexes:
+            self.create_index(field, ordered=True)
+
+    def create_index(self, field: str, ordered: bool = False) -> None:
+        """
+        Add a secondary index and build it from the stored entities.
+
+        Args:
+            field: Field to index
+            ordered: Build a sorted index (ranges, ordering) instead of a hash index
+
+        Raises:
+            ValueError: If the field name is invalid
+        """
+        validate_column(field)
+        with self._lock:
+            indexes: dict[str, Any] = self._sorted_indexes if ordered else self._hash_indexes
+            if field in indexes:
+                return
+            index = indexes[field] = SortedIndex(field) if ordered else HashIndex(field)
+            for entity_id, entity in self._rows.items():
+                values = self._indexed[entity_id]
+                if field not in values:
+                    values[field] = index_value(field_value(entity, field))
+                index.add(entity_id, values[field])
+
+    # Writes
+
+    def save(self, entity: T, mode: WriteMode = WriteMode.UPSERT) -> T:
+        """
+        Save an entity and update its index entries.
+
+        Args:
+            entity: Entity to save
+            mode: UPSERT (default), INSERT_ONLY or UPDATE_ONLY
+
+        Returns:
+            The saved entity
+
+        Raises:
+            RepositoryError: If the entity has no ID, already exists for an
+                INSERT_ONLY save or does not exist for an UPDATE_ONLY save
+        """
+        entity_id = getattr(entity, self.id_field, None)
+        if not entity_id:
+            raise RepositoryError("Cannot save an entity without an ID")
+
+        with self._lock:
+            exists = entity_id in self._rows
+            if mode == WriteMode.INSERT_ONLY and (exists or entity_id in self._deleted):
+                raise RepositoryError(f"Entity {entity_id} already exists")
+            if mode == WriteMode.UPDATE_ONLY and not exists:
+                raise RepositoryError(f"Entity {entity_id} not found for update")
+
+            stored = self._rows.get(entity_id, self._deleted.get(entity_id))
+            bump_revision(entity, getattr(stored, "revision", None))
+            if exists:
+                self._unindex(entity_id)
+            else:
+                self._deleted.pop(entity_id, None)
+                self._positions[entity_id] = next(self._sequence)
+            self._rows[entity_id] = entity
+            self._index(entity_id, entity)
+        return entity
+
+    def insert(self, entity: T) -> T:
+        """
+        Insert a new entity.
+
+        Args:
+            entity: Entity to insert
+
+        Returns:
+            The saved entity
+
+        Raises:
+            RepositoryError: If the entity already exists
+        """
+        return self.save(entity, mode=WriteMode.INSERT_ONLY)
+
+    def update(self, entity: T) -> T:
+        """
+        Update an existing entity.
+
+        Args:
+            entity: Entity to update
+
+        Returns:
+            The saved entity
+
+        Raises:
+            RepositoryError: If the entity does not exist
+        """
+        return self.save(entity, mode=WriteMode.UPDATE_ONLY)
+
+    def patch(
+        self,
+        entity_id: str,
+        changes: dict[str, Any],
+        expected_revision: Optional[int] = None,
+    ) -> Optional[T]:
+        """
+        Update only the given fields of an entity, atomically.
+
+        The revision check and the write happen under the repository lock.
+        The stored entity is changed in place and its revision incremented.
+
+        Args:
+            entity_id: Unique identifier of the entity
+            changes: Mapping of field name to new value
+            expected_revision: Revision the stored entity must have
+                (None = unconditional update)
+
+        Returns:
+            Updated entity, or None if not found
+
+        Raises:
+            ValueError: If a field is not a field of the entity, or is its
+                ID or revision
+            ConcurrencyError: If the stored revision differs from ``expected_revision``
+        """
+        with self._lock:
+            entity = self._rows.get(entity_id)
+            if entity is None:
+                return None
+            apply_patch(entity, entity_id, changes, expected_revision)
+            return self.save(entity)
+
+    def update_where(
+        self,
+        filters: Optional[dict[str, Any]],
+        changes: dict[str, Any],
+        where: Optional[FilterExpr] = None,
+    ) -> int:
+        """
+        Set the given fields on every matching entity in one pass.
+
+        Matches are found with the indexes and updated under one lock
+        acquisition; their index entries are refreshed in place.
+
+        Args:
+            filters: Dictionary of field:value filters
+            changes: Mapping of field name to new value
+            where: Filter expression applied on top of ``filters``
+
+        Returns:
+            Number of entities updated
+
+        Raises:
+            ValueError: If no filter is given or the ID would change
+        """
+        require_update_filter(filters, where)
+        if self.id_field in changes:
+            raise ValueError(f"Cannot update the {self.id_field} field")
+        condition = self._where(filters, where)
+        with self._lock:
+            matches = list(self._scan(self._candidates(condition), condition))
+            for entity in matches:
+                entity_id = getattr(entity, self.id_field)
+                self._unindex(entity_id)
+                apply_patch(entity, entity_id, changes)
+                bump_revision(entity, getattr(entity, "revision", None))
+                self._index(entity_id, entity)
+        return len(matches)
+
+    def save_many(self, entities: list[T]) -> list[T]:
+        """
+        Save several entities under one lock acquisition.
+
+        Args:
+            entities: Entities to save
+
+        Returns:
+            Saved entities, in input order
+
+        Raises:
+            RepositoryError: If an entity has no ID
+        """
+        with self._lock:
+            return [self.save(entity) for entity in entities]
+
+    def delete(self, entity_id: str, hard: bool = False) -> bool:
+        """
+        Delete an entity by ID.
+
+        Args:
+            entity_id: Unique identifier of the entity
+            hard: If True, forget the entity; if False, soft delete (default)
+
+        Returns:
+            True if entity was deleted, False if not found
+        """
+        with self._lock:
+            entity = self._rows.pop(entity_id, None)
+            if entity is None:
+                return hard and self._deleted.pop(entity_id, None) is not None
+
+            self._unindex(entity_id)
+            del self._indexed[entity_id]
+            del self._positions[entity_id]
+            if not hard:
+                bump_revision(entity, getattr(entity, "revision", None))
+                self._deleted[entity_id] = entity
+            return True
+
+    def delete_many(self, entity_ids: list[str], hard: bool = False) -> int:
+        """
+        Delete several entities under one lock acquisition.
+
+        Args:
+            entity_ids: Identifiers of the entities to delete
+            hard: If True, forget the entities; if False, soft delete (default)
+
+        Returns:
+            Number of entities deleted
+        """
+        with self._lock:
+            return sum(1 for entity_id in dict.fromkeys(entity_ids) if self.delete(entity_id, hard=hard))
+
+    def commit(self, batch: WriteBatch[T]) -> list[Any]:
+        """
+        Apply a batch atomically.
+
+        Every write is checked against the state the earlier writes of the
+        batch lead to before anything is applied, all under the repository
+        lock, so a batch either fails untouched or applies in full.
+
+        Args:
+            batch: Writes to apply
+
+        Returns:
+            One result per write (see ``WriteBatch.results``)
+
+        Raises:
+            ConcurrencyError: If a conditional save finds another revision
+            RepositoryError: If an insert finds an existing entity or an
+                update a missing one
+        """
+        with self._lock:
+            # State of the IDs the batch touches: "live", "deleted" (soft) or "gone",
+            # and the revision stored for them (live or soft-deleted)
+            state: dict[str, str] = {}
+            revisions: dict[str, Optional[int]] = {}
+            for write in batch.writes:
+                entity_id = write.entity_id
+                current = state.get(entity_id)
+                if current is None:
+                    current = "live" if entity_id in self._rows else "gone"
+                    if entity_id in self._deleted:
+                        current = "deleted"
+                    stored = self._rows.get(entity_id, self._deleted.get(entity_id))
+                    revisions[entity_id] = getattr(stored, "revision", None)
+                revision = revisions[entity_id]
+                if write.is_delete:
+                    state[entity_id] = "gone" if write.hard or current == "gone" else "deleted"
+                    if state[entity_id] == "gone":
+                        revisions[entity_id] = None
+                    elif current == "live" and revision is not None:
+                        revisions[entity_id] = revision + 1
+                    continue
+                # Inserts also conflict with soft-deleted IDs, like save()
+                taken = current == "live" or (write.mode == WriteMode.INSERT_ONLY and current == "deleted")
+                check_write_mode(write, taken, revision)
+                state[entity_id] = "live"
+                if current != "gone" and revision is not None:
+                    revisions[entity_id] = revision + 1
+                else:
+                    revisions[entity_id] = getattr(write.entity, "revision", None)
+
+            return [
+                self.delete(write.entity_id, hard=write.hard) if write.is_delete else self.save(write.entity)
+                for write in batch.writes
+            ]
+
+    # Reads
+
+    def get(self, entity_id: str) -> Optional[T]:
+        """
+        Retrieve an entity by ID.
+
+        Args:
+            entity_id: Unique identifier of the entity
+
+        Returns:
+            Entity if found and not soft-deleted, None otherwise
+        """
+        return self._rows.get(entity_id)
+
+    def exists(self, entity_id: str) -> bool:
+        """
+        Check if an entity exists.
+
+        Args:
+            entity_id: Unique identifier of the entity
+
+        Returns:
+            True if the entity exists and is not soft-deleted
+        """
+        return entity_id in self._rows
+
+    def get_many(self, entity_ids: list[str]) -> list[T]:
+        """
+        Retrieve several entities by ID.
+
+        Args:
+            entity_ids: Identifiers of the entities to retrieve
+
+        Returns:
+            Entities that were found, in the order of ``entity_ids``
+        """
+        with self._lock:
+            return [self._rows[entity_id] for entity_id in entity_ids if entity_id in self._rows]
+
+    def list(
+        self,
+        filters: Optional[dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[str] = None,
+    ) -> list[T]:
+        """
+        List entities with optional filtering and pagination.
+
+        Without ``order_by`` entities are returned in insertion order.
+
+        Args:
+            filters: Dictionary of field:value filters
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+            order_by: Field name to order by (prefix with '-' for descending)
+
+        Returns:
+            List of entities matching criteria
+        """
+        return self.list_where(self._where(filters), limit=limit, offset=offset, order_by=order_by)
+
+    def list_where(
+        self,
+        where: Optional[FilterExpr],
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[str] = None,
+    ) -> list[T]:
+        """
+        List entities matching a filter expression.
+
+        Ordering on a field with a sorted index walks the index and stops
+        once the page is full.
+
+        Args:
+            where: Filter expression (None = all entities)
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+            order_by: Field name to order by (prefix with '-' for descending)
+
+        Returns:
+            List of matching entities
+        """
+        start = offset or 0
+        stop = start + limit if limit is not None else None
+
+        with self._lock:
+            candidates = self._candidates(where)
+            if not order_by:
+                return list(islice(self._scan(candidates, where), start, stop))
+
+            field_name, descending = parse_order_by(order_by)
+            index = self._sorted_indexes.get(field_name)
+            ordered = index.ordered(descending) if index is not None and candidates is None else None
+            if ordered is not None:
+                matches: Iterator[T] = (self._rows[entity_id] for entity_id in ordered)
+                if where is not None:
+                    matches = (entity for entity in matches if where.matches(entity))
+                return list(islice(matches, start, stop))
+
+            def sort_key(entity: T) -> tuple[bool, Any]:
+                value = keyset_value(getattr(entity, field_name, None))
+                return value is None, value if value is not None else ""
+
+            entities = sorted(self._scan(candidates, where), key=sort_key, reverse=descending)
+            return entities[start:stop]
+
+    def list_page(
+        self,
+        filters: Optional[dict[str, Any]] = None,
+        limit: int = 20,
+        order_by: Optional[str] = None,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        where: Optional[FilterExpr] = None,
+    ) -> KeysetPage[T]:
+        """
+        List one page of entities using keyset (cursor) pagination.
+
+        Args:
+            filters: Dictionary of field:value filters
+            limit: Maximum number of results to return
+            order_by: Field name to order by (prefix with '-' for descending)
+            after: Cursor of the page to continue after
+            before: Cursor of the page to go back from
+            where: Filter expression applied on top of ``filters``
+
+        Returns:
+            Page of entities with next/previous cursors
+
+        Raises:
+            ValueError: If a cursor is malformed
+        """
+        return paginate_keyset(
+            self.list_where(self._where(filters, where)),
+            limit,
+            order_by,
+            after,
+            before,
+            value_of=lambda entity, name: getattr(entity, name, None),
+            id_of=lambda entity: str(getattr(entity, self.id_field)),
+        )
+
+    def iter_all(
+        self,
+        filters: Optional[dict[str, Any]] = None,
+        page_size: int = DEFAULT_SCAN_PAGE_SIZE,
+        where: Optional[FilterExpr] = None,
+    ) -> Iterator[T]:
+        """
+        Iterate over every entity matching the filters, in ID order.
+
+        The matches are collected once; ``page_size`` is only validated.
+
+        Args:
+            filters: Dictionary of field:value filters
+            page_size: Number of entities fetched per request
+            where: Filter expression applied on top of ``filters``
+
+        Yields:
+            Matching entities in ID order
+
+        Raises:
+            ValueError: If page_size is less than 1
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be >= 1")
+        entities = self.list_where(self._where(filters, where))
+        yield from sorted(entities, key=lambda entity: str(getattr(entity, self.id_field)))
+
+    def count(self, filters: Optional[dict[str, Any]] = None) -> int:
+        """
+        Count entities matching filters.
+
+        Args:
+            filters: Dictionary of field:value filters
+
+        Returns:
+            Number of entities matching criteria
+        """
+        return self.count_where(self._where(filters))
+
+    def count_where(self, where: Optional[FilterExpr]) -> int:
+        """
+        Count entities matching a filter expression.
+
+        Args:
+            where: Filter expression (None = all entities)
+
+        Returns:
+            Number of matching entities
+        """
+        with self._lock:
+            if where is None:
+                return len(self._rows)
+            return sum(1 for _ in self._scan(self._candidates(where), where))
+
+    def aggregate(
+        self,
+        group_by: Optional[list[str]] = None,
+        metrics: Optional[list[Metric]] = None,
+        filters: Optional[dict[str, Any]] = None,
+        time_bucket: Optional[TimeBucket] = None,
+        time_field: str = "created_at",
+        where: Optional[FilterExpr] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Aggregate the matching entities per group.
+
+        Args:
+            group_by: Group keys: column names or ``column.key`` JSON paths
+            metrics: Metrics to compute (None = row count)
+            filters: Dictionary of field:value filters
+            time_bucket: Bucket rows by ``time_field`` truncated to this size
+            time_field: Datetime field used for bucketing
+            where: Filter expression applied on top of ``filters``
+
+        Returns:
+            One row per group (see ``Repository.aggregate``)
+
+        Raises:
+            ValueError: If a group key or metric is invalid
+        """
+        entities = self.list_where(self._where(filters, where))
+        return aggregate_items(entities, group_by, metrics, time_bucket, time_field)
+
+    def search(
+        self,
+        query: str,
+        fields: Optional[list[str]] = None,
+        limit: Optional[int] = None,
+    ) -> list[T]:
+        """
+        Search entities by case-insensitive substring, in insertion order.
+
+        Args:
+            query: Search query string
+            fields: List of field names to search in (None = all text fields)
+            limit: Maximum number of results to return
+
+        Returns:
+            List of entities matching search criteria
+        """
+        needle = query.casefold()
+
+        def matches(entity: T) -> bool:
+            if fields:
+                values = (field_value(entity, name) for name in fields)
+            else:
+                values = iter(getattr(entity, "__dict__", {}).values())
+            return any(isinstance(value, str) and needle in value.casefold() for value in values)
+
+        with self._lock:
+            return list(islice((entity for entity in self._rows.values() if matches(entity)), limit))
+
+    # Indexing and query planning
+
+    def _index(self, entity_id: str, entity: T) -> None:
+        """Add an entity to every secondary index."""
+        values = {
+            field: index_value(field_value(entity, field))
+            for field in (*self._hash_indexes, *self._sorted_indexes)
+        }
+        self._indexed[entity_id] = values
+        for field, index in self._hash_indexes.items():
+            index.add(entity_id, values[field])
+        for field, sorted_index in self._sorted_indexes.items():
+            sorted_index.add(entity_id, values[field])
+
+    def _unindex(self, entity_id: str) -> None:
+        """Remove an entity's entries, using the values it was indexed with."""
+        values = self._indexed[entity_id]
+        for field, index in self._hash_indexes.items():
+            index.remove(entity_id, values[field])
+        for field, sorted_index in self._sorted_indexes.items():
+            sorted_index.remove(entity_id, values[field])
+
+    @staticmethod
+    def _where(filters: Optional[dict[str, Any]], where: Optional[FilterExpr] = None) -> Optional[FilterExpr]:
+        """Combine equality filters (None values ignored) and an expression."""
+        conditions: list[FilterExpr] = [
+            eq(field, value) for field, value in (filters or {}).items() if value is not None
+        ]
+        if where is not None:
+            conditions.append(where)
+        if not conditions:
+            return None
+        return conditions[0] if len(conditions) == 1 else and_(*conditions)
+
+    def _candidates(self, where: Optional[FilterExpr]) -> Optional[set[str]]:
+        """
+        Narrow a filter expression down to candidate IDs with the indexes.
+
+        Every entity matching ``where`` is among the candidates; candidates
+        still have to be checked against ``where``.
+
+        Args:
+            where: Filter expression
+
+        Returns:
+            Candidate IDs (the set must not be modified), or None if the
+            indexes cannot narrow the expression and every entity is a
+            candidate
+        """
+        if where is None:
+            return None
+
+        if isinstance(where, AllOf):
+            narrowed = [ids for ids in map(self._candidates, where.filters) if ids is not None]
+            if not narrowed:
+                return None
+            narrowed.sort(key=len)
+            return narrowed[0].intersection(*narrowed[1:]) if len(narrowed) > 1 else narrowed[0]
+
+        if isinstance(where, AnyOf):
+            union: set[str] = set()
+            for member in where.filters:
+                ids = self._candidates(member)
+                if ids is None:
+                    return None
+                union |= ids
+            return union
+
+        hash_index = self._hash_indexes.get(where.field)
+        sorted_index = self._sorted_indexes.get(where.field)
+        index = hash_index or sorted_index
+        ids: Optional[set[str]] = None
+        if where.op == FilterOp.IS_NULL and where.value and index is not None:
+            ids = index.nulls()
+        elif where.op in (FilterOp.EQ, FilterOp.IN):
+            values = where.value if where.op == FilterOp.IN else (where.value,)
+            if hash_index is not None:
+                ids = hash_index.lookup(values)
+            elif sorted_index is not None:
+                ranges = [sorted_index.range(value, value) for value in values]
+                ids = None if None in ranges else set().union(*ranges)
+        elif sorted_index is not None and where.op in (FilterOp.GT, FilterOp.GTE):
+            ids = sorted_index.range(lower=where.value, lower_inclusive=where.op == FilterOp.GTE)
+        elif sorted_index is not None and where.op in (FilterOp.LT, FilterOp.LTE):
+            ids = sorted_index.range(upper=where.value, upper_inclusive=where.op == FilterOp.LTE)
+
+        if ids is None and self.logger is not None:
+            self.logger.debug("In-memory filter not answered by an index", field=where.field, op=where.op.value)
+        return ids
+
+    def _scan(self, candidates: Optional[set[str]], where: Optional[FilterExpr]) -> Iterator[T]:
+        """Yield the candidates matching ``where``, in insertion order."""
+        if candidates is None:
+            entities: Iterable[T] = self._rows.values()
+        else:
+            ordered = sorted(candidates, key=self._positions.__getitem__)
+            entities = (self._rows[entity_id] for entity_id in ordered)
+        if where is None:
+            return iter(entities)
+        return (entity for entity in entities if where.matches(entity))
+
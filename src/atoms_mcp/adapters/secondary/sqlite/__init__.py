@@ -0,0 +1,25 @@
+"""
+SQLite adapter module.
+
+This module provides a SQLite (WAL mode) implementation of the repository
+pattern: a durable, zero-network backend for edge and single-tenant
+installs.
+"""
+
+from atoms_mcp.adapters.secondary.sqlite.connection import (
+    SqliteConnectionError,
+    SqliteConnectionPool,
+)
+from atoms_mcp.adapters.secondary.sqlite.repository import (
+    DEFAULT_INDEXED_FIELDS,
+    DEFAULT_SEARCH_FIELDS,
+    SqliteRepository,
+)
+
+__all__ = [
+    "DEFAULT_INDEXED_FIELDS",
+    "DEFAULT_SEARCH_FIELDS",
+    "SqliteConnectionError",
+    "SqliteConnectionPool",
+    "SqliteRepository",
+]
@@ -0,0 +1,203 @@
+"""
+SQLite connection management.
+
+This module provides a small thread-safe pool of SQLite connections
+opened in WAL mode. In WAL mode readers never block the writer and the
+writer never blocks readers, so every pooled connection can serve reads
+concurrently while writes are serialized by SQLite itself.
+"""
+
+from __future__ import annotations
+
+import json
+import queue
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from atoms_mcp.domain.ports.filters import contains
+
+# Path that opens a private in-memory database
+MEMORY_DATABASE = ":memory:"
+
+# Pragmas applied to every connection; WAL is persistent per database file
+# and ``synchronous=NORMAL`` is durable across application crashes in WAL mode
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA temp_store = MEMORY",
+)
+
+
+class SqliteConnectionError(Exception):
+    """Exception raised for SQLite connection errors."""
+
+    pass
+
+
+def _json_contains(document: Optional[str], expected: Optional[str]) -> int:
+    """
+    SQL function ``json_contains(document, expected)``.
+
+    Implements Postgres ``@>`` containment for JSON text, with the
+    semantics of the ``contains`` filter operator.
+    """
+    if document is None or expected is None:
+        return 0
+    try:
+        actual = json.loads(document)
+    except (TypeError, ValueError):
+        return 0
+    return int(contains("value", json.loads(expected)).matches({"value": actual}))
+
+
+class SqliteConnectionPool:
+    """
+    Fixed-size pool of WAL-mode SQLite connections.
+
+    Connections are opened lazily up to ``size`` and handed out one at a
+    time; callers waiting for a connection block until one is returned.
+    An in-memory database lives in a single connection, so its pool always
+    holds one connection.
+    """
+
+    def __init__(
+        self,
+        database: Union[str, Path] = MEMORY_DATABASE,
+        size: int = 4,
+        busy_timeout: float = 5.0,
+    ) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            database: Database file path, or ":memory:" for a private in-memory database
+            size: Maximum number of open connections
+            busy_timeout: Seconds a statement waits for a lock held by another connection
+
+        Raises:
+            ValueError: If size or busy_timeout is out of range
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        if busy_timeout < 0:
+            raise ValueError("busy_timeout must not be negative")
+
+        self.database = str(database)
+        self.in_memory = self.database == MEMORY_DATABASE
+        self.size = 1 if self.in_memory else size
+        self.busy_timeout = busy_timeout
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._opened: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+        if not self.in_memory:
+            Path(self.database).parent.mkdir(parents=True, exist_ok=True)
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open and configure one connection.
+
+        Connections run in autocommit mode; ``transaction`` opens explicit
+        transactions for writes.
+
+        Returns:
+            Configured connection
+
+        Raises:
+            SqliteConnectionError: If the database cannot be opened
+        """
+        try:
+            connection = sqlite3.connect(
+                self.database,
+                timeout=self.busy_timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            for pragma in CONNECTION_PRAGMAS:
+                connection.execute(pragma)
+            connection.create_function("json_contains", 2, _json_contains, deterministic=True)
+        except sqlite3.Error as e:
+            raise SqliteConnectionError(f"Failed to open SQLite database {self.database}: {e}") from e
+        return connection
+
+    def _acquire(self) -> sqlite3.Connection:
+        """Take an idle connection, opening a new one while below ``size``."""
+        if self._closed:
+            raise SqliteConnectionError("Connection pool is closed")
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._opened) < self.size:
+                connection = self._connect()
+                self._opened.append(connection)
+                return connection
+        return self._idle.get()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrow a connection for the duration of the block.
+
+        Yields:
+            Pooled connection (autocommit mode)
+
+        Raises:
+            SqliteConnectionError: If the pool is closed or a connection cannot be opened
+        """
+        connection = self._acquire()
+        try:
+            yield connection
+        finally:
+            self._idle.put(connection)
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrow a connection inside a write transaction.
+
+        The transaction takes the write lock up front (``BEGIN IMMEDIATE``)
+        so concurrent writers queue on ``busy_timeout`` instead of failing
+        when upgrading a read lock. It commits when the block exits and
+        rolls back if it raises.
+
+        Yields:
+            Pooled connection with an open transaction
+        """
+        with self.connection() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def execute(self, sql: str, parameters: Any = ()) -> list[tuple[Any, ...]]:
+        """
+        Run one read statement and fetch every row.
+
+        Args:
+            sql: SQL statement
+            parameters: Statement parameters
+
+        Returns:
+            Result rows
+        """
+        with self.connection() as connection:
+            return connection.execute(sql, parameters).fetchall()
+
+    def close(self) -> None:
+        """Close every connection; the pool cannot be used afterwards."""
+        with self._lock:
+            self._closed = True
+            for connection in self._opened:
+                connection.close()
+            self._opened.clear()
@@ -0,0 +1,1164 @@
+"""
+SQLite repository implementation.
+
+Each repository owns one table. An entity is stored as JSON: ``doc`` holds
+the encoded entity without its ``metadata`` and ``properties``, which live
+in JSON columns of their own. Fields used by common filters are exposed as
+virtual generated columns extracted from the JSON and indexed, so filters,
+counts and ordered listings on them are index lookups. A field is read from
+the entity first and from its metadata second, like ``field_value``.
+
+Text search uses an FTS5 index over the search fields, ranked with
+``bm25``; short queries fall back to ``LIKE`` matching. The repository
+refreshes the index in the same transaction as each write, so rows
+written to the table by other means are not searchable until saved again.
+Deletes are soft by default, matching the Supabase adapter. Every write
+of a stored row, soft deletes included, increments the ``revision`` kept
+in its JSON.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+from datetime import datetime
+from typing import Any, Generic, Iterable, Optional, TypeVar
+
+from atoms_mcp.domain.ports.filters import AllOf, AnyOf, FilterExpr, FilterOp, and_, eq
+from atoms_mcp.domain.ports.logger import Logger
+from atoms_mcp.domain.ports.pagination import (
+    KeysetPage,
+    decode_cursor,
+    encode_cursor,
+    keyset_value,
+    parse_order_by,
+)
+from atoms_mcp.domain.ports.projection import validate_column
+from atoms_mcp.domain.ports.repository import (
+    ConcurrencyError,
+    Repository,
+    RepositoryError,
+    SearchMode,
+    WriteBatch,
+    WriteMode,
+    apply_patch,
+    bump_revision,
+    require_update_filter,
+)
+from atoms_mcp.infrastructure.serialization.codecs import encode_value, get_codec
+
+from .connection import SqliteConnectionPool
+
+T = TypeVar("T")
+
+# Fields exposed as indexed generated columns unless configured otherwise
+DEFAULT_INDEXED_FIELDS = (
+    "workspace_id",
+    "project_id",
+    "source_id",
+    "target_id",
+    "relationship_type",
+    "workflow_id",
+    "entity_type",
+    "status",
+    "created_at",
+    "updated_at",
+)
+
+# Text fields covered by the FTS5 index unless configured otherwise
+DEFAULT_SEARCH_FIELDS = ("name", "description", "title", "content")
+
+# Entity fields stored in JSON columns of their own
+JSON_COLUMNS = ("metadata", "properties")
+
+# Maximum IDs per statement for batch reads and deletes
+DEFAULT_BATCH_SIZE = 500
+
+# Queries shorter than this use substring matching in AUTO mode
+MIN_FULLTEXT_QUERY_LENGTH = 3
+
+# SQL operator for each comparison filter operator
+SQL_OPERATORS = {
+    FilterOp.EQ: "=",
+    FilterOp.NEQ: "!=",
+    FilterOp.GT: ">",
+    FilterOp.GTE: ">=",
+    FilterOp.LT: "<",
+    FilterOp.LTE: "<=",
+    FilterOp.ILIKE: "LIKE",
+}
+
+_TOKEN = re.compile(r"\w+")
+
+
+class SqliteRepository(Repository[T], Generic[T]):
+    """
+    SQLite implementation of the Repository port.
+
+    Suitable for edge and single-tenant installs: durable, zero-network
+    and safe to share between threads through its connection pool.
+
+    Type parameter T represents the entity type managed by this repository.
+    """
+
+    def __init__(
+        self,
+        table_name: str,
+        entity_type: type[T],
+        pool: Optional[SqliteConnectionPool] = None,
+        id_field: str = "id",
+        indexed_fields: Iterable[str] = DEFAULT_INDEXED_FIELDS,
+        search_fields: Iterable[str] = DEFAULT_SEARCH_FIELDS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        logger: Optional[Logger] = None,
+    ) -> None:
+        """
+        Initialize the repository and create its table if needed.
+
+        Indexed fields missing from an existing table are added to it. The
+        FTS5 index is created with the table; changing ``search_fields``
+        later requires dropping ``<table>_fts`` so it is rebuilt.
+
+        Args:
+            table_name: Name of the table
+            entity_type: Type of entities stored in this repository
+            pool: Connection pool (default: private in-memory database)
+            id_field: Name of the ID field (default: "id")
+            indexed_fields: Fields exposed as indexed generated columns
+            search_fields: Text fields covered by the full-text index
+            batch_size: Maximum IDs per statement for batch operations
+            logger: Logger for search diagnostics (optional)
+
+        Raises:
+            ValueError: If a table or field name is invalid, or batch_size < 1
+            RepositoryError: If the schema cannot be created
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.table_name = validate_column(table_name)
+        self.entity_type = entity_type
+        self.pool = pool or SqliteConnectionPool()
+        self.id_field = id_field
+        self.indexed_fields = tuple(
+            validate_column(field) for field in indexed_fields if field != id_field and field not in JSON_COLUMNS
+        )
+        self.search_fields = tuple(validate_column(field) for field in search_fields)
+        self.batch_size = batch_size
+        self.logger = logger
+        # Precompiled row codec for dataclass entities (None = generic mapping)
+        self._codec = get_codec(entity_type)
+        self._create_schema()
+
+    # Schema
+
+    def _create_schema(self) -> None:
+        """Create the table, generated columns, indexes and FTS5 index."""
+        table = self.table_name
+        fts = f"{table}_fts"
+        fts_columns = ", ".join(self.search_fields)
+
+        statements = [
+            f"""
+            CREATE TABLE IF NOT EXISTS "{table}" (
+                id TEXT PRIMARY KEY,
+                doc TEXT NOT NULL,
+                metadata TEXT,
+                properties TEXT,
+                is_deleted INTEGER NOT NULL DEFAULT 0,
+                deleted_at TEXT
+            )
+            """,
+            f'CREATE VIRTUAL TABLE IF NOT EXISTS "{fts}" '
+            f'USING fts5({fts_columns}, tokenize="unicode61 remove_diacritics 2")',
+        ]
+
+        try:
+            with self.pool.transaction() as connection:
+                for statement in statements:
+                    connection.execute(statement)
+                existing = {row[1] for row in connection.execute(f'PRAGMA table_xinfo("{table}")')}
+                for field in self.indexed_fields:
+                    if field not in existing:
+                        connection.execute(
+                            f'ALTER TABLE "{table}" ADD COLUMN "{field}" '
+                            f"GENERATED ALWAYS AS ({self._field_expression(field)}) VIRTUAL"
+                        )
+                    # Partial indexes: every read filters on is_deleted = 0
+                    connection.execute(
+                        f'CREATE INDEX IF NOT EXISTS "{table}_{field}_idx" '
+                        f'ON "{table}" ("{field}", id) WHERE is_deleted = 0'
+                    )
+        except sqlite3.Error as e:
+            raise RepositoryError(f"Failed to create SQLite schema for {table}: {e}") from e
+
+    @staticmethod
+    def _field_expression(field: str) -> str:
+        """
+        SQL expression reading a field from the entity JSON, then its metadata.
+
+        Args:
+            field: Validated field name
+
+        Returns:
+            SQL expression
+        """
+        return f"coalesce(json_extract(doc, '$.{field}'), json_extract(metadata, '$.{field}'))"
+
+    def _reindex_search(self, connection: sqlite3.Connection, ids: list[str], remove_only: bool = False) -> None:
+        """
+        Refresh the full-text index entries of the given rows.
+
+        The index is maintained here rather than by triggers: one
+        set-based statement per batch is several times faster than a
+        trigger firing per row.
+
+        Args:
+            connection: Connection with an open write transaction
+            ids: IDs of the rows written or about to be removed
+            remove_only: Only drop the entries (before a hard delete)
+        """
+        fts = f"{self.table_name}_fts"
+        fts_columns = ", ".join(self.search_fields)
+        fts_values = ", ".join(self._field_expression(field) for field in self.search_fields)
+        for chunk in self._chunks(ids):
+            placeholders = ", ".join("?" * len(chunk))
+            connection.execute(
+                f'DELETE FROM "{fts}" WHERE rowid IN '
+                f'(SELECT rowid FROM "{self.table_name}" WHERE id IN ({placeholders}))',
+                chunk,
+            )
+            if not remove_only:
+                connection.execute(
+                    f'INSERT INTO "{fts}" (rowid, {fts_columns}) '
+                    f'SELECT rowid, {fts_values} FROM "{self.table_name}" WHERE id IN ({placeholders})',
+                    chunk,
+                )
+
+    def _column(self, field: str) -> str:
+        """
+        SQL expression for a field in filters and ordering.
+
+        Args:
+            field: Field name
+
+        Returns:
+            Generated column, JSON column or JSON extraction
+
+        Raises:
+            ValueError: If the field name is invalid
+        """
+        validate_column(field)
+        if field == self.id_field:
+            return "id"
+        if field in JSON_COLUMNS:
+            return field
+        if field in self.indexed_fields:
+            return f'"{field}"'
+        return self._field_expression(field)
+
+    # Serialization
+
+    def _encode(self, entity: T) -> tuple[str, str, Optional[str], Optional[str]]:
+        """
+        Encode an entity into ``(id, doc, metadata, properties)`` column values.
+
+        Args:
+            entity: Entity to encode
+
+        Returns:
+            Column values
+
+        Raises:
+            RepositoryError: If the entity cannot be serialized or has no ID
+        """
+        if self._codec is not None:
+            row = self._codec.encode(entity)
+        elif hasattr(entity, "model_dump"):
+            row = entity.model_dump(mode="json")
+        elif hasattr(entity, "__dict__"):
+            row = {k: v for k, v in entity.__dict__.items() if not k.startswith("_")}
+        else:
+            raise RepositoryError(f"Cannot serialize entity of type {type(entity)}")
+
+        entity_id = row.get(self.id_field)
+        if not entity_id:
+            raise RepositoryError("Cannot save an entity without an ID")
+
+        json_columns = [
+            json.dumps(row.pop(name), default=_json_default) if name in row else None for name in JSON_COLUMNS
+        ]
+        return (str(entity_id), json.dumps(row, default=_json_default), *json_columns)
+
+    def _decode(self, doc: str, metadata: Optional[str], properties: Optional[str]) -> T:
+        """
+        Build an entity from its stored columns.
+
+        Args:
+            doc: Entity JSON
+            metadata: Metadata JSON (None if the entity has none)
+            properties: Properties JSON (None if the entity has none)
+
+        Returns:
+            Deserialized entity
+
+        Raises:
+            RepositoryError: If deserialization fails
+        """
+        try:
+            row = json.loads(doc)
+            for name, value in zip(JSON_COLUMNS, (metadata, properties), strict=True):
+                if value is not None:
+                    row[name] = json.loads(value)
+            if self._codec is not None:
+                return self._codec.decode(row)
+            if hasattr(self.entity_type, "model_validate"):
+                return self.entity_type.model_validate(row)
+            return self.entity_type(**row)
+        except Exception as e:
+            raise RepositoryError(f"Failed to deserialize entity: {e}") from e
+
+    @staticmethod
+    def _param(value: Any) -> Any:
+        """Convert a filter value to the form stored in the JSON columns."""
+        value = keyset_value(value)
+        if isinstance(value, bool):
+            return int(value)
+        if isinstance(value, (dict, list)):
+            return json.dumps(value)
+        return value
+
+    # Query building
+
+    def _render_where(self, where: FilterExpr, params: list[Any]) -> str:
+        """
+        Translate a filter expression into a SQL condition.
+
+        Args:
+            where: Filter expression
+            params: Statement parameters, extended in place
+
+        Returns:
+            SQL condition
+        """
+        if isinstance(where, (AllOf, AnyOf)):
+            if not where.filters:
+                return "1" if isinstance(where, AllOf) else "0"
+            joiner = " AND " if isinstance(where, AllOf) else " OR "
+            return f"({joiner.join(self._render_where(member, params) for member in where.filters)})"
+
+        column = self._column(where.field)
+        if where.op == FilterOp.IS_NULL:
+            return f"{column} IS NULL" if where.value else f"{column} IS NOT NULL"
+        if where.op == FilterOp.IN:
+            if not where.value:
+                return "0"
+            params.extend(self._param(value) for value in where.value)
+            return f"{column} IN ({', '.join('?' * len(where.value))})"
+        if where.op == FilterOp.CONTAINS:
+            params.append(json.dumps(where.value))
+            return f"json_contains({column}, ?)"
+
+        params.append(self._param(where.value))
+        return f"{column} {SQL_OPERATORS[where.op]} ?"
+
+    def _select(self, where: Optional[FilterExpr], params: list[Any], extra: str = "") -> str:
+        """
+        Build the SELECT of live rows matching ``where``.
+
+        Args:
+            where: Filter expression (None = all live rows)
+            params: Statement parameters, extended in place
+            extra: Additional result columns (with leading comma)
+
+        Returns:
+            SQL statement without ordering or limits
+        """
+        sql = f'SELECT doc, metadata, properties{extra} FROM "{self.table_name}" WHERE is_deleted = 0'
+        if where is not None:
+            sql += f" AND {self._render_where(where, params)}"
+        return sql
+
+    def _order_clause(self, field: str, descending: bool) -> str:
+        """ORDER BY on ``(field, id)``; nulls sort last ascending, first descending."""
+        direction = "DESC" if descending else "ASC"
+        if field == self.id_field:
+            return f" ORDER BY id {direction}"
+        nulls = "FIRST" if descending else "LAST"
+        return f" ORDER BY {self._column(field)} {direction} NULLS {nulls}, id {direction}"
+
+    @staticmethod
+    def _where(filters: Optional[dict[str, Any]], where: Optional[FilterExpr] = None) -> Optional[FilterExpr]:
+        """Combine equality filters (None values ignored) and an expression."""
+        conditions: list[FilterExpr] = [
+            eq(field, value) for field, value in (filters or {}).items() if value is not None
+        ]
+        if where is not None:
+            conditions.append(where)
+        if not conditions:
+            return None
+        return conditions[0] if len(conditions) == 1 else and_(*conditions)
+
+    def _query(self, sql: str, params: Iterable[Any]) -> list[tuple[Any, ...]]:
+        """
+        Run a read statement.
+
+        Raises:
+            RepositoryError: If the statement fails
+        """
+        try:
+            return self.pool.execute(sql, tuple(params))
+        except sqlite3.Error as e:
+            raise RepositoryError(f"SQLite query on {self.table_name} failed: {e}") from e
+
+    def _chunks(self, items: list[Any]) -> Iterable[list[Any]]:
+        """Split items into batches of at most ``batch_size``."""
+        for start in range(0, len(items), self.batch_size):
+            yield items[start : start + self.batch_size]
+
+    # Writes
+
+    def save(self, entity: T, mode: WriteMode = WriteMode.UPSERT) -> T:
+        """
+        Save an entity in a single statement.
+
+        Upserts revive a soft-deleted entity with the same ID.
+
+        Args:
+            entity: Entity to save
+            mode: UPSERT (default), INSERT_ONLY or UPDATE_ONLY
+
+        Returns:
+            The saved entity
+
+        Raises:
+            RepositoryError: If the entity has no ID, already exists for an
+                INSERT_ONLY save, does not exist for an UPDATE_ONLY save or
+                the write fails
+        """
+        values = self._encode(entity)
+
+        try:
+            with self.pool.transaction() as connection:
+                revision = self._write_row(connection, values, mode)
+                self._reindex_search(connection, [values[0]])
+        except sqlite3.IntegrityError as e:
+            raise RepositoryError(f"Entity {values[0]} already exists") from e
+        except sqlite3.Error as e:
+            raise RepositoryError(f"Failed to save entity: {e}") from e
+        _set_revision(entity, revision)
+        return entity
+
+    def _write_row(
+        self,
+        connection: sqlite3.Connection,
+        values: tuple[str, str, Optional[str], Optional[str]],
+        mode: WriteMode,
+        expected_revision: Optional[int] = None,
+    ) -> Optional[int]:
+        """
+        Write one encoded entity inside an open transaction.
+
+        A row that replaces a stored one gets the stored revision plus one.
+
+        Args:
+            connection: Connection with an open write transaction
+            values: Encoded ``(id, doc, metadata, properties)``
+            mode: UPSERT, INSERT_ONLY or UPDATE_ONLY
+            expected_revision: Revision a stored row must have (None = unconditional)
+
+        Returns:
+            Revision of the written row (None if the entity has none)
+
+        Raises:
+            ConcurrencyError: If the stored row has another revision
+            RepositoryError: If an UPDATE_ONLY write finds no live row
+            sqlite3.IntegrityError: If an INSERT_ONLY write finds the ID taken
+        """
+        if expected_revision is not None:
+            row = connection.execute(
+                "SELECT json_extract(doc, '$.revision') "
+                f'FROM "{self.table_name}" WHERE id = ? AND is_deleted = 0',
+                (values[0],),
+            ).fetchone()
+            if row is not None and row[0] != expected_revision:
+                raise ConcurrencyError(values[0], expected_revision, row[0])
+        returning = " RETURNING json_extract(doc, '$.revision')"
+        if mode == WriteMode.UPDATE_ONLY:
+            row = connection.execute(
+                f'UPDATE "{self.table_name}" SET doc = {_bumped("?", "doc")}, metadata = ?, properties = ? '
+                f"WHERE id = ? AND is_deleted = 0{returning}",
+                (*values[1:], values[0]),
+            ).fetchone()
+            if row is None:
+                raise RepositoryError(f"Entity {values[0]} not found for update")
+        elif mode == WriteMode.INSERT_ONLY:
+            row = connection.execute(
+                f'INSERT INTO "{self.table_name}" (id, doc, metadata, properties) VALUES (?, ?, ?, ?){returning}',
+                values,
+            ).fetchone()
+        else:
+            row = connection.execute(self._upsert_sql() + returning, values).fetchone()
+        return row[0]
+
+    def _upsert_sql(self) -> str:
+        """Upsert statement for one row of ``(id, doc, metadata, properties)``."""
+        stored = f'"{self.table_name}".doc'
+        return (
+            f'INSERT INTO "{self.table_name}" (id, doc, metadata, properties) VALUES (?, ?, ?, ?) '
+            f"ON CONFLICT (id) DO UPDATE SET doc = {_bumped('excluded.doc', stored)}, metadata = excluded.metadata, "
+            "properties = excluded.properties, is_deleted = 0, deleted_at = NULL"
+        )
+
+    def insert(self, entity: T) -> T:
+        """
+        Insert a new entity without conflict handling.
+
+        Args:
+            entity: Entity to insert
+
+        Returns:
+            The saved entity
+
+        Raises:
+            RepositoryError: If the entity already exists or the insert fails
+        """
+        return self.save(entity, mode=WriteMode.INSERT_ONLY)
+
+    def update(self, entity: T) -> T:
+        """
+        Update an existing entity without conflict handling.
+
+        Args:
+            entity: Entity to update
+
+        Returns:
+            The saved entity
+
+        Raises:
+            RepositoryError: If the entity does not exist or the update fails
+        """
+        return self.save(entity, mode=WriteMode.UPDATE_ONLY)
+
+    def patch(
+        self,
+        entity_id: str,
+        changes: dict[str, Any],
+        expected_revision: Optional[int] = None,
+    ) -> Optional[T]:
+        """
+        Update only the given fields of an entity in one write transaction.
+
+        The row is read, checked against ``expected_revision`` and rewritten
+        with the next revision while the transaction holds the write lock,
+        so conditional patches from concurrent writers cannot interleave.
+
+        Args:
+            entity_id: Unique identifier of the entity
+            changes: Mapping of field name to new value
+            expected_revision: Revision the stored entity must have
+                (None = unconditional update)
+
+        Returns:
+            Updated entity, or None if not found
+
+        Raises:
+            ValueError: If a field is not a field of the entity, or is its
+                ID or revision
+            ConcurrencyError: If the stored revision differs from ``expected_revision``
+            RepositoryError: If the write fails
+        """
+        table = self.table_name
+        try:
+            with self.pool.transaction() as connection:
+                row = connection.execute(
+                    f'SELECT doc, metadata, properties FROM "{table}" WHERE id = ? AND is_deleted = 0',
+                    (str(entity_id),),
+                ).fetchone()
+                if row is None:
+                    return None
+                entity = self._decode(*row)
+                revision = getattr(entity, "revision", None)
+                apply_patch(entity, entity_id, changes, expected_revision)
+                bump_revision(entity, revision)
+                values = self._encode(entity)
+                connection.execute(
+                    f'UPDATE "{table}" SET doc = ?, metadata = ?, properties = ? WHERE id = ?',
+                    (*values[1:], str(entity_id)),
+                )
+                self._reindex_search(connection, [str(entity_id)])
+        except sqlite3.Error as e:
+            raise RepositoryError(f"Failed to patch entity: {e}") from e
+        return entity
+
+    def update_where(
+        self,
+        filters: Optional[dict[str, Any]],
+        changes: dict[str, Any],
+        where: Optional[FilterExpr] = None,
+    ) -> int:
+        """
+        Set the given fields on every matching entity with one ``UPDATE``.
+
+        Changed fields are written into the entity JSON with ``json_set``
+        (``metadata`` and ``properties`` are replaced) and the revision is
+        incremented, so matching rows are never decoded. Their full-text
+        entries are refreshed in the same transaction.
+
+        Args:
+            filters: Dictionary of field:value filters
+            changes: Mapping of field name to new value
+            where: Filter expression applied on top of ``filters``
+
+        Returns:
+            Number of entities updated
+
+        Raises:
+            ValueError: If no filter is given or a field cannot be updated
+            RepositoryError: If the write fails
+        """
+        require_update_filter(filters, where)
+        if self.id_field in changes:
+            raise ValueError(f"Cannot update the {self.id_field} field")
+        if self._codec is not None:
+            unknown = set(changes) - set(self._codec.fields)
+            if unknown:
+                raise ValueError(f"Unknown fields for {self.entity_type.__name__}: {sorted(unknown)}")
+        if not changes:
+            return 0
+
+        paths: list[str] = []
+        assignments: list[str] = []
+        params: list[Any] = []
+        column_params: list[Any] = []
+        for name, value in changes.items():
+            encoded = json.dumps(encode_value(value), default=_json_default)
+            if name in JSON_COLUMNS:
+                assignments.append(f"{name} = ?")
+                column_params.append(encoded)
+            else:
+                paths.append(f"'$.{validate_column(name)}', json(?)")
+                params.append(encoded)
+        doc = f"json_set(doc, {', '.join(paths)})" if paths else "doc"
+        assignments.insert(0, f"doc = {_bumped(doc, 'doc')}")
+        params.extend(column_params)
+
+        sql = f'UPDATE "{self.table_name}" SET {", ".join(assignments)} WHERE is_deleted = 0'
+        condition = self._where(filters, where)
+        if condition is not None:
+            sql += f" AND {self._render_where(condition, params)}"
+
+        try:
+            with self.pool.transaction() as connection:
+                ids = [row[0] for row in connection.execute(f"{sql} RETURNING id", params).fetchall()]
+                self._reindex_search(connection, ids)
+        except sqlite3.Error as e:
+            raise RepositoryError(f"Failed to update entities: {e}") from e
+        return len(ids)
+
+    def save_many(self, entities: list[T]) -> list[T]:
+        """
+        Upsert several entities with one ``executemany`` in one transaction.
+
+        The new revisions are read back, one query per batch, and set on
+        the entities.
+
+        Args:
+            entities: Entities to save
+
+        Returns:
+            Saved entities, in input order
+
+        Raises:
+            RepositoryError: If an entity has no ID or the write fails
+        """
+        rows = [self._encode(entity) for entity in entities]
+        if not rows:
+            return []
+
+        ids = list(dict.fromkeys(row[0] for row in rows))
+        revisions: dict[str, Optional[int]] = {}
+        try:
+            with self.pool.transaction() as connection:
+                connection.executemany(self._upsert_sql(), rows)
+                self._reindex_search(connection, ids)
+                for chunk in self._chunks(ids):
+                    placeholders = ", ".join("?" * len(chunk))
+                    revisions.update(
+                        connection.execute(
+                            f"SELECT id, json_extract(doc, '$.revision') "
+                            f'FROM "{self.table_name}" WHERE id IN ({placeholders})',
+                            chunk,
+                        ).fetchall()
+                    )
+        except sqlite3.Error as e:
+            raise RepositoryError(f"Failed to save entities: {e}") from e
+        for entity, row in zip(entities, rows, strict=True):
+            _set_revision(entity, revisions.get(row[0]))
+        return list(entities)
+
+    def delete(self, entity_id: str, hard: bool = False) -> bool:
+        """
+        Delete an entity by ID.
+
+        Args:
+            entity_id: Unique identifier of the entity
+            hard: If True, remove the row; if False, soft delete (default)
+
+        Returns:
+            True if entity was deleted, False if not found
+
+        Raises:
+            RepositoryError: If delete operation fails
+        """
+        return self.delete_many([entity_id], hard=hard) > 0
+
+    def delete_many(self, entity_ids: list[str], hard: bool = False) -> int:
+        """
+        Delete several entities, one statement per batch, in one transaction.
+
+        Args:
+            entity_ids: Identifiers of the entities to delete
+            hard: If True, remove the rows; if False, soft delete (default)
+
+        Returns:
+            Number of entities deleted
+
+        Raises:
+            RepositoryError: If delete operation fails
+        """
+        ids = [str(entity_id) for entity_id in dict.fromkeys(entity_ids)]
+
+        try:
+            with self.pool.transaction() as connection:
+                return self._delete_rows(connection, ids, hard)
+        except sqlite3.Error as e:
+            raise RepositoryError(f"Failed to delete entities: {e}") from e
+
+    def _delete_rows(self, connection: sqlite3.Connection, ids: list[str], hard: bool) -> int:
+        """
+        Delete rows by ID inside an open transaction, one statement per batch.
+
+        Args:
+            connection: Connection with an open write transaction
+            ids: Distinct IDs of the rows to delete
+            hard: If True, remove the rows; if False, soft delete
+
+        Returns:
+            Number of rows deleted
+        """
+        if hard:
+            self._reindex_search(connection, ids, remove_only=True)
+        deleted = 0
+        for chunk in self._chunks(ids):
+            placeholders = ", ".join("?" * len(chunk))
+            if hard:
+                cursor = connection.execute(f'DELETE FROM "{self.table_name}" WHERE id IN ({placeholders})', chunk)
+            else:
+                cursor = connection.execute(
+                    f'UPDATE "{self.table_name}" SET doc = {_bumped("doc", "doc")}, is_deleted = 1, deleted_at = ? '
+                    f"WHERE id IN ({placeholders}) AND is_deleted = 0",
+                    (datetime.utcnow().isoformat(), *chunk),
+                )
+            deleted += cursor.rowcount
+        return deleted
+
+    def commit(self, batch: WriteBatch[T]) -> list[Any]:
+        """
+        Apply a batch in one write transaction.
+
+        Any failing write rolls the whole batch back.
+
+        Args:
+            batch: Writes to apply
+
+        Returns:
+            One result per write (see ``WriteBatch.results``)
+
+        Raises:
+            ConcurrencyError: If a conditional save finds another revision
+            RepositoryError: If an insert finds an existing entity, an
+                update a missing one, or the write fails
+        """
+        results: list[Any] = []
+        written: list[str] = []
+        revisions: list[tuple[Any, Optional[int]]] = []
+        try:
+            with self.pool.transaction() as connection:
+                for write in batch.writes:
+                    if write.is_delete:
+                        results.append(self._delete_rows(connection, [write.entity_id], write.hard) > 0)
+                        continue
+                    values = self._encode(write.entity)
+                    revision = self._write_row(
+                        connection, values, write.mode or WriteMode.UPSERT, write.expected_revision
+                    )
+                    revisions.append((write.entity, revision))
+                    written.append(values[0])
+                    results.append(write.entity)
+                self._reindex_search(connection, list(dict.fromkeys(written)))
+        except sqlite3.IntegrityError as e:
+            raise RepositoryError(f"Batch insert conflicts with an existing entity: {e}") from e
+        except sqlite3.Error as e:
+            raise RepositoryError(f"Failed to commit batch: {e}") from e
+        for entity, revision in revisions:
+            _set_revision(entity, revision)
+        return results
+
+    # Reads
+
+    def get(self, entity_id: str) -> Optional[T]:
+        """
+        Retrieve an entity by ID.
+
+        Args:
+            entity_id: Unique identifier of the entity
+
+        Returns:
+            Entity if found and not soft-deleted, None otherwise
+
+        Raises:
+            RepositoryError: If retrieval operation fails
+        """
+        rows = self._query(
+            f'SELECT doc, metadata, properties FROM "{self.table_name}" WHERE id = ? AND is_deleted = 0',
+            (str(entity_id),),
+        )
+        return self._decode(*rows[0]) if rows else None
+
+    def exists(self, entity_id: str) -> bool:
+        """
+        Check if an entity exists.
+
+        Args:
+            entity_id: Unique identifier of the entity
+
+        Returns:
+            True if the entity exists and is not soft-deleted
+
+        Raises:
+            RepositoryError: If existence check fails
+        """
+        rows = self._query(
+            f'SELECT 1 FROM "{self.table_name}" WHERE id = ? AND is_deleted = 0', (str(entity_id),)
+        )
+        return bool(rows)
+
+    def get_many(self, entity_ids: list[str]) -> list[T]:
+        """
+        Retrieve several entities with one statement per batch.
+
+        Args:
+            entity_ids: Identifiers of the entities to retrieve
+
+        Returns:
+            Entities that were found, in the order of ``entity_ids``
+
+        Raises:
+            RepositoryError: If retrieval operation fails
+        """
+        ids = [str(entity_id) for entity_id in dict.fromkeys(entity_ids)]
+        found: dict[str, T] = {}
+        for chunk in self._chunks(ids):
+            rows = self._query(
+                f'SELECT id, doc, metadata, properties FROM "{self.table_name}" '
+                f"WHERE id IN ({', '.join('?' * len(chunk))}) AND is_deleted = 0",
+                chunk,
+            )
+            found.update((row[0], self._decode(*row[1:])) for row in rows)
+        return [found[str(entity_id)] for entity_id in entity_ids if str(entity_id) in found]
+
+    def list(
+        self,
+        filters: Optional[dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[str] = None,
+    ) -> list[T]:
+        """
+        List entities with optional filtering and pagination.
+
+        Without ``order_by`` entities are returned in insertion order.
+
+        Args:
+            filters: Dictionary of field:value filters
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+            order_by: Field name to order by (prefix with '-' for descending)
+
+        Returns:
+            List of entities matching criteria
+
+        Raises:
+            RepositoryError: If list operation fails
+        """
+        return self.list_where(self._where(filters), limit=limit, offset=offset, order_by=order_by)
+
+    def list_where(
+        self,
+        where: Optional[FilterExpr],
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[str] = None,
+    ) -> list[T]:
+        """
+        List entities matching a filter expression in one statement.
+
+        Args:
+            where: Filter expression (None = all entities)
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+            order_by: Field name to order by (prefix with '-' for descending)
+
+        Returns:
+            List of matching entities
+
+        Raises:
+            RepositoryError: If list operation fails
+        """
+        params: list[Any] = []
+        sql = self._select(where, params)
+        sql += self._order_clause(*parse_order_by(order_by, self.id_field)) if order_by else " ORDER BY rowid"
+        if limit is not None or offset:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend((limit if limit is not None else -1, offset or 0))
+        return [self._decode(*row) for row in self._query(sql, params)]
+
+    def list_page(
+        self,
+        filters: Optional[dict[str, Any]] = None,
+        limit: int = 20,
+        order_by: Optional[str] = None,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        where: Optional[FilterExpr] = None,
+    ) -> KeysetPage[T]:
+        """
+        List one page of entities using keyset (cursor) pagination.
+
+        The cursor becomes a ``(field, id)`` range condition, so each page
+        is an index range scan whatever its depth. One extra row is fetched
+        to detect whether more rows follow.
+
+        Args:
+            filters: Dictionary of field:value filters
+            limit: Maximum number of results to return
+            order_by: Field name to order by (prefix with '-' for descending)
+            after: Cursor of the page to continue after
+            before: Cursor of the page to go back from
+            where: Filter expression applied on top of ``filters``
+
+        Returns:
+            Page of entities with next/previous cursors
+
+        Raises:
+            ValueError: If a cursor is malformed
+            RepositoryError: If list operation fails
+        """
+        field, descending = parse_order_by(order_by, self.id_field)
+        if before is not None:
+            descending = not descending
+        column = self._column(field)
+
+        params: list[Any] = []
+        sql = self._select(self._where(filters, where), params, extra=f", {column}, id")
+        token = before or after
+        if token:
+            value, last_id = decode_cursor(token)
+            op = "<" if descending else ">"
+            if field == self.id_field:
+                sql += f" AND id {op} ?"
+                params.append(last_id)
+            else:
+                sql += f" AND ({column} {op} ? OR ({column} = ? AND id {op} ?))"
+                params.extend((self._param(value), self._param(value), last_id))
+        sql += self._order_clause(field, descending) + " LIMIT ?"
+        params.append(limit + 1)
+
+        rows = self._query(sql, params)
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if before is not None:
+            rows.reverse()
+
+        page: KeysetPage[T] = KeysetPage(items=[self._decode(*row[:3]) for row in rows])
+        if rows:
+            first_cursor = encode_cursor(rows[0][3], rows[0][4])
+            last_cursor = encode_cursor(rows[-1][3], rows[-1][4])
+            if before is not None:
+                page.prev_cursor = first_cursor if has_more else None
+                page.next_cursor = last_cursor
+            else:
+                page.next_cursor = last_cursor if has_more else None
+                page.prev_cursor = first_cursor if after else None
+        return page
+
+    def count(self, filters: Optional[dict[str, Any]] = None) -> int:
+        """
+        Count entities matching filters.
+
+        Args:
+            filters: Dictionary of field:value filters
+
+        Returns:
+            Number of entities matching criteria
+
+        Raises:
+            RepositoryError: If count operation fails
+        """
+        return self.count_where(self._where(filters))
+
+    def count_where(self, where: Optional[FilterExpr]) -> int:
+        """
+        Count entities matching a filter expression.
+
+        Args:
+            where: Filter expression (None = all entities)
+
+        Returns:
+            Number of matching entities
+
+        Raises:
+            RepositoryError: If count operation fails
+        """
+        params: list[Any] = []
+        sql = f'SELECT count(*) FROM "{self.table_name}" WHERE is_deleted = 0'
+        if where is not None:
+            sql += f" AND {self._render_where(where, params)}"
+        return self._query(sql, params)[0][0]
+
+    # Search
+
+    def search(
+        self,
+        query: str,
+        fields: Optional[list[str]] = None,
+        limit: Optional[int] = None,
+    ) -> list[T]:
+        """
+        Search entities using text search, most relevant first.
+
+        Equivalent to ``search_ranked`` in AUTO mode.
+
+        Args:
+            query: Search query string
+            fields: List of field names to search in (None = search all text fields)
+            limit: Maximum number of results to return
+
+        Returns:
+            List of entities matching search criteria
+
+        Raises:
+            RepositoryError: If search operation fails
+        """
+        return self.search_ranked(query, fields=fields, limit=limit)
+
+    def search_ranked(
+        self,
+        query: str,
+        fields: Optional[list[str]] = None,
+        limit: Optional[int] = None,
+        mode: SearchMode = SearchMode.AUTO,
+        where: Optional[FilterExpr] = None,
+    ) -> list[T]:
+        """
+        Search entities in one ranked query.
+
+        Full-text matches come from the FTS5 index, ordered by ``bm25``;
+        every query word must match. Short queries, SUBSTRING mode and
+        fields outside the full-text index use ``LIKE`` matching in
+        insertion order. SQLite has no trigram index here, so TRIGRAM mode
+        also uses ``LIKE``.
+
+        Args:
+            query: Search query string
+            fields: List of field names to search in (None = search all text fields)
+            limit: Maximum number of results to return
+            mode: How query text is matched
+            where: Filter expression matches must also satisfy
+
+        Returns:
+            List of matching entities ordered by relevance
+
+        Raises:
+            RepositoryError: If search operation fails
+        """
+        text = query.strip()
+        search_fields = list(fields or self.search_fields)
+        tokens = _TOKEN.findall(text)
+
+        fulltext = mode == SearchMode.FULLTEXT or (
+            mode == SearchMode.AUTO and len(text) >= MIN_FULLTEXT_QUERY_LENGTH and tokens
+        )
+        if fulltext and set(search_fields) <= set(self.search_fields):
+            if not tokens:
+                return []
+            return self._fulltext(tokens, search_fields, limit, where)
+
+        if fulltext and self.logger is not None:
+            self.logger.debug("SQLite search field outside the full-text index", fields=search_fields)
+        return self._substring(text, search_fields, limit, where)
+
+    def _fulltext(
+        self,
+        tokens: list[str],
+        fields: list[str],
+        limit: Optional[int],
+        where: Optional[FilterExpr],
+    ) -> list[T]:
+        """Run an FTS5 query for all tokens over the given indexed fields."""
+        table, fts = self.table_name, f"{self.table_name}_fts"
+        match = " ".join(f'"{token}"' for token in tokens)
+        if set(fields) != set(self.search_fields):
+            match = f"{{{' '.join(fields)}}} : ({match})"
+
+        params: list[Any] = [match]
+        sql = (
+            f'SELECT t.doc, t.metadata, t.properties FROM "{fts}" '
+            f'JOIN "{table}" AS t ON t.rowid = "{fts}".rowid '
+            f'WHERE "{fts}" MATCH ? AND t.is_deleted = 0'
+        )
+        if where is not None:
+            sql += f" AND {self._render_where(where, params)}"
+        sql += f' ORDER BY bm25("{fts}")'
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [self._decode(*row) for row in self._query(sql, params)]
+
+    def _substring(
+        self,
+        text: str,
+        fields: list[str],
+        limit: Optional[int],
+        where: Optional[FilterExpr],
+    ) -> list[T]:
+        """Match the query as a case-insensitive substring of any field."""
+        escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        params: list[Any] = []
+        sql = self._select(where, params)
+        like = " OR ".join(f"{self._column(field)} LIKE ? ESCAPE '\\'" for field in fields)
+        sql += f" AND ({like})"
+        params.extend([f"%{escaped}%"] * len(fields))
+        sql += " ORDER BY rowid"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [self._decode(*row) for row in self._query(sql, params)]
+
+
+def _bumped(doc: str, stored: str) -> str:
+    """SQL for ``doc`` with its revision set to the one in ``stored`` plus one (if it has one)."""
+    return f"json_replace({doc}, '$.revision', coalesce(json_extract({stored}, '$.revision'), 0) + 1)"
+
+
+def _set_revision(entity: Any, revision: Optional[int]) -> None:
+    """Copy a revision written by the database onto the saved entity."""
+    if revision is not None and hasattr(entity, "revision"):
+        entity.revision = revision
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize enums, datetimes and UUIDs found in entity fields."""
+    converted = keyset_value(value)
+    return converted if converted is not value else str(value)
@@ -5,22 +5,74 @@ This module provides Supabase-based implementations of the repository
 pattern for data persistence.
 """
 
+from atoms_mcp.adapters.secondary.supabase.async_repository import AsyncSupabaseRepository
 from atoms_mcp.adapters.secondary.supabase.connection import (
     SupabaseConnection,
     SupabaseConnectionError,
+    configure_existence_filters,
+    configure_query_stats,
+    configure_read_routing,
+    get_async_client,
+    get_async_replica_client,
+    get_circuit_breaker,
     get_client,
     get_client_with_retry,
     get_connection,
+    get_connection_metrics,
+    get_existence_filter,
+    get_query_recorder,
+    get_read_router,
+    get_replica_client,
+    record_write,
     reset_connection,
+    start_health_monitor,
 )
+from atoms_mcp.adapters.secondary.supabase.existence import ExistenceFilter
+from atoms_mcp.adapters.secondary.supabase.health import (
+    CircuitBreaker,
+    CircuitState,
+    ConnectionHealthMonitor,
+)
+from atoms_mcp.adapters.secondary.supabase.query_stats import QueryRecorder, QueryShape, QueryStatsExporter
 from atoms_mcp.adapters.secondary.supabase.repository import SupabaseRepository
+from atoms_mcp.adapters.secondary.supabase.routing import (
+    ConsistencyToken,
+    ReadRouter,
+    consistency_session,
+    current_consistency_token,
+)
 
 __all__ = [
+    "AsyncSupabaseRepository",
+    "CircuitBreaker",
+    "CircuitState",
+    "ConnectionHealthMonitor",
+    "ConsistencyToken",
+    "ExistenceFilter",
+    "QueryRecorder",
+    "QueryShape",
+    "QueryStatsExporter",
+    "ReadRouter",
     "SupabaseConnection",
     "SupabaseConnectionError",
     "SupabaseRepository",
+    "configure_existence_filters",
+    "configure_query_stats",
+    "configure_read_routing",
+    "consistency_session",
+    "current_consistency_token",
+    "get_async_client",
+    "get_async_replica_client",
+    "get_circuit_breaker",
     "get_client",
     "get_client_with_retry",
     "get_connection",
+    "get_connection_metrics",
+    "get_existence_filter",
+    "get_query_recorder",
+    "get_read_router",
+    "get_replica_client",
+    "record_write",
     "reset_connection",
+    "start_health_monitor",
 ]
@@ -0,0 +1,202 @@
+"""
+Server-side aggregation for Supabase tables.
+
+Aggregates run as a single call to a Postgres function exposed through
+PostgREST RPC, which groups rows with ``GROUP BY`` (and ``date_trunc`` for
+time buckets) so only one row per group leaves the database. Filters are
+sent as a JSON tree and compiled into the ``WHERE`` clause by a helper
+function. ``AGGREGATE_FUNCTION_SQL`` holds both definitions, shipped in
+supabase/migrations.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from atoms_mcp.domain.ports.aggregation import (
+    DEFAULT_METRICS,
+    Metric,
+    TimeBucket,
+    validate_group_key,
+)
+from atoms_mcp.domain.ports.filters import AllOf, AnyOf, FilterExpr, FilterOp, and_, eq
+from atoms_mcp.domain.ports.pagination import keyset_value
+from atoms_mcp.domain.ports.projection import validate_column
+
+# Name of the Postgres function called over RPC
+AGGREGATE_FUNCTION = "atoms_aggregate"
+
+# Name of the helper compiling JSON filter trees into SQL predicates
+FILTER_FUNCTION = "atoms_filter_sql"
+
+AGGREGATE_FUNCTION_SQL = f"""
+-- Compiles a JSON filter tree ({{"and": [...]}}, {{"or": [...]}} or
+-- {{"field": ..., "op": ..., "value": ...}}) into a predicate on alias t.
+create or replace function {FILTER_FUNCTION}(p_filter jsonb) returns text
+language plpgsql immutable
+as $$
+declare
+    v_parts text[];
+    v_column text;
+    v_values text;
+begin
+    if p_filter is null then
+        return 'true';
+    end if;
+
+    if p_filter ? 'and' or p_filter ? 'or' then
+        select array_agg({FILTER_FUNCTION}(member)) into v_parts
+        from jsonb_array_elements(coalesce(p_filter->'and', p_filter->'or')) as member;
+        return '(' || array_to_string(
+            coalesce(v_parts, array[(p_filter ? 'and')::text]),
+            case when p_filter ? 'and' then ' and ' else ' or ' end
+        ) || ')';
+    end if;
+
+    v_column := format('t.%I', p_filter->>'field');
+    case p_filter->>'op'
+        when 'eq' then return format('%s = %L', v_column, p_filter->>'value');
+        when 'neq' then return format('%s <> %L', v_column, p_filter->>'value');
+        when 'gt' then return format('%s > %L', v_column, p_filter->>'value');
+        when 'gte' then return format('%s >= %L', v_column, p_filter->>'value');
+        when 'lt' then return format('%s < %L', v_column, p_filter->>'value');
+        when 'lte' then return format('%s <= %L', v_column, p_filter->>'value');
+        when 'ilike' then return format('%s::text ilike %L', v_column, p_filter->>'value');
+        when 'contains' then return format('%s @> %L::jsonb', v_column, p_filter->'value');
+        when 'is_null' then
+            return v_column || case when (p_filter->>'value')::boolean
+                then ' is null' else ' is not null' end;
+        when 'in' then
+            select string_agg(quote_literal(value), ', ') into v_values
+            from jsonb_array_elements_text(p_filter->'value') as value;
+            return coalesce(format('%s in (%s)', v_column, v_values), 'false');
+        else
+            raise exception 'unsupported filter operator: %', p_filter->>'op';
+    end case;
+end;
+$$;
+
+-- Aggregates one table in a single statement, one JSON object per group.
+-- Group keys are columns or column.key JSON paths; metrics are
+-- {{"func", "field", "alias"}} objects.
+create or replace function {AGGREGATE_FUNCTION}(
+    p_table text,
+    p_group_by text[] default '{{}}',
+    p_metrics jsonb default '[{{"func": "count", "alias": "count"}}]',
+    p_filter jsonb default null,
+    p_time_bucket text default null,
+    p_time_field text default 'created_at'
+) returns setof jsonb
+language plpgsql stable
+as $$
+declare
+    v_select text[] := '{{}}';
+    v_group text[] := '{{}}';
+    v_key text;
+    v_expr text;
+    v_metric jsonb;
+begin
+    foreach v_key in array p_group_by loop
+        if position('.' in v_key) > 0 then
+            v_expr := format('t.%I->>%L', split_part(v_key, '.', 1), split_part(v_key, '.', 2));
+        else
+            v_expr := format('t.%I', v_key);
+        end if;
+        v_select := v_select || format('%s as %I', v_expr, v_key);
+        v_group := v_group || v_expr;
+    end loop;
+
+    if p_time_bucket is not null then
+        v_expr := format('date_trunc(%L, t.%I)', p_time_bucket, p_time_field);
+        v_select := v_select || (v_expr || ' as bucket');
+        v_group := v_group || v_expr;
+    end if;
+
+    for v_metric in select * from jsonb_array_elements(p_metrics) loop
+        if v_metric->>'func' not in ('count', 'sum', 'avg', 'min', 'max') then
+            raise exception 'unsupported aggregate: %', v_metric->>'func';
+        end if;
+        v_select := v_select || format('%s(%s) as %I',
+            v_metric->>'func',
+            case when v_metric->>'field' is null then '*'
+                 else format('t.%I', v_metric->>'field') end,
+            v_metric->>'alias');
+    end loop;
+
+    return query execute format(
+        'select to_jsonb(r) from (select %s from %I t where %s%s) r',
+        array_to_string(v_select, ', '),
+        p_table,
+        {FILTER_FUNCTION}(p_filter),
+        case when cardinality(v_group) > 0
+            then ' group by ' || array_to_string(v_group, ', ') else '' end);
+end;
+$$;
+"""
+
+
+def aggregate_params(
+    table_name: str,
+    group_by: Optional[list[str]],
+    metrics: Optional[list[Metric]],
+    filters: Optional[dict[str, Any]],
+    time_bucket: Optional[TimeBucket],
+    time_field: str,
+    where: Optional[FilterExpr],
+) -> dict[str, Any]:
+    """
+    Build the RPC arguments for ``AGGREGATE_FUNCTION``.
+
+    Args:
+        table_name: Table to aggregate
+        group_by: Group keys: column names or ``column.key`` JSON paths
+        metrics: Metrics to compute (None = row count)
+        filters: Dictionary of field:value filters
+        time_bucket: Bucket rows by ``time_field`` truncated to this size
+        time_field: Datetime column used for bucketing
+        where: Filter expression applied on top of ``filters``
+
+    Returns:
+        Keyword arguments for the function call
+
+    Raises:
+        ValueError: If a group key, metric or field name is invalid
+    """
+    conditions = [eq(field, value) for field, value in (filters or {}).items() if value is not None]
+    if where is not None:
+        conditions.append(where)
+
+    return {
+        "p_table": table_name,
+        "p_group_by": [validate_group_key(key) for key in group_by or []],
+        "p_metrics": [
+            {"func": metric.func.value, "field": metric.field, "alias": metric.alias}
+            for metric in metrics or DEFAULT_METRICS
+        ],
+        "p_filter": filter_tree(and_(*conditions)) if conditions else None,
+        "p_time_bucket": TimeBucket(time_bucket).value if time_bucket is not None else None,
+        "p_time_field": validate_column(time_field),
+    }
+
+
+def filter_tree(where: FilterExpr) -> dict[str, Any]:
+    """
+    Serialize a filter expression into the JSON tree ``FILTER_FUNCTION`` reads.
+
+    Args:
+        where: Filter expression
+
+    Returns:
+        JSON-compatible filter tree
+    """
+    if isinstance(where, (AllOf, AnyOf)):
+        group = "and" if isinstance(where, AllOf) else "or"
+        return {group: [filter_tree(member) for member in where.filters]}
+
+    if where.op == FilterOp.IN:
+        value = [keyset_value(item) for item in where.value]
+    elif where.op in (FilterOp.CONTAINS, FilterOp.IS_NULL):
+        value = where.value
+    else:
+        value = keyset_value(where.value)
+    return {"field": where.field, "op": where.op.value, "value": value}
@@ -0,0 +1,1073 @@
+"""
+Asynchronous Supabase repository implementation.
+
+This module provides a concrete implementation of the AsyncRepository port
+on top of the shared async Supabase client, so MCP tools can await database
+calls without blocking the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from typing import Any, Generic, Optional, TypeVar
+
+from postgrest import CountMethod
+from postgrest.exceptions import APIError
+
+from atoms_mcp.adapters.secondary.supabase.aggregate import AGGREGATE_FUNCTION, aggregate_params
+from atoms_mcp.adapters.secondary.supabase.batch import BATCH_FUNCTION, batch_conflict, batch_params
+from atoms_mcp.adapters.secondary.supabase.connection import (
+    get_async_client,
+    get_async_replica_client,
+    record_write,
+)
+from atoms_mcp.adapters.secondary.supabase.repository import (
+    REVISION_COLUMN,
+    SupabaseEntityMapper,
+)
+from atoms_mcp.adapters.secondary.supabase.search import SEARCH_FUNCTION, equality_filter, is_missing_function
+from atoms_mcp.domain.ports.aggregation import Metric, TimeBucket
+from atoms_mcp.domain.ports.async_repository import AsyncRepository
+from atoms_mcp.domain.ports.filters import FilterExpr
+from atoms_mcp.domain.ports.pagination import KeysetPage, decode_cursor
+from atoms_mcp.domain.ports.projection import normalize_columns
+from atoms_mcp.domain.ports.repository import RepositoryError, SearchMode, WriteBatch, WriteMode, require_update_filter
+
+T = TypeVar("T")
+
+
+class AsyncSupabaseRepository(SupabaseEntityMapper[T], AsyncRepository[T], Generic[T]):
+    """
+    Supabase implementation of the AsyncRepository port.
+
+    Shares serialization and query building with SupabaseRepository and
+    issues every request through the process-wide async client.
+
+    Type parameter T represents the entity type managed by this repository.
+    """
+
+    async def _read_client(self) -> Any:
+        """Client for a read: a replica unless the session is pinned to the primary."""
+        return await get_async_replica_client() or await get_async_client()
+
+    async def _write_client(self) -> Any:
+        """Primary client for a write; pins the current session to the primary."""
+        client = await get_async_client()
+        record_write()
+        return client
+
+    async def save(self, entity: T, mode: WriteMode = WriteMode.UPSERT) -> T:
+        """
+        Save an entity to Supabase in a single request.
+
+        By default performs a native upsert on the ID column; callers that
+        know the intent can skip conflict handling with ``mode``.
+
+        Args:
+            entity: Entity to save
+            mode: UPSERT (default), INSERT_ONLY or UPDATE_ONLY
+
+        Returns:
+            Saved entity with any generated fields
+
+        Raises:
+            RepositoryError: If save operation fails, or no row matched an
+                UPDATE_ONLY save
+        """
+        try:
+            client = await self._write_client()
+            data = self._serialize_entity(entity)
+
+            response = await self._execute_async(
+                self._save_query(client.table(self.table_name), data, mode)
+            )
+
+            if not response.data:
+                if mode == WriteMode.UPDATE_ONLY:
+                    raise RepositoryError(f"Entity {data.get(self.id_field)} not found for update")
+                raise RepositoryError("Save operation returned no data")
+
+            return self._deserialize_entity(response.data[0])
+
+        except APIError as e:
+            raise RepositoryError(f"Supabase API error during save: {e}") from e
+        except Exception as e:
+            raise RepositoryError(f"Failed to save entity: {e}") from e
+
+    async def insert(self, entity: T) -> T:
+        """
+        Insert a new entity without conflict handling.
+
+        Args:
+            entity: Entity to insert
+
+        Returns:
+            Saved entity with any generated fields
+
+        Raises:
+            RepositoryError: If the entity already exists or the insert fails
+        """
+        return await self.save(entity, mode=WriteMode.INSERT_ONLY)
+
+    async def update(self, entity: T) -> T:
+        """
+        Update an existing entity without conflict handling.
+
+        Args:
+            entity: Entity to update
+
+        Returns:
+            Saved entity
+
+        Raises:
+            RepositoryError: If the entity does not exist or the update fails
+        """
+        return await self.save(entity, mode=WriteMode.UPDATE_ONLY)
+
+    async def get(self, entity_id: str) -> Optional[T]:
+        """
+        Retrieve an entity by ID.
+
+        Args:
+            entity_id: Unique identifier of the entity
+
+        Returns:
+            Entity if found and not soft-deleted, None otherwise
+
+        Raises:
+            RepositoryError: If retrieval operation fails
+        """
+        if self._definitely_missing(entity_id):
+            return None
+
+        try:
+            row = await self._fetch_row(entity_id, "*")
+
+            if row is None:
+                self._note_false_positives()
+                return None
+
+            return self._deserialize_entity(row)
+
+        except APIError as e:
+            raise RepositoryError(f"Supabase API error during get: {e}") from e
+        except Exception as e:
+            raise RepositoryError(f"Failed to get entity: {e}") from e
+
+    async def get_projected(self, entity_id: str, columns: list[str]) -> Optional[dict[str, Any]]:
+        """
+        Retrieve selected columns of an entity by ID.
+
+        Args:
+            entity_id: Unique identifier of the entity
+            columns: Column names to return
+
+        Returns:
+            Row with the requested columns, or None if not found or soft-deleted
+
+        Raises:
+            ValueError: If the projection is invalid
+            RepositoryError: If retrieval operation fails
+        """
+        select = self._select_columns(columns)
+        if self._definitely_missing(entity_id):
+            return None
+
+        try:
+            return await self._fetch_row(entity_id, select)
+
+        except APIError as e:
+            raise RepositoryError(f"Supabase API error during get: {e}") from e
+        except Exception as e:
+            raise RepositoryError(f"Failed to get entity: {e}") from e
+
+    async def _fetch_row(self, entity_id: str, select: str) -> Optional[dict[str, Any]]:
+        """
+        Fetch one live row by ID.
+
+        Args:
+            entity_id: Unique identifier of the entity
+            select: Columns to select
+
+        Returns:
+            Row data, or None if not found or soft-deleted
+        """
+        client = await self._read_client()
+
+        response = await self._execute_async(
+            client.table(self.table_name)
+            .select(select)
+            .eq(self.id_field, entity_id)
+            .eq("is_deleted", False)
+            .maybe_single()
+        )
+
+        return response.data if response is not None else None
+
+    async def patch(
+        self,
+        entity_id: str,
+        changes: dict[str, Any],
+        expected_revision: Optional[int] = None,
+    ) -> Optional[T]:
+        """
+        Update only the given columns of an entity in one request.
+
+        With ``expected_revision`` the update is conditional on the
+        ``revision`` column and increments it (see ``SupabaseRepository.patch``).
+
+        Args:
+            entity_id: Unique identifier of the entity
+            changes: Mapping of field name to new value
+            expected_revision: Revision the row must have (None = unconditional)
+
+        Returns:
+            Updated entity, or None if not found
+
+        Raises:
+            ValueError: If a field is not a column of the entity type
+            ConcurrencyError: If the row has another revision
+            RepositoryError: If the update fails
+        """
+        if not changes and expected_revision is None:
+            return await self.get(entity_id)
+
+        try:
+            client = await self._write_client()
+            response = await self._execute_async(
+                self._patch_query(client.table(self.table_name), entity_id, changes, expected_revision)
+            )
+            if response.data:
+                return self._deserialize_entity(response.data[0])
+            row = await self._fetch_row(entity_id, REVISION_COLUMN) if expected_revision is not None else None
+
+        except (ValueError, RepositoryError):
+            raise
+        except APIError as e:
+            raise RepositoryError(f"Supabase API error during patch: {e}") from e
+        except Exception as e:
+            raise RepositoryError(f"Failed to patch entity: {e}") from e
+
+        self._patch_conflict(entity_id, expected_revision, row)
+        return None
+
+    async def update_where(
+        self,
+        filters: Optional[dict[str, Any]],
+        changes: dict[str, Any],
+        where: Optional[FilterExpr] = None,
+    ) -> int:
+        """
+        Set the given columns on every matching row with one ``UPDATE``.
+
+        Args:
+            filters: Dictionary of field:value filters
+            changes: Mapping of field name to new value
+            where: Filter expression applied on top of ``filters``
+
+        Returns:
+            Number of entities updated
+
+        Raises:
+            ValueError: If no filter is given or a field is not a column
+            RepositoryError: If the update fails
+        """
+        if not changes:
+            require_update_filter(filters, where)
+            return 0
+
+        try:
+            client = await self._write_client()
+            response = await self._execute_async(
+                self._update_where_query(client.table(self.table_name), filters, changes, where)
+            )
+            self._note_live_rows(response.data)
+            return len(response.data)
+
+        except (ValueError, RepositoryError):
+            raise
+        except APIError as e:
+            raise RepositoryError(f"Supabase API error during update_where: {e}") from e
+        except Exception as e:
+            raise RepositoryError(f"Failed to update entities: {e}") from e
+
+    async def commit(self, batch: WriteBatch[T]) -> list[Any]:
+        """
+        Apply a batch atomically with one call to ``BATCH_FUNCTION``.
+
+        See ``SupabaseRepository.commit``.
+
+        Args:
+            batch: Writes to apply
+
+        Returns:
+            One result per write (see ``WriteBatch.results``)
+
+        Raises:
+            ConcurrencyError: If a conditional save finds another revision
+            RepositoryError: If a write fails; no write of the batch is kept
+        """
+        if self.batch_available:
+            try:
+                client = await self._write_client()
+                response = await self._execute_async(
+                    client.rpc(BATCH_FUNCTION, batch_params(self.table_name, self._batch_writes(batch)))
+                )
+                return self._batch_results(batch, response.data)
+            except APIError as e:
+                conflict = batch_conflict(e)
+                if conflict is not None:
+                    raise conflict from e
+                if not is_missing_function(e):
+                    raise RepositoryError(f"Supabase API error during commit: {e}") from e
+                self.batch_available = False
+                self._warn_fallback(BATCH_FUNCTION, "non-atomic writes")
+            except RepositoryError:
+                raise
+            except Exception as e:
+                raise RepositoryError(f"Failed to commit batch: {e}") from e
+
+        return await super().commit(batch)
+
+    async def delete(self, entity_id: str, hard: bool = False) -> bool:
+        """
+        Delete an entity by ID.
+
+        Args:
+            entity_id: Unique identifier of the entity
+            hard: If True, perform hard delete; if False, soft delete (default)
+
+        Returns:
+            True if entity was deleted, False if not found
+
+        Raises:
+            RepositoryError: If delete operation fails
+        """
+        try:
+            client = await self._write_client()
+
+            if hard:
+                response = await self._execute_async(
+                    client.table(self.table_name)
+                    .delete()
+                    .eq(self.id_field, entity_id)
+                )
+            else:
+                response = await self._execute_async(
+                    client.table(self.table_name)
+                    .update({"is_deleted": True, "deleted_at": datetime.utcnow().isoformat()})
+                    .eq(self.id_field, entity_id)
+                    .eq("is_deleted", False)
+                )
+
+            self._note_deletes(len(response.data))
+            return len(response.data) > 0
+
+        except APIError as e:
+            raise RepositoryError(f"Supabase API error during delete: {e}") from e
+        except Exception as e:
+            raise RepositoryError(f"Failed to delete entity: {e}") from e
+
+    async def list(
+        self,
+        filters: Optional[dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[str] = None,
+    ) -> list[T]:
+        """
+        List entities with optional filtering and pagination.
+
+        Args:
+            filters: Dictionary of field:value filters
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+            order_by: Field name to order by (prefix with '-' for descending)
+
+        Returns:
+            List of entities matching criteria
+
+        Raises:
+            RepositoryError: If list operation fails
+        """
+        try:
+            rows = await self._fetch_rows("*", filters, limit, offset, order_by)
+
+            return [self._deserialize_entity(item) for item in rows]
+
+        except APIError as e:
+            raise RepositoryError(f"Supabase API error during list: {e}") from e
+        except Exception as e:
+            raise RepositoryError(f"Failed to list entities: {e}") from e
+
+    async def list_projected(
+        self,
+        columns: list[str],
+        filters: Optional[dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[str] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        List selected columns of entities with optional filtering and pagination.
+
+        Args:
+            columns: Column names to return
+            filters: Dictionary of field:value filters
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+            order_by: Field name to order by (prefix with '-' for descending)
+
+        Returns:
+            Rows with the requested columns
+
+        Raises:
+            ValueError: If the projection is invalid
+            RepositoryError: If list operation fails
+        """
+        select = self._select_columns(columns)
+
+        try:
+            return await self._fetch_rows(select, filters, limit, offset, order_by)
+
+        except APIError as e:
+            raise RepositoryError(f"Supabase API error during list: {e}") from e
+        except Exception as e:
+            raise RepositoryError(f"Failed to list entities: {e}") from e
+
+    async def _fetch_rows(
+        self,
+        select: str,
+        filters: Optional[dict[str, Any]],
+        limit: Optional[int],
+        offset: Optional[int],
+        order_by: Optional[str],
+        where: Optional[FilterExpr] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch rows matching filters with ordering and pagination.
+
+        Args:
+            select: Columns to select
+            filters: Dictionary of field:value filters
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+            order_by: Field name to order by (prefix with '-' for descending)
+            where: Filter expression applied on top of ``filters``
+
+        Returns:
+            Row data
+        """
+        client = await self._read_client()
+
+        query = client.table(self.table_name).select(select)
+        query = self._apply_filters(query, filters)
+        query = self._apply_where(query, where)
+        query = self._apply_pagination(query, limit, offset, order_by)
+
+        return (await self._execute_async(query)).data
+
+    async def list_page(
+        self,
+        filters: Optional[dict[str, Any]] = None,
+        limit: int = 20,
+        order_by: Optional[str] = None,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        where: Optional[FilterExpr] = None,
+    ) -> KeysetPage[T]:
+        """
+        List one page of entities using keyset (cursor) pagination.
+
+        The boundary is pushed into the query as ``(field, id) > (value,
+        id)``, so every page costs the same regardless of depth. The order
+        field should be non-null.
+
+        Args:
+            filters: Dictionary of field:value filters
+            limit: Maximum number of results to return
+            order_by: Field name to order by (prefix with '-' for descending)
+            after: Cursor of the page to continue after
+            before: Cursor of the page to go back from
+            where: Filter expression applied on top of ``filters``
+
+        Returns:
+            Page of entities with next/previous cursors
+
+        Raises:
+            ValueError: If a cursor is malformed
+            RepositoryError: If list operation fails
+        """
+        # Reject malformed cursors before touching the network
+        for cursor in (after, before):
+            if cursor:
+                decode_cursor(cursor)
+
+        try:
+            client = await self._read_client()
+
+            query = client.table(self.table_name).select("*")
+            query = self._apply_filters(query, filters)
+            query = self._apply_where(query, where)
+            query = self._apply_keyset(query, limit, order_by, after, before)
+
+            response = await self._execute_async(query)
+
+            return self._keyset_page(response.data, limit, order_by, after, before)
+
+        except APIError as e:
+            raise RepositoryError(f"Supabase API error during list_page: {e}") from e
+        except Exception as e:
+            raise RepositoryError(f"Failed to list entities: {e}") from e
+
+    async def list_where(
+        self,
+        where: FilterExpr,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[str] = None,
+    ) -> list[T]:
+        """
+        List entities matching a filter expression, filtered by the database.
+
+        Args:
+            where: Filter expression
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+            order_by: Field name to order by (prefix with '-' for descending)
+
+        Returns:
+            List of matching entities
+
+        Raises:
+            RepositoryError: If list operation fails
+        """
+        try:
+            rows = await self._fetch_rows("*", None, limit, offset, order_by, where)
+
+            return [self._deserialize_entity(item) for item in rows]
+
+        except APIError as e:
+            raise RepositoryError(f"Supabase API error during list: {e}") from e
+        except Exception as e:
+            raise RepositoryError(f"Failed to list entities: {e}") from e
+
+    async def search(
+        self,
+        query: str,
+        fields: Optional[list[str]] = None,
+        limit: Optional[int] = None,
+    ) -> list[T]:
+        """
+        Search entities using text search, most relevant first.
+
+        Equivalent to ``search_ranked`` in AUTO mode.
+
+        Args:
+            query: Search query string
+            fields: List of field names to search in (None = search all text fields)
+            limit: Maximum number of results to return
+
+        Returns:
+            List of entities matching search criteria
+
+        Raises:
+            RepositoryError: If search operation fails
+        """
+        return await self.search_ranked(query, fields=fields, limit=limit)
+
+    async def search_ranked(
+        self,
+        query: str,
+        fields: Optional[list[str]] = None,
+        limit: Optional[int] = None,
+        mode: SearchMode = SearchMode.AUTO,
+        where: Optional[FilterExpr] = None,
+    ) -> list[T]:
+        """
+        Search entities in one ranked query.
+
+        Args:
+            query: Search query string
+            fields: List of field names to search in (None = search all text fields)
+            limit: Maximum number of results to return
+            mode: How query text is matched
+            where: Filter expression matches must also satisfy
+
+        Returns:
+            List of matching entities ordered by relevance
+
+        Raises:
+            RepositoryError: If search operation fails
+        """
+        try:
+            rows = await self._ranked_rows(query, fields, limit, mode, None, where)
+            return [self._deserialize_entity(item) for item in rows]
+
+        except Exception as e:
+            raise RepositoryError(f"Failed to search entities: {e}") from e
+
+    async def search_projected(
+        self,
+        query: str,
+        columns: list[str],
+        fields: Optional[list[str]] = None,
+        limit: Optional[int] = None,
+        mode: SearchMode = SearchMode.AUTO,
+        where: Optional[FilterExpr] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Search entities and return selected columns.
+
+        Args:
+            query: Search query string
+            columns: Column names to return
+            fields: List of field names to search in (None = search all text fields)
+            limit: Maximum number of results to return
+            mode: How query text is matched (see ``search_ranked``)
+            where: Filter expression matches must also satisfy
+
+        Returns:
+            Rows with the requested columns
+
+        Raises:
+            ValueError: If the projection is invalid
+            RepositoryError: If search operation fails
+        """
+        normalize_columns(columns, self.id_field)
+
+        try:
+            return await self._ranked_rows(query, fields, limit, mode, columns, where)
+
+        except Exception as e:
+            raise RepositoryError(f"Failed to search entities: {e}") from e
+
+    async def _ranked_rows(
+        self,
+        query: str,
+        fields: Optional[list[str]],
+        limit: Optional[int],
+        mode: SearchMode,
+        columns: Optional[list[str]],
+        where: Optional[FilterExpr] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch matching rows through the search function, best match first.
+
+        Falls back to concurrent per-field ilike queries in SUBSTRING mode,
+        when the database lacks the search function, or when ``where`` is
+        more than a conjunction of equalities.
+
+        Args:
+            query: Search query string
+            fields: List of field names to search in (None = search all text fields)
+            limit: Maximum number of results
+            mode: How query text is matched
+            columns: Columns to return (None = whole rows)
+            where: Filter expression matches must also satisfy
+
+        Returns:
+            Matching rows
+        """
+        filter_values = equality_filter(where)
+        if mode != SearchMode.SUBSTRING and self.ranked_search_available and filter_values is not None:
+            client = await self._read_client()
+            try:
+                response = await self._execute_async(
+                    self._search_rpc(client, query, fields, limit, mode, columns, filter_values)
+                )
+                return response.data or []
+            except APIError as e:
+                if not is_missing_function(e):
+                    raise
+                self.ranked_search_available = False
+                self._warn_fallback(SEARCH_FUNCTION, "substring matching")
+
+        return await self._search_rows(query, fields, limit, self._select_columns(columns), where)
+
+    async def _search_rows(
+        self,
+        query: str,
+        fields: Optional[list[str]],
+        limit: Optional[int],
+        select: str,
+        where: Optional[FilterExpr] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch live rows whose text fields match the query, in one request.
+
+        See ``SupabaseRepository._search_rows``.
+
+        Args:
+            query: Search query string
+            fields: List of field names to search in (None = search all text fields)
+            limit: Maximum number of results
+            select: Columns to select
+            where: Filter expression rows must also satisfy
+
+        Returns:
+            Matching rows
+        """
+        client = await self._read_client()
+        while True:
+            request = self._substring_search(client, query, fields, limit, select, where)
+            if request is None:
+                return []
+            try:
+                return (await self._execute_async(request)).data
+            except APIError as e:
+                if not self._skip_missing_field(e, fields):
+                    raise
+
+    async def count(self, filters: Optional[dict[str, Any]] = None) -> int:
+        """
+        Count entities matching filters.
+
+        Issued as a HEAD request, so no rows are transferred.
+
+        Args:
+            filters: Dictionary of field:value filters
+
+        Returns:
+            Number of entities matching criteria
+
+        Raises:
+            RepositoryError: If count operation fails
+        """
+        return await self._count(filters, CountMethod.exact)
+
+    async def count_planned(self, filters: Optional[dict[str, Any]] = None) -> int:
+        """
+        Estimate the number of entities matching filters.
+
+        Uses the Postgres planner's row estimate, which costs the same no
+        matter how many rows match but may be off after bulk changes until
+        the table is analyzed.
+
+        Args:
+            filters: Dictionary of field:value filters
+
+        Returns:
+            Estimated number of entities matching criteria
+
+        Raises:
+            RepositoryError: If count operation fails
+        """
+        return await self._count(filters, CountMethod.planned)
+
+    async def count_where(self, where: FilterExpr) -> int:
+        """
+        Count entities matching a filter expression with a HEAD request.
+
+        Args:
+            where: Filter expression
+
+        Returns:
+            Number of matching entities
+
+        Raises:
+            RepositoryError: If count operation fails
+        """
+        return await self._count(None, CountMethod.exact, where)
+
+    async def aggregate(
+        self,
+        group_by: Optional[list[str]] = None,
+        metrics: Optional[list[Metric]] = None,
+        filters: Optional[dict[str, Any]] = None,
+        time_bucket: Optional[TimeBucket] = None,
+        time_field: str = "created_at",
+        where: Optional[FilterExpr] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Aggregate entities per group in one ``GROUP BY`` query.
+
+        Runs through the aggregate function over RPC; a database without
+        it falls back to streaming entities and aggregating in memory.
+
+        Args:
+            group_by: Group keys: column names or ``column.key`` JSON paths
+            metrics: Metrics to compute (None = row count)
+            filters: Dictionary of field:value filters
+            time_bucket: Bucket rows by ``time_field`` truncated to this size
+            time_field: Datetime column used for bucketing
+            where: Filter expression applied on top of ``filters``
+
+        Returns:
+            One row per group holding the group values, the start of the
+            bucket under ``"bucket"`` and one entry per metric alias
+
+        Raises:
+            ValueError: If a group key or metric is invalid
+            RepositoryError: If the aggregation fails
+        """
+        params = aggregate_params(
+            self.table_name, group_by, metrics, filters, time_bucket, time_field, where
+        )
+
+        if self.aggregate_available:
+            try:
+                client = await self._read_client()
+                response = await self._execute_async(client.rpc(AGGREGATE_FUNCTION, params))
+                return response.data or []
+            except APIError as e:
+                if not is_missing_function(e):
+                    raise RepositoryError(f"Supabase API error during aggregate: {e}") from e
+                self.aggregate_available = False
+                self._warn_fallback(AGGREGATE_FUNCTION, "in-memory aggregation")
+            except Exception as e:
+                raise RepositoryError(f"Failed to aggregate entities: {e}") from e
+
+        return await super().aggregate(group_by, metrics, filters, time_bucket, time_field, where)
+
+    async def _count(
+        self,
+        filters: Optional[dict[str, Any]],
+        method: CountMethod,
+        where: Optional[FilterExpr] = None,
+    ) -> int:
+        """
+        Run a head-only count request.
+
+        Args:
+            filters: Dictionary of field:value filters
+            method: PostgREST count method
+            where: Filter expression applied on top of ``filters``
+
+        Returns:
+            Count reported by PostgREST
+
+        Raises:
+            RepositoryError: If count operation fails
+        """
+        try:
+            client = await self._read_client()
+
+            query = client.table(self.table_name).select(self.id_field, count=method, head=True)
+            query = self._apply_filters(query, filters)
+            query = self._apply_where(query, where)
+
+            response = await self._execute_async(query)
+
+            return response.count or 0
+
+        except APIError as e:
+            raise RepositoryError(f"Supabase API error during count: {e}") from e
+        except Exception as e:
+            raise RepositoryError(f"Failed to count entities: {e}") from e
+
+    async def exists(self, entity_id: str) -> bool:
+        """
+        Check if an entity exists.
+
+        Args:
+            entity_id: Unique identifier of the entity
+
+        Returns:
+            True if entity exists and is not soft-deleted, False otherwise
+
+        Raises:
+            RepositoryError: If existence check fails
+        """
+        if self._definitely_missing(entity_id):
+            return False
+
+        try:
+            client = await self._read_client()
+
+            response = await self._execute_async(
+                client.table(self.table_name)
+                .select(self.id_field, count="exact")
+                .eq(self.id_field, entity_id)
+                .eq("is_deleted", False)
+            )
+
+            if not response.count:
+                self._note_false_positives()
+                return False
+            return True
+
+        except APIError as e:
+            raise RepositoryError(f"Supabase API error during exists check: {e}") from e
+        except Exception as e:
+            raise RepositoryError(f"Failed to check entity existence: {e}") from e
+
+    async def refresh_existence_filter(self) -> int:
+        """
+        Rebuild the existence filter from a scan of the table's live IDs.
+
+        See ``SupabaseRepository.refresh_existence_filter``.
+
+        Returns:
+            Number of IDs scanned (0 without an existence filter)
+
+        Raises:
+            RepositoryError: If the scan fails; the previous filter is kept
+        """
+        existence = self.existence_filter
+        if existence is None:
+            return 0
+        try:
+            expected = await self.count_planned()
+        except RepositoryError:
+            expected = 0
+
+        scanned = 0
+        try:
+            with existence.rebuilding(expected) as add:
+                client = await get_async_client()
+                after: Optional[str] = None
+                while True:
+                    response = await self._execute_async(self._id_scan_query(client.table(self.table_name), after))
+                    for row in response.data:
+                        add(row[self.id_field])
+                    scanned += len(response.data)
+                    if len(response.data) < self.batch_size:
+                        break
+                    after = str(response.data[-1][self.id_field])
+        except APIError as e:
+            raise RepositoryError(f"Supabase API error during existence filter rebuild: {e}") from e
+        except RepositoryError:
+            raise
+        except Exception as e:
+            raise RepositoryError(f"Failed to rebuild existence filter: {e}") from e
+        return scanned
+
+    def _start_existence_rebuild(self) -> None:
+        """Rebuild the existence filter in a task on the running event loop."""
+        self._existence_rebuild = asyncio.get_running_loop().create_task(self._rebuild_existence_filter())
+
+    async def _rebuild_existence_filter(self) -> None:
+        """Run a background rebuild; failures are counted by the filter and retried."""
+        try:
+            await self.refresh_existence_filter()
+        except RepositoryError:
+            pass
+
+    async def get_many(self, entity_ids: list[str]) -> list[T]:
+        """
+        Retrieve several entities with one ``in`` select per chunk.
+
+        Chunks are fetched concurrently.
+
+        Args:
+            entity_ids: Identifiers of the entities to retrieve
+
+        Returns:
+            Entities that were found and are not soft-deleted, in the order
+            of ``entity_ids``
+
+        Raises:
+            RepositoryError: If retrieval operation fails
+        """
+        candidates = [
+            entity_id for entity_id in dict.fromkeys(entity_ids) if not self._definitely_missing(entity_id)
+        ]
+        if not candidates:
+            return []
+
+        try:
+            client = await self._read_client()
+
+            responses = await asyncio.gather(
+                *(
+                    self._execute_async(
+                        client.table(self.table_name)
+                        .select("*")
+                        .in_(self.id_field, chunk)
+                        .eq("is_deleted", False)
+                    )
+                    for chunk in self._chunks(candidates)
+                )
+            )
+
+            rows = [item for response in responses for item in response.data]
+            self._note_false_positives(len(candidates) - len(rows))
+            return self._order_by_ids(rows, entity_ids)
+
+        except APIError as e:
+            raise RepositoryError(f"Supabase API error during get_many: {e}") from e
+        except Exception as e:
+            raise RepositoryError(f"Failed to get entities: {e}") from e
+
+    async def save_many(self, entities: list[T]) -> list[T]:
+        """
+        Save several entities with one multi-row upsert per chunk.
+
+        Args:
+            entities: Entities to save
+
+        Returns:
+            Saved entities with any generated fields
+
+        Raises:
+            RepositoryError: If save operation fails
+        """
+        if not entities:
+            return []
+
+        try:
+            client = await self._write_client()
+            rows = [self._serialize_entity(entity) for entity in entities]
+
+            saved = []
+            for chunk in self._chunks(rows):
+                response = await self._execute_async(
+                    client.table(self.table_name).upsert(chunk, on_conflict=self.id_field)
+                )
+                if len(response.data) != len(chunk):
+                    raise RepositoryError(
+                        f"Batch save returned {len(response.data)} rows for {len(chunk)} entities"
+                    )
+                saved.extend(self._deserialize_entity(item) for item in response.data)
+
+            return saved
+
+        except APIError as e:
+            raise RepositoryError(f"Supabase API error during save_many: {e}") from e
+        except Exception as e:
+            raise RepositoryError(f"Failed to save entities: {e}") from e
+
+    async def delete_many(self, entity_ids: list[str], hard: bool = False) -> int:
+        """
+        Delete several entities with one statement per chunk.
+
+        Args:
+            entity_ids: Identifiers of the entities to delete
+            hard: If True, perform hard delete; if False, soft delete (default)
+
+        Returns:
+            Number of entities deleted
+
+        Raises:
+            RepositoryError: If delete operation fails
+        """
+        if not entity_ids:
+            return 0
+
+        try:
+            client = await self._write_client()
+            deleted_at = datetime.utcnow().isoformat()
+
+            deleted = 0
+            for chunk in self._chunks(list(dict.fromkeys(entity_ids))):
+                if hard:
+                    query = client.table(self.table_name).delete().in_(self.id_field, chunk)
+                else:
+                    query = (
+                        client.table(self.table_name)
+                        .update({"is_deleted": True, "deleted_at": deleted_at})
+                        .in_(self.id_field, chunk)
+                        .eq("is_deleted", False)
+                    )
+                response = await self._execute_async(query)
+                deleted += len(response.data)
+
+            self._note_deletes(deleted)
+            return deleted
+
+        except APIError as e:
+            raise RepositoryError(f"Supabase API error during delete_many: {e}") from e
+        except Exception as e:
+            raise RepositoryError(f"Failed to delete entities: {e}") from e
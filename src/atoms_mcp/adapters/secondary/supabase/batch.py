@@ -0,0 +1,163 @@
+"""
+Atomic batch writes for Supabase tables.
+
+A ``WriteBatch`` is sent as one call to a Postgres function exposed through
+PostgREST RPC. PostgREST runs each call in its own transaction, so the
+inserts, upserts, updates and deletes of a batch are applied together or
+not at all, in a single round trip. ``BATCH_FUNCTION_SQL`` holds its
+definition, shipped in supabase/migrations.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Optional
+
+from atoms_mcp.domain.ports.repository import ConcurrencyError, WriteMode
+
+# Name of the Postgres function called over RPC
+BATCH_FUNCTION = "atoms_write_batch"
+
+# SQLSTATE raised by the function when a conditional write finds another revision
+CONFLICT_SQLSTATE = "40001"
+
+# Operation names understood by the function, per write mode
+BATCH_OPERATIONS = {
+    WriteMode.UPSERT: "save",
+    WriteMode.INSERT_ONLY: "insert",
+    WriteMode.UPDATE_ONLY: "update",
+}
+
+BATCH_FUNCTION_SQL = f"""
+-- Applies a list of writes to one table in a single transaction.
+-- Each write is {{"op": "insert" | "save" | "update", "id": ..., "row": {{...}}}}
+-- or {{"op": "delete", "id": ..., "hard": bool}}; saves and updates may add
+-- "expected_revision" to apply only to a row with that revision. Row keys
+-- that are not columns of the table are ignored. Returns one element per
+-- write: the written row, or whether a delete found the row. Any error
+-- (duplicate insert, update of a missing row, revision conflict) aborts
+-- the whole batch; conflicts use SQLSTATE {CONFLICT_SQLSTATE} with the
+-- revisions as JSON detail.
+create or replace function {BATCH_FUNCTION}(
+    p_table text,
+    p_writes jsonb
+) returns jsonb
+language plpgsql volatile
+as $$
+declare
+    v_write jsonb;
+    v_row jsonb;
+    v_columns text;
+    v_updates text;
+    v_upserts text;
+    v_count integer;
+    v_expected integer;
+    v_current integer;
+    v_results jsonb := '[]'::jsonb;
+begin
+    for v_write in select value from jsonb_array_elements(p_writes) loop
+        if v_write->>'op' = 'delete' then
+            if coalesce((v_write->>'hard')::boolean, false) then
+                execute format('delete from %I where id::text = $1', p_table)
+                using v_write->>'id';
+            else
+                execute format(
+                    'update %I set is_deleted = true, deleted_at = now()'
+                    ' where id::text = $1 and not is_deleted', p_table)
+                using v_write->>'id';
+            end if;
+            get diagnostics v_count = row_count;
+            v_results := v_results || jsonb_build_array(v_count > 0);
+            continue;
+        end if;
+
+        select string_agg(format('%I', c.column_name), ', '),
+               string_agg(format('%I = r.%I', c.column_name, c.column_name), ', '),
+               string_agg(format('%I = excluded.%I', c.column_name, c.column_name), ', ')
+        into v_columns, v_updates, v_upserts
+        from information_schema.columns c
+        where c.table_schema = 'public' and c.table_name = p_table
+          and v_write->'row' ? c.column_name::text;
+
+        v_row := null;
+        v_expected := (v_write->>'expected_revision')::integer;
+        if v_write->>'op' = 'update' then
+            execute format(
+                'update %I t set %s from jsonb_populate_record(null::%I, $1) r'
+                ' where t.id::text = $2 and not t.is_deleted'
+                ' and ($3::integer is null or t.revision = $3) returning to_jsonb(t)',
+                p_table, v_updates, p_table)
+            into v_row using v_write->'row', v_write->>'id', v_expected;
+        elsif v_write->>'op' in ('insert', 'save') then
+            execute format(
+                'insert into %I as t (%s) select %s from jsonb_populate_record(null::%I, $1) r %s'
+                ' returning to_jsonb(t)',
+                p_table, v_columns, v_columns, p_table,
+                case when v_write->>'op' = 'save'
+                    then 'on conflict (id) do update set ' || v_upserts
+                        || ' where $2::integer is null or t.revision = $2' else '' end)
+            into v_row using v_write->'row', v_expected;
+        else
+            raise exception 'Unknown batch operation %', v_write->>'op';
+        end if;
+
+        if v_row is null then
+            v_current := null;
+            if v_expected is not null then
+                execute format('select revision from %I where id::text = $1 and not is_deleted', p_table)
+                into v_current using v_write->>'id';
+            end if;
+            if v_current is not null then
+                raise exception 'Entity % was modified concurrently', v_write->>'id'
+                    using errcode = '{CONFLICT_SQLSTATE}',
+                          detail = jsonb_build_object(
+                              'id', v_write->>'id',
+                              'expected_revision', v_expected,
+                              'current_revision', v_current)::text;
+            end if;
+            raise exception 'Entity % not found for update', v_write->>'id'
+                using errcode = 'no_data_found';
+        end if;
+        v_results := v_results || jsonb_build_array(v_row);
+    end loop;
+    return v_results;
+end;
+$$;
+"""
+
+
+def batch_params(table_name: str, writes: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Build the RPC arguments for ``BATCH_FUNCTION``.
+
+    Args:
+        table_name: Table written to
+        writes: Serialized writes (see ``BATCH_FUNCTION_SQL``)
+
+    Returns:
+        Keyword arguments for the function call
+    """
+    return {"p_table": table_name, "p_writes": writes}
+
+
+def batch_conflict(error: Any) -> Optional[ConcurrencyError]:
+    """
+    Translate a revision conflict reported by ``BATCH_FUNCTION``.
+
+    Args:
+        error: Error raised by the RPC call (``postgrest.APIError``)
+
+    Returns:
+        The matching ``ConcurrencyError``, or None for other errors
+    """
+    if getattr(error, "code", None) != CONFLICT_SQLSTATE:
+        return None
+    try:
+        detail = json.loads(getattr(error, "details", None) or "{}")
+    except (TypeError, ValueError):
+        detail = {}
+    return ConcurrencyError(
+        str(detail.get("id", "")),
+        detail.get("expected_revision", 0),
+        detail.get("current_revision"),
+    )
@@ -2,20 +2,38 @@
 Supabase connection management.
 
 This module handles Supabase client initialization, connection pooling,
-and configuration for database operations.
+and configuration for database operations. Writes always use the primary
+client; reads can be routed to read replicas (see ``routing``).
 """
 
 from __future__ import annotations
 
+import asyncio
 import os
 import time
-from typing import Optional
-
-from supabase import Client, create_client
-from supabase.lib.client_options import ClientOptions
-
+from typing import Any, Optional
+
+import httpx
+from supabase import AsyncClient, Client, acreate_client, create_client
+from supabase.lib.client_options import AsyncClientOptions, ClientOptions
+
+from atoms_mcp.adapters.secondary.supabase.existence import ExistenceFilter
+from atoms_mcp.adapters.secondary.supabase.health import (
+    CircuitBreaker,
+    ConnectionHealthMonitor,
+)
+from atoms_mcp.adapters.secondary.supabase.query_stats import QueryRecorder, QueryStatsExporter
+from atoms_mcp.adapters.secondary.supabase.routing import ConsistencyToken, ReadRouter
 from atoms_mcp.infrastructure.config.settings import DatabaseSettings, get_settings
 
+# Exceptions that indicate the database is unreachable (as opposed to a
+# request the database rejected); only these trip the circuit breaker.
+CONNECTION_ERRORS: tuple[type[BaseException], ...] = (
+    httpx.TransportError,
+    ConnectionError,
+    TimeoutError,
+)
+
 
 class SupabaseConnectionError(Exception):
     """Exception raised for Supabase connection errors."""
@@ -29,11 +47,18 @@ class SupabaseConnection:
 
     This class provides a singleton pattern for Supabase client management,
     ensuring efficient connection reuse and automatic retry on failures.
+    Connection health is tracked by a circuit breaker fed from real requests
+    and an optional background monitor, never by probing on the hot path.
     """
 
     _instance: Optional[SupabaseConnection] = None
     _client: Optional[Client] = None
+    _async_client: Optional[AsyncClient] = None
+    _async_lock: Optional[asyncio.Lock] = None
     _settings: Optional[DatabaseSettings] = None
+    _monitor: Optional[ConnectionHealthMonitor] = None
+    _replica_clients: dict[int, Client] = {}
+    _async_replica_clients: dict[int, AsyncClient] = {}
 
     def __new__(cls) -> SupabaseConnection:
         """Ensure singleton instance."""
@@ -94,6 +119,135 @@ class SupabaseConnection:
             raise SupabaseConnectionError("Supabase client is not initialized")
         return self._client
 
+    async def get_async_client(self) -> AsyncClient:
+        """
+        Get the shared asynchronous Supabase client.
+
+        The client is created lazily on first use and reused by every
+        async repository, so all coroutines share one HTTP connection pool.
+
+        Returns:
+            AsyncClient: Configured async Supabase client
+
+        Raises:
+            SupabaseConnectionError: If initialization fails
+        """
+        if not get_circuit_breaker().allow_request():
+            raise SupabaseConnectionError(
+                "Supabase circuit breaker is open; database marked unavailable"
+            )
+
+        if self._async_client is not None:
+            return self._async_client
+
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()
+
+        async with self._async_lock:
+            if self._async_client is None:
+                try:
+                    settings = self._settings or get_settings().database
+                    if not settings.url:
+                        raise SupabaseConnectionError("Supabase URL is not configured")
+                    if not settings.api_key:
+                        raise SupabaseConnectionError("Supabase API key is not configured")
+
+                    options = AsyncClientOptions(
+                        schema=settings.schema,
+                        auto_refresh_token=True,
+                        persist_session=True,
+                    )
+                    self._async_client = await acreate_client(
+                        supabase_url=settings.url,
+                        supabase_key=settings.api_key,
+                        options=options,
+                    )
+                except SupabaseConnectionError:
+                    raise
+                except Exception as e:
+                    raise SupabaseConnectionError(
+                        f"Failed to initialize async Supabase client: {e}"
+                    ) from e
+
+        return self._async_client
+
+    def _replica_url(self, number: int) -> tuple[DatabaseSettings, str]:
+        """Get the database settings and the URL of a 1-based replica number."""
+        settings = self._settings or get_settings().database
+        if not 1 <= number <= len(settings.replica_urls):
+            raise SupabaseConnectionError(f"Read replica {number} is not configured")
+        return settings, settings.replica_urls[number - 1]
+
+    def get_replica_client(self, number: int) -> Client:
+        """
+        Get the client of a read replica, creating it on first use.
+
+        Replicas are addressed with the primary's API key and schema.
+
+        Args:
+            number: 1-based replica number (see ``DatabaseSettings.replica_urls``)
+
+        Returns:
+            Client: Replica Supabase client
+
+        Raises:
+            SupabaseConnectionError: If the circuit is open or the client fails to initialize
+        """
+        if not get_circuit_breaker().allow_request():
+            raise SupabaseConnectionError(
+                "Supabase circuit breaker is open; database marked unavailable"
+            )
+
+        client = self._replica_clients.get(number)
+        if client is None:
+            settings, url = self._replica_url(number)
+            try:
+                client = create_client(
+                    supabase_url=url,
+                    supabase_key=settings.api_key,
+                    options=ClientOptions(schema=settings.schema),
+                )
+            except Exception as e:
+                raise SupabaseConnectionError(
+                    f"Failed to initialize Supabase replica client: {e}"
+                ) from e
+            self._replica_clients = {**self._replica_clients, number: client}
+        return client
+
+    async def get_async_replica_client(self, number: int) -> AsyncClient:
+        """
+        Get the async client of a read replica, creating it on first use.
+
+        Args:
+            number: 1-based replica number (see ``DatabaseSettings.replica_urls``)
+
+        Returns:
+            AsyncClient: Replica async Supabase client
+
+        Raises:
+            SupabaseConnectionError: If the circuit is open or the client fails to initialize
+        """
+        if not get_circuit_breaker().allow_request():
+            raise SupabaseConnectionError(
+                "Supabase circuit breaker is open; database marked unavailable"
+            )
+
+        client = self._async_replica_clients.get(number)
+        if client is None:
+            settings, url = self._replica_url(number)
+            try:
+                client = await acreate_client(
+                    supabase_url=url,
+                    supabase_key=settings.api_key,
+                    options=AsyncClientOptions(schema=settings.schema),
+                )
+            except Exception as e:
+                raise SupabaseConnectionError(
+                    f"Failed to initialize async Supabase replica client: {e}"
+                ) from e
+            self._async_replica_clients = {**self._async_replica_clients, number: client}
+        return client
+
     def get_client_with_retry(
         self,
         max_retries: int = 3,
@@ -101,10 +255,14 @@ class SupabaseConnection:
         backoff_factor: float = 2.0,
     ) -> Client:
         """
-        Get Supabase client with automatic retry on connection failures.
+        Get Supabase client, retrying client initialization on failure.
+
+        No request is made to check the connection: request outcomes are
+        recorded by the repositories and probes run in the background
+        health monitor. While the circuit breaker is open this fails fast.
 
         Args:
-            max_retries: Maximum number of retry attempts
+            max_retries: Maximum number of initialization attempts
             retry_delay: Initial delay between retries in seconds
             backoff_factor: Multiplier for retry delay on each attempt
 
@@ -112,30 +270,92 @@ class SupabaseConnection:
             Client: Configured Supabase client
 
         Raises:
-            SupabaseConnectionError: If all retry attempts fail
+            SupabaseConnectionError: If the circuit is open or all attempts fail
         """
+        if not get_circuit_breaker().allow_request():
+            raise SupabaseConnectionError(
+                "Supabase circuit breaker is open; database marked unavailable"
+            )
+
         last_error: Optional[Exception] = None
         delay = retry_delay
 
         for attempt in range(max_retries):
             try:
-                client = self.get_client()
-                # Test connection with a simple query
-                client.table("_health_check").select("*").limit(1).execute()
-                return client
+                if self._client is None:
+                    self._initialize_client()
+                return self.get_client()
             except Exception as e:
                 last_error = e
                 if attempt < max_retries - 1:
                     time.sleep(delay)
                     delay *= backoff_factor
-                    # Try to reinitialize client on error
                     self._client = None
-                    self._initialize_client()
 
         raise SupabaseConnectionError(
             f"Failed to connect to Supabase after {max_retries} attempts: {last_error}"
         ) from last_error
 
+    def check_health(self) -> None:
+        """
+        Probe the database with a minimal query.
+
+        Used by the background health monitor only. On failure the client
+        is dropped so the next request reinitializes it.
+
+        Raises:
+            Exception: If the probe fails
+        """
+        try:
+            self.get_client().table("_health_check").select("*").limit(1).execute()
+        except Exception:
+            self._client = None
+            raise
+
+    def start_health_monitor(self, interval: float = 30.0) -> ConnectionHealthMonitor:
+        """
+        Start the background health monitor.
+
+        Args:
+            interval: Seconds between scheduled probes
+
+        Returns:
+            The running monitor
+        """
+        if self._monitor is None:
+            self._monitor = ConnectionHealthMonitor(
+                probe=self._probe, breaker=get_circuit_breaker(), interval=interval
+            )
+        self._monitor.start()
+        return self._monitor
+
+    def stop_health_monitor(self) -> None:
+        """Stop the background health monitor if running."""
+        if self._monitor is not None:
+            self._monitor.stop()
+            self._monitor = None
+
+    def metrics(self) -> dict[str, Any]:
+        """
+        Get connection health metrics.
+
+        Returns:
+            Dictionary with circuit breaker and monitor metrics
+        """
+        return {
+            "connected": self.is_connected,
+            "circuit_breaker": get_circuit_breaker().metrics(),
+            "health_monitor": self._monitor.metrics() if self._monitor else None,
+            "read_routing": get_read_router().metrics(),
+            "existence_filters": existence_filter_metrics(),
+        }
+
+    def _probe(self) -> None:
+        """Reinitialize the client if needed, then probe it."""
+        if self._client is None:
+            self._initialize_client()
+        self.check_health()
+
     def reset(self) -> None:
         """
         Reset the connection (mainly for testing).
@@ -143,8 +363,13 @@ class SupabaseConnection:
         This clears the cached client instance and forces reinitialization
         on the next connection attempt.
         """
+        self.stop_health_monitor()
         self._client = None
+        self._async_client = None
+        self._async_lock = None
         self._settings = None
+        self._replica_clients = {}
+        self._async_replica_clients = {}
 
     @property
     def is_connected(self) -> bool:
@@ -160,6 +385,200 @@ class SupabaseConnection:
 # Global connection instance
 _connection: Optional[SupabaseConnection] = None
 
+# Global circuit breaker shared by every Supabase repository
+_circuit_breaker: Optional[CircuitBreaker] = None
+
+# Global read router; routes everything to the primary until configured
+_read_router: Optional[ReadRouter] = None
+
+# Global query-shape recorder shared by every Supabase repository
+_query_recorder: Optional[QueryRecorder] = None
+
+# Background export of the query stats, once configured with a file
+_query_stats_exporter: Optional[QueryStatsExporter] = None
+
+# Existence filters of the tables configured to keep one, by table name
+_existence_filters: dict[str, ExistenceFilter] = {}
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """
+    Get the global Supabase circuit breaker.
+
+    Returns:
+        CircuitBreaker: Shared breaker instance
+    """
+    global _circuit_breaker
+    if _circuit_breaker is None:
+        _circuit_breaker = CircuitBreaker()
+    return _circuit_breaker
+
+
+def get_read_router() -> ReadRouter:
+    """
+    Get the global read router.
+
+    Returns:
+        ReadRouter: Shared router instance
+    """
+    global _read_router
+    if _read_router is None:
+        _read_router = ReadRouter()
+    return _read_router
+
+
+def configure_read_routing(settings: Optional[DatabaseSettings] = None) -> ReadRouter:
+    """
+    Route reads to the read replicas configured in the database settings.
+
+    Args:
+        settings: Database settings (uses global settings if not provided)
+
+    Returns:
+        ReadRouter: The configured global router
+    """
+    settings = settings or get_settings().database
+    router = get_read_router()
+    router.configure(len(settings.replica_urls), settings.read_your_writes_window)
+    return router
+
+
+def get_query_recorder() -> QueryRecorder:
+    """
+    Get the global query-shape recorder.
+
+    Returns:
+        QueryRecorder: Shared recorder instance
+    """
+    global _query_recorder
+    if _query_recorder is None:
+        _query_recorder = QueryRecorder()
+    return _query_recorder
+
+
+def configure_query_stats(settings: Optional[DatabaseSettings] = None) -> QueryRecorder:
+    """
+    Apply the query stats settings and start exporting them if a file is set.
+
+    Args:
+        settings: Database settings (uses global settings if not provided)
+
+    Returns:
+        QueryRecorder: The configured global recorder
+    """
+    global _query_stats_exporter
+    settings = settings or get_settings().database
+    recorder = get_query_recorder()
+    recorder.configure(settings.slow_query_threshold, settings.query_stats_max_shapes, settings.query_stats_enabled)
+    if _query_stats_exporter is not None:
+        _query_stats_exporter.stop()
+        _query_stats_exporter = None
+    if settings.query_stats_enabled and settings.query_stats_path:
+        _query_stats_exporter = QueryStatsExporter(
+            recorder, settings.query_stats_path, settings.query_stats_export_interval
+        )
+        _query_stats_exporter.start()
+    return recorder
+
+
+def configure_existence_filters(settings: Optional[DatabaseSettings] = None) -> dict[str, ExistenceFilter]:
+    """
+    Create the existence filters of the tables listed in the database settings.
+
+    Repositories of a table share its filter; pass ``get_existence_filter``
+    of the table to each of them.
+
+    Args:
+        settings: Database settings (uses global settings if not provided)
+
+    Returns:
+        The configured filters by table name
+    """
+    settings = settings or get_settings().database
+    _existence_filters.clear()
+    for table_name in settings.existence_filter_tables:
+        _existence_filters[table_name] = ExistenceFilter(
+            capacity=settings.existence_filter_capacity,
+            error_rate=settings.existence_filter_error_rate,
+            rebuild_interval=settings.existence_filter_rebuild_interval,
+        )
+    return dict(_existence_filters)
+
+
+def get_existence_filter(table_name: str) -> Optional[ExistenceFilter]:
+    """
+    Get the existence filter of a table.
+
+    Args:
+        table_name: Name of the Supabase table
+
+    Returns:
+        The table's filter, or None if the table is not configured to keep one
+    """
+    return _existence_filters.get(table_name)
+
+
+def existence_filter_metrics() -> dict[str, dict[str, Any]]:
+    """
+    Get the metrics of the configured existence filters.
+
+    Returns:
+        Filter metrics (see ``ExistenceFilter.metrics``) by table name
+    """
+    return {table_name: existence.metrics() for table_name, existence in _existence_filters.items()}
+
+
+def get_replica_client() -> Optional[Client]:
+    """
+    Get a read replica client for the next read, if it may use one.
+
+    Returns:
+        Client: Replica client chosen round-robin, or None when no replica
+        is configured or the current session wrote recently and must read
+        from the primary
+
+    Raises:
+        SupabaseConnectionError: If the replica client cannot be used
+    """
+    number = get_read_router().route_read()
+    return get_connection().get_replica_client(number) if number else None
+
+
+async def get_async_replica_client() -> Optional[AsyncClient]:
+    """
+    Get an async read replica client for the next read, if it may use one.
+
+    Returns:
+        AsyncClient: Replica client, or None if the read must use the primary
+
+    Raises:
+        SupabaseConnectionError: If the replica client cannot be used
+    """
+    number = get_read_router().route_read()
+    return await get_connection().get_async_replica_client(number) if number else None
+
+
+def record_write() -> ConsistencyToken:
+    """
+    Pin the current session to the primary after a write.
+
+    Only code inside ``consistency_session`` is pinned.
+
+    Returns:
+        ConsistencyToken: Token to hand back to the caller
+    """
+    return get_read_router().record_write()
+
+
+def record_request_success() -> None:
+    """Record a successful Supabase request."""
+    get_circuit_breaker().record_success()
+
+
+def record_request_failure() -> None:
+    """Record a Supabase request that failed to reach the database."""
+    get_circuit_breaker().record_failure()
+
 
 def get_connection() -> SupabaseConnection:
     """
@@ -187,6 +606,19 @@ def get_client() -> Client:
     return get_connection().get_client()
 
 
+async def get_async_client() -> AsyncClient:
+    """
+    Get the shared async Supabase client from global connection.
+
+    Returns:
+        AsyncClient: Configured async Supabase client
+
+    Raises:
+        SupabaseConnectionError: If connection fails
+    """
+    return await get_connection().get_async_client()
+
+
 def get_client_with_retry(
     max_retries: int = 3,
     retry_delay: float = 1.0,
@@ -209,9 +641,58 @@ def get_client_with_retry(
     return get_connection().get_client_with_retry(max_retries, retry_delay, backoff_factor)
 
 
+def start_health_monitor(
+    settings: Optional[DatabaseSettings] = None,
+) -> ConnectionHealthMonitor:
+    """
+    Configure the circuit breaker and start the background health monitor.
+
+    Args:
+        settings: Database settings (uses global settings if not provided)
+
+    Returns:
+        ConnectionHealthMonitor: Running monitor
+    """
+    settings = settings or get_settings().database
+    breaker = get_circuit_breaker()
+    breaker.failure_threshold = settings.circuit_failure_threshold
+    breaker.reset_timeout = settings.circuit_reset_timeout
+    return get_connection().start_health_monitor(settings.health_check_interval)
+
+
+def get_connection_metrics() -> dict[str, Any]:
+    """
+    Get health metrics for the global connection.
+
+    The circuit state is reported both by name and as a gauge value
+    (0 = closed, 1 = half-open, 2 = open).
+
+    Returns:
+        Dictionary with circuit breaker and monitor metrics
+    """
+    if _connection is None:
+        return {
+            "connected": False,
+            "circuit_breaker": get_circuit_breaker().metrics(),
+            "health_monitor": None,
+            "read_routing": get_read_router().metrics(),
+            "existence_filters": existence_filter_metrics(),
+        }
+    return _connection.metrics()
+
+
 def reset_connection() -> None:
-    """Reset global connection (mainly for testing)."""
-    global _connection
+    """Reset global connection, circuit breaker, read router, query stats and existence filters (mainly for testing)."""
+    global _connection, _read_router, _query_stats_exporter
     if _connection is not None:
         _connection.reset()
     _connection = None
+    _read_router = None
+    if _query_stats_exporter is not None:
+        _query_stats_exporter.stop()
+    _query_stats_exporter = None
+    if _query_recorder is not None:
+        _query_recorder.reset()
+    if _circuit_breaker is not None:
+        _circuit_breaker.reset()
+    _existence_filters.clear()
@@ -0,0 +1,330 @@
+"""
+Probabilistic existence filter for Supabase tables.
+
+Lookups of IDs that do not exist (stale or made-up IDs passed by agents)
+always cost a round trip. An ``ExistenceFilter`` is a Bloom filter over
+the IDs of the live rows of one table: when it reports an ID as absent,
+the repository answers ``get``/``exists`` without a request. It never
+reports an existing ID of a row written or read through the repository
+as absent; IDs it reports as present may still be missing (a false
+positive), and such lookups go to the database as before.
+
+The filter is built from a streamed scan of the table's IDs and learns
+about every live row the repository writes or reads afterwards. Deleted
+IDs cannot be removed from a Bloom filter, so they turn into false
+positives; the filter is rebuilt once it is older than
+``rebuild_interval``, or once the IDs added or deleted since the last
+build exceed what it was sized for.
+
+Rows created by other processes are only learned by the next rebuild
+(or when this process reads them), so until then they can be reported
+missing. Enable the filter for tables whose writes go through this
+process (``DatabaseSettings.existence_filter_tables``), or pick a
+``rebuild_interval`` matching the staleness that is acceptable.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from typing import Any, Optional
+
+# Seconds before a failed rebuild is attempted again
+REBUILD_RETRY_DELAY = 30.0
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter of strings.
+
+    Uses ``hashes`` bit positions per item, derived from one BLAKE2b
+    digest by double hashing. Not thread-safe; ``ExistenceFilter`` locks
+    around it.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        """
+        Size the filter for a number of items and a false-positive rate.
+
+        Args:
+            capacity: Number of items the filter is sized for
+            error_rate: False-positive rate at ``capacity`` items
+
+        Raises:
+            ValueError: If capacity < 1 or error_rate is not in (0, 1)
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.capacity = capacity
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.items = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str) -> list[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self.size for i in range(self.hashes)]
+
+    def add(self, item: str) -> bool:
+        """
+        Add an item.
+
+        Args:
+            item: Item to add
+
+        Returns:
+            True if the item was not in the filter before
+        """
+        added = False
+        bits = self._bits
+        for position in self._positions(item):
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not bits[byte] & mask:
+                bits[byte] |= mask
+                added = True
+        if added:
+            self.items += 1
+        return added
+
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    @property
+    def estimated_error_rate(self) -> float:
+        """False-positive rate expected at the current number of items."""
+        return (1 - math.exp(-self.hashes * self.items / self.size)) ** self.hashes
+
+
+class ExistenceFilter:
+    """
+    Thread-safe, periodically rebuilt Bloom filter of a table's live IDs.
+
+    Until the first build completes every ID is reported as possibly
+    present, so lookups behave as without a filter.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 100_000,
+        error_rate: float = 0.01,
+        rebuild_interval: float = 3600.0,
+    ) -> None:
+        """
+        Initialize an empty filter.
+
+        Args:
+            capacity: Minimum number of IDs a build is sized for; builds
+                size for twice the table's estimated row count if larger
+            error_rate: Target false-positive rate
+            rebuild_interval: Seconds after which the filter is rebuilt
+
+        Raises:
+            ValueError: If an argument is out of range
+        """
+        if rebuild_interval <= 0:
+            raise ValueError("rebuild_interval must be positive")
+        BloomFilter(capacity, error_rate)  # validates the sizing arguments
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.rebuild_interval = rebuild_interval
+        self._lock = threading.Lock()
+        self._bloom: Optional[BloomFilter] = None
+        # Filters being built; IDs added meanwhile go into them too
+        self._building: list[BloomFilter] = []
+        self._built_at = 0.0
+        self._retry_at = 0.0
+        self._claimed = False
+        self._added_since_build = 0
+        self._deleted_since_build = 0
+
+        # Counters
+        self._checks = 0
+        self._definite_misses = 0
+        self._false_positives = 0
+        self._rebuilds = 0
+        self._failed_rebuilds = 0
+
+    @property
+    def ready(self) -> bool:
+        """Whether a build has completed."""
+        return self._bloom is not None
+
+    def might_contain(self, entity_id: str) -> bool:
+        """
+        Check whether an ID may belong to a live row.
+
+        Args:
+            entity_id: ID looked up
+
+        Returns:
+            False only if the row definitely does not exist
+        """
+        with self._lock:
+            if self._bloom is None:
+                return True
+            self._checks += 1
+            if entity_id in self._bloom:
+                return True
+            self._definite_misses += 1
+            return False
+
+    def add(self, entity_id: str) -> None:
+        """
+        Record the ID of a live row (written, or read from the table).
+
+        Args:
+            entity_id: Row ID
+        """
+        with self._lock:
+            for bloom in self._building:
+                bloom.add(entity_id)
+            if self._bloom is not None and self._bloom.add(entity_id):
+                self._added_since_build += 1
+
+    def record_deletes(self, count: int = 1) -> None:
+        """
+        Record deleted rows; their IDs stay in the filter until the next build.
+
+        Args:
+            count: Number of rows deleted
+        """
+        with self._lock:
+            self._deleted_since_build += count
+
+    def record_false_positives(self, count: int = 1) -> None:
+        """
+        Record lookups the filter let through that found no row.
+
+        Args:
+            count: Number of IDs not found
+        """
+        if count > 0:
+            with self._lock:
+                if self._bloom is not None:
+                    self._false_positives += count
+
+    def claim_rebuild(self) -> bool:
+        """
+        Claim a due rebuild.
+
+        A rebuild is due when the filter was never built, is older than
+        ``rebuild_interval``, or has taken in more added and deleted IDs
+        since its build than its spare capacity. Only one caller gets the
+        claim until the rebuild finishes.
+
+        Returns:
+            True if the caller must now run ``rebuild`` (or ``rebuilding``)
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self._claimed or now < self._retry_at:
+                return False
+            bloom = self._bloom
+            due = (
+                bloom is None
+                or now - self._built_at >= self.rebuild_interval
+                or bloom.items + self._deleted_since_build > bloom.capacity
+            )
+            self._claimed = due
+            return due
+
+    @contextmanager
+    def rebuilding(self, expected: int = 0) -> Iterator[Callable[[Any], None]]:
+        """
+        Build a replacement filter from IDs passed to the yielded function.
+
+        Lookups keep using the current filter while the IDs are streamed
+        in; IDs added meanwhile go into both. The new filter replaces the
+        current one when the block exits normally; if it raises, the
+        current filter is kept and the rebuild is retried later.
+
+        Args:
+            expected: Estimated number of rows, used to size the filter
+
+        Yields:
+            Function adding the ID of one live row to the new filter
+        """
+        bloom = BloomFilter(max(self.capacity, 2 * expected), self.error_rate)
+        with self._lock:
+            self._building.append(bloom)
+
+        def add(entity_id: Any) -> None:
+            with self._lock:
+                bloom.add(str(entity_id))
+
+        try:
+            yield add
+        except BaseException:
+            with self._lock:
+                self._building.remove(bloom)
+                self._claimed = False
+                self._failed_rebuilds += 1
+                self._retry_at = time.monotonic() + min(REBUILD_RETRY_DELAY, self.rebuild_interval)
+            raise
+        with self._lock:
+            self._building.remove(bloom)
+            self._bloom = bloom
+            self._built_at = time.monotonic()
+            self._claimed = False
+            self._added_since_build = 0
+            self._deleted_since_build = 0
+            self._rebuilds += 1
+
+    def rebuild(self, entity_ids: Iterable[Any], expected: int = 0) -> int:
+        """
+        Replace the filter with one built from the table's IDs (see ``rebuilding``).
+
+        Args:
+            entity_ids: IDs of every live row, e.g. from a streamed scan
+            expected: Estimated number of rows, used to size the filter
+
+        Returns:
+            Number of IDs scanned
+        """
+        scanned = 0
+        with self.rebuilding(expected) as add:
+            for entity_id in entity_ids:
+                add(entity_id)
+                scanned += 1
+        return scanned
+
+    def metrics(self) -> dict[str, Any]:
+        """
+        Get filter metrics.
+
+        ``false_positive_rate`` is observed: lookups let through that
+        found no row, over all lookups of missing IDs.
+
+        Returns:
+            Dictionary with sizing, lookup counters and false-positive rates
+        """
+        with self._lock:
+            bloom = self._bloom
+            negatives = self._false_positives + self._definite_misses
+            return {
+                "ready": bloom is not None,
+                "capacity": bloom.capacity if bloom else 0,
+                "bits": bloom.size if bloom else 0,
+                "hashes": bloom.hashes if bloom else 0,
+                "items": bloom.items if bloom else 0,
+                "added_since_build": self._added_since_build,
+                "deleted_since_build": self._deleted_since_build,
+                "age": time.monotonic() - self._built_at if bloom else None,
+                "checks": self._checks,
+                "definite_misses": self._definite_misses,
+                "false_positives": self._false_positives,
+                "false_positive_rate": self._false_positives / negatives if negatives else 0.0,
+                "estimated_false_positive_rate": bloom.estimated_error_rate if bloom else 0.0,
+                "rebuilds": self._rebuilds,
+                "failed_rebuilds": self._failed_rebuilds,
+                "rebuilding": bool(self._building),
+            }
@@ -0,0 +1,293 @@
+"""
+Supabase connection health tracking.
+
+This module provides a circuit breaker that records the outcome of real
+requests and a background monitor that probes the database on a timer or
+after failures, so request paths never pay for a health-check round trip.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from enum import Enum
+from typing import Any, Callable, Optional
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker state."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+# Numeric encoding of the state for gauge-style metrics
+CIRCUIT_STATE_VALUES = {
+    CircuitState.CLOSED: 0,
+    CircuitState.HALF_OPEN: 1,
+    CircuitState.OPEN: 2,
+}
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker for the Supabase connection.
+
+    The breaker opens after ``failure_threshold`` consecutive connection
+    failures and rejects requests until ``reset_timeout`` seconds have
+    passed. It then moves to half-open and lets requests through again;
+    the first success closes the circuit and the first failure re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures before opening
+            reset_timeout: Seconds to stay open before allowing a trial request
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._listeners: list[Callable[[CircuitState], None]] = []
+
+        # Counters
+        self._total_failures = 0
+        self._total_successes = 0
+        self._rejected = 0
+        self._times_opened = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Get the current state, promoting OPEN to HALF_OPEN when due."""
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a request may be sent.
+
+        Returns:
+            True if the request may proceed, False if the circuit is open
+        """
+        with self._lock:
+            self._maybe_half_open()
+
+            if self._state != CircuitState.OPEN:
+                return True
+
+            self._rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        """Record a successful request and close the circuit."""
+        with self._lock:
+            self._total_successes += 1
+            self._consecutive_failures = 0
+            self._transition(CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit if needed."""
+        with self._lock:
+            self._total_failures += 1
+            self._consecutive_failures += 1
+
+            if (
+                self._state == CircuitState.HALF_OPEN
+                or self._consecutive_failures >= self.failure_threshold
+            ):
+                self._opened_at = time.monotonic()
+                if self._state != CircuitState.OPEN:
+                    self._times_opened += 1
+                self._transition(CircuitState.OPEN)
+
+    def add_listener(self, listener: Callable[[CircuitState], None]) -> None:
+        """
+        Register a callback invoked with the new state on every transition.
+
+        Registering the same callback twice has no effect.
+
+        Args:
+            listener: Callback receiving the new state
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[CircuitState], None]) -> None:
+        """
+        Unregister a transition callback.
+
+        Args:
+            listener: Previously registered callback
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def reset(self) -> None:
+        """Return to the initial closed state (mainly for testing)."""
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._consecutive_failures = 0
+            self._opened_at = None
+
+    def metrics(self) -> dict[str, Any]:
+        """
+        Get breaker metrics.
+
+        Returns:
+            Dictionary with the state (name and gauge value) and counters
+        """
+        with self._lock:
+            self._maybe_half_open()
+            return {
+                "state": self._state.value,
+                "state_value": CIRCUIT_STATE_VALUES[self._state],
+                "consecutive_failures": self._consecutive_failures,
+                "total_failures": self._total_failures,
+                "total_successes": self._total_successes,
+                "rejected_requests": self._rejected,
+                "times_opened": self._times_opened,
+            }
+
+    def _maybe_half_open(self) -> None:
+        """Move from OPEN to HALF_OPEN once the reset timeout elapsed (lock held)."""
+        if (
+            self._state == CircuitState.OPEN
+            and self._opened_at is not None
+            and time.monotonic() - self._opened_at >= self.reset_timeout
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+
+    def _transition(self, new_state: CircuitState) -> None:
+        """Change state and notify listeners (lock held)."""
+        if new_state == self._state:
+            return
+        self._state = new_state
+        for listener in self._listeners:
+            try:
+                listener(new_state)
+            except Exception:
+                pass
+
+
+class ConnectionHealthMonitor:
+    """
+    Background health monitor for the Supabase connection.
+
+    Runs ``probe`` on a daemon thread every ``interval`` seconds, and
+    immediately whenever the circuit breaker opens. Probe results are fed
+    back into the breaker, so a recovered database closes the circuit
+    without waiting for user traffic.
+    """
+
+    def __init__(
+        self,
+        probe: Callable[[], None],
+        breaker: CircuitBreaker,
+        interval: float = 30.0,
+    ):
+        """
+        Initialize health monitor.
+
+        Args:
+            probe: Callable that raises if the database is unreachable
+            breaker: Circuit breaker to update with probe results
+            interval: Seconds between scheduled probes
+        """
+        self.probe = probe
+        self.breaker = breaker
+        self.interval = interval
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._probes = 0
+        self._probe_failures = 0
+        self._last_probe_at: Optional[float] = None
+
+    def start(self) -> None:
+        """Start the monitor thread if it is not already running."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self.breaker.add_listener(self._on_state_change)
+        self._thread = threading.Thread(
+            target=self._run, name="supabase-health-monitor", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 1.0) -> None:
+        """
+        Stop the monitor thread.
+
+        Args:
+            timeout: Seconds to wait for the thread to exit
+        """
+        self._stop.set()
+        self._wake.set()
+        self.breaker.remove_listener(self._on_state_change)
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the monitor thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def check_now(self) -> bool:
+        """
+        Run a probe synchronously and record the outcome.
+
+        Returns:
+            True if the probe succeeded
+        """
+        self._probes += 1
+        self._last_probe_at = time.time()
+        try:
+            self.probe()
+        except Exception:
+            self._probe_failures += 1
+            self.breaker.record_failure()
+            return False
+        self.breaker.record_success()
+        return True
+
+    def metrics(self) -> dict[str, Any]:
+        """
+        Get monitor metrics.
+
+        Returns:
+            Dictionary with probe counters and last probe timestamp
+        """
+        return {
+            "running": self.running,
+            "interval": self.interval,
+            "probes": self._probes,
+            "probe_failures": self._probe_failures,
+            "last_probe_at": self._last_probe_at,
+        }
+
+    def _on_state_change(self, state: CircuitState) -> None:
+        """Probe early when the circuit opens."""
+        if state == CircuitState.OPEN:
+            self._wake.set()
+
+    def _run(self) -> None:
+        """Monitor loop."""
+        while not self._stop.is_set():
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            if self.breaker.state == CircuitState.OPEN:
+                # Give the database the reset timeout before re-probing
+                self._stop.wait(self.breaker.reset_timeout)
+                if self._stop.is_set():
+                    break
+            self.check_now()
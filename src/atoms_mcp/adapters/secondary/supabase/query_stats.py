@@ -0,0 +1,550 @@
+"""
+Query-shape statistics and slow-query log for Supabase repositories.
+
+Every PostgREST request a repository executes is recorded under its
+*shape*: table, operation, filtered columns with their operators, order
+and selected columns, without any filter values. Each shape keeps a
+latency histogram, error count, and the rows and payload bytes returned,
+so the hot paths of a running server can be found without attaching a
+profiler. Requests slower than ``slow_threshold`` are also logged as
+warnings with their shape and duration.
+
+Statistics live in the server process. ``QueryStatsExporter`` writes
+them to a JSON file periodically, where ``atoms admin queries`` reads
+them; the ``get_query_stats`` MCP tool reports them directly.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from atoms_mcp.domain.ports.logger import Logger
+from atoms_mcp.infrastructure.logging.logger import get_logger
+
+# Upper bounds (seconds) of the latency histogram buckets; a last bucket
+# takes everything slower
+LATENCY_BUCKETS = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0, 2.0, 5.0, 10.0)
+
+# Keys ``top_shapes`` can sort by
+SORT_KEYS = ("total_time", "mean_time", "p95", "max_time", "count", "errors", "rows", "bytes")
+
+# Shape recorded once ``max_shapes`` distinct shapes exist
+OVERFLOW_SHAPE = "(other)"
+
+# Query parameters that are not column filters
+_NON_FILTER_PARAMS = frozenset({"select", "order", "limit", "offset", "on_conflict", "columns"})
+
+# ``column.operator.`` pairs inside ``or``/``and`` filter groups
+_GROUP_CONDITION = re.compile(r"([\w\->]+)\.(?:not\.)?(\w+)\.")
+
+# Operation of each HTTP method of a table request
+_OPERATIONS = {"GET": "select", "HEAD": "count", "POST": "insert", "PATCH": "update", "DELETE": "delete"}
+
+
+@dataclass(frozen=True)
+class QueryShape:
+    """
+    Value-free description of a PostgREST request.
+
+    Attributes:
+        table: Table (or RPC function) name
+        operation: select, count, insert, upsert, update, delete or rpc
+        filters: Sorted ``column.operator`` filters (argument names for RPCs)
+        order: Order parameter, e.g. ``created_at.desc,id.desc``
+        columns: Select parameter (empty when not set)
+    """
+
+    table: str
+    operation: str
+    filters: tuple[str, ...] = ()
+    order: str = ""
+    columns: str = ""
+
+    def __str__(self) -> str:
+        text = f"{self.operation} {self.table}"
+        if self.filters:
+            text += f" where {', '.join(self.filters)}"
+        if self.order:
+            text += f" order {self.order}"
+        if self.columns and self.columns != "*":
+            text += f" select {self.columns}"
+        return text
+
+
+def query_shape(query: Any, table: str) -> QueryShape:
+    """
+    Describe the shape of a PostgREST query builder.
+
+    Reads the request path, method, headers and query parameters, from
+    the builder's request config where postgrest keeps one and from the
+    builder itself otherwise; parts neither exposes are left out of the
+    shape.
+
+    Args:
+        query: Sync or async PostgREST query builder
+        table: Table the repository is bound to
+
+    Returns:
+        Shape of the request
+    """
+    request = getattr(query, "request", None) or query
+    path = getattr(request, "path", None)
+    path = getattr(path, "path", path)  # URL objects carry the path separately
+    method = getattr(request, "http_method", None)
+    operation = _OPERATIONS.get(method, "query") if isinstance(method, str) else "query"
+
+    if isinstance(path, str) and "/rpc/" in path:
+        body = getattr(request, "json", None)
+        arguments = tuple(sorted(body)) if isinstance(body, dict) else ()
+        return QueryShape(path.rpartition("/rpc/")[2], "rpc", arguments)
+
+    if operation == "insert":
+        headers = getattr(request, "headers", None)
+        prefer = headers.get("Prefer", "") if headers is not None and hasattr(headers, "get") else ""
+        if isinstance(prefer, str) and "resolution=" in prefer:
+            operation = "upsert"
+
+    filters: set[str] = set()
+    order = columns = ""
+    params = getattr(request, "params", None)
+    items = params.multi_items() if params is not None and hasattr(params, "multi_items") else None
+    if isinstance(items, list):
+        for key, value in items:
+            value = str(value)
+            if key == "order":
+                order = value
+            elif key == "select":
+                columns = value
+            elif key in ("or", "and"):
+                filters.update(f"{key}({column}.{op})" for column, op in _GROUP_CONDITION.findall(value))
+            elif key not in _NON_FILTER_PARAMS:
+                op, _, rest = value.partition(".")
+                if op == "not":
+                    op = "not." + rest.partition(".")[0]
+                filters.add(f"{key}.{op}")
+    return QueryShape(table, operation, tuple(sorted(filters)), order, columns)
+
+
+def response_size(response: Any) -> tuple[int, int]:
+    """
+    Count the rows and payload bytes of a PostgREST response.
+
+    Bytes are those of the compact JSON encoding of the returned data,
+    which matches the response body PostgREST sends.
+
+    Args:
+        response: PostgREST response
+
+    Returns:
+        Tuple of (rows, bytes)
+    """
+    data = getattr(response, "data", None)
+    if isinstance(data, list):
+        rows = len(data)
+    elif isinstance(data, dict):
+        rows = 1
+    else:
+        return 0, 0
+    return rows, len(json.dumps(data, separators=(",", ":"), default=str))
+
+
+@dataclass
+class ShapeStats:
+    """Counters and latency histogram of one query shape."""
+
+    count: int = 0
+    errors: int = 0
+    slow: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    rows: int = 0
+    bytes: int = 0
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Estimate a latency percentile from the histogram.
+
+        Args:
+            fraction: Percentile as a fraction (0.95 for p95)
+
+        Returns:
+            Upper bound of the bucket holding the percentile, capped at
+            the slowest recorded latency
+        """
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for bound, hits in zip(LATENCY_BUCKETS, self.buckets[:-1], strict=True):
+            seen += hits
+            if seen >= rank:
+                return min(bound, self.max_time)
+        return self.max_time
+
+    def to_dict(self, shape: Union[QueryShape, str]) -> dict[str, Any]:
+        """
+        Report the statistics of a shape.
+
+        Args:
+            shape: Shape the statistics belong to
+
+        Returns:
+            Dictionary with counters, latencies (seconds) and histogram
+        """
+        return {
+            "shape": str(shape),
+            "table": shape.table if isinstance(shape, QueryShape) else "",
+            "operation": shape.operation if isinstance(shape, QueryShape) else "",
+            "count": self.count,
+            "errors": self.errors,
+            "slow": self.slow,
+            "total_time": self.total_time,
+            "mean_time": self.total_time / self.count if self.count else 0.0,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "max_time": self.max_time,
+            "rows": self.rows,
+            "mean_rows": self.rows / self.count if self.count else 0.0,
+            "bytes": self.bytes,
+            "histogram": {
+                **{f"le_{bound:g}": hits for bound, hits in zip(LATENCY_BUCKETS, self.buckets[:-1], strict=True)},
+                "inf": self.buckets[-1],
+            },
+        }
+
+
+def top_shapes(shapes: list[dict[str, Any]], limit: int = 10, sort_by: str = "total_time") -> list[dict[str, Any]]:
+    """
+    Pick the top shapes of a report.
+
+    Args:
+        shapes: Shape dictionaries as produced by ``ShapeStats.to_dict``
+        limit: Number of shapes to return
+        sort_by: Key to sort by, descending (one of ``SORT_KEYS``)
+
+    Returns:
+        Up to ``limit`` shapes with the largest ``sort_by`` values
+
+    Raises:
+        ValueError: If sort_by is not a sort key
+    """
+    if sort_by not in SORT_KEYS:
+        raise ValueError(f"Unknown sort key {sort_by!r}; expected one of {', '.join(SORT_KEYS)}")
+    return sorted(shapes, key=lambda shape: shape.get(sort_by, 0), reverse=True)[: max(limit, 0)]
+
+
+class QueryRecorder:
+    """
+    Thread-safe recorder of per-shape query statistics.
+
+    At most ``max_shapes`` distinct shapes are tracked; requests of
+    further shapes are counted under ``OVERFLOW_SHAPE``.
+    """
+
+    def __init__(
+        self,
+        slow_threshold: float = 0.5,
+        max_shapes: int = 500,
+        enabled: bool = True,
+        logger: Optional[Logger] = None,
+    ) -> None:
+        """
+        Initialize an empty recorder.
+
+        Args:
+            slow_threshold: Seconds after which a request is logged as slow
+            max_shapes: Maximum number of distinct shapes tracked
+            enabled: Whether requests are recorded at all
+            logger: Logger for slow requests (default: atoms_mcp.supabase.queries)
+
+        Raises:
+            ValueError: If slow_threshold or max_shapes is out of range
+        """
+        self._lock = threading.Lock()
+        self._shapes: dict[Union[QueryShape, str], ShapeStats] = {}
+        self._since = time.time()
+        self._logger = logger
+        self.configure(slow_threshold, max_shapes, enabled)
+
+    def configure(
+        self,
+        slow_threshold: Optional[float] = None,
+        max_shapes: Optional[int] = None,
+        enabled: Optional[bool] = None,
+    ) -> None:
+        """
+        Change recorder settings; arguments left as None are kept.
+
+        Args:
+            slow_threshold: Seconds after which a request is logged as slow
+            max_shapes: Maximum number of distinct shapes tracked
+            enabled: Whether requests are recorded at all
+
+        Raises:
+            ValueError: If slow_threshold or max_shapes is out of range
+        """
+        if slow_threshold is not None and slow_threshold <= 0:
+            raise ValueError("slow_threshold must be positive")
+        if max_shapes is not None and max_shapes < 1:
+            raise ValueError("max_shapes must be at least 1")
+        if slow_threshold is not None:
+            self.slow_threshold = slow_threshold
+        if max_shapes is not None:
+            self.max_shapes = max_shapes
+        if enabled is not None:
+            self.enabled = enabled
+
+    @property
+    def logger(self) -> Logger:
+        """Logger receiving slow-query warnings."""
+        if self._logger is None:
+            self._logger = get_logger("atoms_mcp.supabase.queries")
+        return self._logger
+
+    def record(
+        self,
+        shape: QueryShape,
+        elapsed: float,
+        rows: int = 0,
+        payload_bytes: int = 0,
+        error: bool = False,
+    ) -> None:
+        """
+        Record one request.
+
+        Args:
+            shape: Shape of the request
+            elapsed: Seconds the request took
+            rows: Rows returned
+            payload_bytes: Bytes of data returned
+            error: Whether the request failed
+        """
+        slow = elapsed >= self.slow_threshold
+        bucket = len(LATENCY_BUCKETS)
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if elapsed <= bound:
+                bucket = index
+                break
+        with self._lock:
+            stats = self._shapes.get(shape)
+            if stats is None:
+                key: Union[QueryShape, str] = shape if len(self._shapes) < self.max_shapes else OVERFLOW_SHAPE
+                stats = self._shapes.setdefault(key, ShapeStats())
+            stats.count += 1
+            stats.errors += error
+            stats.slow += slow
+            stats.total_time += elapsed
+            stats.max_time = max(stats.max_time, elapsed)
+            stats.rows += rows
+            stats.bytes += payload_bytes
+            stats.buckets[bucket] += 1
+        if slow:
+            self.logger.warning(
+                f"Slow Supabase query ({elapsed * 1000:.0f} ms): {shape}",
+                query_shape=str(shape),
+                duration_ms=round(elapsed * 1000, 1),
+                rows=rows,
+                bytes=payload_bytes,
+                error=error,
+            )
+
+    def record_query(self, query: Any, table: str, elapsed: float, response: Any = None, error: bool = False) -> None:
+        """
+        Record an executed query builder.
+
+        Args:
+            query: PostgREST query builder
+            table: Table the repository is bound to
+            elapsed: Seconds the request took
+            response: PostgREST response (None if the request failed)
+            error: Whether the request failed
+        """
+        if not self.enabled:
+            return
+        rows, payload_bytes = (0, 0) if error else response_size(response)
+        self.record(query_shape(query, table), elapsed, rows, payload_bytes, error)
+
+    def shapes(self) -> list[dict[str, Any]]:
+        """
+        Report every tracked shape.
+
+        Returns:
+            List of shape dictionaries (see ``ShapeStats.to_dict``)
+        """
+        with self._lock:
+            return [stats.to_dict(shape) for shape, stats in self._shapes.items()]
+
+    def report(self, limit: int = 10, sort_by: str = "total_time") -> dict[str, Any]:
+        """
+        Summarize the recorded requests with the top shapes.
+
+        Args:
+            limit: Number of shapes to include
+            sort_by: Key to rank shapes by (one of ``SORT_KEYS``)
+
+        Returns:
+            Dictionary with totals, settings and the top shapes
+
+        Raises:
+            ValueError: If sort_by is not a sort key
+        """
+        shapes = self.shapes()
+        return {
+            "since": datetime.fromtimestamp(self._since, tz=timezone.utc).isoformat(),
+            "enabled": self.enabled,
+            "slow_threshold": self.slow_threshold,
+            "queries": sum(shape["count"] for shape in shapes),
+            "errors": sum(shape["errors"] for shape in shapes),
+            "slow_queries": sum(shape["slow"] for shape in shapes),
+            "total_time": sum(shape["total_time"] for shape in shapes),
+            "shape_count": len(shapes),
+            "sort_by": sort_by,
+            "shapes": top_shapes(shapes, limit, sort_by),
+        }
+
+    def export(self, path: Union[str, Path]) -> None:
+        """
+        Write a report of every shape to a JSON file, replacing it atomically.
+
+        Args:
+            path: File to write
+        """
+        report = self.report(limit=self.max_shapes + 1)
+        report["exported_at"] = datetime.now(timezone.utc).isoformat()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        handle, temporary = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(handle, "w") as file:
+                json.dump(report, file)
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def reset(self) -> None:
+        """Discard every recorded request."""
+        with self._lock:
+            self._shapes.clear()
+            self._since = time.time()
+
+
+def load_report(path: Union[str, Path], limit: int = 10, sort_by: str = "total_time") -> dict[str, Any]:
+    """
+    Read a report written by ``QueryRecorder.export`` and rank its shapes.
+
+    Args:
+        path: Exported report file
+        limit: Number of shapes to keep
+        sort_by: Key to rank shapes by (one of ``SORT_KEYS``)
+
+    Returns:
+        Report in the format of ``QueryRecorder.report``
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If the file is not a report or sort_by is not a sort key
+    """
+    try:
+        report = json.loads(Path(path).read_text())
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid query stats file {path}: {e}") from e
+    if not isinstance(report, dict) or not isinstance(report.get("shapes"), list):
+        raise ValueError(f"Invalid query stats file {path}: no shapes")
+    report["shape_count"] = len(report["shapes"])
+    report["sort_by"] = sort_by
+    report["shapes"] = top_shapes(report["shapes"], limit, sort_by)
+    return report
+
+
+class QueryStatsExporter:
+    """Daemon thread exporting a recorder's statistics every ``interval`` seconds."""
+
+    def __init__(self, recorder: QueryRecorder, path: Union[str, Path], interval: float = 60.0) -> None:
+        """
+        Initialize the exporter.
+
+        Args:
+            recorder: Recorder to export
+            path: File to write
+            interval: Seconds between exports
+        """
+        self.recorder = recorder
+        self.path = Path(path)
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._exports = 0
+        self._failures = 0
+
+    def start(self) -> None:
+        """Start the exporter thread if it is not already running."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="supabase-query-stats", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 1.0) -> None:
+        """
+        Stop the exporter thread after a final export.
+
+        Args:
+            timeout: Seconds to wait for the thread to exit
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the exporter thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def export_now(self) -> bool:
+        """
+        Export synchronously.
+
+        Returns:
+            True if the file was written
+        """
+        try:
+            self.recorder.export(self.path)
+        except OSError as e:
+            self._failures += 1
+            self.recorder.logger.warning(f"Failed to export query stats to {self.path}: {e}")
+            return False
+        self._exports += 1
+        return True
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.export_now()
+        self.export_now()
+
+    def metrics(self) -> dict[str, Any]:
+        """
+        Get exporter metrics.
+
+        Returns:
+            Dictionary with path, interval and export counters
+        """
+        return {
+            "path": str(self.path),
+            "interval": self.interval,
+            "running": self.running,
+            "exports": self._exports,
+            "failures": self._failures,
+        }
@@ -9,30 +9,117 @@ error handling.
 from __future__ import annotations
 
 import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any, Generic, Optional, TypeVar
 from uuid import UUID
 
+from postgrest import CountMethod, ReturnMethod
 from postgrest.exceptions import APIError
 
-from atoms_mcp.adapters.secondary.supabase.connection import get_client_with_retry
-from atoms_mcp.domain.ports.repository import Repository, RepositoryError
+from atoms_mcp.adapters.secondary.supabase.aggregate import AGGREGATE_FUNCTION, aggregate_params
+from atoms_mcp.adapters.secondary.supabase.batch import BATCH_FUNCTION, BATCH_OPERATIONS, batch_conflict, batch_params
+from atoms_mcp.adapters.secondary.supabase.connection import (
+    CONNECTION_ERRORS,
+    get_client_with_retry,
+    get_query_recorder,
+    get_replica_client,
+    record_request_failure,
+    record_request_success,
+    record_write,
+)
+from atoms_mcp.adapters.secondary.supabase.existence import ExistenceFilter
+from atoms_mcp.adapters.secondary.supabase.search import (
+    SEARCH_FUNCTION,
+    equality_filter,
+    is_missing_function,
+    missing_column,
+    search_params,
+)
+from atoms_mcp.domain.ports.aggregation import Metric, TimeBucket
+from atoms_mcp.domain.ports.filters import AllOf, AnyOf, Condition, FilterExpr, FilterOp, ilike
+from atoms_mcp.domain.ports.logger import Logger
+from atoms_mcp.domain.ports.pagination import (
+    KeysetPage,
+    decode_cursor,
+    encode_cursor,
+    keyset_value,
+    parse_order_by,
+)
+from atoms_mcp.domain.ports.projection import normalize_columns
+from atoms_mcp.domain.ports.repository import (
+    ConcurrencyError,
+    Repository,
+    RepositoryError,
+    SearchMode,
+    WriteBatch,
+    WriteMode,
+    require_update_filter,
+)
+from atoms_mcp.infrastructure.logging.logger import get_logger
+from atoms_mcp.infrastructure.serialization.codecs import encode_value, get_codec
 
 T = TypeVar("T")
 
+# Text columns searched when the caller does not name any
+DEFAULT_SEARCH_FIELDS = ["name", "description", "title", "content"]
+
+# Maximum rows per request for batch operations; keeps `in.(...)` filters
+# within URL length limits and request bodies reasonably sized
+DEFAULT_BATCH_SIZE = 500
+
+# Column holding the write counter used by conditional patches
+REVISION_COLUMN = "revision"
+
+# Trigger function incrementing the revision on every update, so saves,
+# upserts, batch writes and soft deletes all move it on
+REVISION_FUNCTION_SQL = f"""
+create or replace function atoms_bump_revision() returns trigger
+language plpgsql
+as $$
+begin
+    new.{REVISION_COLUMN} := old.{REVISION_COLUMN} + 1;
+    return new;
+end;
+$$;
+"""
+
+# Adds the revision column and its trigger to a table, formatted with the
+# table name; shipped for the entity tables in supabase/migrations
+REVISION_COLUMN_SQL = f"""
+alter table {{table}} add column if not exists {REVISION_COLUMN} bigint not null default 0;
+
+drop trigger if exists {{table}}_bump_revision on {{table}};
+create trigger {{table}}_bump_revision before update on {{table}}
+    for each row execute function atoms_bump_revision();
+"""
 
-class SupabaseRepository(Repository[T], Generic[T]):
+# PostgREST operator for each filter expression operator
+POSTGREST_OPERATORS = {
+    FilterOp.EQ: "eq",
+    FilterOp.NEQ: "neq",
+    FilterOp.IN: "in",
+    FilterOp.GT: "gt",
+    FilterOp.GTE: "gte",
+    FilterOp.LT: "lt",
+    FilterOp.LTE: "lte",
+    FilterOp.ILIKE: "ilike",
+    FilterOp.IS_NULL: "is",
+    FilterOp.CONTAINS: "cs",
+}
+
+
+class SupabaseEntityMapper(ABC, Generic[T]):
     """
-    Supabase implementation of the Repository port.
+    Row mapping shared by the sync and async Supabase repositories.
 
-    This repository handles:
-    - UUID and datetime serialization
-    - Soft deletes with is_deleted flag
-    - Pagination support
-    - Error handling and retries
-    - Type-safe entity operations
+    Holds the table binding and converts entities to and from the
+    dictionaries exchanged with PostgREST.
 
-    Type parameter T represents the entity type managed by this repository.
+    Type parameter T represents the entity type managed by the repository.
     """
 
     def __init__(
@@ -40,6 +127,8 @@ class SupabaseRepository(Repository[T], Generic[T]):
         table_name: str,
         entity_type: type[T],
         id_field: str = "id",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        existence_filter: Optional[ExistenceFilter] = None,
     ) -> None:
         """
         Initialize repository for a specific table.
@@ -48,10 +137,63 @@ class SupabaseRepository(Repository[T], Generic[T]):
             table_name: Name of the Supabase table
             entity_type: Type of entities stored in this repository
             id_field: Name of the ID field (default: "id")
+            batch_size: Maximum rows per request for batch operations
+            existence_filter: Filter of the table's IDs answering lookups of
+                missing IDs without a request (default: none); built on
+                first use and rebuilt in the background
         """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
         self.table_name = table_name
         self.entity_type = entity_type
         self.id_field = id_field
+        self.batch_size = batch_size
+        # Cleared once the database reports the search function missing
+        self.ranked_search_available = True
+        # Search fields the table turned out not to have
+        self._missing_search_fields: set[str] = set()
+        # Cleared once the database reports the aggregate function missing
+        self.aggregate_available = True
+        # Cleared once the database reports the batch write function missing
+        self.batch_available = True
+        # Precompiled row codec for dataclass entities (None = generic mapping)
+        self._codec = get_codec(entity_type)
+        self.existence_filter = existence_filter
+        # Background rebuild of the existence filter, while one runs
+        self._existence_rebuild: Any = None
+        self._logger: Optional[Logger] = None
+
+    @property
+    def logger(self) -> Logger:
+        """Logger receiving fallback warnings."""
+        if self._logger is None:
+            self._logger = get_logger("atoms_mcp.supabase.repository")
+        return self._logger
+
+    @property
+    def missing_functions(self) -> list[str]:
+        """Database functions found missing, whose callers use a slower fallback."""
+        available = {
+            SEARCH_FUNCTION: self.ranked_search_available,
+            AGGREGATE_FUNCTION: self.aggregate_available,
+            BATCH_FUNCTION: self.batch_available,
+        }
+        return [function for function, found in available.items() if not found]
+
+    def _warn_fallback(self, function: str, fallback: str) -> None:
+        """
+        Log that a missing database function is replaced by a fallback.
+
+        Called once per repository, when the function is found missing.
+
+        Args:
+            function: Name of the missing function
+            fallback: What is done instead
+        """
+        self.logger.warning(
+            f"Postgres function {function} is not installed; {self.table_name} uses {fallback} "
+            "until the supabase/migrations are applied"
+        )
 
     def _serialize_value(self, value: Any) -> Any:
         """
@@ -75,12 +217,17 @@ class SupabaseRepository(Repository[T], Generic[T]):
         """
         Serialize entity to dictionary for Supabase.
 
+        Dataclass entities go through their precompiled codec (see
+        ``atoms_mcp.infrastructure.serialization.codecs``).
+
         Args:
             entity: Entity to serialize
 
         Returns:
             Dictionary representation suitable for Supabase
         """
+        if self._codec is not None:
+            return self._codec.encode(entity)
         if hasattr(entity, "model_dump"):
             # Pydantic model
             data = entity.model_dump(mode="json")
@@ -93,10 +240,161 @@ class SupabaseRepository(Repository[T], Generic[T]):
         # Serialize special types
         return {k: self._serialize_value(v) for k, v in data.items()}
 
+    def _serialize_changes(self, changes: dict[str, Any]) -> dict[str, Any]:
+        """
+        Serialize a partial update to the columns it changes.
+
+        Args:
+            changes: Mapping of field name to new value
+
+        Returns:
+            Dictionary of column updates suitable for Supabase
+
+        Raises:
+            ValueError: If a field is not a column of the entity type, or
+                the change would rewrite the ID or the revision
+        """
+        if self.id_field in changes:
+            raise ValueError(f"Cannot patch the {self.id_field} column")
+        if REVISION_COLUMN in changes:
+            raise ValueError(f"Cannot patch the {REVISION_COLUMN} column")
+        if self._codec is not None:
+            unknown = set(changes) - set(self._codec.fields)
+            if unknown:
+                raise ValueError(f"Unknown fields for {self.entity_type.__name__}: {sorted(unknown)}")
+            return {name: encode_value(value) for name, value in changes.items()}
+        return {name: self._serialize_value(encode_value(value)) for name, value in changes.items()}
+
+    def _patch_query(
+        self,
+        table: Any,
+        entity_id: str,
+        changes: dict[str, Any],
+        expected_revision: Optional[int],
+    ) -> Any:
+        """
+        Build the ``UPDATE ... RETURNING`` statement of a patch.
+
+        A conditional patch also matches the expected revision and writes
+        the next one, so two writers based on the same revision cannot
+        both succeed.
+
+        Args:
+            table: PostgREST table builder
+            entity_id: Unique identifier of the entity
+            changes: Mapping of field name to new value
+            expected_revision: Revision the row must have (None = unconditional)
+
+        Returns:
+            Update query builder
+
+        Raises:
+            ValueError: If a field is not a column of the entity type
+        """
+        data = self._serialize_changes(changes)
+        if expected_revision is not None:
+            data[REVISION_COLUMN] = expected_revision + 1
+        query = table.update(data).eq(self.id_field, entity_id).eq("is_deleted", False)
+        if expected_revision is not None:
+            query = query.eq(REVISION_COLUMN, expected_revision)
+        return query
+
+    def _update_where_query(
+        self,
+        table: Any,
+        filters: Optional[dict[str, Any]],
+        changes: dict[str, Any],
+        where: Optional[FilterExpr],
+    ) -> Any:
+        """
+        Build the set-based ``UPDATE ... WHERE`` of ``update_where``.
+
+        Args:
+            table: PostgREST table builder
+            filters: Dictionary of field:value filters
+            changes: Mapping of field name to new value
+            where: Filter expression applied on top of ``filters``
+
+        Returns:
+            Update query builder
+
+        Raises:
+            ValueError: If no filter is given or a field is not a column
+        """
+        require_update_filter(filters, where)
+        query = self._apply_filters(table.update(self._serialize_changes(changes)), filters)
+        return self._apply_where(query, where)
+
+    def _patch_conflict(
+        self,
+        entity_id: str,
+        expected_revision: Optional[int],
+        row: Optional[dict[str, Any]],
+    ) -> None:
+        """
+        Explain a patch that matched no row.
+
+        Args:
+            entity_id: Unique identifier of the entity
+            expected_revision: Revision the patch was conditional on
+            row: Current ``revision`` column of the entity, None if not found
+
+        Raises:
+            ConcurrencyError: If the entity exists with another revision
+        """
+        if expected_revision is not None and row is not None:
+            raise ConcurrencyError(entity_id, expected_revision, row.get(REVISION_COLUMN))
+
+    def _batch_writes(self, batch: WriteBatch[T]) -> list[dict[str, Any]]:
+        """
+        Serialize the writes of a batch for ``BATCH_FUNCTION``.
+
+        Args:
+            batch: Writes to send
+
+        Returns:
+            JSON-ready write descriptions, in batch order
+        """
+        writes = []
+        for write in batch.writes:
+            if write.is_delete:
+                writes.append({"op": "delete", "id": write.entity_id, "hard": write.hard})
+            else:
+                writes.append(
+                    {
+                        "op": BATCH_OPERATIONS[write.mode or WriteMode.UPSERT],
+                        "id": write.entity_id,
+                        "row": self._serialize_entity(write.entity),
+                        "expected_revision": write.expected_revision,
+                    }
+                )
+        return writes
+
+    def _batch_results(self, batch: WriteBatch[T], data: Optional[list[Any]]) -> list[Any]:
+        """
+        Map the results of ``BATCH_FUNCTION`` to entities and delete flags.
+
+        Args:
+            batch: Writes that were sent
+            data: Result array returned by the function
+
+        Returns:
+            One result per write (see ``WriteBatch.results``)
+        """
+        results = [
+            bool(result) if write.is_delete else self._deserialize_entity(result)
+            for write, result in zip(batch.writes, data or [])
+        ]
+        self._note_deletes(sum(1 for write, result in zip(batch.writes, results) if write.is_delete and result))
+        return results
+
     def _deserialize_entity(self, data: dict[str, Any]) -> T:
         """
         Deserialize dictionary from Supabase to entity.
 
+        Dataclass entities are built by their precompiled codec, which
+        restores enums and datetimes and ignores unknown columns.
+
         Args:
             data: Dictionary from Supabase
 
@@ -107,312 +405,1564 @@ class SupabaseRepository(Repository[T], Generic[T]):
             RepositoryError: If deserialization fails
         """
         try:
-            if hasattr(self.entity_type, "model_validate"):
+            if self._codec is not None:
+                entity = self._codec.decode(data)
+            elif hasattr(self.entity_type, "model_validate"):
                 # Pydantic model
-                return self.entity_type.model_validate(data)
+                entity = self.entity_type.model_validate(data)
             else:
                 # Regular class - try direct instantiation
-                return self.entity_type(**data)
+                entity = self.entity_type(**data)
         except Exception as e:
             raise RepositoryError(f"Failed to deserialize entity: {e}") from e
+        # Every live row decoded was just written or read: the ID exists
+        if self.existence_filter is not None and not data.get("is_deleted"):
+            self.existence_filter.add(str(data.get(self.id_field)))
+        return entity
 
-    def save(self, entity: T) -> T:
+    def _definitely_missing(self, entity_id: Any) -> bool:
         """
-        Save an entity to Supabase.
+        Check the existence filter before a lookup by ID.
 
-        Performs upsert operation - inserts new entities or updates existing ones.
+        Starts a due rebuild of the filter in the background.
 
         Args:
-            entity: Entity to save
+            entity_id: ID looked up
 
         Returns:
-            Saved entity with any generated fields
+            True if no live row has the ID, False if it may exist
+        """
+        existence = self.existence_filter
+        if existence is None:
+            return False
+        if existence.claim_rebuild():
+            self._start_existence_rebuild()
+        return not existence.might_contain(str(entity_id))
+
+    @abstractmethod
+    def _start_existence_rebuild(self) -> None:
+        """Rebuild the existence filter in the background (a thread or an event-loop task)."""
+
+    def _note_false_positives(self, count: int = 1) -> None:
+        """Record lookups let through by the existence filter that found nothing."""
+        if self.existence_filter is not None:
+            self.existence_filter.record_false_positives(count)
+
+    def _note_deletes(self, count: int) -> None:
+        """Record deleted rows, which the existence filter keeps until rebuilt."""
+        if self.existence_filter is not None and count:
+            self.existence_filter.record_deletes(count)
+
+    def _note_live_rows(self, rows: list[dict[str, Any]]) -> None:
+        """Add the IDs of written rows that are live to the existence filter."""
+        if self.existence_filter is not None:
+            for row in rows:
+                if not row.get("is_deleted"):
+                    self.existence_filter.add(str(row.get(self.id_field)))
+
+    def _id_scan_query(self, table: Any, after: Optional[str]) -> Any:
+        """
+        Build the query of one page of the existence filter's ID scan.
 
-        Raises:
-            RepositoryError: If save operation fails
+        Args:
+            table: PostgREST table builder
+            after: Last ID of the previous page (None = first page)
+
+        Returns:
+            Select query of up to ``batch_size`` live IDs in ID order
         """
-        try:
-            client = get_client_with_retry()
-            data = self._serialize_entity(entity)
+        query = table.select(self.id_field).eq("is_deleted", False).order(self.id_field).limit(self.batch_size)
+        return query if after is None else query.gt(self.id_field, after)
 
-            # Check if entity has ID and exists
-            entity_id = data.get(self.id_field)
-            if entity_id and self.exists(str(entity_id)):
-                # Update existing entity
-                response = (
-                    client.table(self.table_name)
-                    .update(data)
-                    .eq(self.id_field, str(entity_id))
-                    .execute()
-                )
-            else:
-                # Insert new entity
-                response = client.table(self.table_name).insert(data).execute()
+    def _select_columns(self, columns: Optional[list[str]]) -> str:
+        """
+        Build the ``select`` clause for a projection.
 
-            if not response.data:
-                raise RepositoryError("Save operation returned no data")
+        Args:
+            columns: Column names to select (None = all columns)
 
-            return self._deserialize_entity(response.data[0])
+        Returns:
+            Comma-separated column list, or "*" when no projection is given
 
-        except APIError as e:
-            raise RepositoryError(f"Supabase API error during save: {e}") from e
-        except Exception as e:
-            raise RepositoryError(f"Failed to save entity: {e}") from e
+        Raises:
+            ValueError: If the projection is invalid
+        """
+        if columns is None:
+            return "*"
+        return ",".join(normalize_columns(columns, self.id_field))
 
-    def get(self, entity_id: str) -> Optional[T]:
+    def _search_rpc(
+        self,
+        client: Any,
+        query: str,
+        fields: Optional[list[str]],
+        limit: Optional[int],
+        mode: SearchMode,
+        columns: Optional[list[str]],
+        filter_values: Optional[dict[str, Any]] = None,
+    ) -> Any:
         """
-        Retrieve an entity by ID.
+        Build the ranked search RPC call.
 
         Args:
-            entity_id: Unique identifier of the entity
+            client: Supabase client
+            query: Search query string
+            fields: Text columns to search (None = default text fields)
+            limit: Maximum number of rows
+            mode: Matching mode
+            columns: Columns to return (None = whole rows)
+            filter_values: Column values rows must equal
 
         Returns:
-            Entity if found and not soft-deleted, None otherwise
+            PostgREST RPC request builder
+        """
+        if columns is not None:
+            columns = normalize_columns(columns, self.id_field)
+        params = search_params(
+            self.table_name, query, fields or DEFAULT_SEARCH_FIELDS, limit, mode, columns, filter_values
+        )
+        return client.rpc(SEARCH_FUNCTION, params)
+
+    def _substring_search(
+        self,
+        client: Any,
+        query: str,
+        fields: Optional[list[str]],
+        limit: Optional[int],
+        select: str,
+        where: Optional[FilterExpr] = None,
+    ) -> Optional[Any]:
+        """
+        Build the substring search: one request matching any search field.
 
-        Raises:
-            RepositoryError: If retrieval operation fails
+        Args:
+            client: Supabase client
+            query: Search query string
+            fields: Text columns to search (None = default text fields)
+            limit: Maximum number of rows
+            select: Columns to select
+            where: Filter expression rows must also satisfy
+
+        Returns:
+            PostgREST request builder, or None if the table has none of the fields
         """
-        try:
-            client = get_client_with_retry()
+        search_fields = [field for field in fields or DEFAULT_SEARCH_FIELDS if field not in self._missing_search_fields]
+        if not search_fields:
+            return None
+        pattern = f"%{query}%"
+        request = self._apply_where(client.table(self.table_name).select(select).eq("is_deleted", False), where)
+        if len(search_fields) == 1:
+            request = request.ilike(search_fields[0], pattern)
+        else:
+            request = request.or_(",".join(self._render_where(ilike(field, pattern)) for field in search_fields))
+        return request.limit(limit) if limit else request
 
-            response = (
-                client.table(self.table_name)
-                .select("*")
-                .eq(self.id_field, entity_id)
-                .eq("is_deleted", False)
-                .maybe_single()
-                .execute()
-            )
+    def _skip_missing_field(self, error: APIError, fields: Optional[list[str]]) -> bool:
+        """
+        Leave a search field the table does not have out of later searches.
 
-            if response.data is None:
-                return None
+        Args:
+            error: Error raised by a substring search
+            fields: Text columns searched (None = default text fields)
+
+        Returns:
+            True if the error named a search field, so the search can be retried
+        """
+        column = missing_column(error)
+        if column is None or column not in (fields or DEFAULT_SEARCH_FIELDS) or column in self._missing_search_fields:
+            return False
+        self._missing_search_fields.add(column)
+        self.logger.warning(f"Table {self.table_name} has no column {column}; it is not searched")
+        return True
+
+    def _chunks(self, items: list[Any]) -> Iterator[list[Any]]:
+        """
+        Split items into request-sized chunks.
 
-            return self._deserialize_entity(response.data)
+        Args:
+            items: Items to split
 
-        except APIError as e:
-            raise RepositoryError(f"Supabase API error during get: {e}") from e
-        except Exception as e:
-            raise RepositoryError(f"Failed to get entity: {e}") from e
+        Yields:
+            Consecutive slices of at most ``batch_size`` items
+        """
+        for start in range(0, len(items), self.batch_size):
+            yield items[start : start + self.batch_size]
 
-    def delete(self, entity_id: str, hard: bool = False) -> bool:
+    def _order_by_ids(self, rows: list[dict[str, Any]], entity_ids: list[str]) -> list[T]:
         """
-        Delete an entity by ID.
+        Deserialize rows in the order their IDs were requested.
 
         Args:
-            entity_id: Unique identifier of the entity
-            hard: If True, perform hard delete; if False, soft delete (default)
+            rows: Rows returned by one or more ``in_`` selects
+            entity_ids: Requested IDs (duplicates allowed)
 
         Returns:
-            True if entity was deleted, False if not found
+            Entities in request order; IDs without a row are skipped
+        """
+        by_id = {str(row[self.id_field]): row for row in rows}
+        return [
+            self._deserialize_entity(by_id[entity_id])
+            for entity_id in entity_ids
+            if entity_id in by_id
+        ]
+
+    def _execute(self, query: Any) -> Any:
+        """
+        Execute a query builder and report the outcome to the circuit breaker and query stats.
 
-        Raises:
-            RepositoryError: If delete operation fails
+        Args:
+            query: PostgREST query builder
+
+        Returns:
+            PostgREST response
         """
+        started = time.perf_counter()
+        failed = True
         try:
-            client = get_client_with_retry()
+            response = query.execute()
+            failed = False
+        except CONNECTION_ERRORS:
+            record_request_failure()
+            raise
+        finally:
+            get_query_recorder().record_query(
+                query, self.table_name, time.perf_counter() - started, None if failed else response, failed
+            )
+        record_request_success()
+        return response
 
-            if hard:
-                # Hard delete - remove from database
-                response = (
-                    client.table(self.table_name)
-                    .delete()
-                    .eq(self.id_field, entity_id)
-                    .execute()
-                )
-            else:
-                # Soft delete - set is_deleted flag
-                response = (
-                    client.table(self.table_name)
-                    .update({"is_deleted": True, "deleted_at": datetime.utcnow().isoformat()})
-                    .eq(self.id_field, entity_id)
-                    .eq("is_deleted", False)
-                    .execute()
-                )
+    async def _execute_async(self, query: Any) -> Any:
+        """
+        Execute an async query builder and report the outcome to the circuit breaker and query stats.
 
-            return len(response.data) > 0
+        Args:
+            query: Async PostgREST query builder
 
-        except APIError as e:
-            raise RepositoryError(f"Supabase API error during delete: {e}") from e
-        except Exception as e:
-            raise RepositoryError(f"Failed to delete entity: {e}") from e
+        Returns:
+            PostgREST response
+        """
+        started = time.perf_counter()
+        failed = True
+        try:
+            response = await query.execute()
+            failed = False
+        except CONNECTION_ERRORS:
+            record_request_failure()
+            raise
+        finally:
+            get_query_recorder().record_query(
+                query, self.table_name, time.perf_counter() - started, None if failed else response, failed
+            )
+        record_request_success()
+        return response
 
-    def list(
-        self,
-        filters: Optional[dict[str, Any]] = None,
-        limit: Optional[int] = None,
-        offset: Optional[int] = None,
-        order_by: Optional[str] = None,
-    ) -> list[T]:
+    def _save_query(self, table: Any, data: dict[str, Any], mode: WriteMode) -> Any:
         """
-        List entities with optional filtering and pagination.
+        Build the single write statement for a save.
 
         Args:
-            filters: Dictionary of field:value filters
-            limit: Maximum number of results to return
-            offset: Number of results to skip
-            order_by: Field name to order by (prefix with '-' for descending)
+            table: PostgREST table request builder
+            data: Serialized entity
+            mode: Write mode
 
         Returns:
-            List of entities matching criteria
+            Query builder returning the written row
 
         Raises:
-            RepositoryError: If list operation fails
+            RepositoryError: If an update is requested without an ID
         """
-        try:
-            client = get_client_with_retry()
+        entity_id = data.get(self.id_field)
 
-            # Build query
-            query = client.table(self.table_name).select("*")
+        if mode == WriteMode.UPDATE_ONLY:
+            if not entity_id:
+                raise RepositoryError("Cannot update an entity without an ID")
+            return table.update(data, returning=ReturnMethod.representation).eq(
+                self.id_field, str(entity_id)
+            )
 
-            # Always filter out soft-deleted entities
-            query = query.eq("is_deleted", False)
+        if mode == WriteMode.INSERT_ONLY or not entity_id:
+            return table.insert(data, returning=ReturnMethod.representation)
 
-            # Apply filters
-            if filters:
-                for field, value in filters.items():
-                    if value is not None:
-                        query = query.eq(field, self._serialize_value(value))
+        return table.upsert(
+            data, on_conflict=self.id_field, returning=ReturnMethod.representation
+        )
 
-            # Apply ordering
-            if order_by:
-                descending = order_by.startswith("-")
-                field = order_by.lstrip("-")
-                query = query.order(field, desc=descending)
+    def _apply_filters(self, query: Any, filters: Optional[dict[str, Any]]) -> Any:
+        """
+        Apply soft-delete and equality filters to a query builder.
 
-            # Apply pagination
-            if limit is not None:
-                query = query.limit(limit)
-            if offset is not None:
-                query = query.range(offset, offset + (limit or 1000) - 1)
+        Args:
+            query: PostgREST query builder
+            filters: Dictionary of field:value filters
 
-            response = query.execute()
+        Returns:
+            Query builder with filters applied
+        """
+        # Always filter out soft-deleted entities
+        query = query.eq("is_deleted", False)
 
-            return [self._deserialize_entity(item) for item in response.data]
+        if filters:
+            for field, value in filters.items():
+                if value is not None:
+                    query = query.eq(field, self._serialize_value(value))
 
-        except APIError as e:
-            raise RepositoryError(f"Supabase API error during list: {e}") from e
-        except Exception as e:
-            raise RepositoryError(f"Failed to list entities: {e}") from e
+        return query
 
-    def search(
-        self,
-        query: str,
-        fields: Optional[list[str]] = None,
-        limit: Optional[int] = None,
-    ) -> list[T]:
+    def _apply_where(self, query: Any, where: Optional[FilterExpr]) -> Any:
         """
-        Search entities using text search.
+        Translate a filter expression into PostgREST filters.
 
-        Note: This implementation uses PostgreSQL's ilike operator for simple
-        text matching. For full-text search, consider using Supabase's
-        text search functions.
+        Top-level conditions become query parameters; ``or`` groups (and
+        anything nested in them) use PostgREST's logic tree syntax.
 
         Args:
-            query: Search query string
-            fields: List of field names to search in (None = search all text fields)
-            limit: Maximum number of results to return
+            query: PostgREST query builder
+            where: Filter expression (None = no filter)
 
         Returns:
-            List of entities matching search criteria
+            Query builder with the expression applied
+        """
+        if where is None:
+            return query
+        if isinstance(where, AllOf):
+            for member in where.filters:
+                query = self._apply_where(query, member)
+            return query
+        if isinstance(where, AnyOf):
+            return query.or_(",".join(self._render_where(member) for member in where.filters))
+
+        operator, operand = self._where_operand(where, quoted=False)
+        return query.filter(where.field, operator, operand)
+
+    def _render_where(self, where: FilterExpr) -> str:
+        """
+        Render a filter expression in PostgREST logic tree syntax.
 
-        Raises:
-            RepositoryError: If search operation fails
+        Args:
+            where: Filter expression
+
+        Returns:
+            Expression such as ``and(status.eq."active",priority.lte."2")``
         """
-        try:
-            client = get_client_with_retry()
-
-            # For simple implementation, search in common text fields
-            # This should be enhanced based on table schema
-            search_fields = fields or ["name", "description", "title", "content"]
-            pattern = f"%{query}%"
-
-            # Build OR query for multiple fields
-            base_query = client.table(self.table_name).select("*").eq("is_deleted", False)
-
-            # Apply OR conditions for each search field
-            results = []
-            for field in search_fields:
-                try:
-                    field_query = base_query.ilike(field, pattern)
-                    if limit:
-                        field_query = field_query.limit(limit)
-                    response = field_query.execute()
-                    results.extend(response.data)
-                except APIError:
-                    # Field might not exist in this table, skip it
-                    continue
-
-            # Remove duplicates based on ID
-            unique_items = {item[self.id_field]: item for item in results}
-            return [self._deserialize_entity(item) for item in unique_items.values()]
+        if isinstance(where, (AllOf, AnyOf)):
+            group = "and" if isinstance(where, AllOf) else "or"
+            return f"{group}({','.join(self._render_where(member) for member in where.filters)})"
 
-        except Exception as e:
-            raise RepositoryError(f"Failed to search entities: {e}") from e
+        operator, operand = self._where_operand(where, quoted=True)
+        return f"{where.field}.{operator}.{operand}"
 
-    def count(self, filters: Optional[dict[str, Any]] = None) -> int:
+    def _where_operand(self, condition: Condition, quoted: bool) -> tuple[str, str]:
         """
-        Count entities matching filters.
+        Build the PostgREST operator and operand for a condition.
 
         Args:
-            filters: Dictionary of field:value filters
+            condition: Filter condition
+            quoted: Quote the operand for use inside a logic tree
 
         Returns:
-            Number of entities matching criteria
-
-        Raises:
-            RepositoryError: If count operation fails
+            Tuple of (operator, operand)
         """
-        try:
-            client = get_client_with_retry()
+        if condition.op == FilterOp.IS_NULL:
+            return ("is" if condition.value else "not.is"), "null"
+        if condition.op == FilterOp.IN:
+            values = ",".join(self._quote_filter_value(keyset_value(v)) for v in condition.value)
+            return "in", f"({values})"
+
+        value = keyset_value(condition.value)
+        if condition.op == FilterOp.CONTAINS or isinstance(value, bool):
+            value = json.dumps(value)
+        operand = self._quote_filter_value(value) if quoted else str(value)
+        return POSTGREST_OPERATORS[condition.op], operand
+
+    def _apply_keyset(
+        self,
+        query: Any,
+        limit: int,
+        order_by: Optional[str],
+        after: Optional[str],
+        before: Optional[str],
+    ) -> Any:
+        """
+        Apply keyset ordering, boundary and limit to a query builder.
 
-            # Build query with count
-            query = client.table(self.table_name).select("*", count="exact")
+        Rows are ordered by ``(field, id)``. When paging backwards the order
+        is reversed so the rows nearest the cursor are fetched; callers
+        restore listing order with ``_keyset_page``. One extra row is
+        requested to detect whether more rows follow.
 
-            # Always filter out soft-deleted entities
-            query = query.eq("is_deleted", False)
+        Args:
+            query: PostgREST query builder
+            limit: Maximum number of results to return
+            order_by: Field name to order by (prefix with '-' for descending)
+            after: Cursor of the page to continue after
+            before: Cursor of the page to go back from
 
-            # Apply filters
-            if filters:
-                for field, value in filters.items():
-                    if value is not None:
-                        query = query.eq(field, self._serialize_value(value))
+        Returns:
+            Query builder with keyset pagination applied
 
-            response = query.execute()
+        Raises:
+            ValueError: If a cursor is malformed
+        """
+        field, descending = parse_order_by(order_by, self.id_field)
+        if before is not None:
+            descending = not descending
+
+        token = before or after
+        if token:
+            value, last_id = decode_cursor(token)
+            op = "lt" if descending else "gt"
+            if field == self.id_field:
+                query = getattr(query, op)(self.id_field, last_id)
+            else:
+                boundary = self._quote_filter_value(value)
+                query = query.or_(
+                    f"{field}.{op}.{boundary},"
+                    f"and({field}.eq.{boundary},{self.id_field}.{op}.{self._quote_filter_value(last_id)})"
+                )
 
-            return response.count or 0
+        query = query.order(field, desc=descending)
+        if field != self.id_field:
+            query = query.order(self.id_field, desc=descending)
 
-        except APIError as e:
-            raise RepositoryError(f"Supabase API error during count: {e}") from e
-        except Exception as e:
-            raise RepositoryError(f"Failed to count entities: {e}") from e
+        return query.limit(limit + 1)
 
-    def exists(self, entity_id: str) -> bool:
+    def _keyset_page(
+        self,
+        rows: list[dict[str, Any]],
+        limit: int,
+        order_by: Optional[str],
+        after: Optional[str],
+        before: Optional[str],
+    ) -> KeysetPage[T]:
         """
-        Check if an entity exists.
+        Build a keyset page from rows fetched with ``_apply_keyset``.
 
         Args:
-            entity_id: Unique identifier of the entity
+            rows: Rows returned by the query (up to ``limit + 1``)
+            limit: Maximum number of results to return
+            order_by: Field name the rows are ordered by
+            after: Cursor the page continues after
+            before: Cursor the page goes back from
 
         Returns:
-            True if entity exists and is not soft-deleted, False otherwise
+            Page of entities with next/previous cursors
+        """
+        field, _ = parse_order_by(order_by, self.id_field)
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if before is not None:
+            rows.reverse()
+
+        page: KeysetPage[T] = KeysetPage(
+            items=[self._deserialize_entity(row) for row in rows]
+        )
+        if rows:
+            first_cursor = encode_cursor(rows[0].get(field), rows[0][self.id_field])
+            last_cursor = encode_cursor(rows[-1].get(field), rows[-1][self.id_field])
+            if before is not None:
+                page.prev_cursor = first_cursor if has_more else None
+                page.next_cursor = last_cursor
+            else:
+                page.next_cursor = last_cursor if has_more else None
+                page.prev_cursor = first_cursor if after else None
+        return page
 
-        Raises:
-            RepositoryError: If existence check fails
+    @staticmethod
+    def _quote_filter_value(value: Any) -> str:
         """
+        Quote a value for use inside a PostgREST ``or`` filter.
+
+        Args:
+            value: Filter value
+
+        Returns:
+            Double-quoted value with quotes and backslashes escaped
+        """
+        text = str(value).replace("\\", "\\\\").replace('"', '\\"')
+        return f'"{text}"'
+
+    def _apply_pagination(
+        self,
+        query: Any,
+        limit: Optional[int],
+        offset: Optional[int],
+        order_by: Optional[str],
+    ) -> Any:
+        """
+        Apply ordering and pagination to a query builder.
+
+        Args:
+            query: PostgREST query builder
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+            order_by: Field name to order by (prefix with '-' for descending)
+
+        Returns:
+            Query builder with ordering and pagination applied
+        """
+        if order_by:
+            descending = order_by.startswith("-")
+            field = order_by.lstrip("-")
+            query = query.order(field, desc=descending)
+
+        if limit is not None:
+            query = query.limit(limit)
+        if offset is not None:
+            query = query.range(offset, offset + (limit or 1000) - 1)
+
+        return query
+
+
+class SupabaseRepository(SupabaseEntityMapper[T], Repository[T], Generic[T]):
+    """
+    Supabase implementation of the Repository port.
+
+    This repository handles:
+    - UUID and datetime serialization
+    - Soft deletes with is_deleted flag
+    - Pagination support
+    - Error handling and retries
+    - Type-safe entity operations
+
+    Type parameter T represents the entity type managed by this repository.
+    """
+
+    def _read_client(self) -> Any:
+        """Client for a read: a replica unless the session is pinned to the primary."""
+        return get_replica_client() or get_client_with_retry()
+
+    def _write_client(self) -> Any:
+        """Primary client for a write; pins the current session to the primary."""
+        client = get_client_with_retry()
+        record_write()
+        return client
+
+    def save(self, entity: T, mode: WriteMode = WriteMode.UPSERT) -> T:
+        """
+        Save an entity to Supabase in a single request.
+
+        By default performs a native upsert on the ID column; callers that
+        know the intent can skip conflict handling with ``mode``.
+
+        Args:
+            entity: Entity to save
+            mode: UPSERT (default), INSERT_ONLY or UPDATE_ONLY
+
+        Returns:
+            Saved entity with any generated fields
+
+        Raises:
+            RepositoryError: If save operation fails, or no row matched an
+                UPDATE_ONLY save
+        """
+        try:
+            client = self._write_client()
+            data = self._serialize_entity(entity)
+
+            response = self._execute(
+                self._save_query(client.table(self.table_name), data, mode)
+            )
+
+            if not response.data:
+                if mode == WriteMode.UPDATE_ONLY:
+                    raise RepositoryError(f"Entity {data.get(self.id_field)} not found for update")
+                raise RepositoryError("Save operation returned no data")
+
+            return self._deserialize_entity(response.data[0])
+
+        except APIError as e:
+            raise RepositoryError(f"Supabase API error during save: {e}") from e
+        except Exception as e:
+            raise RepositoryError(f"Failed to save entity: {e}") from e
+
+    def insert(self, entity: T) -> T:
+        """
+        Insert a new entity without conflict handling.
+
+        Args:
+            entity: Entity to insert
+
+        Returns:
+            Saved entity with any generated fields
+
+        Raises:
+            RepositoryError: If the entity already exists or the insert fails
+        """
+        return self.save(entity, mode=WriteMode.INSERT_ONLY)
+
+    def update(self, entity: T) -> T:
+        """
+        Update an existing entity without conflict handling.
+
+        Args:
+            entity: Entity to update
+
+        Returns:
+            Saved entity
+
+        Raises:
+            RepositoryError: If the entity does not exist or the update fails
+        """
+        return self.save(entity, mode=WriteMode.UPDATE_ONLY)
+
+    def get(self, entity_id: str) -> Optional[T]:
+        """
+        Retrieve an entity by ID.
+
+        Args:
+            entity_id: Unique identifier of the entity
+
+        Returns:
+            Entity if found and not soft-deleted, None otherwise
+
+        Raises:
+            RepositoryError: If retrieval operation fails
+        """
+        if self._definitely_missing(entity_id):
+            return None
+
+        try:
+            row = self._fetch_row(entity_id, "*")
+
+            if row is None:
+                self._note_false_positives()
+                return None
+
+            return self._deserialize_entity(row)
+
+        except APIError as e:
+            raise RepositoryError(f"Supabase API error during get: {e}") from e
+        except Exception as e:
+            raise RepositoryError(f"Failed to get entity: {e}") from e
+
+    def get_projected(self, entity_id: str, columns: list[str]) -> Optional[dict[str, Any]]:
+        """
+        Retrieve selected columns of an entity by ID.
+
+        Only the requested columns are selected, so unrequested blobs never
+        leave the database.
+
+        Args:
+            entity_id: Unique identifier of the entity
+            columns: Column names to return
+
+        Returns:
+            Row with the requested columns, or None if not found or soft-deleted
+
+        Raises:
+            ValueError: If the projection is invalid
+            RepositoryError: If retrieval operation fails
+        """
+        select = self._select_columns(columns)
+        if self._definitely_missing(entity_id):
+            return None
+
+        try:
+            return self._fetch_row(entity_id, select)
+
+        except APIError as e:
+            raise RepositoryError(f"Supabase API error during get: {e}") from e
+        except Exception as e:
+            raise RepositoryError(f"Failed to get entity: {e}") from e
+
+    def _fetch_row(self, entity_id: str, select: str) -> Optional[dict[str, Any]]:
+        """
+        Fetch one live row by ID.
+
+        Args:
+            entity_id: Unique identifier of the entity
+            select: Columns to select
+
+        Returns:
+            Row data, or None if not found or soft-deleted
+        """
+        client = self._read_client()
+
+        response = self._execute(
+            client.table(self.table_name)
+            .select(select)
+            .eq(self.id_field, entity_id)
+            .eq("is_deleted", False)
+            .maybe_single()
+        )
+
+        return response.data
+
+    def patch(
+        self,
+        entity_id: str,
+        changes: dict[str, Any],
+        expected_revision: Optional[int] = None,
+    ) -> Optional[T]:
+        """
+        Update only the given columns of an entity in one request.
+
+        Sends a single ``UPDATE ... RETURNING`` carrying just the changed
+        columns instead of rewriting the whole row. With
+        ``expected_revision`` the update is conditional on the ``revision``
+        column (``WHERE revision = n``) and sets it to n + 1; only when no
+        row matches is the entity read again to tell a conflict from a
+        missing entity.
+
+        Args:
+            entity_id: Unique identifier of the entity
+            changes: Mapping of field name to new value
+            expected_revision: Revision the row must have (None = unconditional)
+
+        Returns:
+            Updated entity, or None if not found
+
+        Raises:
+            ValueError: If a field is not a column of the entity type
+            ConcurrencyError: If the row has another revision
+            RepositoryError: If the update fails
+        """
+        if not changes and expected_revision is None:
+            return self.get(entity_id)
+
+        try:
+            client = self._write_client()
+            response = self._execute(
+                self._patch_query(client.table(self.table_name), entity_id, changes, expected_revision)
+            )
+            if response.data:
+                return self._deserialize_entity(response.data[0])
+            row = self._fetch_row(entity_id, REVISION_COLUMN) if expected_revision is not None else None
+
+        except (ValueError, RepositoryError):
+            raise
+        except APIError as e:
+            raise RepositoryError(f"Supabase API error during patch: {e}") from e
+        except Exception as e:
+            raise RepositoryError(f"Failed to patch entity: {e}") from e
+
+        self._patch_conflict(entity_id, expected_revision, row)
+        return None
+
+    def update_where(
+        self,
+        filters: Optional[dict[str, Any]],
+        changes: dict[str, Any],
+        where: Optional[FilterExpr] = None,
+    ) -> int:
+        """
+        Set the given columns on every matching row with one ``UPDATE``.
+
+        Args:
+            filters: Dictionary of field:value filters
+            changes: Mapping of field name to new value
+            where: Filter expression applied on top of ``filters``
+
+        Returns:
+            Number of entities updated
+
+        Raises:
+            ValueError: If no filter is given or a field is not a column
+            RepositoryError: If the update fails
+        """
+        if not changes:
+            require_update_filter(filters, where)
+            return 0
+
+        try:
+            client = self._write_client()
+            response = self._execute(
+                self._update_where_query(client.table(self.table_name), filters, changes, where)
+            )
+            self._note_live_rows(response.data)
+            return len(response.data)
+
+        except (ValueError, RepositoryError):
+            raise
+        except APIError as e:
+            raise RepositoryError(f"Supabase API error during update_where: {e}") from e
+        except Exception as e:
+            raise RepositoryError(f"Failed to update entities: {e}") from e
+
+    def commit(self, batch: WriteBatch[T]) -> list[Any]:
+        """
+        Apply a batch atomically with one call to ``BATCH_FUNCTION``.
+
+        The function runs in a single database transaction, so a failing
+        write rolls back the whole batch and nothing needs compensating.
+        Falls back to the non-atomic default when the function is not
+        installed.
+
+        Args:
+            batch: Writes to apply
+
+        Returns:
+            One result per write (see ``WriteBatch.results``)
+
+        Raises:
+            ConcurrencyError: If a conditional save finds another revision
+            RepositoryError: If a write fails; no write of the batch is kept
+        """
+        if self.batch_available:
+            try:
+                client = self._write_client()
+                response = self._execute(
+                    client.rpc(BATCH_FUNCTION, batch_params(self.table_name, self._batch_writes(batch)))
+                )
+                return self._batch_results(batch, response.data)
+            except APIError as e:
+                conflict = batch_conflict(e)
+                if conflict is not None:
+                    raise conflict from e
+                if not is_missing_function(e):
+                    raise RepositoryError(f"Supabase API error during commit: {e}") from e
+                self.batch_available = False
+                self._warn_fallback(BATCH_FUNCTION, "non-atomic writes")
+            except RepositoryError:
+                raise
+            except Exception as e:
+                raise RepositoryError(f"Failed to commit batch: {e}") from e
+
+        return super().commit(batch)
+
+    def delete(self, entity_id: str, hard: bool = False) -> bool:
+        """
+        Delete an entity by ID.
+
+        Args:
+            entity_id: Unique identifier of the entity
+            hard: If True, perform hard delete; if False, soft delete (default)
+
+        Returns:
+            True if entity was deleted, False if not found
+
+        Raises:
+            RepositoryError: If delete operation fails
+        """
+        try:
+            client = self._write_client()
+
+            if hard:
+                # Hard delete - remove from database
+                response = self._execute(
+                    client.table(self.table_name)
+                    .delete()
+                    .eq(self.id_field, entity_id)
+                )
+            else:
+                # Soft delete - set is_deleted flag
+                response = self._execute(
+                    client.table(self.table_name)
+                    .update({"is_deleted": True, "deleted_at": datetime.utcnow().isoformat()})
+                    .eq(self.id_field, entity_id)
+                    .eq("is_deleted", False)
+                )
+
+            self._note_deletes(len(response.data))
+            return len(response.data) > 0
+
+        except APIError as e:
+            raise RepositoryError(f"Supabase API error during delete: {e}") from e
+        except Exception as e:
+            raise RepositoryError(f"Failed to delete entity: {e}") from e
+
+    def list(
+        self,
+        filters: Optional[dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[str] = None,
+    ) -> list[T]:
+        """
+        List entities with optional filtering and pagination.
+
+        Args:
+            filters: Dictionary of field:value filters
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+            order_by: Field name to order by (prefix with '-' for descending)
+
+        Returns:
+            List of entities matching criteria
+
+        Raises:
+            RepositoryError: If list operation fails
+        """
+        try:
+            rows = self._fetch_rows("*", filters, limit, offset, order_by)
+
+            return [self._deserialize_entity(item) for item in rows]
+
+        except APIError as e:
+            raise RepositoryError(f"Supabase API error during list: {e}") from e
+        except Exception as e:
+            raise RepositoryError(f"Failed to list entities: {e}") from e
+
+    def list_projected(
+        self,
+        columns: list[str],
+        filters: Optional[dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[str] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        List selected columns of entities with optional filtering and pagination.
+
+        Args:
+            columns: Column names to return
+            filters: Dictionary of field:value filters
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+            order_by: Field name to order by (prefix with '-' for descending)
+
+        Returns:
+            Rows with the requested columns
+
+        Raises:
+            ValueError: If the projection is invalid
+            RepositoryError: If list operation fails
+        """
+        select = self._select_columns(columns)
+
+        try:
+            return self._fetch_rows(select, filters, limit, offset, order_by)
+
+        except APIError as e:
+            raise RepositoryError(f"Supabase API error during list: {e}") from e
+        except Exception as e:
+            raise RepositoryError(f"Failed to list entities: {e}") from e
+
+    def _fetch_rows(
+        self,
+        select: str,
+        filters: Optional[dict[str, Any]],
+        limit: Optional[int],
+        offset: Optional[int],
+        order_by: Optional[str],
+        where: Optional[FilterExpr] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch rows matching filters with ordering and pagination.
+
+        Args:
+            select: Columns to select
+            filters: Dictionary of field:value filters
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+            order_by: Field name to order by (prefix with '-' for descending)
+            where: Filter expression applied on top of ``filters``
+
+        Returns:
+            Row data
+        """
+        client = self._read_client()
+
+        query = client.table(self.table_name).select(select)
+        query = self._apply_filters(query, filters)
+        query = self._apply_where(query, where)
+        query = self._apply_pagination(query, limit, offset, order_by)
+
+        return self._execute(query).data
+
+    def list_page(
+        self,
+        filters: Optional[dict[str, Any]] = None,
+        limit: int = 20,
+        order_by: Optional[str] = None,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        where: Optional[FilterExpr] = None,
+    ) -> KeysetPage[T]:
+        """
+        List one page of entities using keyset (cursor) pagination.
+
+        The boundary is pushed into the query as ``(field, id) > (value,
+        id)``, so every page costs the same regardless of depth. The order
+        field should be non-null.
+
+        Args:
+            filters: Dictionary of field:value filters
+            limit: Maximum number of results to return
+            order_by: Field name to order by (prefix with '-' for descending)
+            after: Cursor of the page to continue after
+            before: Cursor of the page to go back from
+            where: Filter expression applied on top of ``filters``
+
+        Returns:
+            Page of entities with next/previous cursors
+
+        Raises:
+            ValueError: If a cursor is malformed
+            RepositoryError: If list operation fails
+        """
+        # Reject malformed cursors before touching the network
+        for cursor in (after, before):
+            if cursor:
+                decode_cursor(cursor)
+
+        try:
+            client = self._read_client()
+
+            query = client.table(self.table_name).select("*")
+            query = self._apply_filters(query, filters)
+            query = self._apply_where(query, where)
+            query = self._apply_keyset(query, limit, order_by, after, before)
+
+            response = self._execute(query)
+
+            return self._keyset_page(response.data, limit, order_by, after, before)
+
+        except APIError as e:
+            raise RepositoryError(f"Supabase API error during list_page: {e}") from e
+        except Exception as e:
+            raise RepositoryError(f"Failed to list entities: {e}") from e
+
+    def list_where(
+        self,
+        where: FilterExpr,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[str] = None,
+    ) -> list[T]:
+        """
+        List entities matching a filter expression, filtered by the database.
+
+        Args:
+            where: Filter expression
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+            order_by: Field name to order by (prefix with '-' for descending)
+
+        Returns:
+            List of matching entities
+
+        Raises:
+            RepositoryError: If list operation fails
+        """
+        try:
+            rows = self._fetch_rows("*", None, limit, offset, order_by, where)
+
+            return [self._deserialize_entity(item) for item in rows]
+
+        except APIError as e:
+            raise RepositoryError(f"Supabase API error during list: {e}") from e
+        except Exception as e:
+            raise RepositoryError(f"Failed to list entities: {e}") from e
+
+    def count_where(self, where: FilterExpr) -> int:
+        """
+        Count entities matching a filter expression with a HEAD request.
+
+        Args:
+            where: Filter expression
+
+        Returns:
+            Number of matching entities
+
+        Raises:
+            RepositoryError: If count operation fails
+        """
+        return self._count(None, CountMethod.exact, where)
+
+    def aggregate(
+        self,
+        group_by: Optional[list[str]] = None,
+        metrics: Optional[list[Metric]] = None,
+        filters: Optional[dict[str, Any]] = None,
+        time_bucket: Optional[TimeBucket] = None,
+        time_field: str = "created_at",
+        where: Optional[FilterExpr] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Aggregate entities per group in one ``GROUP BY`` query.
+
+        Runs through the aggregate function over RPC; a database without
+        it falls back to streaming entities and aggregating in memory.
+
+        Args:
+            group_by: Group keys: column names or ``column.key`` JSON paths
+            metrics: Metrics to compute (None = row count)
+            filters: Dictionary of field:value filters
+            time_bucket: Bucket rows by ``time_field`` truncated to this size
+            time_field: Datetime column used for bucketing
+            where: Filter expression applied on top of ``filters``
+
+        Returns:
+            One row per group holding the group values, the start of the
+            bucket under ``"bucket"`` and one entry per metric alias
+
+        Raises:
+            ValueError: If a group key or metric is invalid
+            RepositoryError: If the aggregation fails
+        """
+        params = aggregate_params(
+            self.table_name, group_by, metrics, filters, time_bucket, time_field, where
+        )
+
+        if self.aggregate_available:
+            try:
+                client = self._read_client()
+                response = self._execute(client.rpc(AGGREGATE_FUNCTION, params))
+                return response.data or []
+            except APIError as e:
+                if not is_missing_function(e):
+                    raise RepositoryError(f"Supabase API error during aggregate: {e}") from e
+                self.aggregate_available = False
+                self._warn_fallback(AGGREGATE_FUNCTION, "in-memory aggregation")
+            except Exception as e:
+                raise RepositoryError(f"Failed to aggregate entities: {e}") from e
+
+        return super().aggregate(group_by, metrics, filters, time_bucket, time_field, where)
+
+    def search(
+        self,
+        query: str,
+        fields: Optional[list[str]] = None,
+        limit: Optional[int] = None,
+    ) -> list[T]:
+        """
+        Search entities using text search, most relevant first.
+
+        Equivalent to ``search_ranked`` in AUTO mode.
+
+        Args:
+            query: Search query string
+            fields: List of field names to search in (None = search all text fields)
+            limit: Maximum number of results to return
+
+        Returns:
+            List of entities matching search criteria
+
+        Raises:
+            RepositoryError: If search operation fails
+        """
+        return self.search_ranked(query, fields=fields, limit=limit)
+
+    def search_ranked(
+        self,
+        query: str,
+        fields: Optional[list[str]] = None,
+        limit: Optional[int] = None,
+        mode: SearchMode = SearchMode.AUTO,
+        where: Optional[FilterExpr] = None,
+    ) -> list[T]:
+        """
+        Search entities in one ranked query.
+
+        Full-text matches are ordered by ``ts_rank``; short queries use
+        trigram similarity. SUBSTRING mode, a database without the search
+        function, or a ``where`` that is more than a conjunction of
+        equalities uses per-field ``ilike`` matching instead.
+
+        Args:
+            query: Search query string
+            fields: List of field names to search in (None = search all text fields)
+            limit: Maximum number of results to return
+            mode: How query text is matched
+            where: Filter expression matches must also satisfy
+
+        Returns:
+            List of matching entities ordered by relevance
+
+        Raises:
+            RepositoryError: If search operation fails
+        """
+        try:
+            rows = self._ranked_rows(query, fields, limit, mode, None, where)
+            return [self._deserialize_entity(item) for item in rows]
+
+        except Exception as e:
+            raise RepositoryError(f"Failed to search entities: {e}") from e
+
+    def search_projected(
+        self,
+        query: str,
+        columns: list[str],
+        fields: Optional[list[str]] = None,
+        limit: Optional[int] = None,
+        mode: SearchMode = SearchMode.AUTO,
+        where: Optional[FilterExpr] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Search entities and return selected columns.
+
+        Args:
+            query: Search query string
+            columns: Column names to return
+            fields: List of field names to search in (None = search all text fields)
+            limit: Maximum number of results to return
+            mode: How query text is matched (see ``search_ranked``)
+            where: Filter expression matches must also satisfy
+
+        Returns:
+            Rows with the requested columns
+
+        Raises:
+            ValueError: If the projection is invalid
+            RepositoryError: If search operation fails
+        """
+        normalize_columns(columns, self.id_field)
+
+        try:
+            return self._ranked_rows(query, fields, limit, mode, columns, where)
+
+        except Exception as e:
+            raise RepositoryError(f"Failed to search entities: {e}") from e
+
+    def _ranked_rows(
+        self,
+        query: str,
+        fields: Optional[list[str]],
+        limit: Optional[int],
+        mode: SearchMode,
+        columns: Optional[list[str]],
+        where: Optional[FilterExpr] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch matching rows through the search function, best match first.
+
+        Args:
+            query: Search query string
+            fields: List of field names to search in (None = search all text fields)
+            limit: Maximum number of results
+            mode: How query text is matched
+            columns: Columns to return (None = whole rows)
+            where: Filter expression matches must also satisfy
+
+        Returns:
+            Matching rows
+        """
+        filter_values = equality_filter(where)
+        if mode != SearchMode.SUBSTRING and self.ranked_search_available and filter_values is not None:
+            client = self._read_client()
+            try:
+                response = self._execute(
+                    self._search_rpc(client, query, fields, limit, mode, columns, filter_values)
+                )
+                return response.data or []
+            except APIError as e:
+                if not is_missing_function(e):
+                    raise
+                self.ranked_search_available = False
+                self._warn_fallback(SEARCH_FUNCTION, "substring matching")
+
+        return self._search_rows(query, fields, limit, self._select_columns(columns), where)
+
+    def _search_rows(
+        self,
+        query: str,
+        fields: Optional[list[str]],
+        limit: Optional[int],
+        select: str,
+        where: Optional[FilterExpr] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch live rows whose text fields match the query, in one request.
+
+        Fields the table does not have are dropped and the request retried.
+
+        Args:
+            query: Search query string
+            fields: List of field names to search in (None = search all text fields)
+            limit: Maximum number of results
+            select: Columns to select
+            where: Filter expression rows must also satisfy
+
+        Returns:
+            Matching rows
+        """
+        client = self._read_client()
+        while True:
+            request = self._substring_search(client, query, fields, limit, select, where)
+            if request is None:
+                return []
+            try:
+                return self._execute(request).data
+            except APIError as e:
+                if not self._skip_missing_field(e, fields):
+                    raise
+
+    def count(self, filters: Optional[dict[str, Any]] = None) -> int:
+        """
+        Count entities matching filters.
+
+        Issued as a HEAD request, so no rows are transferred.
+
+        Args:
+            filters: Dictionary of field:value filters
+
+        Returns:
+            Number of entities matching criteria
+
+        Raises:
+            RepositoryError: If count operation fails
+        """
+        return self._count(filters, CountMethod.exact)
+
+    def count_planned(self, filters: Optional[dict[str, Any]] = None) -> int:
+        """
+        Estimate the number of entities matching filters.
+
+        Uses the Postgres planner's row estimate, which costs the same no
+        matter how many rows match but may be off after bulk changes until
+        the table is analyzed.
+
+        Args:
+            filters: Dictionary of field:value filters
+
+        Returns:
+            Estimated number of entities matching criteria
+
+        Raises:
+            RepositoryError: If count operation fails
+        """
+        return self._count(filters, CountMethod.planned)
+
+    def _count(
+        self,
+        filters: Optional[dict[str, Any]],
+        method: CountMethod,
+        where: Optional[FilterExpr] = None,
+    ) -> int:
+        """
+        Run a head-only count request.
+
+        Args:
+            filters: Dictionary of field:value filters
+            method: PostgREST count method
+            where: Filter expression applied on top of ``filters``
+
+        Returns:
+            Count reported by PostgREST
+
+        Raises:
+            RepositoryError: If count operation fails
+        """
+        try:
+            client = self._read_client()
+
+            query = client.table(self.table_name).select(self.id_field, count=method, head=True)
+            query = self._apply_filters(query, filters)
+            query = self._apply_where(query, where)
+
+            response = self._execute(query)
+
+            return response.count or 0
+
+        except APIError as e:
+            raise RepositoryError(f"Supabase API error during count: {e}") from e
+        except Exception as e:
+            raise RepositoryError(f"Failed to count entities: {e}") from e
+
+    def exists(self, entity_id: str) -> bool:
+        """
+        Check if an entity exists.
+
+        Args:
+            entity_id: Unique identifier of the entity
+
+        Returns:
+            True if entity exists and is not soft-deleted, False otherwise
+
+        Raises:
+            RepositoryError: If existence check fails
+        """
+        if self._definitely_missing(entity_id):
+            return False
+
         try:
-            client = get_client_with_retry()
+            client = self._read_client()
 
-            response = (
+            response = self._execute(
                 client.table(self.table_name)
                 .select(self.id_field, count="exact")
                 .eq(self.id_field, entity_id)
                 .eq("is_deleted", False)
-                .execute()
             )
 
-            return (response.count or 0) > 0
+            if not response.count:
+                self._note_false_positives()
+                return False
+            return True
 
         except APIError as e:
             raise RepositoryError(f"Supabase API error during exists check: {e}") from e
         except Exception as e:
             raise RepositoryError(f"Failed to check entity existence: {e}") from e
+
+    def refresh_existence_filter(self) -> int:
+        """
+        Rebuild the existence filter from a scan of the table's live IDs.
+
+        IDs are read from the primary one ``batch_size`` keyset page at a
+        time, so the scan holds a single page in memory. Lookups keep
+        using the previous filter until the scan completes.
+
+        Returns:
+            Number of IDs scanned (0 without an existence filter)
+
+        Raises:
+            RepositoryError: If the scan fails; the previous filter is kept
+        """
+        existence = self.existence_filter
+        if existence is None:
+            return 0
+        try:
+            expected = self.count_planned()
+        except RepositoryError:
+            expected = 0
+
+        scanned = 0
+        try:
+            with existence.rebuilding(expected) as add:
+                client = get_client_with_retry()
+                after: Optional[str] = None
+                while True:
+                    rows = self._execute(self._id_scan_query(client.table(self.table_name), after)).data
+                    for row in rows:
+                        add(row[self.id_field])
+                    scanned += len(rows)
+                    if len(rows) < self.batch_size:
+                        break
+                    after = str(rows[-1][self.id_field])
+        except APIError as e:
+            raise RepositoryError(f"Supabase API error during existence filter rebuild: {e}") from e
+        except RepositoryError:
+            raise
+        except Exception as e:
+            raise RepositoryError(f"Failed to rebuild existence filter: {e}") from e
+        return scanned
+
+    def _start_existence_rebuild(self) -> None:
+        """Rebuild the existence filter in a daemon thread."""
+        self._existence_rebuild = threading.Thread(
+            target=self._rebuild_existence_filter,
+            name=f"existence-filter-{self.table_name}",
+            daemon=True,
+        )
+        self._existence_rebuild.start()
+
+    def _rebuild_existence_filter(self) -> None:
+        """Run a background rebuild; failures are counted by the filter and retried."""
+        try:
+            self.refresh_existence_filter()
+        except RepositoryError:
+            pass
+
+    def get_many(self, entity_ids: list[str]) -> list[T]:
+        """
+        Retrieve several entities with one ``in`` select per chunk.
+
+        Args:
+            entity_ids: Identifiers of the entities to retrieve
+
+        Returns:
+            Entities that were found and are not soft-deleted, in the order
+            of ``entity_ids``
+
+        Raises:
+            RepositoryError: If retrieval operation fails
+        """
+        candidates = [
+            entity_id for entity_id in dict.fromkeys(entity_ids) if not self._definitely_missing(entity_id)
+        ]
+        if not candidates:
+            return []
+
+        try:
+            client = self._read_client()
+
+            rows: list[dict[str, Any]] = []
+            for chunk in self._chunks(candidates):
+                response = self._execute(
+                    client.table(self.table_name)
+                    .select("*")
+                    .in_(self.id_field, chunk)
+                    .eq("is_deleted", False)
+                )
+                rows.extend(response.data)
+
+            self._note_false_positives(len(candidates) - len(rows))
+            return self._order_by_ids(rows, entity_ids)
+
+        except APIError as e:
+            raise RepositoryError(f"Supabase API error during get_many: {e}") from e
+        except Exception as e:
+            raise RepositoryError(f"Failed to get entities: {e}") from e
+
+    def save_many(self, entities: list[T]) -> list[T]:
+        """
+        Save several entities with one multi-row upsert per chunk.
+
+        Args:
+            entities: Entities to save
+
+        Returns:
+            Saved entities with any generated fields
+
+        Raises:
+            RepositoryError: If save operation fails
+        """
+        if not entities:
+            return []
+
+        try:
+            client = self._write_client()
+            rows = [self._serialize_entity(entity) for entity in entities]
+
+            saved = []
+            for chunk in self._chunks(rows):
+                response = self._execute(
+                    client.table(self.table_name).upsert(chunk, on_conflict=self.id_field)
+                )
+                if len(response.data) != len(chunk):
+                    raise RepositoryError(
+                        f"Batch save returned {len(response.data)} rows for {len(chunk)} entities"
+                    )
+                saved.extend(self._deserialize_entity(item) for item in response.data)
+
+            return saved
+
+        except APIError as e:
+            raise RepositoryError(f"Supabase API error during save_many: {e}") from e
+        except Exception as e:
+            raise RepositoryError(f"Failed to save entities: {e}") from e
+
+    def delete_many(self, entity_ids: list[str], hard: bool = False) -> int:
+        """
+        Delete several entities with one statement per chunk.
+
+        Args:
+            entity_ids: Identifiers of the entities to delete
+            hard: If True, perform hard delete; if False, soft delete (default)
+
+        Returns:
+            Number of entities deleted
+
+        Raises:
+            RepositoryError: If delete operation fails
+        """
+        if not entity_ids:
+            return 0
+
+        try:
+            client = self._write_client()
+            deleted_at = datetime.utcnow().isoformat()
+
+            deleted = 0
+            for chunk in self._chunks(list(dict.fromkeys(entity_ids))):
+                if hard:
+                    query = client.table(self.table_name).delete().in_(self.id_field, chunk)
+                else:
+                    query = (
+                        client.table(self.table_name)
+                        .update({"is_deleted": True, "deleted_at": deleted_at})
+                        .in_(self.id_field, chunk)
+                        .eq("is_deleted", False)
+                    )
+                response = self._execute(query)
+                deleted += len(response.data)
+
+            self._note_deletes(deleted)
+            return deleted
+
+        except APIError as e:
+            raise RepositoryError(f"Supabase API error during delete_many: {e}") from e
+        except Exception as e:
+            raise RepositoryError(f"Failed to delete entities: {e}") from e
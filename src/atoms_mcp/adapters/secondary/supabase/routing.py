@@ -0,0 +1,264 @@
+"""
+Read-replica routing with read-your-writes consistency.
+
+Repository reads are spread round-robin over the configured read
+replicas, while writes always go to the primary. Replicas lag the
+primary, so a session that has just written is pinned to the primary
+for a configurable window and keeps seeing its own writes.
+
+A session is identified by the ``consistency_session`` context, opened
+per incoming request with the caller's session ID (the MCP server does
+this for every tool call). Each write moves the session's pin forward
+and yields a ``ConsistencyToken`` that can be handed to the caller and
+sent back with later requests, so the pin also holds when those requests
+reach another server process. Code running outside any session is never
+pinned, and a session without an ID only pins its own context.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from itertools import count
+from typing import Any, Optional
+
+# Pins are pruned once the table holds this many sessions
+_PRUNE_THRESHOLD = 10_000
+
+
+@dataclass(frozen=True)
+class ConsistencyToken:
+    """
+    Proof that a session wrote recently.
+
+    Attributes:
+        pinned_until: Wall-clock time (epoch seconds) until which reads
+            must be served by the primary
+    """
+
+    pinned_until: float
+
+    @property
+    def active(self) -> bool:
+        """Whether reads must still go to the primary."""
+        return time.time() < self.pinned_until
+
+    def encode(self) -> str:
+        """
+        Encode the token as an opaque string.
+
+        Returns:
+            URL-safe token string
+        """
+        return base64.urlsafe_b64encode(f"{self.pinned_until:.3f}".encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> ConsistencyToken:
+        """
+        Decode a token produced by ``encode``.
+
+        Args:
+            token: Token string
+
+        Returns:
+            Decoded token
+
+        Raises:
+            ValueError: If the token is malformed
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            return cls(float(base64.urlsafe_b64decode(padded.encode()).decode()))
+        except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+            raise ValueError(f"Invalid consistency token: {token!r}") from e
+
+
+@dataclass
+class _Session:
+    """State of the session bound to the current context."""
+
+    session_id: Optional[str]
+    pinned_until: float = 0.0
+
+
+_current_session: ContextVar[Optional[_Session]] = ContextVar("supabase_consistency_session", default=None)
+
+
+@contextmanager
+def consistency_session(
+    session_id: Optional[str] = None,
+    token: Optional[str] = None,
+) -> Iterator[None]:
+    """
+    Bind reads and writes in this context to a session.
+
+    Args:
+        session_id: Caller session ID (None = pin only this context)
+        token: Consistency token returned to the caller after a write
+            (malformed tokens are ignored)
+
+    Yields:
+        Nothing; the session is active inside the block
+    """
+    session = _Session(session_id or None)
+    if token:
+        try:
+            session.pinned_until = ConsistencyToken.decode(token).pinned_until
+        except ValueError:
+            pass
+    reset = _current_session.set(session)
+    try:
+        yield
+    finally:
+        _current_session.reset(reset)
+
+
+def current_consistency_token() -> Optional[ConsistencyToken]:
+    """
+    Get the token of the current session's latest write.
+
+    Returns:
+        Token, or None if no session is bound or it has not written
+    """
+    session = _current_session.get()
+    if session is None or not session.pinned_until:
+        return None
+    return ConsistencyToken(session.pinned_until)
+
+
+class ReadRouter:
+    """
+    Thread-safe router choosing the endpoint of each read.
+
+    Endpoints are numbered: 0 is the primary and ``1..replica_count`` are
+    the replicas, used round-robin. Pins are kept per session ID in
+    memory and also carried by the session's consistency token.
+    """
+
+    def __init__(self, replica_count: int = 0, pin_window: float = 5.0) -> None:
+        """
+        Initialize the router.
+
+        Args:
+            replica_count: Number of read replicas (0 = primary only)
+            pin_window: Seconds a session that wrote reads from the primary
+
+        Raises:
+            ValueError: If replica_count or pin_window is negative
+        """
+        self._pins: dict[str, float] = {}
+        self._next = count()
+        self._lock = threading.Lock()
+        self.configure(replica_count, pin_window)
+
+        # Counters
+        self._replica_reads = 0
+        self._primary_reads = 0
+        self._pinned_reads = 0
+        self._writes = 0
+
+    def configure(self, replica_count: int, pin_window: float) -> None:
+        """
+        Change the number of replicas and the pin window.
+
+        Args:
+            replica_count: Number of read replicas (0 = primary only)
+            pin_window: Seconds a session that wrote reads from the primary
+
+        Raises:
+            ValueError: If replica_count or pin_window is negative
+        """
+        if replica_count < 0:
+            raise ValueError("replica_count must not be negative")
+        if pin_window < 0:
+            raise ValueError("pin_window must not be negative")
+        with self._lock:
+            self.replica_count = replica_count
+            self.pin_window = pin_window
+
+    def record_write(self) -> ConsistencyToken:
+        """
+        Pin the current session to the primary after a write.
+
+        Outside ``consistency_session`` nothing is pinned.
+
+        Returns:
+            Token of the write, also stored on the bound session
+        """
+        pinned_until = time.time() + self.pin_window
+        session = _current_session.get()
+        if session is not None:
+            session.pinned_until = max(session.pinned_until, pinned_until)
+
+        with self._lock:
+            self._writes += 1
+            if session is None or session.session_id is None:
+                return ConsistencyToken(pinned_until)
+            self._pins[session.session_id] = pinned_until
+            if len(self._pins) > _PRUNE_THRESHOLD:
+                now = time.time()
+                self._pins = {key: until for key, until in self._pins.items() if until > now}
+        return ConsistencyToken(pinned_until)
+
+    def is_pinned(self) -> bool:
+        """
+        Check whether the current session must read from the primary.
+
+        Returns:
+            True if the session wrote within the pin window (always False
+            outside ``consistency_session``)
+        """
+        now = time.time()
+        session = _current_session.get()
+        if session is None:
+            return False
+        if session.pinned_until > now:
+            return True
+        if session.session_id is None:
+            return False
+        with self._lock:
+            return self._pins.get(session.session_id, 0.0) > now
+
+    def route_read(self) -> int:
+        """
+        Choose the endpoint for a read.
+
+        Returns:
+            0 for the primary, otherwise the 1-based replica number
+        """
+        if self.replica_count == 0:
+            with self._lock:
+                self._primary_reads += 1
+            return 0
+        if self.is_pinned():
+            with self._lock:
+                self._pinned_reads += 1
+                self._primary_reads += 1
+            return 0
+        with self._lock:
+            self._replica_reads += 1
+            return next(self._next) % self.replica_count + 1
+
+    def metrics(self) -> dict[str, Any]:
+        """
+        Get routing metrics.
+
+        Returns:
+            Dictionary with replica count and read/write counters
+        """
+        with self._lock:
+            return {
+                "replicas": self.replica_count,
+                "pin_window": self.pin_window,
+                "replica_reads": self._replica_reads,
+                "primary_reads": self._primary_reads,
+                "pinned_reads": self._pinned_reads,
+                "writes": self._writes,
+                "pinned_sessions": sum(1 for until in self._pins.values() if until > time.time()),
+            }
@@ -0,0 +1,203 @@
+"""
+Ranked text search for Supabase tables.
+
+Ranked searches run as a single call to a Postgres function exposed through
+PostgREST RPC. The function ranks full-text matches with
+``websearch_to_tsquery``/``ts_rank`` and falls back to trigram similarity
+for queries too short to tokenize. ``SEARCH_FUNCTION_SQL`` holds its
+definition, shipped in supabase/migrations.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Optional
+
+from postgrest.exceptions import APIError
+
+from atoms_mcp.domain.ports.filters import AllOf, Condition, FilterExpr, FilterOp
+from atoms_mcp.domain.ports.pagination import keyset_value
+from atoms_mcp.domain.ports.repository import SearchMode
+
+# Name of the Postgres function called over RPC
+SEARCH_FUNCTION = "atoms_search"
+
+# Queries shorter than this use trigram matching in AUTO mode
+MIN_FULLTEXT_QUERY_LENGTH = 3
+
+# PostgREST / Postgres error codes meaning the search function is not installed
+_MISSING_FUNCTION_CODES = {"PGRST202", "42883"}
+
+# Postgres error code for a column the table does not have, and its message
+_UNDEFINED_COLUMN_CODE = "42703"
+_UNDEFINED_COLUMN = re.compile(r'column (?:"?\w+"?\.)?"?(\w+)"? does not exist')
+
+SEARCH_FUNCTION_SQL = f"""
+create extension if not exists pg_trgm;
+
+-- Superseded by the signature below, which adds p_filter
+drop function if exists {SEARCH_FUNCTION}(text, text, text[], integer, text, text[]);
+
+-- Searches the text columns of one table in a single statement.
+-- Rows are returned as JSON objects, best match first. p_filter keeps
+-- rows whose JSON form contains it (equality filters). Recommended index
+-- per table (adjust the column list to the table):
+--   create index on <table> using gin (to_tsvector('english',
+--     coalesce(name, '') || ' ' || coalesce(description, '')));
+--   create index on <table> using gin (
+--     (coalesce(name, '') || ' ' || coalesce(description, '')) gin_trgm_ops);
+create or replace function {SEARCH_FUNCTION}(
+    p_table text,
+    p_query text,
+    p_fields text[],
+    p_limit integer default null,
+    p_mode text default 'auto',
+    p_columns text[] default null,
+    p_filter jsonb default null
+) returns setof jsonb
+language plpgsql stable
+as $$
+declare
+    v_fields text[];
+    v_document text;
+    v_mode text := p_mode;
+    v_row text := 'to_jsonb(t)';
+begin
+    -- Ignore requested fields the table does not have
+    select array_agg(column_name::text) into v_fields
+    from information_schema.columns
+    where table_schema = 'public' and table_name = p_table and column_name = any(p_fields);
+    if v_fields is null then
+        return;
+    end if;
+
+    select string_agg(format('coalesce(t.%I::text, '''')', f), ' || '' '' || ')
+    into v_document from unnest(v_fields) as f;
+
+    if p_columns is not null then
+        v_row := '(select jsonb_object_agg(key, value) from jsonb_each(to_jsonb(t))'
+              || ' where key = any($3))';
+    end if;
+
+    if v_mode = 'auto' then
+        v_mode := case
+            when char_length(btrim(p_query)) < {MIN_FULLTEXT_QUERY_LENGTH}
+              or numnode(websearch_to_tsquery('english', p_query)) = 0 then 'trigram'
+            else 'fulltext'
+        end;
+    end if;
+
+    if v_mode = 'fulltext' then
+        return query execute format(
+            'select %s from %I t, websearch_to_tsquery(''english'', $1) q'
+            ' where not t.is_deleted and to_tsvector(''english'', %s) @@ q'
+            ' and ($4::jsonb is null or to_jsonb(t) @> $4)'
+            ' order by ts_rank(to_tsvector(''english'', %s), q) desc limit $2',
+            v_row, p_table, v_document, v_document)
+        using p_query, p_limit, p_columns, p_filter;
+    else
+        return query execute format(
+            'select %s from %I t'
+            ' where not t.is_deleted and (%s) ilike ''%%'' || $1 || ''%%'''
+            ' and ($4::jsonb is null or to_jsonb(t) @> $4)'
+            ' order by word_similarity($1, %s) desc limit $2',
+            v_row, p_table, v_document, v_document)
+        using p_query, p_limit, p_columns, p_filter;
+    end if;
+end;
+$$;
+"""
+
+
+def search_params(
+    table_name: str,
+    query: str,
+    fields: list[str],
+    limit: Optional[int],
+    mode: SearchMode,
+    columns: Optional[list[str]] = None,
+    filter_values: Optional[dict[str, Any]] = None,
+) -> dict[str, Any]:
+    """
+    Build the RPC arguments for ``SEARCH_FUNCTION``.
+
+    Args:
+        table_name: Table to search
+        query: Search query string
+        fields: Text columns to search
+        limit: Maximum number of rows (None = no limit)
+        mode: Matching mode (AUTO, FULLTEXT or TRIGRAM)
+        columns: Columns to return (None = whole rows)
+        filter_values: Column values rows must equal (see ``equality_filter``)
+
+    Returns:
+        Keyword arguments for the function call
+    """
+    return {
+        "p_table": table_name,
+        "p_query": query,
+        "p_fields": fields,
+        "p_limit": limit,
+        "p_mode": SearchMode(mode).value,
+        "p_columns": columns,
+        "p_filter": filter_values or None,
+    }
+
+
+def equality_filter(where: Optional[FilterExpr]) -> Optional[dict[str, Any]]:
+    """
+    Express a filter expression as column values for ``p_filter``.
+
+    Only conjunctions of equality conditions fit the function's ``@>``
+    check; other expressions have to be evaluated through PostgREST.
+
+    Args:
+        where: Filter expression (None = no filter)
+
+    Returns:
+        Column values rows must equal ({} for no filter), or None if the
+        expression is not a conjunction of equalities
+    """
+    values: dict[str, Any] = {}
+    pending = [where] if where is not None else []
+    while pending:
+        expr = pending.pop()
+        if isinstance(expr, AllOf):
+            pending.extend(expr.filters)
+        elif isinstance(expr, Condition) and expr.op == FilterOp.EQ and expr.value is not None:
+            value = keyset_value(expr.value)
+            if values.get(expr.field, value) != value:
+                return None
+            values[expr.field] = value
+        else:
+            return None
+    return values
+
+
+def is_missing_function(error: APIError) -> bool:
+    """
+    Check whether an API error means the search function is not installed.
+
+    Args:
+        error: Error raised by PostgREST
+
+    Returns:
+        True if the function does not exist in the database
+    """
+    return getattr(error, "code", None) in _MISSING_FUNCTION_CODES
+
+
+def missing_column(error: APIError) -> Optional[str]:
+    """
+    Find the column an API error reports the table does not have.
+
+    Args:
+        error: Error raised by PostgREST
+
+    Returns:
+        Name of the missing column, or None for any other error
+    """
+    if getattr(error, "code", None) != _UNDEFINED_COLUMN_CODE:
+        return None
+    match = _UNDEFINED_COLUMN.search(getattr(error, "message", None) or "")
+    return match.group(1) if match else None
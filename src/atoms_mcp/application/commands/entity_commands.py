@@ -17,9 +17,11 @@ from ...domain.models.entity import (
     TaskEntity,
     WorkspaceEntity,
 )
+from ...domain.ports.async_repository import AsyncRepository, ThreadedAsyncRepository
 from ...domain.ports.cache import Cache
 from ...domain.ports.logger import Logger
-from ...domain.ports.repository import Repository, RepositoryError
+from ...domain.ports.repository import ConcurrencyError, Repository, RepositoryError
+from ...domain.services.async_entity_service import AsyncEntityService
 from ...domain.services.entity_service import EntityService
 from ..dto import CommandResult, EntityDTO, ResultStatus
 
@@ -87,11 +89,14 @@ class UpdateEntityCommand:
         entity_id: ID of entity to update
         updates: Dictionary of field updates
         validate_updates: Whether to validate updates
+        expected_revision: Revision the caller last read; the update is
+            rejected with a conflict if the entity changed since
     """
 
     entity_id: str
     updates: dict[str, Any] = field(default_factory=dict)
     validate_updates: bool = True
+    expected_revision: Optional[int] = None
 
     def validate(self) -> None:
         """
@@ -106,6 +111,8 @@ class UpdateEntityCommand:
             raise EntityValidationError("updates cannot be empty")
         if "id" in self.updates:
             raise EntityValidationError("cannot update entity id")
+        if "revision" in self.updates:
+            raise EntityValidationError("cannot update entity revision")
 
 
 @dataclass
@@ -191,6 +198,8 @@ class EntityCommandHandler:
 
     Attributes:
         entity_service: Domain service for entity operations
+        async_entity_service: Non-blocking domain service used by the
+            ``*_async`` handlers
         logger: Logger for recording events
     """
 
@@ -199,6 +208,7 @@ class EntityCommandHandler:
         repository: Repository[Entity],
         logger: Logger,
         cache: Optional[Cache] = None,
+        async_repository: Optional[AsyncRepository[Entity]] = None,
     ):
         """
         Initialize entity command handler.
@@ -207,8 +217,13 @@ class EntityCommandHandler:
             repository: Repository for entity persistence
             logger: Logger for recording events
             cache: Optional cache for performance
+            async_repository: Optional native async repository; when omitted
+                the sync repository is run in worker threads
         """
         self.entity_service = EntityService(repository, logger, cache)
+        self.async_entity_service = AsyncEntityService(
+            async_repository or ThreadedAsyncRepository(repository), logger, cache
+        )
         self.logger = logger
 
     def handle_create_entity(
@@ -224,15 +239,8 @@ class EntityCommandHandler:
             Command result with entity DTO
         """
         try:
-            # Validate command
-            command.validate()
-
-            # Create appropriate entity type
-            entity = self._create_entity_instance(command)
-
-            # Add metadata
-            if command.created_by:
-                entity.set_metadata("created_by", command.created_by)
+            # Validate command and build the entity
+            entity = self._build_entity(command)
 
             # Create entity using service
             created_entity = self.entity_service.create_entity(entity, validate=True)
@@ -288,6 +296,7 @@ class EntityCommandHandler:
                 command.entity_id,
                 command.updates,
                 validate=command.validate_updates,
+                expected_revision=command.expected_revision,
             )
 
             if not updated_entity:
@@ -316,6 +325,10 @@ class EntityCommandHandler:
                 error=str(e),
             )
 
+        except ConcurrencyError as e:
+            self.logger.warning(str(e))
+            return self._conflict_result(e)
+
         except RepositoryError as e:
             self.logger.error(f"Repository error during entity update: {e}")
             return CommandResult(
@@ -524,6 +537,321 @@ class EntityCommandHandler:
                 error=f"Unexpected error: {str(e)}",
             )
 
+    async def handle_create_entity_async(
+        self, command: CreateEntityCommand
+    ) -> CommandResult[EntityDTO]:
+        """
+        Handle create entity command without blocking the event loop.
+
+        Args:
+            command: Create entity command
+
+        Returns:
+            Command result with entity DTO
+        """
+        try:
+            entity = self._build_entity(command)
+
+            created_entity = await self.async_entity_service.create_entity(
+                entity, validate=True
+            )
+
+            return CommandResult(
+                status=ResultStatus.SUCCESS,
+                data=self._entity_to_dto(created_entity),
+                metadata={"entity_id": created_entity.id},
+            )
+
+        except EntityValidationError as e:
+            self.logger.error(f"Entity validation failed: {e}")
+            return CommandResult(
+                status=ResultStatus.ERROR,
+                error=f"Validation error: {str(e)}",
+            )
+
+        except RepositoryError as e:
+            self.logger.error(f"Repository error during entity creation: {e}")
+            return CommandResult(
+                status=ResultStatus.ERROR,
+                error=f"Failed to create entity: {str(e)}",
+            )
+
+        except Exception as e:
+            self.logger.error(f"Unexpected error during entity creation: {e}")
+            return CommandResult(
+                status=ResultStatus.ERROR,
+                error=f"Unexpected error: {str(e)}",
+            )
+
+    async def handle_update_entity_async(
+        self, command: UpdateEntityCommand
+    ) -> CommandResult[EntityDTO]:
+        """
+        Handle update entity command without blocking the event loop.
+
+        Args:
+            command: Update entity command
+
+        Returns:
+            Command result with updated entity DTO
+        """
+        try:
+            command.validate()
+
+            updated_entity = await self.async_entity_service.update_entity(
+                command.entity_id,
+                command.updates,
+                validate=command.validate_updates,
+                expected_revision=command.expected_revision,
+            )
+
+            if not updated_entity:
+                raise EntityNotFoundError(f"Entity {command.entity_id} not found")
+
+            return CommandResult(
+                status=ResultStatus.SUCCESS,
+                data=self._entity_to_dto(updated_entity),
+                metadata={"entity_id": updated_entity.id},
+            )
+
+        except EntityValidationError as e:
+            self.logger.error(f"Entity validation failed: {e}")
+            return CommandResult(
+                status=ResultStatus.ERROR,
+                error=f"Validation error: {str(e)}",
+            )
+
+        except EntityNotFoundError as e:
+            self.logger.error(str(e))
+            return CommandResult(
+                status=ResultStatus.ERROR,
+                error=str(e),
+            )
+
+        except ConcurrencyError as e:
+            self.logger.warning(str(e))
+            return self._conflict_result(e)
+
+        except RepositoryError as e:
+            self.logger.error(f"Repository error during entity update: {e}")
+            return CommandResult(
+                status=ResultStatus.ERROR,
+                error=f"Failed to update entity: {str(e)}",
+            )
+
+        except Exception as e:
+            self.logger.error(f"Unexpected error during entity update: {e}")
+            return CommandResult(
+                status=ResultStatus.ERROR,
+                error=f"Unexpected error: {str(e)}",
+            )
+
+    async def handle_delete_entity_async(
+        self, command: DeleteEntityCommand
+    ) -> CommandResult[bool]:
+        """
+        Handle delete entity command without blocking the event loop.
+
+        Args:
+            command: Delete entity command
+
+        Returns:
+            Command result with success boolean
+        """
+        try:
+            command.validate()
+
+            success = await self.async_entity_service.delete_entity(
+                command.entity_id,
+                soft_delete=command.soft_delete,
+            )
+
+            if not success:
+                raise EntityNotFoundError(f"Entity {command.entity_id} not found")
+
+            return CommandResult(
+                status=ResultStatus.SUCCESS,
+                data=True,
+                metadata={
+                    "entity_id": command.entity_id,
+                    "soft_delete": command.soft_delete,
+                },
+            )
+
+        except EntityValidationError as e:
+            self.logger.error(f"Entity validation failed: {e}")
+            return CommandResult(
+                status=ResultStatus.ERROR,
+                error=f"Validation error: {str(e)}",
+            )
+
+        except EntityNotFoundError as e:
+            self.logger.error(str(e))
+            return CommandResult(
+                status=ResultStatus.ERROR,
+                error=str(e),
+            )
+
+        except RepositoryError as e:
+            self.logger.error(f"Repository error during entity deletion: {e}")
+            return CommandResult(
+                status=ResultStatus.ERROR,
+                error=f"Failed to delete entity: {str(e)}",
+            )
+
+        except Exception as e:
+            self.logger.error(f"Unexpected error during entity deletion: {e}")
+            return CommandResult(
+                status=ResultStatus.ERROR,
+                error=f"Unexpected error: {str(e)}",
+            )
+
+    async def handle_archive_entity_async(
+        self, command: ArchiveEntityCommand
+    ) -> CommandResult[EntityDTO]:
+        """
+        Handle archive entity command without blocking the event loop.
+
+        Args:
+            command: Archive entity command
+
+        Returns:
+            Command result with archived entity DTO
+        """
+        try:
+            command.validate()
+
+            archived_entity = await self.async_entity_service.archive_entity(
+                command.entity_id
+            )
+
+            if not archived_entity:
+                raise EntityNotFoundError(f"Entity {command.entity_id} not found")
+
+            if command.archived_by:
+                archived_entity.set_metadata("archived_by", command.archived_by)
+                archived_entity.set_metadata(
+                    "archived_at", datetime.utcnow().isoformat()
+                )
+
+            return CommandResult(
+                status=ResultStatus.SUCCESS,
+                data=self._entity_to_dto(archived_entity),
+                metadata={"entity_id": archived_entity.id},
+            )
+
+        except EntityValidationError as e:
+            self.logger.error(f"Entity validation failed: {e}")
+            return CommandResult(
+                status=ResultStatus.ERROR,
+                error=f"Validation error: {str(e)}",
+            )
+
+        except EntityNotFoundError as e:
+            self.logger.error(str(e))
+            return CommandResult(
+                status=ResultStatus.ERROR,
+                error=str(e),
+            )
+
+        except RepositoryError as e:
+            self.logger.error(f"Repository error during entity archival: {e}")
+            return CommandResult(
+                status=ResultStatus.ERROR,
+                error=f"Failed to archive entity: {str(e)}",
+            )
+
+        except Exception as e:
+            self.logger.error(f"Unexpected error during entity archival: {e}")
+            return CommandResult(
+                status=ResultStatus.ERROR,
+                error=f"Unexpected error: {str(e)}",
+            )
+
+    async def handle_restore_entity_async(
+        self, command: RestoreEntityCommand
+    ) -> CommandResult[EntityDTO]:
+        """
+        Handle restore entity command without blocking the event loop.
+
+        Args:
+            command: Restore entity command
+
+        Returns:
+            Command result with restored entity DTO
+        """
+        try:
+            command.validate()
+
+            restored_entity = await self.async_entity_service.restore_entity(
+                command.entity_id
+            )
+
+            if not restored_entity:
+                raise EntityNotFoundError(f"Entity {command.entity_id} not found")
+
+            if command.restored_by:
+                restored_entity.set_metadata("restored_by", command.restored_by)
+                restored_entity.set_metadata(
+                    "restored_at", datetime.utcnow().isoformat()
+                )
+
+            return CommandResult(
+                status=ResultStatus.SUCCESS,
+                data=self._entity_to_dto(restored_entity),
+                metadata={"entity_id": restored_entity.id},
+            )
+
+        except EntityValidationError as e:
+            self.logger.error(f"Entity validation failed: {e}")
+            return CommandResult(
+                status=ResultStatus.ERROR,
+                error=f"Validation error: {str(e)}",
+            )
+
+        except EntityNotFoundError as e:
+            self.logger.error(str(e))
+            return CommandResult(
+                status=ResultStatus.ERROR,
+                error=str(e),
+            )
+
+        except RepositoryError as e:
+            self.logger.error(f"Repository error during entity restoration: {e}")
+            return CommandResult(
+                status=ResultStatus.ERROR,
+                error=f"Failed to restore entity: {str(e)}",
+            )
+
+        except Exception as e:
+            self.logger.error(f"Unexpected error during entity restoration: {e}")
+            return CommandResult(
+                status=ResultStatus.ERROR,
+                error=f"Unexpected error: {str(e)}",
+            )
+
+    def _build_entity(self, command: CreateEntityCommand) -> Entity:
+        """
+        Validate a create command and build its entity without persisting it.
+
+        Args:
+            command: Create entity command
+
+        Returns:
+            Entity instance with creation metadata applied
+
+        Raises:
+            EntityValidationError: If the command is invalid
+        """
+        command.validate()
+
+        entity = self._create_entity_instance(command)
+
+        if command.created_by:
+            entity.set_metadata("created_by", command.created_by)
+
+        return entity
+
     def _create_entity_instance(self, command: CreateEntityCommand) -> Entity:
         """
         Create appropriate entity instance based on type.
@@ -586,6 +914,27 @@ class EntityCommandHandler:
                 entity.set_metadata(key, value)
             return entity
 
+    def _conflict_result(self, error: ConcurrencyError) -> CommandResult[EntityDTO]:
+        """
+        Build the result of an update that lost a write conflict.
+
+        Args:
+            error: Conflict raised by the repository
+
+        Returns:
+            CONFLICT result carrying the revisions, so the caller can
+            re-read the entity and retry
+        """
+        return CommandResult(
+            status=ResultStatus.CONFLICT,
+            error=str(error),
+            metadata={
+                "entity_id": error.entity_id,
+                "expected_revision": error.expected_revision,
+                "current_revision": error.current_revision,
+            },
+        )
+
     def _entity_to_dto(self, entity: Entity) -> EntityDTO:
         """
         Convert entity to DTO.
@@ -655,6 +1004,7 @@ class EntityCommandHandler:
             updated_at=entity.updated_at,
             metadata=entity.metadata,
             properties=properties,
+            revision=entity.revision,
         )
 
 
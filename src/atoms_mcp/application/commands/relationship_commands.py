@@ -9,9 +9,11 @@ from dataclasses import dataclass, field
 from typing import Any, Optional
 
 from ...domain.models.relationship import Relationship, RelationType
+from ...domain.ports.async_repository import AsyncRepository, ThreadedAsyncRepository
 from ...domain.ports.cache import Cache
 from ...domain.ports.logger import Logger
 from ...domain.ports.repository import Repository, RepositoryError
+from ...domain.services.async_relationship_service import AsyncRelationshipService
 from ...domain.services.relationship_service import RelationshipService
 from ..dto import CommandResult, RelationshipDTO, ResultStatus
 
@@ -151,6 +153,8 @@ class RelationshipCommandHandler:
 
     Attributes:
         relationship_service: Domain service for relationship operations
+        async_relationship_service: Non-blocking domain service used by the
+            ``*_async`` handlers
         logger: Logger for recording events
     """
 
@@ -159,6 +163,7 @@ class RelationshipCommandHandler:
         repository: Repository[Relationship],
         logger: Logger,
         cache: Optional[Cache] = None,
+        async_repository: Optional[AsyncRepository[Relationship]] = None,
     ):
         """
         Initialize relationship command handler.
@@ -167,8 +172,13 @@ class RelationshipCommandHandler:
             repository: Repository for relationship persistence
             logger: Logger for recording events
             cache: Optional cache for performance
+            async_repository: Optional native async repository; when omitted
+                the sync repository is run in worker threads
         """
         self.relationship_service = RelationshipService(repository, logger, cache)
+        self.async_relationship_service = AsyncRelationshipService(
+            async_repository or ThreadedAsyncRepository(repository), logger, cache
+        )
         self.logger = logger
 
     def handle_create_relationship(
@@ -365,7 +375,7 @@ class RelationshipCommandHandler:
                 relationship.set_property(key, value)
 
             # Save updated relationship
-            updated_relationship = self.relationship_service.repository.save(
+            updated_relationship = self.relationship_service.repository.update(
                 relationship
             )
 
@@ -406,6 +416,162 @@ class RelationshipCommandHandler:
                 error=f"Unexpected error: {str(e)}",
             )
 
+    async def handle_create_relationship_async(
+        self, command: CreateRelationshipCommand
+    ) -> CommandResult[RelationshipDTO]:
+        """
+        Handle create relationship command without blocking the event loop.
+
+        Args:
+            command: Create relationship command
+
+        Returns:
+            Command result with relationship DTO
+        """
+        try:
+            command.validate()
+
+            relationship_type = RelationType(command.relationship_type)
+
+            created_relationship = (
+                await self.async_relationship_service.add_relationship(
+                    source_id=command.source_id,
+                    target_id=command.target_id,
+                    relationship_type=relationship_type,
+                    properties=command.properties,
+                    bidirectional=command.bidirectional,
+                    created_by=command.created_by,
+                )
+            )
+
+            return CommandResult(
+                status=ResultStatus.SUCCESS,
+                data=self._relationship_to_dto(created_relationship),
+                metadata={
+                    "relationship_id": created_relationship.id,
+                    "bidirectional": command.bidirectional,
+                },
+            )
+
+        except RelationshipValidationError as e:
+            self.logger.error(f"Relationship validation failed: {e}")
+            return CommandResult(
+                status=ResultStatus.ERROR,
+                error=f"Validation error: {str(e)}",
+            )
+
+        except ValueError as e:
+            self.logger.error(f"Invalid relationship type: {e}")
+            return CommandResult(
+                status=ResultStatus.ERROR,
+                error=f"Invalid relationship type: {str(e)}",
+            )
+
+        except RepositoryError as e:
+            self.logger.error(f"Repository error during relationship creation: {e}")
+            return CommandResult(
+                status=ResultStatus.ERROR,
+                error=f"Failed to create relationship: {str(e)}",
+            )
+
+        except Exception as e:
+            self.logger.error(f"Unexpected error during relationship creation: {e}")
+            return CommandResult(
+                status=ResultStatus.ERROR,
+                error=f"Unexpected error: {str(e)}",
+            )
+
+    async def handle_delete_relationship_async(
+        self, command: DeleteRelationshipCommand
+    ) -> CommandResult[bool]:
+        """
+        Handle delete relationship command without blocking the event loop.
+
+        Args:
+            command: Delete relationship command
+
+        Returns:
+            Command result with success boolean
+        """
+        try:
+            command.validate()
+
+            service = self.async_relationship_service
+
+            if command.relationship_id:
+                success = await service.remove_relationship(
+                    command.relationship_id,
+                    remove_inverse=command.remove_inverse,
+                )
+
+                if not success:
+                    raise RelationshipNotFoundError(
+                        f"Relationship {command.relationship_id} not found"
+                    )
+
+                relationship_id = command.relationship_id
+
+            else:
+                relationship_type = None
+                if command.relationship_type:
+                    relationship_type = RelationType(command.relationship_type)
+
+                relationships = await service.get_relationships(
+                    source_id=command.source_id,
+                    target_id=command.target_id,
+                    relationship_type=relationship_type,
+                )
+
+                if not relationships:
+                    raise RelationshipNotFoundError(
+                        f"No relationship found between {command.source_id} and {command.target_id}"
+                    )
+
+                relationship = relationships[0]
+                await service.remove_relationship(
+                    relationship.id,
+                    remove_inverse=command.remove_inverse,
+                )
+
+                relationship_id = relationship.id
+
+            return CommandResult(
+                status=ResultStatus.SUCCESS,
+                data=True,
+                metadata={
+                    "relationship_id": relationship_id,
+                    "remove_inverse": command.remove_inverse,
+                },
+            )
+
+        except RelationshipValidationError as e:
+            self.logger.error(f"Relationship validation failed: {e}")
+            return CommandResult(
+                status=ResultStatus.ERROR,
+                error=f"Validation error: {str(e)}",
+            )
+
+        except RelationshipNotFoundError as e:
+            self.logger.error(str(e))
+            return CommandResult(
+                status=ResultStatus.ERROR,
+                error=str(e),
+            )
+
+        except RepositoryError as e:
+            self.logger.error(f"Repository error during relationship deletion: {e}")
+            return CommandResult(
+                status=ResultStatus.ERROR,
+                error=f"Failed to delete relationship: {str(e)}",
+            )
+
+        except Exception as e:
+            self.logger.error(f"Unexpected error during relationship deletion: {e}")
+            return CommandResult(
+                status=ResultStatus.ERROR,
+                error=f"Unexpected error: {str(e)}",
+            )
+
     def _relationship_to_dto(self, relationship: Relationship) -> RelationshipDTO:
         """
         Convert relationship to DTO.
@@ -19,6 +19,7 @@ class ResultStatus(Enum):
     SUCCESS = "success"
     ERROR = "error"
     PARTIAL_SUCCESS = "partial_success"
+    CONFLICT = "conflict"
 
 
 @dataclass
@@ -45,8 +46,13 @@ class CommandResult(Generic[T]):
 
     @property
     def is_error(self) -> bool:
-        """Check if command failed."""
-        return self.status == ResultStatus.ERROR
+        """Check if command failed, including write conflicts."""
+        return self.status in (ResultStatus.ERROR, ResultStatus.CONFLICT)
+
+    @property
+    def is_conflict(self) -> bool:
+        """Check if command lost a write conflict and can be retried."""
+        return self.status == ResultStatus.CONFLICT
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary representation."""
@@ -71,6 +77,8 @@ class QueryResult(Generic[T]):
         page_size: Number of items per page
         error: Error message if failed
         metadata: Additional result metadata
+        next_cursor: Cursor of the following page (cursor pagination only)
+        prev_cursor: Cursor of the preceding page (cursor pagination only)
     """
 
     status: ResultStatus
@@ -80,6 +88,8 @@ class QueryResult(Generic[T]):
     page_size: int = 20
     error: Optional[str] = None
     metadata: dict[str, Any] = field(default_factory=dict)
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
 
     @property
     def is_success(self) -> bool:
@@ -104,6 +114,8 @@ class QueryResult(Generic[T]):
             "total_count": self.total_count,
             "page": self.page,
             "page_size": self.page_size,
+            "next_cursor": self.next_cursor,
+            "prev_cursor": self.prev_cursor,
             "error": self.error,
             "metadata": self.metadata,
         }
@@ -124,6 +136,7 @@ class EntityDTO:
         updated_at: Update timestamp
         metadata: Additional metadata
         properties: Entity-specific properties
+        revision: Entity revision, for conditional updates
     """
 
     id: str
@@ -135,6 +148,7 @@ class EntityDTO:
     updated_at: Optional[datetime] = None
     metadata: dict[str, Any] = field(default_factory=dict)
     properties: dict[str, Any] = field(default_factory=dict)
+    revision: int = 0
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary representation."""
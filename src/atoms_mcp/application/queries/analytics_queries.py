@@ -10,7 +10,9 @@ from datetime import datetime, timedelta
 from typing import Any, Optional
 
 from ...domain.models.entity import Entity, EntityStatus
+from ...domain.ports.aggregation import BUCKET_KEY, TimeBucket
 from ...domain.ports.cache import Cache
+from ...domain.ports.filters import FilterExpr, and_, contains, gte, lte, or_
 from ...domain.ports.logger import Logger
 from ...domain.ports.repository import Repository, RepositoryError
 from ...domain.services.entity_service import EntityService
@@ -29,6 +31,20 @@ class AnalyticsQueryValidationError(AnalyticsQueryError):
     pass
 
 
+# Aggregate group key for each EntityCountQuery.group_by value
+GROUP_BY_KEYS = {
+    "type": "metadata.entity_type",
+    "status": "status",
+    "workspace_id": "metadata.workspace_id",
+    "project_id": "metadata.project_id",
+}
+
+
+def _entity_types_filter(entity_types: list[str]) -> FilterExpr:
+    """Filter matching entities whose metadata names one of the types."""
+    return or_(*(contains("metadata", {"entity_type": t}) for t in entity_types))
+
+
 @dataclass
 class EntityCountQuery:
     """
@@ -37,10 +53,16 @@ class EntityCountQuery:
     Attributes:
         group_by: Field to group by ("type", "status", or "workspace_id")
         filters: Optional filters to apply
+        entity_type: Optional entity type to count
+        start_date: Optional earliest creation date
+        end_date: Optional latest creation date
     """
 
     group_by: str = "type"
     filters: dict[str, Any] = field(default_factory=dict)
+    entity_type: Optional[str] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
 
     def validate(self) -> None:
         """
@@ -49,11 +71,25 @@ class EntityCountQuery:
         Raises:
             AnalyticsQueryValidationError: If validation fails
         """
-        if self.group_by not in ("type", "status", "workspace_id", "project_id"):
+        if self.group_by not in GROUP_BY_KEYS:
             raise AnalyticsQueryValidationError(
                 "group_by must be 'type', 'status', 'workspace_id', or 'project_id'"
             )
 
+        if self.start_date and self.end_date and self.end_date < self.start_date:
+            raise AnalyticsQueryValidationError("end_date cannot be before start_date")
+
+    def get_where(self) -> Optional[FilterExpr]:
+        """Get the entity type and date range as a filter expression."""
+        conditions: list[FilterExpr] = []
+        if self.entity_type:
+            conditions.append(_entity_types_filter([self.entity_type]))
+        if self.start_date:
+            conditions.append(gte("created_at", self.start_date))
+        if self.end_date:
+            conditions.append(lte("created_at", self.end_date))
+        return and_(*conditions) if conditions else None
+
 
 @dataclass
 class WorkspaceStatsQuery:
@@ -179,14 +215,15 @@ class AnalyticsQueryHandler:
                         metadata={"cached": True, "group_by": query.group_by},
                     )
 
-            # Get all entities with filters
-            entities = self.entity_service.list_entities(filters=query.filters)
-
-            # Group and count
+            # Count per group in the repository
+            group_key = GROUP_BY_KEYS[query.group_by]
+            rows = self.entity_service.aggregate_entities(
+                group_by=[group_key], filters=query.filters, where=query.get_where()
+            )
             counts: dict[str, int] = {}
-            for entity in entities:
-                group_value = self._get_group_value(entity, query.group_by)
-                counts[group_value] = counts.get(group_value, 0) + 1
+            for row in rows:
+                group_value = str(row[group_key]) if row[group_key] is not None else "unknown"
+                counts[group_value] = counts.get(group_value, 0) + row["count"]
 
             # Cache result
             if self.cache:
@@ -258,28 +295,40 @@ class AnalyticsQueryHandler:
             if query.workspace_id:
                 filters["workspace_id"] = query.workspace_id
 
-            # Get entities
-            entities = self.entity_service.list_entities(filters=filters)
-
-            # Calculate statistics
+            # Count entities per status and type in the repository
             stats = {
-                "total_entities": len(entities),
-                "active_entities": sum(1 for e in entities if e.is_active()),
-                "deleted_entities": sum(1 for e in entities if e.is_deleted()),
-                "archived_entities": sum(
-                    1 for e in entities if e.status == EntityStatus.ARCHIVED
-                ),
+                "total_entities": 0,
+                "active_entities": 0,
+                "deleted_entities": 0,
+                "archived_entities": 0,
                 "entity_types": {},
-                "recent_activity": self._get_recent_activity_count(entities),
+                "recent_activity": 0,
             }
+            status_counts = {
+                EntityStatus.ACTIVE.value: "active_entities",
+                EntityStatus.DELETED.value: "deleted_entities",
+                EntityStatus.ARCHIVED.value: "archived_entities",
+            }
+
+            type_key = GROUP_BY_KEYS["type"]
+            for row in self.entity_service.aggregate_entities(
+                group_by=["status", type_key], filters=filters
+            ):
+                stats["total_entities"] += row["count"]
+                if row["status"] in status_counts:
+                    stats[status_counts[row["status"]]] += row["count"]
 
-            # Count by type
-            for entity in entities:
-                entity_type = entity.metadata.get("entity_type", "unknown")
+                entity_type = row[type_key] or "unknown"
                 stats["entity_types"][entity_type] = (
-                    stats["entity_types"].get(entity_type, 0) + 1
+                    stats["entity_types"].get(entity_type, 0) + row["count"]
                 )
 
+            recent_cutoff = datetime.utcnow() - timedelta(days=1)
+            recent = self.entity_service.aggregate_entities(
+                filters=filters, where=gte("updated_at", recent_cutoff)
+            )
+            stats["recent_activity"] = sum(row["count"] for row in recent)
+
             # Cache result
             if self.cache:
                 self.cache.set(cache_key, stats, ttl=600)  # 10 minutes
@@ -345,35 +394,30 @@ class AnalyticsQueryHandler:
                         metadata={"cached": True},
                     )
 
-            # Get entities
-            entities = self.entity_service.list_entities()
-
-            # Filter by date range
             start_date = query.get_start_date()
             end_date = query.get_end_date()
 
-            filtered_entities = [
-                e
-                for e in entities
-                if start_date <= e.created_at <= end_date
-            ]
-
-            # Filter by entity types if specified
+            # Count entities per time period in the repository
+            where = and_(gte("created_at", start_date), lte("created_at", end_date))
             if query.entity_types:
-                filtered_entities = [
-                    e
-                    for e in filtered_entities
-                    if e.metadata.get("entity_type") in query.entity_types
-                ]
-
-            # Group by time period
-            activity = self._group_by_time(
-                filtered_entities, query.granularity, start_date, end_date
+                where = and_(where, _entity_types_filter(query.entity_types))
+
+            rows = self.entity_service.aggregate_entities(
+                time_bucket=TimeBucket(query.granularity), where=where
             )
 
+            activity = self._empty_time_buckets(query.granularity, start_date, end_date)
+            total_entities = 0
+            for row in rows:
+                total_entities += row["count"]
+                bucket_start = datetime.fromisoformat(row[BUCKET_KEY])
+                bucket_key = self._get_time_bucket_key(bucket_start, query.granularity)
+                if bucket_key in activity:
+                    activity[bucket_key] += row["count"]
+
             result = {
                 "activity": activity,
-                "total_entities": len(filtered_entities),
+                "total_entities": total_entities,
                 "start_date": start_date.isoformat(),
                 "end_date": end_date.isoformat(),
                 "granularity": query.granularity,
@@ -413,44 +457,21 @@ class AnalyticsQueryHandler:
                 error=f"Unexpected error: {str(e)}",
             )
 
-    def _get_group_value(self, entity: Entity, group_by: str) -> str:
-        """Get value to group by."""
-        if group_by == "type":
-            return entity.metadata.get("entity_type", "unknown")
-        elif group_by == "status":
-            return entity.status.value
-        elif group_by in ("workspace_id", "project_id"):
-            return entity.metadata.get(group_by, "unknown")
-        return "unknown"
-
-    def _get_recent_activity_count(self, entities: list[Entity]) -> int:
-        """Get count of entities updated in last 24 hours."""
-        cutoff = datetime.utcnow() - timedelta(days=1)
-        return sum(1 for e in entities if e.updated_at >= cutoff)
-
-    def _group_by_time(
+    def _empty_time_buckets(
         self,
-        entities: list[Entity],
         granularity: str,
         start_date: datetime,
         end_date: datetime,
     ) -> dict[str, int]:
-        """Group entities by time period."""
+        """Generate zeroed time buckets covering the date range."""
         activity = {}
 
-        # Generate time buckets
         current = start_date
         while current <= end_date:
             bucket_key = self._get_time_bucket_key(current, granularity)
             activity[bucket_key] = 0
             current = self._increment_time(current, granularity)
 
-        # Count entities in each bucket
-        for entity in entities:
-            bucket_key = self._get_time_bucket_key(entity.created_at, granularity)
-            if bucket_key in activity:
-                activity[bucket_key] += 1
-
         return activity
 
     def _get_time_bucket_key(self, dt: datetime, granularity: str) -> str:
@@ -5,13 +5,19 @@ This module implements query handlers for entity retrieval operations.
 Queries use domain services and return QueryResult DTOs.
 """
 
+import asyncio
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 from ...domain.models.entity import Entity
+from ...domain.ports.async_repository import AsyncRepository, ThreadedAsyncRepository
 from ...domain.ports.cache import Cache
+from ...domain.ports.filters import FilterExpr, parse_filters
 from ...domain.ports.logger import Logger
-from ...domain.ports.repository import Repository, RepositoryError
+from ...domain.ports.pagination import decode_cursor
+from ...domain.ports.projection import normalize_columns
+from ...domain.ports.repository import CountMode, Repository, RepositoryError, SearchMode
+from ...domain.services.async_entity_service import AsyncEntityService
 from ...domain.services.entity_service import EntityService
 from ..dto import EntityDTO, QueryResult, ResultStatus
 
@@ -28,6 +34,44 @@ class EntityQueryValidationError(EntityQueryError):
     pass
 
 
+def _validate_columns(columns: Optional[list[str]]) -> None:
+    """
+    Validate an optional column projection.
+
+    Args:
+        columns: Requested column names (None = full entities)
+
+    Raises:
+        EntityQueryValidationError: If the projection is invalid
+    """
+    if columns is None:
+        return
+    try:
+        normalize_columns(columns)
+    except ValueError as e:
+        raise EntityQueryValidationError(str(e)) from e
+
+
+def _parse_count_mode(count_mode: str) -> CountMode:
+    """
+    Parse a count mode name.
+
+    Args:
+        count_mode: "exact", "planned" or "cached"
+
+    Returns:
+        Matching count mode
+
+    Raises:
+        EntityQueryValidationError: If the mode is unknown
+    """
+    try:
+        return CountMode(count_mode)
+    except ValueError as e:
+        modes = ", ".join(m.value for m in CountMode)
+        raise EntityQueryValidationError(f"count_mode must be one of: {modes}") from e
+
+
 @dataclass
 class GetEntityQuery:
     """
@@ -36,10 +80,12 @@ class GetEntityQuery:
     Attributes:
         entity_id: ID of entity to retrieve
         use_cache: Whether to use cache for retrieval
+        columns: Columns to return (None = full entity)
     """
 
     entity_id: str
     use_cache: bool = True
+    columns: Optional[list[str]] = None
 
     def validate(self) -> None:
         """
@@ -50,6 +96,7 @@ class GetEntityQuery:
         """
         if not self.entity_id:
             raise EntityQueryValidationError("entity_id is required")
+        _validate_columns(self.columns)
 
 
 @dataclass
@@ -64,6 +111,12 @@ class ListEntitiesQuery:
         order_by: Field to order by
         page: Page number (1-indexed)
         page_size: Number of items per page
+        keyset: Use cursor pagination even without a cursor (first page)
+        after: Cursor of the page to continue after
+        before: Cursor of the page to go back from
+        columns: Columns to return (None = full entities)
+        count_mode: "exact" (default), "planned" or "cached"; callers
+            that only need an estimate for page headers pass "planned"
     """
 
     filters: dict[str, Any] = field(default_factory=dict)
@@ -72,6 +125,11 @@ class ListEntitiesQuery:
     order_by: Optional[str] = None
     page: int = 1
     page_size: int = 20
+    keyset: bool = False
+    after: Optional[str] = None
+    before: Optional[str] = None
+    columns: Optional[list[str]] = None
+    count_mode: str = CountMode.EXACT.value
 
     def validate(self) -> None:
         """
@@ -84,6 +142,30 @@ class ListEntitiesQuery:
             raise EntityQueryValidationError("page must be >= 1")
         if self.page_size < 1 or self.page_size > 1000:
             raise EntityQueryValidationError("page_size must be between 1 and 1000")
+        if self.uses_keyset:
+            if self.after and self.before:
+                raise EntityQueryValidationError("after and before cannot be combined")
+            if self.offset is not None or self.page > 1:
+                raise EntityQueryValidationError(
+                    "offset and page cannot be combined with cursor pagination"
+                )
+            for cursor in (self.after, self.before):
+                if cursor:
+                    try:
+                        decode_cursor(cursor)
+                    except ValueError as e:
+                        raise EntityQueryValidationError(str(e)) from e
+            if self.columns is not None:
+                raise EntityQueryValidationError(
+                    "columns cannot be combined with cursor pagination"
+                )
+        _validate_columns(self.columns)
+        self.get_count_mode()
+
+    @property
+    def uses_keyset(self) -> bool:
+        """Whether this query pages with cursors instead of offsets."""
+        return self.keyset or bool(self.after) or bool(self.before)
 
     def get_limit(self) -> int:
         """Get effective limit."""
@@ -95,6 +177,10 @@ class ListEntitiesQuery:
             return self.offset
         return (self.page - 1) * self.page_size
 
+    def get_count_mode(self) -> CountMode:
+        """Get the count mode for ``total_count``."""
+        return _parse_count_mode(self.count_mode)
+
 
 @dataclass
 class SearchEntitiesQuery:
@@ -104,10 +190,15 @@ class SearchEntitiesQuery:
     Attributes:
         query: Search query string
         fields: Fields to search in
-        filters: Optional filters to apply
+        filters: Optional filters to apply; plain values match by equality
+            and ``{op: operand}`` values use filter operators (see
+            ``parse_filters``)
         limit: Maximum number of results
         page: Page number (1-indexed)
         page_size: Number of items per page
+        columns: Columns to return (None = full entities)
+        mode: Text matching mode: "auto" (ranked full-text, trigram for
+            short queries), "fulltext", "trigram" or "substring"
     """
 
     query: str
@@ -116,6 +207,8 @@ class SearchEntitiesQuery:
     limit: Optional[int] = None
     page: int = 1
     page_size: int = 20
+    columns: Optional[list[str]] = None
+    mode: str = SearchMode.AUTO.value
 
     def validate(self) -> None:
         """
@@ -130,11 +223,43 @@ class SearchEntitiesQuery:
             raise EntityQueryValidationError("page must be >= 1")
         if self.page_size < 1 or self.page_size > 1000:
             raise EntityQueryValidationError("page_size must be between 1 and 1000")
+        _validate_columns(self.get_columns())
+        self.get_mode()
+        self.get_where()
 
     def get_limit(self) -> int:
         """Get effective limit."""
         return self.limit if self.limit is not None else self.page_size
 
+    def get_where(self) -> Optional[FilterExpr]:
+        """
+        Get the filters as a filter expression.
+
+        Raises:
+            EntityQueryValidationError: If the filters are invalid
+        """
+        try:
+            return parse_filters(self.filters)
+        except ValueError as e:
+            raise EntityQueryValidationError(f"Invalid filters: {e}") from e
+
+    def get_mode(self) -> SearchMode:
+        """
+        Get the search mode.
+
+        Raises:
+            EntityQueryValidationError: If the mode is unknown
+        """
+        try:
+            return SearchMode(self.mode)
+        except ValueError as e:
+            modes = ", ".join(m.value for m in SearchMode)
+            raise EntityQueryValidationError(f"mode must be one of: {modes}") from e
+
+    def get_columns(self) -> Optional[list[str]]:
+        """Get columns to fetch."""
+        return self.columns
+
 
 @dataclass
 class CountEntitiesQuery:
@@ -143,13 +268,24 @@ class CountEntitiesQuery:
 
     Attributes:
         filters: Optional filters to apply
+        count_mode: "exact" (default), "planned" or "cached"
     """
 
     filters: dict[str, Any] = field(default_factory=dict)
+    count_mode: str = CountMode.EXACT.value
 
     def validate(self) -> None:
-        """Validate query parameters."""
-        pass  # No validation needed
+        """
+        Validate query parameters.
+
+        Raises:
+            EntityQueryValidationError: If validation fails
+        """
+        self.get_count_mode()
+
+    def get_count_mode(self) -> CountMode:
+        """Get the count mode."""
+        return _parse_count_mode(self.count_mode)
 
 
 class EntityQueryHandler:
@@ -161,6 +297,8 @@ class EntityQueryHandler:
 
     Attributes:
         entity_service: Domain service for entity operations
+        async_entity_service: Non-blocking domain service used by the
+            ``*_async`` handlers
         logger: Logger for recording events
     """
 
@@ -169,6 +307,7 @@ class EntityQueryHandler:
         repository: Repository[Entity],
         logger: Logger,
         cache: Optional[Cache] = None,
+        async_repository: Optional[AsyncRepository[Entity]] = None,
     ):
         """
         Initialize entity query handler.
@@ -177,8 +316,13 @@ class EntityQueryHandler:
             repository: Repository for entity persistence
             logger: Logger for recording events
             cache: Optional cache for performance
+            async_repository: Optional native async repository; when omitted
+                the sync repository is run in worker threads
         """
         self.entity_service = EntityService(repository, logger, cache)
+        self.async_entity_service = AsyncEntityService(
+            async_repository or ThreadedAsyncRepository(repository), logger, cache
+        )
         self.logger = logger
 
     def handle_get_entity(self, query: GetEntityQuery) -> QueryResult[EntityDTO]:
@@ -195,10 +339,15 @@ class EntityQueryHandler:
             # Validate query
             query.validate()
 
-            # Get entity using service
-            entity = self.entity_service.get_entity(
-                query.entity_id, use_cache=query.use_cache
-            )
+            # Get entity (or only the requested columns) using service
+            if query.columns:
+                entity = self.entity_service.get_entity_projected(
+                    query.entity_id, query.columns, use_cache=query.use_cache
+                )
+            else:
+                entity = self.entity_service.get_entity(
+                    query.entity_id, use_cache=query.use_cache
+                )
 
             if not entity:
                 return QueryResult(
@@ -206,16 +355,7 @@ class EntityQueryHandler:
                     error=f"Entity {query.entity_id} not found",
                 )
 
-            # Convert to DTO
-            dto = self._entity_to_dto(entity)
-
-            return QueryResult(
-                status=ResultStatus.SUCCESS,
-                data=dto,
-                total_count=1,
-                page=1,
-                page_size=1,
-            )
+            return self._get_result(entity)
 
         except EntityQueryValidationError as e:
             self.logger.error(f"Entity query validation failed: {e}")
@@ -255,30 +395,40 @@ class EntityQueryHandler:
             query.validate()
 
             # Get total count
-            total_count = self.entity_service.count_entities(filters=query.filters)
-
-            # List entities using service
-            entities = self.entity_service.list_entities(
-                filters=query.filters,
-                limit=query.get_limit(),
-                offset=query.get_offset(),
-                order_by=query.order_by,
+            total_count = self.entity_service.count_entities(
+                filters=query.filters, mode=query.get_count_mode()
             )
 
-            # Convert to DTOs
-            dtos = [self._entity_to_dto(entity) for entity in entities]
+            if query.uses_keyset:
+                page = self.entity_service.list_entities_page(
+                    filters=query.filters,
+                    limit=query.get_limit(),
+                    order_by=query.order_by,
+                    after=query.after,
+                    before=query.before,
+                )
+                return self._list_result(
+                    query, page.items, total_count, page.next_cursor, page.prev_cursor
+                )
 
-            return QueryResult(
-                status=ResultStatus.SUCCESS,
-                data=dtos,
-                total_count=total_count,
-                page=query.page,
-                page_size=query.page_size,
-                metadata={
-                    "filters": query.filters,
-                    "order_by": query.order_by,
-                },
-            )
+            # List entities (or only the requested columns) using service
+            if query.columns:
+                entities = self.entity_service.list_entities_projected(
+                    query.columns,
+                    filters=query.filters,
+                    limit=query.get_limit(),
+                    offset=query.get_offset(),
+                    order_by=query.order_by,
+                )
+            else:
+                entities = self.entity_service.list_entities(
+                    filters=query.filters,
+                    limit=query.get_limit(),
+                    offset=query.get_offset(),
+                    order_by=query.order_by,
+                )
+
+            return self._list_result(query, entities, total_count)
 
         except EntityQueryValidationError as e:
             self.logger.error(f"Entity query validation failed: {e}")
@@ -317,41 +467,258 @@ class EntityQueryHandler:
             # Validate query
             query.validate()
 
-            # Search entities using service
-            entities = self.entity_service.search_entities(
-                query=query.query,
-                fields=query.fields,
-                limit=query.get_limit(),
+            # Search entities (or only the requested columns) using service
+            if query.columns:
+                entities = self.entity_service.search_entities_projected(
+                    query.query,
+                    query.get_columns(),
+                    fields=query.fields,
+                    limit=query.get_limit(),
+                    mode=query.get_mode(),
+                    where=query.get_where(),
+                )
+            else:
+                entities = self.entity_service.search_entities(
+                    query=query.query,
+                    fields=query.fields,
+                    limit=query.get_limit(),
+                    mode=query.get_mode(),
+                    where=query.get_where(),
+                )
+
+            return self._search_result(query, entities)
+
+        except EntityQueryValidationError as e:
+            self.logger.error(f"Entity query validation failed: {e}")
+            return QueryResult(
+                status=ResultStatus.ERROR,
+                error=f"Validation error: {str(e)}",
+            )
+
+        except RepositoryError as e:
+            self.logger.error(f"Repository error during entity search: {e}")
+            return QueryResult(
+                status=ResultStatus.ERROR,
+                error=f"Failed to search entities: {str(e)}",
+            )
+
+        except Exception as e:
+            self.logger.error(f"Unexpected error during entity search: {e}")
+            return QueryResult(
+                status=ResultStatus.ERROR,
+                error=f"Unexpected error: {str(e)}",
             )
 
-            # Apply additional filters if provided
-            if query.filters:
-                entities = self._apply_filters(entities, query.filters)
+    def handle_count_entities(self, query: CountEntitiesQuery) -> QueryResult[int]:
+        """
+        Handle count entities query.
 
-            # Get total count before pagination
-            total_count = len(entities)
+        Args:
+            query: Count entities query
 
-            # Apply pagination
-            start_idx = (query.page - 1) * query.page_size
-            end_idx = start_idx + query.page_size
-            paginated_entities = entities[start_idx:end_idx]
+        Returns:
+            Query result with entity count
+        """
+        try:
+            # Validate query
+            query.validate()
 
-            # Convert to DTOs
-            dtos = [self._entity_to_dto(entity) for entity in paginated_entities]
+            # Count entities using service
+            count = self.entity_service.count_entities(
+                filters=query.filters, mode=query.get_count_mode()
+            )
 
+            return self._count_result(query, count)
+
+        except EntityQueryValidationError as e:
+            self.logger.error(f"Entity query validation failed: {e}")
+            return QueryResult(
+                status=ResultStatus.ERROR,
+                error=f"Validation error: {str(e)}",
+            )
+
+        except RepositoryError as e:
+            self.logger.error(f"Repository error during entity count: {e}")
+            return QueryResult(
+                status=ResultStatus.ERROR,
+                error=f"Failed to count entities: {str(e)}",
+            )
+
+        except Exception as e:
+            self.logger.error(f"Unexpected error during entity count: {e}")
             return QueryResult(
-                status=ResultStatus.SUCCESS,
-                data=dtos,
-                total_count=total_count,
-                page=query.page,
-                page_size=query.page_size,
-                metadata={
-                    "query": query.query,
-                    "fields": query.fields,
-                    "filters": query.filters,
-                },
+                status=ResultStatus.ERROR,
+                error=f"Unexpected error: {str(e)}",
             )
 
+    async def handle_get_entity_async(
+        self, query: GetEntityQuery
+    ) -> QueryResult[EntityDTO]:
+        """
+        Handle get entity query without blocking the event loop.
+
+        Args:
+            query: Get entity query
+
+        Returns:
+            Query result with entity DTO
+        """
+        try:
+            query.validate()
+
+            if query.columns:
+                entity = await self.async_entity_service.get_entity_projected(
+                    query.entity_id, query.columns, use_cache=query.use_cache
+                )
+            else:
+                entity = await self.async_entity_service.get_entity(
+                    query.entity_id, use_cache=query.use_cache
+                )
+
+            if not entity:
+                return QueryResult(
+                    status=ResultStatus.ERROR,
+                    error=f"Entity {query.entity_id} not found",
+                )
+
+            return self._get_result(entity)
+
+        except EntityQueryValidationError as e:
+            self.logger.error(f"Entity query validation failed: {e}")
+            return QueryResult(
+                status=ResultStatus.ERROR,
+                error=f"Validation error: {str(e)}",
+            )
+
+        except RepositoryError as e:
+            self.logger.error(f"Repository error during entity retrieval: {e}")
+            return QueryResult(
+                status=ResultStatus.ERROR,
+                error=f"Failed to retrieve entity: {str(e)}",
+            )
+
+        except Exception as e:
+            self.logger.error(f"Unexpected error during entity retrieval: {e}")
+            return QueryResult(
+                status=ResultStatus.ERROR,
+                error=f"Unexpected error: {str(e)}",
+            )
+
+    async def handle_list_entities_async(
+        self, query: ListEntitiesQuery
+    ) -> QueryResult[list[EntityDTO]]:
+        """
+        Handle list entities query without blocking the event loop.
+
+        The total count and the page are fetched concurrently.
+
+        Args:
+            query: List entities query
+
+        Returns:
+            Query result with list of entity DTOs
+        """
+        try:
+            query.validate()
+
+            if query.uses_keyset:
+                total_count, page = await asyncio.gather(
+                    self.async_entity_service.count_entities(
+                        filters=query.filters, mode=query.get_count_mode()
+                    ),
+                    self.async_entity_service.list_entities_page(
+                        filters=query.filters,
+                        limit=query.get_limit(),
+                        order_by=query.order_by,
+                        after=query.after,
+                        before=query.before,
+                    ),
+                )
+                return self._list_result(
+                    query, page.items, total_count, page.next_cursor, page.prev_cursor
+                )
+
+            if query.columns:
+                listing = self.async_entity_service.list_entities_projected(
+                    query.columns,
+                    filters=query.filters,
+                    limit=query.get_limit(),
+                    offset=query.get_offset(),
+                    order_by=query.order_by,
+                )
+            else:
+                listing = self.async_entity_service.list_entities(
+                    filters=query.filters,
+                    limit=query.get_limit(),
+                    offset=query.get_offset(),
+                    order_by=query.order_by,
+                )
+
+            total_count, entities = await asyncio.gather(
+                self.async_entity_service.count_entities(
+                    filters=query.filters, mode=query.get_count_mode()
+                ),
+                listing,
+            )
+
+            return self._list_result(query, entities, total_count)
+
+        except EntityQueryValidationError as e:
+            self.logger.error(f"Entity query validation failed: {e}")
+            return QueryResult(
+                status=ResultStatus.ERROR,
+                error=f"Validation error: {str(e)}",
+            )
+
+        except RepositoryError as e:
+            self.logger.error(f"Repository error during entity listing: {e}")
+            return QueryResult(
+                status=ResultStatus.ERROR,
+                error=f"Failed to list entities: {str(e)}",
+            )
+
+        except Exception as e:
+            self.logger.error(f"Unexpected error during entity listing: {e}")
+            return QueryResult(
+                status=ResultStatus.ERROR,
+                error=f"Unexpected error: {str(e)}",
+            )
+
+    async def handle_search_entities_async(
+        self, query: SearchEntitiesQuery
+    ) -> QueryResult[list[EntityDTO]]:
+        """
+        Handle search entities query without blocking the event loop.
+
+        Args:
+            query: Search entities query
+
+        Returns:
+            Query result with list of entity DTOs
+        """
+        try:
+            query.validate()
+
+            if query.columns:
+                entities = await self.async_entity_service.search_entities_projected(
+                    query.query,
+                    query.get_columns(),
+                    fields=query.fields,
+                    limit=query.get_limit(),
+                    mode=query.get_mode(),
+                    where=query.get_where(),
+                )
+            else:
+                entities = await self.async_entity_service.search_entities(
+                    query=query.query,
+                    fields=query.fields,
+                    limit=query.get_limit(),
+                    mode=query.get_mode(),
+                    where=query.get_where(),
+                )
+
+            return self._search_result(query, entities)
+
         except EntityQueryValidationError as e:
             self.logger.error(f"Entity query validation failed: {e}")
             return QueryResult(
@@ -373,9 +740,11 @@ class EntityQueryHandler:
                 error=f"Unexpected error: {str(e)}",
             )
 
-    def handle_count_entities(self, query: CountEntitiesQuery) -> QueryResult[int]:
+    async def handle_count_entities_async(
+        self, query: CountEntitiesQuery
+    ) -> QueryResult[int]:
         """
-        Handle count entities query.
+        Handle count entities query without blocking the event loop.
 
         Args:
             query: Count entities query
@@ -384,19 +753,19 @@ class EntityQueryHandler:
             Query result with entity count
         """
         try:
-            # Validate query
             query.validate()
 
-            # Count entities using service
-            count = self.entity_service.count_entities(filters=query.filters)
+            count = await self.async_entity_service.count_entities(
+                filters=query.filters, mode=query.get_count_mode()
+            )
 
+            return self._count_result(query, count)
+
+        except EntityQueryValidationError as e:
+            self.logger.error(f"Entity query validation failed: {e}")
             return QueryResult(
-                status=ResultStatus.SUCCESS,
-                data=count,
-                total_count=count,
-                page=1,
-                page_size=1,
-                metadata={"filters": query.filters},
+                status=ResultStatus.ERROR,
+                error=f"Validation error: {str(e)}",
             )
 
         except RepositoryError as e:
@@ -413,6 +782,138 @@ class EntityQueryHandler:
                 error=f"Unexpected error: {str(e)}",
             )
 
+    def _get_result(self, entity: Union[Entity, dict[str, Any]]) -> QueryResult[EntityDTO]:
+        """
+        Build the result for a single retrieved entity.
+
+        Args:
+            entity: Retrieved entity, or projected row
+
+        Returns:
+            Query result with entity DTO (partial DTO for projections)
+        """
+        return QueryResult(
+            status=ResultStatus.SUCCESS,
+            data=self._to_dto(entity),
+            total_count=1,
+            page=1,
+            page_size=1,
+        )
+
+    def _list_result(
+        self,
+        query: ListEntitiesQuery,
+        entities: list[Union[Entity, dict[str, Any]]],
+        total_count: int,
+        next_cursor: Optional[str] = None,
+        prev_cursor: Optional[str] = None,
+    ) -> QueryResult[list[EntityDTO]]:
+        """
+        Build the result for a page of listed entities.
+
+        Args:
+            query: List entities query
+            entities: Entities (or projected rows) on the requested page
+            total_count: Total number of matching entities
+            next_cursor: Cursor of the following page (cursor pagination)
+            prev_cursor: Cursor of the preceding page (cursor pagination)
+
+        Returns:
+            Query result with list of entity DTOs
+        """
+        return QueryResult(
+            status=ResultStatus.SUCCESS,
+            data=[self._to_dto(entity) for entity in entities],
+            total_count=total_count,
+            page=query.page,
+            page_size=query.page_size,
+            metadata={
+                "filters": query.filters,
+                "order_by": query.order_by,
+                "columns": query.columns,
+                "count_mode": query.get_count_mode().value,
+            },
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
+        )
+
+    def _search_result(
+        self, query: SearchEntitiesQuery, entities: list[Union[Entity, dict[str, Any]]]
+    ) -> QueryResult[list[EntityDTO]]:
+        """
+        Paginate and convert search hits.
+
+        Args:
+            query: Search entities query
+            entities: Entities (or projected rows) returned by the search
+
+        Returns:
+            Query result with list of entity DTOs
+        """
+        # Get total count before pagination
+        total_count = len(entities)
+
+        # Apply pagination
+        start_idx = (query.page - 1) * query.page_size
+        end_idx = start_idx + query.page_size
+        paginated_entities = entities[start_idx:end_idx]
+
+        return QueryResult(
+            status=ResultStatus.SUCCESS,
+            data=[self._to_dto(entity) for entity in paginated_entities],
+            total_count=total_count,
+            page=query.page,
+            page_size=query.page_size,
+            metadata={
+                "query": query.query,
+                "fields": query.fields,
+                "filters": query.filters,
+                "columns": query.columns,
+                "mode": query.get_mode().value,
+            },
+        )
+
+    def _count_result(
+        self, query: CountEntitiesQuery, count: int
+    ) -> QueryResult[int]:
+        """
+        Build the result for an entity count.
+
+        Args:
+            query: Count entities query
+            count: Number of matching entities
+
+        Returns:
+            Query result with entity count
+        """
+        return QueryResult(
+            status=ResultStatus.SUCCESS,
+            data=count,
+            total_count=count,
+            page=1,
+            page_size=1,
+            metadata={"filters": query.filters, "count_mode": query.get_count_mode().value},
+        )
+
+    def _to_dto(
+        self, entity: Union[Entity, dict[str, Any]]
+    ) -> Union[EntityDTO, dict[str, Any]]:
+        """
+        Convert an entity to a DTO, passing projected rows through.
+
+        A projected row already holds only the requested columns and is
+        returned as-is as a partial DTO.
+
+        Args:
+            entity: Entity or projected row
+
+        Returns:
+            EntityDTO for entities, the row dictionary for projections
+        """
+        if isinstance(entity, dict):
+            return entity
+        return self._entity_to_dto(entity)
+
     def _entity_to_dto(self, entity: Entity) -> EntityDTO:
         """
         Convert entity to DTO.
@@ -434,36 +935,6 @@ class EntityQueryHandler:
         )
         return handler._entity_to_dto(entity)
 
-    def _apply_filters(
-        self, entities: list[Entity], filters: dict[str, Any]
-    ) -> list[Entity]:
-        """
-        Apply filters to entity list.
-
-        Args:
-            entities: List of entities
-            filters: Filters to apply
-
-        Returns:
-            Filtered entity list
-        """
-        filtered = []
-        for entity in entities:
-            matches = True
-            for key, value in filters.items():
-                entity_value = getattr(entity, key, None)
-                if entity_value is None:
-                    entity_value = entity.metadata.get(key)
-
-                if entity_value != value:
-                    matches = False
-                    break
-
-            if matches:
-                filtered.append(entity)
-
-        return filtered
-
 
 __all__ = [
     "GetEntityQuery",
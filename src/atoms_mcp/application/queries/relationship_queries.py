@@ -8,9 +8,11 @@ from dataclasses import dataclass, field
 from typing import Any, Optional
 
 from ...domain.models.relationship import Relationship, RelationType
+from ...domain.ports.async_repository import AsyncRepository, ThreadedAsyncRepository
 from ...domain.ports.cache import Cache
 from ...domain.ports.logger import Logger
 from ...domain.ports.repository import Repository, RepositoryError
+from ...domain.services.async_relationship_service import AsyncRelationshipService
 from ...domain.services.relationship_service import RelationshipService
 from ..dto import QueryResult, RelationshipDTO, ResultStatus
 
@@ -185,6 +187,8 @@ class RelationshipQueryHandler:
 
     Attributes:
         relationship_service: Domain service for relationship operations
+        async_relationship_service: Non-blocking domain service used by the
+            ``*_async`` handlers
         logger: Logger for recording events
     """
 
@@ -193,6 +197,7 @@ class RelationshipQueryHandler:
         repository: Repository[Relationship],
         logger: Logger,
         cache: Optional[Cache] = None,
+        async_repository: Optional[AsyncRepository[Relationship]] = None,
     ):
         """
         Initialize relationship query handler.
@@ -201,8 +206,13 @@ class RelationshipQueryHandler:
             repository: Repository for relationship persistence
             logger: Logger for recording events
             cache: Optional cache for performance
+            async_repository: Optional native async repository; when omitted
+                the sync repository is run in worker threads
         """
         self.relationship_service = RelationshipService(repository, logger, cache)
+        self.async_relationship_service = AsyncRelationshipService(
+            async_repository or ThreadedAsyncRepository(repository), logger, cache
+        )
         self.logger = logger
 
     def handle_get_relationships(
@@ -233,29 +243,7 @@ class RelationshipQueryHandler:
                 relationship_type=relationship_type,
             )
 
-            # Apply pagination
-            total_count = len(relationships)
-            start_idx = (query.page - 1) * query.page_size
-            end_idx = start_idx + query.page_size
-            paginated_relationships = relationships[start_idx:end_idx]
-
-            # Convert to DTOs
-            dtos = [
-                self._relationship_to_dto(rel) for rel in paginated_relationships
-            ]
-
-            return QueryResult(
-                status=ResultStatus.SUCCESS,
-                data=dtos,
-                total_count=total_count,
-                page=query.page,
-                page_size=query.page_size,
-                metadata={
-                    "source_id": query.source_id,
-                    "target_id": query.target_id,
-                    "relationship_type": query.relationship_type,
-                },
-            )
+            return self._relationships_result(query, relationships)
 
         except RelationshipQueryValidationError as e:
             self.logger.error(f"Relationship query validation failed: {e}")
@@ -299,36 +287,7 @@ class RelationshipQueryHandler:
                 query.start_id, query.end_id, query.max_depth
             )
 
-            if path is None:
-                return QueryResult(
-                    status=ResultStatus.SUCCESS,
-                    data=[],
-                    total_count=0,
-                    page=1,
-                    page_size=1,
-                    metadata={
-                        "start_id": query.start_id,
-                        "end_id": query.end_id,
-                        "path_found": False,
-                    },
-                )
-
-            # Convert to DTOs
-            dtos = [self._relationship_to_dto(rel) for rel in path]
-
-            return QueryResult(
-                status=ResultStatus.SUCCESS,
-                data=dtos,
-                total_count=len(dtos),
-                page=1,
-                page_size=len(dtos),
-                metadata={
-                    "start_id": query.start_id,
-                    "end_id": query.end_id,
-                    "path_found": True,
-                    "path_length": len(dtos),
-                },
-            )
+            return self._path_result(query, path)
 
         except RelationshipQueryValidationError as e:
             self.logger.error(f"Relationship query validation failed: {e}")
@@ -455,6 +414,164 @@ class RelationshipQueryHandler:
                 error=f"Unexpected error: {str(e)}",
             )
 
+    async def handle_get_relationships_async(
+        self, query: GetRelationshipsQuery
+    ) -> QueryResult[list[RelationshipDTO]]:
+        """
+        Handle get relationships query without blocking the event loop.
+
+        Args:
+            query: Get relationships query
+
+        Returns:
+            Query result with list of relationship DTOs
+        """
+        try:
+            query.validate()
+
+            relationship_type = None
+            if query.relationship_type:
+                relationship_type = RelationType(query.relationship_type)
+
+            relationships = await self.async_relationship_service.get_relationships(
+                source_id=query.source_id,
+                target_id=query.target_id,
+                relationship_type=relationship_type,
+            )
+
+            return self._relationships_result(query, relationships)
+
+        except RelationshipQueryValidationError as e:
+            self.logger.error(f"Relationship query validation failed: {e}")
+            return QueryResult(
+                status=ResultStatus.ERROR,
+                error=f"Validation error: {str(e)}",
+            )
+
+        except RepositoryError as e:
+            self.logger.error(f"Repository error during relationship retrieval: {e}")
+            return QueryResult(
+                status=ResultStatus.ERROR,
+                error=f"Failed to retrieve relationships: {str(e)}",
+            )
+
+        except Exception as e:
+            self.logger.error(f"Unexpected error during relationship retrieval: {e}")
+            return QueryResult(
+                status=ResultStatus.ERROR,
+                error=f"Unexpected error: {str(e)}",
+            )
+
+    async def handle_find_path_async(
+        self, query: FindPathQuery
+    ) -> QueryResult[list[RelationshipDTO]]:
+        """
+        Handle find path query without blocking the event loop.
+
+        Args:
+            query: Find path query
+
+        Returns:
+            Query result with path as list of relationship DTOs
+        """
+        try:
+            query.validate()
+
+            path = await self.async_relationship_service.find_path(
+                query.start_id, query.end_id, query.max_depth
+            )
+
+            return self._path_result(query, path)
+
+        except RelationshipQueryValidationError as e:
+            self.logger.error(f"Relationship query validation failed: {e}")
+            return QueryResult(
+                status=ResultStatus.ERROR,
+                error=f"Validation error: {str(e)}",
+            )
+
+        except Exception as e:
+            self.logger.error(f"Unexpected error during path finding: {e}")
+            return QueryResult(
+                status=ResultStatus.ERROR,
+                error=f"Unexpected error: {str(e)}",
+            )
+
+    def _relationships_result(
+        self, query: GetRelationshipsQuery, relationships: list[Relationship]
+    ) -> QueryResult[list[RelationshipDTO]]:
+        """
+        Paginate and convert relationships.
+
+        Args:
+            query: Get relationships query
+            relationships: All matching relationships
+
+        Returns:
+            Query result with list of relationship DTOs
+        """
+        # Apply pagination
+        total_count = len(relationships)
+        start_idx = (query.page - 1) * query.page_size
+        end_idx = start_idx + query.page_size
+        paginated_relationships = relationships[start_idx:end_idx]
+
+        return QueryResult(
+            status=ResultStatus.SUCCESS,
+            data=[self._relationship_to_dto(rel) for rel in paginated_relationships],
+            total_count=total_count,
+            page=query.page,
+            page_size=query.page_size,
+            metadata={
+                "source_id": query.source_id,
+                "target_id": query.target_id,
+                "relationship_type": query.relationship_type,
+            },
+        )
+
+    def _path_result(
+        self, query: FindPathQuery, path: Optional[list[Relationship]]
+    ) -> QueryResult[list[RelationshipDTO]]:
+        """
+        Build the result for a path search.
+
+        Args:
+            query: Find path query
+            path: Relationships forming the path, or None if no path exists
+
+        Returns:
+            Query result with path as list of relationship DTOs
+        """
+        if path is None:
+            return QueryResult(
+                status=ResultStatus.SUCCESS,
+                data=[],
+                total_count=0,
+                page=1,
+                page_size=1,
+                metadata={
+                    "start_id": query.start_id,
+                    "end_id": query.end_id,
+                    "path_found": False,
+                },
+            )
+
+        dtos = [self._relationship_to_dto(rel) for rel in path]
+
+        return QueryResult(
+            status=ResultStatus.SUCCESS,
+            data=dtos,
+            total_count=len(dtos),
+            page=1,
+            page_size=len(dtos),
+            metadata={
+                "start_id": query.start_id,
+                "end_id": query.end_id,
+                "path_found": True,
+                "path_length": len(dtos),
+            },
+        )
+
     def _relationship_to_dto(self, relationship: Relationship) -> RelationshipDTO:
         """
         Convert relationship to DTO.
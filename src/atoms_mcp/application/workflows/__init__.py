@@ -9,6 +9,7 @@ from .bulk_operations import (
     BulkCreateEntitiesWorkflow,
     BulkDeleteEntitiesWorkflow,
     BulkOperationsHandler,
+    BulkStatusUpdateWorkflow,
     BulkUpdateEntitiesWorkflow,
 )
 from .import_export import (
@@ -22,6 +23,7 @@ __all__ = [
     "BulkCreateEntitiesWorkflow",
     "BulkUpdateEntitiesWorkflow",
     "BulkDeleteEntitiesWorkflow",
+    "BulkStatusUpdateWorkflow",
     "BulkOperationsHandler",
     # Import/export
     "ImportFromFileWorkflow",
@@ -8,15 +8,15 @@ with transaction support and error handling.
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
-from ...domain.models.entity import Entity
+from ...domain.models.entity import Entity, EntityStatus
 from ...domain.ports.cache import Cache
 from ...domain.ports.logger import Logger
 from ...domain.ports.repository import Repository, RepositoryError
-from ...domain.services.entity_service import EntityService
 from ..commands.entity_commands import (
     CreateEntityCommand,
-    DeleteEntityCommand,
     EntityCommandHandler,
+    EntityNotFoundError,
+    EntityValidationError,
     UpdateEntityCommand,
 )
 from ..dto import CommandResult, EntityDTO, ResultStatus
@@ -126,6 +126,36 @@ class BulkDeleteEntitiesWorkflow:
             )
 
 
+@dataclass
+class BulkStatusUpdateWorkflow:
+    """
+    Workflow for moving entities to a new status.
+
+    Attributes:
+        entity_ids: List of entity IDs to update
+        new_status: Target status (an ``EntityStatus`` value)
+    """
+
+    entity_ids: list[str] = field(default_factory=list)
+    new_status: str = ""
+
+    def validate(self) -> None:
+        """
+        Validate workflow parameters.
+
+        Raises:
+            BulkOperationValidationError: If validation fails
+        """
+        if not self.entity_ids:
+            raise BulkOperationValidationError("entity_ids list cannot be empty")
+        if len(self.entity_ids) > 1000:
+            raise BulkOperationValidationError(
+                "cannot update more than 1000 entities at once"
+            )
+        if self.new_status not in {status.value for status in EntityStatus}:
+            raise BulkOperationValidationError(f"invalid status: {self.new_status}")
+
+
 class BulkOperationsHandler:
     """
     Handler for bulk operation workflows.
@@ -161,6 +191,12 @@ class BulkOperationsHandler:
         """
         Handle bulk create entities workflow.
 
+        Every command is validated before anything is written, and the
+        valid entities are then persisted with one batch save. In
+        transaction mode a validation failure discards the batch without
+        touching the repository, and the save is one repository
+        transaction, so a failed write leaves nothing behind.
+
         Args:
             workflow: Bulk create workflow
 
@@ -175,63 +211,58 @@ class BulkOperationsHandler:
                 f"Starting bulk create for {len(workflow.entities)} entities"
             )
 
-            created_entities = []
+            pending: list[tuple[int, Entity]] = []
             failed_entities = []
             errors = []
 
-            # Process each entity
+            # Build and validate each entity
             for i, command in enumerate(workflow.entities):
                 try:
-                    result = self.entity_handler.handle_create_entity(command)
-
-                    if result.is_success:
-                        created_entities.append(result.data)
-                        self.logger.debug(
-                            f"Created entity {i + 1}/{len(workflow.entities)}"
-                        )
-                    else:
-                        failed_entities.append(i)
-                        errors.append(f"Entity {i}: {result.error}")
-                        self.logger.warning(
-                            f"Failed to create entity {i + 1}: {result.error}"
-                        )
-
-                        if workflow.stop_on_error:
-                            self.logger.info("Stopping bulk create due to error")
-                            break
-
+                    pending.append((i, self.entity_handler._build_entity(command)))
+                except EntityValidationError as e:
+                    failed_entities.append(i)
+                    errors.append(f"Entity {i}: Validation error: {str(e)}")
+                    self.logger.warning(f"Failed to create entity {i + 1}: {e}")
                 except Exception as e:
                     failed_entities.append(i)
                     errors.append(f"Entity {i}: {str(e)}")
                     self.logger.error(f"Unexpected error creating entity {i + 1}: {e}")
 
-                    if workflow.stop_on_error:
-                        break
+                if failed_entities and workflow.stop_on_error:
+                    self.logger.info("Stopping bulk create due to error")
+                    break
 
             # Handle transaction mode
             if workflow.transaction and failed_entities:
                 self.logger.warning(
-                    f"Transaction mode: Rolling back {len(created_entities)} created entities"
+                    f"Transaction mode: Rolling back {len(pending)} pending entities"
                 )
-                # In a real implementation, this would rollback the transaction
-                # For now, we'll delete the created entities
-                for entity in created_entities:
-                    try:
-                        delete_cmd = DeleteEntityCommand(entity_id=entity.id)
-                        self.entity_handler.handle_delete_entity(delete_cmd)
-                    except Exception as e:
-                        self.logger.error(f"Failed to rollback entity {entity.id}: {e}")
-
                 return CommandResult(
                     status=ResultStatus.ERROR,
                     error=f"Bulk create failed: {'; '.join(errors)}",
                     metadata={
                         "total": len(workflow.entities),
                         "failed": len(failed_entities),
-                        "rolled_back": len(created_entities),
+                        "rolled_back": len(pending),
                     },
                 )
 
+            created_entities = []
+            if pending:
+                try:
+                    created = self.entity_handler.entity_service.create_entities(
+                        [entity for _, entity in pending],
+                        atomic=workflow.transaction,
+                    )
+                    created_entities = [
+                        self.entity_handler._entity_to_dto(entity) for entity in created
+                    ]
+                except (RepositoryError, ValueError) as e:
+                    self.logger.error(f"Batch save failed during bulk create: {e}")
+                    for i, _ in pending:
+                        failed_entities.append(i)
+                        errors.append(f"Entity {i}: Failed to create entity: {str(e)}")
+
             # Determine result status
             if not created_entities:
                 status = ResultStatus.ERROR
@@ -275,6 +306,14 @@ class BulkOperationsHandler:
         """
         Handle bulk update entities workflow.
 
+        Targets are loaded with one batch read and written back with one
+        repository transaction, each write conditional on the revision
+        that was read (or the revision a command expects), so a failed
+        write leaves every target unchanged. Outside transaction mode a
+        concurrent change is retried with fresh reads. Several commands
+        for one entity are applied in order and each reports the entity
+        as finally written.
+
         Args:
             workflow: Bulk update workflow
 
@@ -289,72 +328,90 @@ class BulkOperationsHandler:
                 f"Starting bulk update for {len(workflow.updates)} entities"
             )
 
-            updated_entities = []
+            entity_service = self.entity_handler.entity_service
             failed_entities = []
             errors = []
 
-            # Store original states for rollback
-            original_states = {}
+            # Load current states once; needed to fail before anything is written
+            existing: Optional[dict[str, Entity]] = None
+            if workflow.transaction or workflow.stop_on_error:
+                existing = {
+                    entity.id: entity
+                    for entity in entity_service.get_entities(
+                        [command.entity_id for command in workflow.updates],
+                        use_cache=False,
+                    )
+                }
 
-            # Process each update
+            # Validate each update
+            ready: list[tuple[int, UpdateEntityCommand]] = []
             for i, command in enumerate(workflow.updates):
                 try:
-                    # Store original state if in transaction mode
-                    if workflow.transaction:
-                        original = self.entity_handler.entity_service.get_entity(
-                            command.entity_id
-                        )
-                        if original:
-                            original_states[command.entity_id] = original
-
-                    result = self.entity_handler.handle_update_entity(command)
-
-                    if result.is_success:
-                        updated_entities.append(result.data)
-                        self.logger.debug(
-                            f"Updated entity {i + 1}/{len(workflow.updates)}"
-                        )
-                    else:
-                        failed_entities.append(i)
-                        errors.append(f"Entity {i}: {result.error}")
-                        self.logger.warning(
-                            f"Failed to update entity {i + 1}: {result.error}"
-                        )
-
-                        if workflow.stop_on_error:
-                            break
-
+                    command.validate()
+                    if existing is not None and command.entity_id not in existing:
+                        raise EntityNotFoundError(f"Entity {command.entity_id} not found")
+                    ready.append((i, command))
+                except EntityValidationError as e:
+                    failed_entities.append(i)
+                    errors.append(f"Entity {i}: Validation error: {str(e)}")
+                    self.logger.warning(f"Failed to update entity {i + 1}: {e}")
+                except EntityNotFoundError as e:
+                    failed_entities.append(i)
+                    errors.append(f"Entity {i}: {str(e)}")
+                    self.logger.warning(f"Failed to update entity {i + 1}: {e}")
                 except Exception as e:
                     failed_entities.append(i)
                     errors.append(f"Entity {i}: {str(e)}")
                     self.logger.error(f"Unexpected error updating entity {i + 1}: {e}")
 
-                    if workflow.stop_on_error:
-                        break
+                if failed_entities and workflow.stop_on_error:
+                    break
 
-            # Handle transaction mode rollback
             if workflow.transaction and failed_entities:
-                self.logger.warning(
-                    f"Transaction mode: Rolling back {len(updated_entities)} updated entities"
-                )
-                for entity_id, original_state in original_states.items():
-                    try:
-                        # Restore original state
-                        self.entity_handler.entity_service.repository.save(
-                            original_state
-                        )
-                    except Exception as e:
-                        self.logger.error(f"Failed to rollback entity {entity_id}: {e}")
+                return self._update_rollback_result(workflow, failed_entities, errors, len(ready))
+
+            # Commands for the same entity are merged in order, so later
+            # commands win as if applied one after another; the entity is
+            # validated if any of its commands asks for it and must still
+            # have the first revision one of them expects
+            changes: dict[str, dict[str, Any]] = {}
+            validate: dict[str, bool] = {}
+            expected_revisions: dict[str, int] = {}
+            for _, command in ready:
+                changes.setdefault(command.entity_id, {}).update(command.updates)
+                validate[command.entity_id] = validate.get(command.entity_id, False) or command.validate_updates
+                if command.expected_revision is not None:
+                    expected_revisions.setdefault(command.entity_id, command.expected_revision)
 
-                return CommandResult(
-                    status=ResultStatus.ERROR,
-                    error=f"Bulk update failed: {'; '.join(errors)}",
-                    metadata={
-                        "total": len(workflow.updates),
-                        "failed": len(failed_entities),
-                        "rolled_back": len(updated_entities),
-                    },
-                )
+            updated_entities = []
+            if ready:
+                try:
+                    updated = entity_service.update_entities(
+                        changes,
+                        validate=validate,
+                        atomic=workflow.transaction,
+                        expected_revisions=expected_revisions,
+                    )
+                    updated_by_id = {entity.id: entity for entity in updated}
+                    for i, command in ready:
+                        entity = updated_by_id.get(command.entity_id)
+                        if entity is None:
+                            failed_entities.append(i)
+                            errors.append(f"Entity {i}: Entity {command.entity_id} not found")
+                            self.logger.warning(
+                                f"Failed to update entity {i + 1}: {command.entity_id} not found"
+                            )
+                        else:
+                            updated_entities.append(self.entity_handler._entity_to_dto(entity))
+                except (RepositoryError, ValueError) as e:
+                    self.logger.error(f"Batch save failed during bulk update: {e}")
+                    if workflow.transaction:
+                        return self._update_rollback_result(
+                            workflow, [i for i, _ in ready], [f"Batch save failed: {e}"], len(ready)
+                        )
+                    for i, _ in ready:
+                        failed_entities.append(i)
+                        errors.append(f"Entity {i}: Failed to update entity: {str(e)}")
 
             # Determine result status
             if not updated_entities:
@@ -399,6 +456,9 @@ class BulkOperationsHandler:
         """
         Handle bulk delete entities workflow.
 
+        Deletes are issued as batch statements rather than one request per
+        entity; in transaction mode they are one repository transaction.
+
         Args:
             workflow: Bulk delete workflow
 
@@ -413,45 +473,47 @@ class BulkOperationsHandler:
                 f"Starting bulk delete for {len(workflow.entity_ids)} entities"
             )
 
-            deleted_entities = []
+            entity_service = self.entity_handler.entity_service
+            entity_ids = workflow.entity_ids
             failed_entities = []
             errors = []
 
-            # Process each delete
-            for i, entity_id in enumerate(workflow.entity_ids):
-                try:
-                    command = DeleteEntityCommand(
-                        entity_id=entity_id,
-                        soft_delete=workflow.soft_delete,
-                    )
-
-                    result = self.entity_handler.handle_delete_entity(command)
-
-                    if result.is_success:
-                        deleted_entities.append(entity_id)
-                        self.logger.debug(
-                            f"Deleted entity {i + 1}/{len(workflow.entity_ids)}"
-                        )
-                    else:
+            # Stopping at the first missing entity needs existence up front
+            if workflow.stop_on_error:
+                existing = {
+                    entity.id
+                    for entity in entity_service.get_entities(entity_ids, use_cache=False)
+                }
+                for i, entity_id in enumerate(entity_ids):
+                    if entity_id not in existing:
+                        entity_ids = entity_ids[:i]
                         failed_entities.append(entity_id)
-                        errors.append(f"Entity {entity_id}: {result.error}")
-                        self.logger.warning(
-                            f"Failed to delete entity {entity_id}: {result.error}"
-                        )
-
-                        if workflow.stop_on_error:
-                            break
-
-                except Exception as e:
-                    failed_entities.append(entity_id)
-                    errors.append(f"Entity {entity_id}: {str(e)}")
-                    self.logger.error(f"Unexpected error deleting entity {entity_id}: {e}")
-
-                    if workflow.stop_on_error:
+                        errors.append(f"Entity {entity_id}: Entity {entity_id} not found")
+                        self.logger.warning(f"Failed to delete entity {entity_id}: not found")
                         break
 
-            # Note: Rollback for delete operations would restore deleted entities
-            # This is left as a TODO for implementation with proper transaction support
+            deleted_entities = []
+            if entity_ids:
+                try:
+                    deleted = set(
+                        entity_service.delete_entities(
+                            entity_ids,
+                            soft_delete=workflow.soft_delete,
+                            atomic=workflow.transaction,
+                        )
+                    )
+                    for entity_id in entity_ids:
+                        if entity_id in deleted:
+                            deleted_entities.append(entity_id)
+                        else:
+                            failed_entities.append(entity_id)
+                            errors.append(f"Entity {entity_id}: Entity {entity_id} not found")
+                            self.logger.warning(f"Failed to delete entity {entity_id}: not found")
+                except RepositoryError as e:
+                    self.logger.error(f"Batch delete failed during bulk delete: {e}")
+                    for entity_id in entity_ids:
+                        failed_entities.append(entity_id)
+                        errors.append(f"Entity {entity_id}: Failed to delete entity: {str(e)}")
 
             # Determine result status
             if not deleted_entities:
@@ -496,11 +558,115 @@ class BulkOperationsHandler:
                 error=f"Unexpected error: {str(e)}",
             )
 
+    def handle_bulk_status_update(
+        self, workflow: BulkStatusUpdateWorkflow
+    ) -> CommandResult[dict[str, Any]]:
+        """
+        Handle bulk status update workflow.
+
+        The transition is written with set-based updates instead of one
+        read and one write per entity, so IDs that were not updated are
+        reported by count only.
+
+        Args:
+            workflow: Bulk status update workflow
+
+        Returns:
+            Command result with update statistics
+        """
+        try:
+            workflow.validate()
+
+            entity_ids = list(dict.fromkeys(workflow.entity_ids))
+            self.logger.info(
+                f"Starting bulk status update for {len(entity_ids)} entities"
+            )
+
+            updated = self.entity_handler.entity_service.set_status(
+                entity_ids, EntityStatus(workflow.new_status)
+            )
+            missing = len(entity_ids) - updated
+
+            if not updated:
+                status = ResultStatus.ERROR
+            elif missing:
+                status = ResultStatus.PARTIAL_SUCCESS
+            else:
+                status = ResultStatus.SUCCESS
+
+            self.logger.info(
+                f"Bulk status update completed: {updated} updated, {missing} not found"
+            )
+
+            return CommandResult(
+                status=status,
+                data={"updated_count": updated, "failed_count": missing},
+                error=f"{missing} entities not found" if missing else None,
+                metadata={
+                    "total": len(entity_ids),
+                    "new_status": workflow.new_status,
+                },
+            )
+
+        except BulkOperationValidationError as e:
+            self.logger.error(f"Bulk operation validation failed: {e}")
+            return CommandResult(
+                status=ResultStatus.ERROR,
+                error=f"Validation error: {str(e)}",
+            )
+
+        except RepositoryError as e:
+            self.logger.error(f"Repository error during bulk status update: {e}")
+            return CommandResult(
+                status=ResultStatus.ERROR,
+                error=f"Failed to update status: {str(e)}",
+            )
+
+        except Exception as e:
+            self.logger.error(f"Unexpected error during bulk status update: {e}")
+            return CommandResult(
+                status=ResultStatus.ERROR,
+                error=f"Unexpected error: {str(e)}",
+            )
+
+    def _update_rollback_result(
+        self,
+        workflow: BulkUpdateEntitiesWorkflow,
+        failed_entities: list[int],
+        errors: list[str],
+        rolled_back: int,
+    ) -> CommandResult[list[EntityDTO]]:
+        """
+        Build the error result for a rolled back bulk update.
+
+        Args:
+            workflow: Bulk update workflow
+            failed_entities: Indexes of failed updates
+            errors: Error messages
+            rolled_back: Number of updates discarded or reverted
+
+        Returns:
+            Error command result
+        """
+        self.logger.warning(
+            f"Transaction mode: Rolling back {rolled_back} updated entities"
+        )
+        return CommandResult(
+            status=ResultStatus.ERROR,
+            error=f"Bulk update failed: {'; '.join(errors)}",
+            metadata={
+                "total": len(workflow.updates),
+                "failed": len(failed_entities),
+                "rolled_back": rolled_back,
+            },
+        )
+
 
 __all__ = [
     "BulkCreateEntitiesWorkflow",
     "BulkUpdateEntitiesWorkflow",
     "BulkDeleteEntitiesWorkflow",
+    "BulkStatusUpdateWorkflow",
     "BulkOperationsHandler",
     "BulkOperationError",
     "BulkOperationValidationError",
@@ -9,15 +9,20 @@ import csv
 import json
 from dataclasses import dataclass, field
 from io import StringIO
-from typing import Any, Optional
+from textwrap import indent
+from typing import Any, Iterable, Optional, TextIO
 
 from ...domain.models.entity import Entity
 from ...domain.ports.cache import Cache
 from ...domain.ports.logger import Logger
-from ...domain.ports.repository import Repository
-from ..commands.entity_commands import CreateEntityCommand, EntityCommandHandler
+from ...domain.ports.repository import Repository, RepositoryError
+from ..commands.entity_commands import (
+    CreateEntityCommand,
+    EntityCommandHandler,
+    EntityValidationError,
+)
 from ..dto import CommandResult, ResultStatus
-from ..queries.entity_queries import EntityQueryHandler, ListEntitiesQuery
+from ..queries.entity_queries import EntityQueryHandler
 
 
 class ImportExportError(Exception):
@@ -178,37 +183,24 @@ class ImportExportHandler:
 
             self.logger.info(f"Parsed {len(entities_data)} entities from file")
 
-            # Import entities
-            imported = []
+            # Build entities; persistence happens in one batch afterwards
+            pending: list[tuple[int, Entity]] = []
             failed = []
             errors = []
 
             for i, entity_data in enumerate(entities_data):
                 try:
-                    # Create entity command
                     command = self._create_entity_command(entity_data, workflow.entity_type)
+                    pending.append((i, self.entity_handler._build_entity(command)))
+                    self.logger.debug(f"Prepared entity {i + 1}/{len(entities_data)}")
 
-                    # Validate if requested
-                    if workflow.validate:
-                        command.validate()
-
-                    # Create entity
-                    result = self.entity_handler.handle_create_entity(command)
-
-                    if result.is_success:
-                        imported.append(result.data.id)
-                        self.logger.debug(
-                            f"Imported entity {i + 1}/{len(entities_data)}"
-                        )
-                    else:
-                        failed.append(i)
-                        errors.append(f"Entity {i}: {result.error}")
-                        self.logger.warning(
-                            f"Failed to import entity {i + 1}: {result.error}"
-                        )
+                except EntityValidationError as e:
+                    failed.append(i)
+                    errors.append(f"Entity {i}: Validation error: {str(e)}")
+                    self.logger.warning(f"Failed to import entity {i + 1}: {e}")
 
-                        if workflow.stop_on_error:
-                            break
+                    if workflow.stop_on_error:
+                        break
 
                 except Exception as e:
                     failed.append(i)
@@ -218,6 +210,18 @@ class ImportExportHandler:
                     if workflow.stop_on_error:
                         break
 
+            imported = []
+            if pending:
+                try:
+                    created = self.entity_handler.entity_service.create_entities(
+                        [entity for _, entity in pending]
+                    )
+                    imported = [entity.id for entity in created]
+                except (RepositoryError, ValueError) as e:
+                    failed.extend(i for i, _ in pending)
+                    errors.append(f"Failed to import {len(pending)} entities: {str(e)}")
+                    self.logger.error(f"Batch save failed during import: {e}")
+
             # Determine result status
             if not imported:
                 status = ResultStatus.ERROR
@@ -286,30 +290,28 @@ class ImportExportHandler:
 
             self.logger.info(f"Starting export to {workflow.format} format")
 
-            # Query entities
-            query = ListEntitiesQuery(
-                filters=workflow.filters,
-                limit=10000,  # Max export limit
+            # Stream entities page by page instead of materializing the table
+            entities = (
+                self.query_handler._entity_to_dto(entity)
+                for entity in self.query_handler.entity_service.iter_entities(
+                    filters=workflow.filters
+                )
             )
 
-            result = self.query_handler.handle_list_entities(query)
-
-            if not result.is_success:
-                raise ImportExportError(f"Failed to query entities: {result.error}")
-
-            entities = result.data
-            self.logger.info(f"Retrieved {len(entities)} entities for export")
-
             # Export based on format
+            output = StringIO()
             if workflow.format == "json":
-                content = self._export_json(
-                    entities, workflow.fields, workflow.pretty_print
+                entity_count = self._export_json(
+                    output, entities, workflow.fields, workflow.pretty_print
                 )
             elif workflow.format == "csv":
-                content = self._export_csv(entities, workflow.fields)
+                entity_count = self._export_csv(output, entities, workflow.fields)
             else:
                 raise UnsupportedFormatError(f"Unsupported format: {workflow.format}")
 
+            content = output.getvalue()
+            self.logger.info(f"Exported {entity_count} entities")
+
             # Write to file if path provided
             if workflow.output_path:
                 with open(workflow.output_path, "w") as f:
@@ -323,7 +325,7 @@ class ImportExportHandler:
                 data=content,
                 metadata={
                     "format": workflow.format,
-                    "entity_count": len(entities),
+                    "entity_count": entity_count,
                     "output_path": workflow.output_path,
                 },
             )
@@ -391,10 +393,15 @@ class ImportExportHandler:
         )
 
     def _export_json(
-        self, entities: list[Any], fields: Optional[list[str]], pretty_print: bool
-    ) -> str:
-        """Export entities to JSON."""
-        entities_data = []
+        self,
+        output: TextIO,
+        entities: Iterable[Any],
+        fields: Optional[list[str]],
+        pretty_print: bool,
+    ) -> int:
+        """Write entities to output as a JSON array, one entity at a time."""
+        count = 0
+        output.write("[")
 
         for entity in entities:
             entity_dict = entity.to_dict()
@@ -403,39 +410,36 @@ class ImportExportHandler:
             if fields:
                 entity_dict = {k: v for k, v in entity_dict.items() if k in fields}
 
-            entities_data.append(entity_dict)
+            if pretty_print:
+                output.write(",\n" if count else "\n")
+                output.write(indent(json.dumps(entity_dict, indent=2, default=str), "  "))
+            else:
+                output.write(", " if count else "")
+                output.write(json.dumps(entity_dict, default=str))
+            count += 1
 
-        if pretty_print:
-            return json.dumps(entities_data, indent=2, default=str)
-        else:
-            return json.dumps(entities_data, default=str)
+        output.write("\n]" if count and pretty_print else "]")
+        return count
 
     def _export_csv(
-        self, entities: list[Any], fields: Optional[list[str]]
-    ) -> str:
-        """Export entities to CSV."""
-        if not entities:
-            return ""
-
-        # Determine fields to export
-        if fields:
-            fieldnames = fields
-        else:
-            # Use all fields from first entity
-            first_entity = entities[0].to_dict()
-            fieldnames = list(first_entity.keys())
-
-        # Create CSV
-        output = StringIO()
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
+        self, output: TextIO, entities: Iterable[Any], fields: Optional[list[str]]
+    ) -> int:
+        """Write entities to output as CSV rows, one entity at a time."""
+        count = 0
+        writer: Optional[csv.DictWriter] = None
 
         for entity in entities:
             entity_dict = entity.to_dict()
 
+            if writer is None:
+                # Use the requested fields, or all fields from the first entity
+                fieldnames = fields or list(entity_dict.keys())
+                writer = csv.DictWriter(output, fieldnames=fieldnames)
+                writer.writeheader()
+
             # Filter and flatten nested structures
             row = {}
-            for field in fieldnames:
+            for field in writer.fieldnames:
                 value = entity_dict.get(field)
                 if isinstance(value, (dict, list)):
                     row[field] = json.dumps(value)
@@ -443,8 +447,9 @@ class ImportExportHandler:
                     row[field] = str(value) if value is not None else ""
 
             writer.writerow(row)
+            count += 1
 
-        return output.getvalue()
+        return count
 
 
 __all__ = [
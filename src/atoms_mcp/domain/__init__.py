@@ -56,10 +56,32 @@ from .models import (
 )
 
 # Ports
-from .ports import Cache, Logger, Repository, RepositoryError
+from .ports import (
+    AggregateFunc,
+    AsyncRepository,
+    Cache,
+    CountMode,
+    FilterExpr,
+    FilterOp,
+    KeysetPage,
+    Logger,
+    Metric,
+    Repository,
+    RepositoryError,
+    SearchMode,
+    ThreadedAsyncRepository,
+    TimeBucket,
+    WriteMode,
+)
 
 # Services
-from .services import EntityService, RelationshipService, WorkflowService
+from .services import (
+    AsyncEntityService,
+    AsyncRelationshipService,
+    EntityService,
+    RelationshipService,
+    WorkflowService,
+)
 
 __all__ = [
     # Models - Entity
@@ -90,10 +112,23 @@ __all__ = [
     # Ports
     "Repository",
     "RepositoryError",
+    "CountMode",
+    "SearchMode",
+    "WriteMode",
+    "KeysetPage",
+    "FilterExpr",
+    "FilterOp",
+    "AggregateFunc",
+    "Metric",
+    "TimeBucket",
+    "AsyncRepository",
+    "ThreadedAsyncRepository",
     "Logger",
     "Cache",
     # Services
     "EntityService",
     "RelationshipService",
     "WorkflowService",
+    "AsyncEntityService",
+    "AsyncRelationshipService",
 ]
@@ -13,6 +13,7 @@ from .entity import (
     TaskEntity,
     WorkspaceEntity,
 )
+from .ids import ID_VERSIONS, get_id_version, id_timestamp, new_id, set_id_version, uuid7
 from .relationship import (
     Relationship,
     RelationshipConstraint,
@@ -42,6 +43,13 @@ __all__ = [
     "ProjectEntity",
     "TaskEntity",
     "DocumentEntity",
+    # Identifiers
+    "ID_VERSIONS",
+    "get_id_version",
+    "id_timestamp",
+    "new_id",
+    "set_id_version",
+    "uuid7",
     # Relationship models
     "Relationship",
     "RelationshipType",
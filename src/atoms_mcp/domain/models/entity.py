@@ -5,11 +5,13 @@ This module defines the core entity models for the Atoms MCP system.
 All models are pure dataclasses with no external dependencies.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from enum import Enum
+from functools import cache
 from typing import Any, Optional
-from uuid import uuid4
+
+from .ids import new_id
 
 
 class EntityStatus(Enum):
@@ -36,6 +38,20 @@ class EntityType(Enum):
     USER = "user"
 
 
+@cache
+def entity_fields(entity_type: type) -> frozenset[str]:
+    """
+    Get the names of the dataclass fields of an entity type.
+
+    Args:
+        entity_type: Entity class
+
+    Returns:
+        Field names, including inherited ones
+    """
+    return frozenset(item.name for item in fields(entity_type))
+
+
 @dataclass
 class Entity:
     """
@@ -44,19 +60,63 @@ class Entity:
     All domain entities inherit from this class. It provides
     common tracking fields and identity management.
 
+    Entities record which fields were assigned since they were last
+    marked clean, so repositories can write only the changed columns
+    (see ``get_changes``). An entity that was never marked clean, such as
+    one built by its constructor, counts every field as changed, so
+    assignments made while it is constructed are not recorded one by
+    one; one decoded from a stored row starts clean. In-place edits of
+    list and dict fields are only recorded when made through the entity's
+    methods.
+
     Attributes:
-        id: Unique identifier for the entity
+        id: Unique identifier for the entity; time-ordered (see ``new_id``)
         created_at: Timestamp when entity was created
         updated_at: Timestamp when entity was last updated
         status: Current status of the entity
         metadata: Additional flexible metadata
+        revision: Write counter, incremented by every stored write;
+            used for optimistic concurrency control
     """
 
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=new_id)
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
     status: EntityStatus = EntityStatus.ACTIVE
     metadata: dict[str, Any] = field(default_factory=dict)
+    revision: int = 0
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, recording dataclass fields as changed."""
+        object.__setattr__(self, name, value)
+        changed = self.__dict__.get("_changed")
+        if changed is not None and name in entity_fields(type(self)):
+            changed.add(name)
+
+    def _mark_changed(self, name: str) -> None:
+        """Record a field as changed, e.g. after editing it in place."""
+        changed = self.__dict__.get("_changed")
+        if changed is not None:
+            changed.add(name)
+
+    @property
+    def changed_fields(self) -> frozenset[str]:
+        """Names of the fields changed since the entity was last marked clean."""
+        changed = self.__dict__.get("_changed")
+        return entity_fields(type(self)) if changed is None else frozenset(changed)
+
+    def get_changes(self) -> dict[str, Any]:
+        """
+        Get the current values of the changed fields.
+
+        Returns:
+            Dictionary of field name to value, suitable for ``Repository.patch``
+        """
+        return {name: getattr(self, name) for name in self.changed_fields}
+
+    def mark_clean(self) -> None:
+        """Forget recorded changes, e.g. once the entity is persisted."""
+        self.__dict__["_changed"] = set()
 
     def mark_updated(self) -> None:
         """Update the updated_at timestamp to current time."""
@@ -107,6 +167,7 @@ class Entity:
             value: Value to store
         """
         self.metadata[key] = value
+        self._mark_changed("metadata")
         self.mark_updated()
 
 
@@ -143,6 +204,7 @@ class WorkspaceEntity(Entity):
             settings: Settings to merge with existing settings
         """
         self.settings.update(settings)
+        self._mark_changed("settings")
         self.mark_updated()
 
     def change_owner(self, new_owner_id: str) -> None:
@@ -214,6 +276,7 @@ class ProjectEntity(Entity):
         """
         if tag and tag not in self.tags:
             self.tags.append(tag)
+            self._mark_changed("tags")
             self.mark_updated()
 
     def remove_tag(self, tag: str) -> None:
@@ -225,6 +288,7 @@ class ProjectEntity(Entity):
         """
         if tag in self.tags:
             self.tags.remove(tag)
+            self._mark_changed("tags")
             self.mark_updated()
 
     def is_overdue(self) -> bool:
@@ -302,6 +366,7 @@ class TaskEntity(Entity):
             raise ValueError("Task cannot depend on itself")
         if task_id not in self.dependencies:
             self.dependencies.append(task_id)
+            self._mark_changed("dependencies")
             self.mark_updated()
 
     def remove_dependency(self, task_id: str) -> None:
@@ -313,6 +378,7 @@ class TaskEntity(Entity):
         """
         if task_id in self.dependencies:
             self.dependencies.remove(task_id)
+            self._mark_changed("dependencies")
             self.mark_updated()
 
     def log_time(self, hours: float) -> None:
@@ -9,7 +9,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any, Optional
-from uuid import uuid4
+
+from .ids import new_id
 
 
 class RelationType(Enum):
@@ -67,7 +68,7 @@ class Relationship:
     a source entity to a target entity with a specific type.
 
     Attributes:
-        id: Unique identifier for the relationship
+        id: Unique identifier for the relationship; time-ordered (see ``new_id``)
         source_id: ID of the source entity
         target_id: ID of the target entity
         relationship_type: Type of relationship
@@ -77,9 +78,11 @@ class Relationship:
         created_by: ID of user who created the relationship
         metadata: Additional flexible metadata
         properties: Relationship-specific properties
+        revision: Write counter, incremented by every stored write;
+            used for optimistic concurrency control
     """
 
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=new_id)
     source_id: str = ""
     target_id: str = ""
     relationship_type: RelationType = RelationType.RELATES_TO
@@ -89,6 +92,7 @@ class Relationship:
     created_by: Optional[str] = None
     metadata: dict[str, Any] = field(default_factory=dict)
     properties: dict[str, Any] = field(default_factory=dict)
+    revision: int = 0
 
     def __post_init__(self) -> None:
         """Validate relationship after initialization."""
@@ -9,7 +9,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any, Callable, Optional
-from uuid import uuid4
+
+from .ids import new_id
 
 
 class TriggerType(Enum):
@@ -154,7 +155,7 @@ class Trigger:
         conditions: Conditions that must be met
     """
 
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=new_id)
     trigger_type: TriggerType = TriggerType.MANUAL
     config: dict[str, Any] = field(default_factory=dict)
     conditions: list[Condition] = field(default_factory=list)
@@ -189,7 +190,7 @@ class Action:
         timeout_seconds: Timeout for action execution
     """
 
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=new_id)
     action_type: ActionType = ActionType.EXECUTE_SCRIPT
     config: dict[str, Any] = field(default_factory=dict)
     retry_count: int = 0
@@ -228,7 +229,7 @@ class WorkflowStep:
         on_failure_step_id: ID of step to execute on failure
     """
 
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=new_id)
     name: str = ""
     description: str = ""
     action: Optional[Action] = None
@@ -268,9 +269,11 @@ class Workflow:
         created_at: Creation timestamp
         updated_at: Update timestamp
         metadata: Additional metadata
+        revision: Write counter, incremented by every stored write;
+            used for optimistic concurrency control
     """
 
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=new_id)
     name: str = ""
     description: str = ""
     trigger: Optional[Trigger] = None
@@ -279,6 +282,7 @@ class Workflow:
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
     metadata: dict[str, Any] = field(default_factory=dict)
+    revision: int = 0
 
     def __post_init__(self) -> None:
         """Validate workflow after initialization."""
@@ -370,7 +374,7 @@ class WorkflowExecution:
     Tracks the execution of a workflow instance.
 
     Attributes:
-        id: Unique identifier
+        id: Unique identifier; time-ordered (see ``new_id``)
         workflow_id: ID of the workflow being executed
         status: Current execution status
         current_step_id: ID of currently executing step
@@ -381,7 +385,7 @@ class WorkflowExecution:
         execution_log: Log of execution events
     """
 
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=new_id)
     workflow_id: str = ""
     status: WorkflowStatus = WorkflowStatus.PENDING
     current_step_id: Optional[str] = None
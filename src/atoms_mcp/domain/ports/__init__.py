@@ -4,13 +4,46 @@ Domain ports package.
 Exports all port (interface) definitions for dependency injection.
 """
 
+from .aggregation import AggregateFunc, Metric, TimeBucket
+from .async_repository import AsyncRepository, ThreadedAsyncRepository
 from .cache import Cache
+from .filters import AllOf, AnyOf, Condition, FilterExpr, FilterOp, parse_filters
 from .logger import Logger
-from .repository import Repository, RepositoryError
+from .pagination import KeysetPage, decode_cursor, encode_cursor
+from .repository import (
+    BatchWrite,
+    ConcurrencyError,
+    CountMode,
+    Repository,
+    RepositoryError,
+    SearchMode,
+    WriteBatch,
+    WriteMode,
+)
 
 __all__ = [
     "Repository",
     "RepositoryError",
+    "ConcurrencyError",
+    "CountMode",
+    "SearchMode",
+    "WriteMode",
+    "WriteBatch",
+    "BatchWrite",
+    "KeysetPage",
+    "encode_cursor",
+    "decode_cursor",
+    "FilterExpr",
+    "FilterOp",
+    "Condition",
+    "AllOf",
+    "AnyOf",
+    "parse_filters",
+    "AggregateFunc",
+    "Metric",
+    "TimeBucket",
+    "AsyncRepository",
+    "ThreadedAsyncRepository",
     "Logger",
     "Cache",
 ]
@@ -0,0 +1,290 @@
+"""
+Aggregation primitives.
+
+Aggregate reads return one row per group with the requested metrics
+(counts, sums, averages, minimums and maximums) instead of the entities
+themselves, so adapters can compute them with ``GROUP BY`` in the database.
+Rows may also be bucketed by time like ``date_trunc``. This module defines
+the metric and bucket types and aggregates in-memory entities for
+repositories without native aggregation. Pure Python with no external
+dependencies.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from enum import Enum
+from typing import Any, Iterable, Optional
+
+from .filters import field_value
+from .pagination import keyset_value
+from .projection import validate_column
+
+# Key of the time bucket in aggregate rows
+BUCKET_KEY = "bucket"
+
+
+class AggregateFunc(str, Enum):
+    """Aggregate functions available as metrics."""
+
+    COUNT = "count"
+    SUM = "sum"
+    AVG = "avg"
+    MIN = "min"
+    MAX = "max"
+
+
+class TimeBucket(str, Enum):
+    """Time bucket sizes, named after ``date_trunc`` fields."""
+
+    HOUR = "hour"
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+
+@dataclass(frozen=True)
+class Metric:
+    """
+    An aggregate computed per group.
+
+    Attributes:
+        func: Aggregate function
+        field: Field aggregated (None for COUNT, which counts rows)
+    """
+
+    func: AggregateFunc = AggregateFunc.COUNT
+    field: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        """Validate the function and field."""
+        object.__setattr__(self, "func", AggregateFunc(self.func))
+        if self.field is not None:
+            validate_column(self.field)
+        elif self.func != AggregateFunc.COUNT:
+            raise ValueError(f"'{self.func.value}' metric needs a field")
+
+    @property
+    def alias(self) -> str:
+        """Key of the metric in aggregate rows, e.g. ``count`` or ``sum_priority``."""
+        if self.field is None:
+            return self.func.value
+        return f"{self.func.value}_{self.field}"
+
+
+# Metrics used when none are requested
+DEFAULT_METRICS = (Metric(),)
+
+
+def validate_group_key(key: Any) -> str:
+    """
+    Check that a group key is a column or a ``column.key`` JSON path.
+
+    Args:
+        key: Group key to check
+
+    Returns:
+        The group key
+
+    Raises:
+        ValueError: If the key is not a column or one-level JSON path
+    """
+    if not isinstance(key, str) or key.count(".") > 1:
+        raise ValueError(f"Invalid group key: {key!r}")
+    for part in key.split("."):
+        validate_column(part)
+    return key
+
+
+def group_value(item: Any, key: str) -> Any:
+    """
+    Read a group key from an entity or row dictionary.
+
+    Args:
+        item: Entity or row dictionary
+        key: Column name or ``column.key`` JSON path
+
+    Returns:
+        Normalized value, or None if absent
+    """
+    column, _, path = key.partition(".")
+    value = field_value(item, column)
+    if path:
+        value = value.get(path) if isinstance(value, dict) else None
+    return keyset_value(value)
+
+
+def truncate_time(value: datetime, bucket: TimeBucket) -> datetime:
+    """
+    Truncate a datetime to the start of its bucket, like ``date_trunc``.
+
+    Weeks start on Monday.
+
+    Args:
+        value: Datetime to truncate
+        bucket: Bucket size
+
+    Returns:
+        Start of the bucket
+    """
+    bucket = TimeBucket(bucket)
+    if bucket == TimeBucket.HOUR:
+        return value.replace(minute=0, second=0, microsecond=0)
+    start = value.replace(hour=0, minute=0, second=0, microsecond=0)
+    if bucket == TimeBucket.WEEK:
+        return start - timedelta(days=start.weekday())
+    if bucket == TimeBucket.MONTH:
+        return start.replace(day=1)
+    return start
+
+
+class Aggregator:
+    """
+    Incremental in-memory aggregation.
+
+    Produces the same rows as ``GROUP BY``: one per distinct combination
+    of group values (and time bucket), or a single row when there are no
+    groups. Only running totals are kept per group, so items can be
+    streamed through ``add``. Items whose time field is unset are skipped
+    when bucketing.
+    """
+
+    def __init__(
+        self,
+        group_by: Optional[list[str]] = None,
+        metrics: Optional[list[Metric]] = None,
+        time_bucket: Optional[TimeBucket] = None,
+        time_field: str = "created_at",
+    ):
+        """
+        Initialize the aggregator.
+
+        Args:
+            group_by: Group keys (see ``validate_group_key``)
+            metrics: Metrics to compute (None = row count)
+            time_bucket: Bucket items by ``time_field`` truncated to this size
+            time_field: Datetime field used for bucketing
+
+        Raises:
+            ValueError: If a group key or field name is invalid
+        """
+        self.keys = [validate_group_key(key) for key in group_by or []]
+        self.metrics = list(metrics or DEFAULT_METRICS)
+        self.time_bucket = TimeBucket(time_bucket) if time_bucket is not None else None
+        self.time_field = validate_column(time_field)
+        self._groups: dict[tuple[Any, ...], list[_Accumulator]] = {}
+
+    def add(self, item: Any) -> None:
+        """
+        Add an entity or row dictionary to its group.
+
+        Args:
+            item: Entity or row dictionary
+        """
+        group = tuple(group_value(item, key) for key in self.keys)
+        if self.time_bucket is not None:
+            moment = field_value(item, self.time_field)
+            if isinstance(moment, str):
+                moment = datetime.fromisoformat(moment)
+            if not isinstance(moment, (datetime, date)):
+                return
+            if not isinstance(moment, datetime):
+                moment = datetime(moment.year, moment.month, moment.day)
+            group += (truncate_time(moment, self.time_bucket).isoformat(),)
+
+        accumulators = self._groups.get(group)
+        if accumulators is None:
+            accumulators = self._groups[group] = [_Accumulator(m) for m in self.metrics]
+        for accumulator in accumulators:
+            accumulator.add(item)
+
+    def rows(self) -> list[dict[str, Any]]:
+        """
+        Build the aggregate rows.
+
+        Returns:
+            Rows holding the group values, the ISO start of the bucket
+            under ``BUCKET_KEY`` and one entry per metric alias
+        """
+        groups = self._groups
+        if not groups and not self.keys and self.time_bucket is None:
+            groups = {(): [_Accumulator(m) for m in self.metrics]}
+
+        rows = []
+        for group, accumulators in groups.items():
+            row = dict(zip(self.keys, group[: len(self.keys)], strict=True))
+            if self.time_bucket is not None:
+                row[BUCKET_KEY] = group[-1]
+            for accumulator in accumulators:
+                row[accumulator.metric.alias] = accumulator.result()
+            rows.append(row)
+        return rows
+
+
+def aggregate_items(
+    items: Iterable[Any],
+    group_by: Optional[list[str]] = None,
+    metrics: Optional[list[Metric]] = None,
+    time_bucket: Optional[TimeBucket] = None,
+    time_field: str = "created_at",
+) -> list[dict[str, Any]]:
+    """
+    Aggregate entities in memory.
+
+    Args:
+        items: Entities or row dictionaries
+        group_by: Group keys (see ``validate_group_key``)
+        metrics: Metrics to compute (None = row count)
+        time_bucket: Bucket items by ``time_field`` truncated to this size
+        time_field: Datetime field used for bucketing
+
+    Returns:
+        Aggregate rows (see ``Aggregator.rows``)
+
+    Raises:
+        ValueError: If a group key or field name is invalid
+    """
+    aggregator = Aggregator(group_by, metrics, time_bucket, time_field)
+    for item in items:
+        aggregator.add(item)
+    return aggregator.rows()
+
+
+class _Accumulator:
+    """Running state of one metric within one group; nulls are ignored like SQL."""
+
+    def __init__(self, metric: Metric):
+        self.metric = metric
+        self.count = 0
+        self.total: Any = 0
+        self.low: Any = None
+        self.high: Any = None
+
+    def add(self, item: Any) -> None:
+        if self.metric.field is None:
+            self.count += 1
+            return
+
+        value = keyset_value(field_value(item, self.metric.field))
+        if value is None:
+            return
+        self.count += 1
+        if self.metric.func in (AggregateFunc.SUM, AggregateFunc.AVG):
+            self.total += value
+        if self.low is None or value < self.low:
+            self.low = value
+        if self.high is None or value > self.high:
+            self.high = value
+
+    def result(self) -> Any:
+        func = self.metric.func
+        if func == AggregateFunc.COUNT:
+            return self.count
+        if not self.count:
+            return None
+        if func == AggregateFunc.SUM:
+            return self.total
+        if func == AggregateFunc.AVG:
+            return self.total / self.count
+        return self.low if func == AggregateFunc.MIN else self.high
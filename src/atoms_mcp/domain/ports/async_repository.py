@@ -0,0 +1,975 @@
+"""
+Abstract asynchronous repository interface (port).
+
+This module defines the awaitable counterpart of the Repository port for
+adapters that perform non-blocking I/O. Pure ABC with no external
+dependencies.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from itertools import groupby, islice
+from typing import Any, AsyncIterator, Generic, Optional, TypeVar
+
+from .aggregation import Aggregator, Metric, TimeBucket
+from .filters import FilterExpr
+from .pagination import DEFAULT_SCAN_PAGE_SIZE, KeysetPage, keyset_value, paginate_keyset, parse_order_by
+from .projection import normalize_columns, project
+from .repository import (
+    Repository,
+    RepositoryError,
+    SearchMode,
+    WriteBatch,
+    apply_patch,
+    bump_revision,
+    check_write_mode,
+    require_update_filter,
+)
+
+T = TypeVar("T")
+
+
+class AsyncRepository(ABC, Generic[T]):
+    """
+    Abstract base class for asynchronous repositories.
+
+    Mirrors the Repository port method for method, but every operation is a
+    coroutine so callers running on an event loop never block on I/O.
+
+    Type parameter T represents the entity type managed by this repository.
+    """
+
+    @abstractmethod
+    async def save(self, entity: T) -> T:
+        """
+        Save an entity to the repository.
+
+        Args:
+            entity: Entity to save
+
+        Returns:
+            Saved entity (may include generated fields)
+
+        Raises:
+            RepositoryError: If save operation fails
+        """
+        pass
+
+    @abstractmethod
+    async def get(self, entity_id: str) -> Optional[T]:
+        """
+        Retrieve an entity by ID.
+
+        Args:
+            entity_id: Unique identifier of the entity
+
+        Returns:
+            Entity if found, None otherwise
+
+        Raises:
+            RepositoryError: If retrieval operation fails
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, entity_id: str) -> bool:
+        """
+        Delete an entity by ID.
+
+        Args:
+            entity_id: Unique identifier of the entity
+
+        Returns:
+            True if entity was deleted, False if not found
+
+        Raises:
+            RepositoryError: If delete operation fails
+        """
+        pass
+
+    @abstractmethod
+    async def list(
+        self,
+        filters: Optional[dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[str] = None,
+    ) -> list[T]:
+        """
+        List entities with optional filtering and pagination.
+
+        Args:
+            filters: Dictionary of field:value filters
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+            order_by: Field name to order by (prefix with '-' for descending)
+
+        Returns:
+            List of entities matching criteria
+
+        Raises:
+            RepositoryError: If list operation fails
+        """
+        pass
+
+    @abstractmethod
+    async def search(
+        self,
+        query: str,
+        fields: Optional[list[str]] = None,
+        limit: Optional[int] = None,
+    ) -> list[T]:
+        """
+        Search entities using text search.
+
+        Args:
+            query: Search query string
+            fields: List of field names to search in (None = search all)
+            limit: Maximum number of results to return
+
+        Returns:
+            List of entities matching search criteria
+
+        Raises:
+            RepositoryError: If search operation fails
+        """
+        pass
+
+    @abstractmethod
+    async def count(self, filters: Optional[dict[str, Any]] = None) -> int:
+        """
+        Count entities matching filters.
+
+        Args:
+            filters: Dictionary of field:value filters
+
+        Returns:
+            Number of entities matching criteria
+
+        Raises:
+            RepositoryError: If count operation fails
+        """
+        pass
+
+    @abstractmethod
+    async def exists(self, entity_id: str) -> bool:
+        """
+        Check if an entity exists.
+
+        Args:
+            entity_id: Unique identifier of the entity
+
+        Returns:
+            True if entity exists, False otherwise
+
+        Raises:
+            RepositoryError: If existence check fails
+        """
+        pass
+
+    async def count_planned(self, filters: Optional[dict[str, Any]] = None) -> int:
+        """
+        Estimate the number of entities matching filters.
+
+        The default returns the exact ``count``.
+
+        Args:
+            filters: Dictionary of field:value filters
+
+        Returns:
+            Estimated number of entities matching criteria
+
+        Raises:
+            RepositoryError: If count operation fails
+        """
+        return await self.count(filters=filters)
+
+    async def list_page(
+        self,
+        filters: Optional[dict[str, Any]] = None,
+        limit: int = 20,
+        order_by: Optional[str] = None,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        where: Optional[FilterExpr] = None,
+    ) -> KeysetPage[T]:
+        """
+        List one page of entities using keyset (cursor) pagination.
+
+        Pages are keyed on ``(order_by field, id)``, so cost does not grow
+        with depth and rows inserted concurrently do not shift later pages.
+        The default implementation loads every match through ``list`` and
+        slices in memory; adapters backed by a database should override it.
+
+        Args:
+            filters: Dictionary of field:value filters
+            limit: Maximum number of results to return
+            order_by: Field name to order by (prefix with '-' for descending)
+            after: Cursor of the page to continue after
+            before: Cursor of the page to go back from
+            where: Filter expression applied on top of ``filters``
+
+        Returns:
+            Page of entities with next/previous cursors
+
+        Raises:
+            ValueError: If a cursor is malformed
+            RepositoryError: If list operation fails
+        """
+        entities = await self.list(filters=filters)
+        if where is not None:
+            entities = [entity for entity in entities if where.matches(entity)]
+        return paginate_keyset(
+            entities,
+            limit,
+            order_by,
+            after,
+            before,
+            value_of=lambda entity, name: getattr(entity, name, None),
+            id_of=lambda entity: str(entity.id),
+        )
+
+    async def iter_all(
+        self,
+        filters: Optional[dict[str, Any]] = None,
+        page_size: int = DEFAULT_SCAN_PAGE_SIZE,
+        where: Optional[FilterExpr] = None,
+    ) -> AsyncIterator[T]:
+        """
+        Lazily iterate over every entity matching the filters.
+
+        Walks the table with ``list_page`` in ID order and yields entities
+        one page at a time, so at most ``page_size`` entities are held in
+        memory. Use this instead of an unbounded ``list`` for full scans.
+        Repositories that keep the default in-memory ``list_page`` already
+        hold every match, so they are sorted once and yielded directly.
+
+        Args:
+            filters: Dictionary of field:value filters
+            page_size: Number of entities fetched per request
+            where: Filter expression applied on top of ``filters``
+
+        Yields:
+            Matching entities in ID order
+
+        Raises:
+            ValueError: If page_size is less than 1
+            RepositoryError: If a page fails to load
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be >= 1")
+
+        if type(self).list_page is AsyncRepository.list_page:
+            for entity in sorted(await self.list(filters=filters), key=lambda e: str(e.id)):
+                if where is None or where.matches(entity):
+                    yield entity
+            return
+
+        after: Optional[str] = None
+        while True:
+            page = await self.list_page(filters=filters, limit=page_size, after=after, where=where)
+            for entity in page.items:
+                yield entity
+            if page.next_cursor is None:
+                return
+            after = page.next_cursor
+
+    async def list_where(
+        self,
+        where: FilterExpr,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[str] = None,
+    ) -> list[T]:
+        """
+        List entities matching a filter expression.
+
+        The default scans with ``iter_all`` and evaluates the expression in
+        memory.
+
+        Args:
+            where: Filter expression
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+            order_by: Field name to order by (prefix with '-' for descending)
+
+        Returns:
+            List of matching entities
+
+        Raises:
+            RepositoryError: If list operation fails
+        """
+        entities = [entity async for entity in self.iter_all(where=where)]
+        if order_by:
+            field_name, descending = parse_order_by(order_by)
+
+            def sort_key(entity: T) -> tuple[bool, Any]:
+                value = keyset_value(getattr(entity, field_name, None))
+                return value is None, value if value is not None else ""
+
+            entities.sort(key=sort_key, reverse=descending)
+        start = offset or 0
+        return entities[start : start + limit] if limit is not None else entities[start:]
+
+    async def count_where(self, where: FilterExpr) -> int:
+        """
+        Count entities matching a filter expression.
+
+        Args:
+            where: Filter expression
+
+        Returns:
+            Number of matching entities
+
+        Raises:
+            RepositoryError: If count operation fails
+        """
+        return len([entity async for entity in self.iter_all(where=where)])
+
+    async def aggregate(
+        self,
+        group_by: Optional[list[str]] = None,
+        metrics: Optional[list[Metric]] = None,
+        filters: Optional[dict[str, Any]] = None,
+        time_bucket: Optional[TimeBucket] = None,
+        time_field: str = "created_at",
+        where: Optional[FilterExpr] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Aggregate entities per group, optionally bucketed by time.
+
+        Adapters with native aggregation override this to run one
+        ``GROUP BY`` query; the default streams matching entities through
+        ``iter_all`` and aggregates them in memory.
+
+        Args:
+            group_by: Group keys: column names or ``column.key`` JSON paths
+            metrics: Metrics to compute (None = row count)
+            filters: Dictionary of field:value filters
+            time_bucket: Bucket rows by ``time_field`` truncated to this size
+            time_field: Datetime field used for bucketing
+            where: Filter expression applied on top of ``filters``
+
+        Returns:
+            One row per group holding the group values, the ISO start of
+            the bucket under ``"bucket"`` and one entry per metric alias
+
+        Raises:
+            ValueError: If a group key or metric is invalid
+            RepositoryError: If the aggregation fails
+        """
+        aggregator = Aggregator(group_by, metrics, time_bucket, time_field)
+        async for entity in self.iter_all(filters=filters, where=where):
+            aggregator.add(entity)
+        return aggregator.rows()
+
+    async def insert(self, entity: T) -> T:
+        """
+        Save an entity that is known to be new.
+
+        Adapters that support write modes override this to skip conflict
+        handling; the default delegates to ``save``.
+
+        Args:
+            entity: Entity to insert
+
+        Returns:
+            Saved entity (may include generated fields)
+
+        Raises:
+            RepositoryError: If the entity already exists or the insert fails
+        """
+        return await self.save(entity)
+
+    async def update(self, entity: T) -> T:
+        """
+        Save an entity that is known to exist.
+
+        Adapters that support write modes override this to skip conflict
+        handling; the default delegates to ``save``.
+
+        Args:
+            entity: Entity to update
+
+        Returns:
+            Saved entity
+
+        Raises:
+            RepositoryError: If the entity does not exist or the update fails
+        """
+        return await self.save(entity)
+
+    async def patch(
+        self,
+        entity_id: str,
+        changes: dict[str, Any],
+        expected_revision: Optional[int] = None,
+    ) -> Optional[T]:
+        """
+        Update only the given fields of an entity.
+
+        Like every write of an existing entity, a patch increments the
+        revision. With ``expected_revision`` the update is conditional: it
+        only applies if the stored entity still has that revision.
+
+        Adapters backed by a remote store should override this to send just
+        the changed columns in one conditional update that returns the row.
+        The default loads the entity, applies the changes and updates it.
+
+        Args:
+            entity_id: Unique identifier of the entity
+            changes: Mapping of field name to new value, e.g. from
+                ``Entity.get_changes``
+            expected_revision: Revision the stored entity must have
+                (None = unconditional update)
+
+        Returns:
+            Updated entity, or None if not found
+
+        Raises:
+            ValueError: If a field is not a field of the entity, or is its
+                ID or revision
+            ConcurrencyError: If the stored revision differs from ``expected_revision``
+            RepositoryError: If the update fails
+        """
+        entity = await self.get(entity_id)
+        if entity is None:
+            return None
+        revision = getattr(entity, "revision", None)
+        apply_patch(entity, entity_id, changes, expected_revision)
+        bump_revision(entity, revision)
+        return await self.update(entity)
+
+    async def update_where(
+        self,
+        filters: Optional[dict[str, Any]],
+        changes: dict[str, Any],
+        where: Optional[FilterExpr] = None,
+    ) -> int:
+        """
+        Set the given fields on every entity matching the filters.
+
+        Adapters backed by a database should override this with a single
+        set-based ``UPDATE ... WHERE``; the default loads the matching
+        entities with ``iter_all`` and writes them back with ``save_many``.
+        The revision of every updated entity is incremented.
+
+        Args:
+            filters: Dictionary of field:value filters
+            changes: Mapping of field name to new value
+            where: Filter expression applied on top of ``filters``
+
+        Returns:
+            Number of entities updated
+
+        Raises:
+            ValueError: If no filter is given or a field cannot be updated
+            RepositoryError: If the update fails
+        """
+        require_update_filter(filters, where)
+        entities = [entity async for entity in self.iter_all(filters=filters, where=where)]
+        for entity in entities:
+            revision = getattr(entity, "revision", None)
+            apply_patch(entity, getattr(entity, "id", ""), changes)
+            bump_revision(entity, revision)
+        return len(await self.save_many(entities)) if entities else 0
+
+    # Projected reads. They return dictionaries holding only the requested
+    # columns (plus the ID). Defaults load full entities and project them in
+    # memory; adapters backed by a remote store should select the columns.
+
+    async def get_projected(self, entity_id: str, columns: list[str]) -> Optional[dict[str, Any]]:
+        """
+        Retrieve selected columns of an entity by ID.
+
+        Args:
+            entity_id: Unique identifier of the entity
+            columns: Column names to return
+
+        Returns:
+            Dictionary of the requested columns, or None if not found
+
+        Raises:
+            ValueError: If the projection is invalid
+            RepositoryError: If retrieval operation fails
+        """
+        normalize_columns(columns)
+        entity = await self.get(entity_id)
+        return project(entity, columns) if entity is not None else None
+
+    async def list_projected(
+        self,
+        columns: list[str],
+        filters: Optional[dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[str] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        List selected columns of entities with optional filtering and pagination.
+
+        Args:
+            columns: Column names to return
+            filters: Dictionary of field:value filters
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+            order_by: Field name to order by (prefix with '-' for descending)
+
+        Returns:
+            One dictionary of the requested columns per matching entity
+
+        Raises:
+            ValueError: If the projection is invalid
+            RepositoryError: If list operation fails
+        """
+        normalize_columns(columns)
+        entities = await self.list(filters=filters, limit=limit, offset=offset, order_by=order_by)
+        return [project(entity, columns) for entity in entities]
+
+    async def search_projected(
+        self,
+        query: str,
+        columns: list[str],
+        fields: Optional[list[str]] = None,
+        limit: Optional[int] = None,
+        mode: SearchMode = SearchMode.AUTO,
+        where: Optional[FilterExpr] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Search entities and return selected columns.
+
+        Args:
+            query: Search query string
+            columns: Column names to return
+            fields: List of field names to search in (None = search all text fields)
+            limit: Maximum number of results to return
+            mode: How query text is matched (see ``search_ranked``)
+            where: Filter expression the results must also match
+
+        Returns:
+            One dictionary of the requested columns per matching entity
+
+        Raises:
+            ValueError: If the projection is invalid
+            RepositoryError: If search operation fails
+        """
+        normalize_columns(columns)
+        entities = await self.search_ranked(query, fields=fields, limit=limit, mode=mode, where=where)
+        return [project(entity, columns) for entity in entities]
+
+    async def search_ranked(
+        self,
+        query: str,
+        fields: Optional[list[str]] = None,
+        limit: Optional[int] = None,
+        mode: SearchMode = SearchMode.AUTO,
+        where: Optional[FilterExpr] = None,
+    ) -> list[T]:
+        """
+        Search entities, most relevant first.
+
+        The default ignores ``mode``, returns ``search`` results and
+        applies ``where`` in memory.
+
+        Args:
+            query: Search query string
+            fields: List of field names to search in (None = search all text fields)
+            limit: Maximum number of results to return
+            mode: How query text is matched
+            where: Filter expression the results must also match
+
+        Returns:
+            List of matching entities ordered by relevance
+
+        Raises:
+            RepositoryError: If search operation fails
+        """
+        if where is None:
+            return await self.search(query, fields=fields, limit=limit)
+        found = await self.search(query, fields=fields)
+        entities = [entity for entity in found if where.matches(entity)]
+        return entities[:limit] if limit else entities
+
+    # Batch operations. Defaults fall back to one call per item; adapters
+    # should override them with set-based queries.
+
+    async def get_many(self, entity_ids: list[str]) -> list[T]:
+        """
+        Retrieve several entities by ID.
+
+        Args:
+            entity_ids: Identifiers of the entities to retrieve
+
+        Returns:
+            Entities that were found, in the order of ``entity_ids``.
+            Missing IDs are skipped.
+
+        Raises:
+            RepositoryError: If retrieval operation fails
+        """
+        entities = []
+        for entity_id in entity_ids:
+            entity = await self.get(entity_id)
+            if entity is not None:
+                entities.append(entity)
+        return entities
+
+    async def save_many(self, entities: list[T]) -> list[T]:
+        """
+        Save several entities.
+
+        Args:
+            entities: Entities to save
+
+        Returns:
+            Saved entities, in input order
+
+        Raises:
+            RepositoryError: If save operation fails
+        """
+        return [await self.save(entity) for entity in entities]
+
+    async def delete_many(self, entity_ids: list[str], hard: bool = False) -> int:
+        """
+        Delete several entities by ID.
+
+        The default implementation delegates to ``delete`` and therefore
+        uses that method's delete semantics regardless of ``hard``.
+
+        Args:
+            entity_ids: Identifiers of the entities to delete
+            hard: If True, perform hard delete; if False, soft delete
+
+        Returns:
+            Number of entities deleted
+
+        Raises:
+            RepositoryError: If delete operation fails
+        """
+        deleted = 0
+        for entity_id in entity_ids:
+            if await self.delete(entity_id):
+                deleted += 1
+        return deleted
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[WriteBatch[T]]:
+        """
+        Collect writes and commit them as one batch.
+
+        See ``Repository.transaction``::
+
+            async with repository.transaction() as batch:
+                batch.insert(entity)
+            saved = batch.results[0]
+
+        Yields:
+            Empty write batch
+
+        Raises:
+            RepositoryError: If the commit fails
+        """
+        batch: WriteBatch[T] = WriteBatch()
+        yield batch
+        batch.results = await self.commit(batch) if batch.writes else []
+
+    async def commit(self, batch: WriteBatch[T]) -> list[Any]:
+        """
+        Apply the writes of a batch.
+
+        Not atomic; see ``Repository.commit`` for the fallback semantics.
+
+        Args:
+            batch: Writes to apply
+
+        Returns:
+            One result per write (see ``WriteBatch.results``)
+
+        Raises:
+            ConcurrencyError: If a conditional save finds another revision
+            RepositoryError: If a write fails, or the batch could not be
+                rolled back
+        """
+        touched = list(dict.fromkeys(write.entity_id for write in batch.writes))
+        snapshot = {str(entity.id): copy.deepcopy(entity) for entity in await self.get_many(touched)}
+        live = {entity_id: getattr(entity, "revision", None) for entity_id, entity in snapshot.items()}
+        results: list[Any] = []
+        try:
+            for (is_delete, hard), group in groupby(batch.writes, key=lambda w: (w.is_delete, w.hard)):
+                writes = list(group)
+                if is_delete:
+                    results.extend(write.entity_id in live for write in writes)
+                    await self.delete_many([write.entity_id for write in writes], hard=hard)
+                    for write in writes:
+                        live.pop(write.entity_id, None)
+                    continue
+                for write in writes:
+                    check_write_mode(write, write.entity_id in live, live.get(write.entity_id))
+                    if write.entity_id in live:
+                        bump_revision(write.entity, live[write.entity_id])
+                    live[write.entity_id] = getattr(write.entity, "revision", None)
+                results.extend(await self.save_many([write.entity for write in writes]))
+        except Exception as e:
+            restore = [snapshot[entity_id] for entity_id in touched if entity_id in snapshot]
+            created = [entity_id for entity_id in touched if entity_id not in snapshot]
+            failed: list[str] = []
+            if created:
+                try:
+                    await self.delete_many(created, hard=True)
+                except Exception:
+                    failed.extend(created)
+            if restore:
+                try:
+                    await self.save_many(restore)
+                except Exception:
+                    failed.extend(str(entity.id) for entity in restore)
+            if failed:
+                raise RepositoryError(
+                    f"Batch failed ({e}) and could not be rolled back for entities: {', '.join(failed)}"
+                ) from e
+            raise
+        return results
+
+
+class ThreadedAsyncRepository(AsyncRepository[T], Generic[T]):
+    """
+    AsyncRepository backed by a synchronous Repository.
+
+    Each call is dispatched to the default executor with asyncio.to_thread,
+    so a blocking adapter can be used from async code without stalling the
+    event loop. Used as the fallback when no native async adapter exists.
+
+    Attributes:
+        repository: Wrapped synchronous repository
+    """
+
+    def __init__(self, repository: Repository[T]):
+        """
+        Initialize the adapter.
+
+        Args:
+            repository: Synchronous repository to wrap
+        """
+        self.repository = repository
+
+    async def save(self, entity: T) -> T:
+        """Save an entity in a worker thread."""
+        return await asyncio.to_thread(self.repository.save, entity)
+
+    async def get(self, entity_id: str) -> Optional[T]:
+        """Retrieve an entity in a worker thread."""
+        return await asyncio.to_thread(self.repository.get, entity_id)
+
+    async def delete(self, entity_id: str) -> bool:
+        """Delete an entity in a worker thread."""
+        return await asyncio.to_thread(self.repository.delete, entity_id)
+
+    async def list(
+        self,
+        filters: Optional[dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[str] = None,
+    ) -> list[T]:
+        """List entities in a worker thread."""
+        return await asyncio.to_thread(
+            self.repository.list,
+            filters=filters,
+            limit=limit,
+            offset=offset,
+            order_by=order_by,
+        )
+
+    async def search(
+        self,
+        query: str,
+        fields: Optional[list[str]] = None,
+        limit: Optional[int] = None,
+    ) -> list[T]:
+        """Search entities in a worker thread."""
+        return await asyncio.to_thread(
+            self.repository.search, query=query, fields=fields, limit=limit
+        )
+
+    async def count(self, filters: Optional[dict[str, Any]] = None) -> int:
+        """Count entities in a worker thread."""
+        return await asyncio.to_thread(self.repository.count, filters=filters)
+
+    async def count_planned(self, filters: Optional[dict[str, Any]] = None) -> int:
+        """Estimate a count in a worker thread."""
+        return await asyncio.to_thread(self.repository.count_planned, filters=filters)
+
+    async def exists(self, entity_id: str) -> bool:
+        """Check existence in a worker thread."""
+        return await asyncio.to_thread(self.repository.exists, entity_id)
+
+    async def list_page(
+        self,
+        filters: Optional[dict[str, Any]] = None,
+        limit: int = 20,
+        order_by: Optional[str] = None,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        where: Optional[FilterExpr] = None,
+    ) -> KeysetPage[T]:
+        """List one keyset page in a worker thread."""
+        return await asyncio.to_thread(
+            self.repository.list_page,
+            filters=filters,
+            limit=limit,
+            order_by=order_by,
+            after=after,
+            before=before,
+            where=where,
+        )
+
+    async def iter_all(
+        self,
+        filters: Optional[dict[str, Any]] = None,
+        page_size: int = DEFAULT_SCAN_PAGE_SIZE,
+        where: Optional[FilterExpr] = None,
+    ) -> AsyncIterator[T]:
+        """Scan the sync repository, fetching each page in a worker thread."""
+        if page_size < 1:
+            raise ValueError("page_size must be >= 1")
+
+        entities = self.repository.iter_all(filters=filters, page_size=page_size, where=where)
+        while True:
+            page = await asyncio.to_thread(list, islice(entities, page_size))
+            for entity in page:
+                yield entity
+            if len(page) < page_size:
+                return
+
+    async def list_where(
+        self,
+        where: FilterExpr,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[str] = None,
+    ) -> list[T]:
+        """List entities matching an expression in a worker thread."""
+        return await asyncio.to_thread(
+            self.repository.list_where, where, limit=limit, offset=offset, order_by=order_by
+        )
+
+    async def count_where(self, where: FilterExpr) -> int:
+        """Count entities matching an expression in a worker thread."""
+        return await asyncio.to_thread(self.repository.count_where, where)
+
+    async def aggregate(
+        self,
+        group_by: Optional[list[str]] = None,
+        metrics: Optional[list[Metric]] = None,
+        filters: Optional[dict[str, Any]] = None,
+        time_bucket: Optional[TimeBucket] = None,
+        time_field: str = "created_at",
+        where: Optional[FilterExpr] = None,
+    ) -> list[dict[str, Any]]:
+        """Aggregate entities in a worker thread."""
+        return await asyncio.to_thread(
+            self.repository.aggregate, group_by, metrics, filters, time_bucket, time_field, where
+        )
+
+    async def insert(self, entity: T) -> T:
+        """Insert an entity in a worker thread."""
+        return await asyncio.to_thread(self.repository.insert, entity)
+
+    async def update(self, entity: T) -> T:
+        """Update an entity in a worker thread."""
+        return await asyncio.to_thread(self.repository.update, entity)
+
+    async def patch(
+        self,
+        entity_id: str,
+        changes: dict[str, Any],
+        expected_revision: Optional[int] = None,
+    ) -> Optional[T]:
+        """Update selected fields of an entity in a worker thread."""
+        return await asyncio.to_thread(self.repository.patch, entity_id, changes, expected_revision)
+
+    async def update_where(
+        self,
+        filters: Optional[dict[str, Any]],
+        changes: dict[str, Any],
+        where: Optional[FilterExpr] = None,
+    ) -> int:
+        """Update matching entities in a worker thread."""
+        return await asyncio.to_thread(self.repository.update_where, filters, changes, where)
+
+    async def get_projected(self, entity_id: str, columns: list[str]) -> Optional[dict[str, Any]]:
+        """Retrieve selected columns in a worker thread."""
+        return await asyncio.to_thread(self.repository.get_projected, entity_id, columns)
+
+    async def list_projected(
+        self,
+        columns: list[str],
+        filters: Optional[dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[str] = None,
+    ) -> list[dict[str, Any]]:
+        """List selected columns in a worker thread."""
+        return await asyncio.to_thread(
+            self.repository.list_projected,
+            columns,
+            filters=filters,
+            limit=limit,
+            offset=offset,
+            order_by=order_by,
+        )
+
+    async def search_projected(
+        self,
+        query: str,
+        columns: list[str],
+        fields: Optional[list[str]] = None,
+        limit: Optional[int] = None,
+        mode: SearchMode = SearchMode.AUTO,
+        where: Optional[FilterExpr] = None,
+    ) -> list[dict[str, Any]]:
+        """Search selected columns in a worker thread."""
+        return await asyncio.to_thread(
+            self.repository.search_projected,
+            query,
+            columns,
+            fields=fields,
+            limit=limit,
+            mode=mode,
+            where=where,
+        )
+
+    async def search_ranked(
+        self,
+        query: str,
+        fields: Optional[list[str]] = None,
+        limit: Optional[int] = None,
+        mode: SearchMode = SearchMode.AUTO,
+        where: Optional[FilterExpr] = None,
+    ) -> list[T]:
+        """Run a ranked search in a worker thread."""
+        return await asyncio.to_thread(
+            self.repository.search_ranked, query, fields=fields, limit=limit, mode=mode, where=where
+        )
+
+    async def get_many(self, entity_ids: list[str]) -> list[T]:
+        """Retrieve several entities in a worker thread."""
+        return await asyncio.to_thread(self.repository.get_many, entity_ids)
+
+    async def save_many(self, entities: list[T]) -> list[T]:
+        """Save several entities in a worker thread."""
+        return await asyncio.to_thread(self.repository.save_many, entities)
+
+    async def delete_many(self, entity_ids: list[str], hard: bool = False) -> int:
+        """Delete several entities in a worker thread."""
+        return await asyncio.to_thread(
+            self.repository.delete_many, entity_ids, hard=hard
+        )
+
+    async def commit(self, batch: WriteBatch[T]) -> list[Any]:
+        """Apply a write batch in a worker thread."""
+        return await asyncio.to_thread(self.repository.commit, batch)
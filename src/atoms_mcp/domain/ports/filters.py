@@ -0,0 +1,332 @@
+"""
+Filter expressions.
+
+Plain ``filters`` dictionaries only express equality. Filter expressions
+add comparison, pattern, null and containment operators combined with
+and/or groups, so adapters can push the whole predicate down to the
+database instead of filtering rows in Python. Every expression can also
+be evaluated in memory, which is what the default port implementations
+do. Pure Python with no external dependencies.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Optional, Union
+
+from .projection import validate_column
+
+
+class FilterOp(str, Enum):
+    """Comparison operators available in filter conditions."""
+
+    EQ = "eq"
+    NEQ = "neq"
+    IN = "in"
+    GT = "gt"
+    GTE = "gte"
+    LT = "lt"
+    LTE = "lte"
+    ILIKE = "ilike"
+    IS_NULL = "is_null"
+    CONTAINS = "contains"
+
+
+@dataclass(frozen=True)
+class Condition:
+    """
+    A single comparison of one field against a value.
+
+    Attributes:
+        field: Field (column) name
+        op: Comparison operator
+        value: Operand; a sequence for IN, a ``%``/``_`` pattern for ILIKE,
+            a bool for IS_NULL and a dict or list for CONTAINS
+    """
+
+    field: str
+    op: FilterOp
+    value: Any = None
+
+    def __post_init__(self) -> None:
+        """Validate the field name and operand."""
+        validate_column(self.field)
+        object.__setattr__(self, "op", FilterOp(self.op))
+        if self.op == FilterOp.IN:
+            if isinstance(self.value, (str, bytes)) or not hasattr(self.value, "__iter__"):
+                raise ValueError(f"'in' filter on {self.field} needs a list of values")
+            object.__setattr__(self, "value", tuple(self.value))
+        elif self.op == FilterOp.ILIKE and not isinstance(self.value, str):
+            raise ValueError(f"'ilike' filter on {self.field} needs a string pattern")
+        elif self.op == FilterOp.CONTAINS and not isinstance(self.value, (dict, list)):
+            raise ValueError(f"'contains' filter on {self.field} needs a dict or list")
+
+    def matches(self, item: Any) -> bool:
+        """
+        Evaluate the condition against an entity or row.
+
+        Args:
+            item: Entity or row dictionary
+
+        Returns:
+            True if the item satisfies the condition
+        """
+        actual = field_value(item, self.field)
+
+        if self.op == FilterOp.IS_NULL:
+            return (actual is None) == bool(self.value)
+        if actual is None:
+            # Like SQL, comparisons with NULL never match
+            return False
+        if self.op == FilterOp.IN:
+            return any(_equals(actual, value) for value in self.value)
+        if self.op == FilterOp.ILIKE:
+            return _like_pattern(self.value).fullmatch(str(_plain(actual))) is not None
+        if self.op == FilterOp.CONTAINS:
+            return _contains(actual, self.value)
+        if self.op == FilterOp.EQ:
+            return _equals(actual, self.value)
+        if self.op == FilterOp.NEQ:
+            return not _equals(actual, self.value)
+
+        try:
+            left, right = _comparable(actual, self.value)
+            if self.op == FilterOp.GT:
+                return left > right
+            if self.op == FilterOp.GTE:
+                return left >= right
+            if self.op == FilterOp.LT:
+                return left < right
+            return left <= right
+        except (TypeError, ValueError):
+            return False
+
+
+@dataclass(frozen=True)
+class AllOf:
+    """
+    Conjunction of filter expressions (all must match).
+
+    Attributes:
+        filters: Member expressions
+    """
+
+    filters: tuple[FilterExpr, ...]
+
+    def matches(self, item: Any) -> bool:
+        """Evaluate the group against an entity or row."""
+        return all(member.matches(item) for member in self.filters)
+
+
+@dataclass(frozen=True)
+class AnyOf:
+    """
+    Disjunction of filter expressions (at least one must match).
+
+    Attributes:
+        filters: Member expressions
+    """
+
+    filters: tuple[FilterExpr, ...]
+
+    def matches(self, item: Any) -> bool:
+        """Evaluate the group against an entity or row."""
+        return any(member.matches(item) for member in self.filters)
+
+
+FilterExpr = Union[Condition, AllOf, AnyOf]
+
+
+def eq(field: str, value: Any) -> Condition:
+    """Field equals value."""
+    return Condition(field, FilterOp.EQ, value)
+
+
+def neq(field: str, value: Any) -> Condition:
+    """Field differs from value."""
+    return Condition(field, FilterOp.NEQ, value)
+
+
+def in_(field: str, values: Any) -> Condition:
+    """Field equals one of the values."""
+    return Condition(field, FilterOp.IN, values)
+
+
+def gt(field: str, value: Any) -> Condition:
+    """Field is greater than value."""
+    return Condition(field, FilterOp.GT, value)
+
+
+def gte(field: str, value: Any) -> Condition:
+    """Field is greater than or equal to value."""
+    return Condition(field, FilterOp.GTE, value)
+
+
+def lt(field: str, value: Any) -> Condition:
+    """Field is less than value."""
+    return Condition(field, FilterOp.LT, value)
+
+
+def lte(field: str, value: Any) -> Condition:
+    """Field is less than or equal to value."""
+    return Condition(field, FilterOp.LTE, value)
+
+
+def ilike(field: str, pattern: str) -> Condition:
+    """Field matches a case-insensitive ``%``/``_`` pattern."""
+    return Condition(field, FilterOp.ILIKE, pattern)
+
+
+def is_null(field: str, null: bool = True) -> Condition:
+    """Field is null (or, with ``null=False``, is not null)."""
+    return Condition(field, FilterOp.IS_NULL, null)
+
+
+def contains(field: str, value: Union[dict[str, Any], list[Any]]) -> Condition:
+    """JSON field contains the given object or array."""
+    return Condition(field, FilterOp.CONTAINS, value)
+
+
+def and_(*filters: FilterExpr) -> AllOf:
+    """All of the expressions match."""
+    return AllOf(tuple(filters))
+
+
+def or_(*filters: FilterExpr) -> AnyOf:
+    """At least one of the expressions matches."""
+    return AnyOf(tuple(filters))
+
+
+def parse_filters(filters: Optional[dict[str, Any]]) -> Optional[FilterExpr]:
+    """
+    Build a filter expression from a filters dictionary.
+
+    Plain values mean equality and None values are ignored, as with
+    repository ``filters``. A dictionary value whose keys are all operator
+    names applies those operators to the field, and the special keys
+    ``and``/``or`` take lists of nested filter dictionaries::
+
+        {"status": "active", "created_at": {"gte": "2024-01-01"},
+         "or": [{"priority": 1}, {"title": {"ilike": "%urgent%"}}]}
+
+    Args:
+        filters: Filters dictionary (None or empty = no filter)
+
+    Returns:
+        The parsed expression (a conjunction when there are several
+        conditions), or None if there are none
+
+    Raises:
+        ValueError: If an operator, field name or operand is invalid
+    """
+    if not filters:
+        return None
+    if not isinstance(filters, dict):
+        raise ValueError("filters must be an object of field conditions")
+
+    members: list[FilterExpr] = []
+    for key, value in filters.items():
+        if key in ("and", "or"):
+            if not isinstance(value, list):
+                raise ValueError(f"'{key}' filter needs a list of filter objects")
+            group = [parse_filters(member) for member in value]
+            parsed = [member for member in group if member is not None]
+            if parsed:
+                members.append(and_(*parsed) if key == "and" else or_(*parsed))
+        elif _is_operator_map(value):
+            members.extend(Condition(key, FilterOp(op), operand) for op, operand in value.items())
+        elif value is not None:
+            members.append(eq(key, value))
+
+    if not members:
+        return None
+    return members[0] if len(members) == 1 else and_(*members)
+
+
+def field_value(item: Any, field: str) -> Any:
+    """
+    Read a field from an entity or row dictionary.
+
+    Entity attributes that are unset fall back to the entity's metadata.
+
+    Args:
+        item: Entity or row dictionary
+        field: Field name
+
+    Returns:
+        Field value, or None if absent
+    """
+    if isinstance(item, dict):
+        return item.get(field)
+    value = getattr(item, field, None)
+    if value is None:
+        metadata = getattr(item, "metadata", None)
+        if isinstance(metadata, dict):
+            value = metadata.get(field)
+    return value
+
+
+def _is_operator_map(value: Any) -> bool:
+    """Whether a filters-dictionary value is an ``{op: operand}`` mapping."""
+    if not isinstance(value, dict) or not value:
+        return False
+    operators = {op.value for op in FilterOp}
+    return all(key in operators for key in value)
+
+
+def _plain(value: Any) -> Any:
+    """Unwrap enums to their values."""
+    return value.value if isinstance(value, Enum) else value
+
+
+def _comparable(left: Any, right: Any) -> tuple[Any, Any]:
+    """
+    Coerce two operands to comparable types.
+
+    Enums compare by value and ISO strings are parsed when compared with
+    dates, matching how the database compares a column with a literal.
+    """
+    left, right = _plain(left), _plain(right)
+    if isinstance(left, (datetime, date)) and isinstance(right, str):
+        right = type(left).fromisoformat(right)
+    elif isinstance(right, (datetime, date)) and isinstance(left, str):
+        left = type(right).fromisoformat(left)
+    return left, right
+
+
+def _equals(left: Any, right: Any) -> bool:
+    """Compare two operands for equality after coercion."""
+    try:
+        left, right = _comparable(left, right)
+    except ValueError:
+        return False
+    return left == right
+
+
+def _contains(actual: Any, expected: Any) -> bool:
+    """JSON containment with the semantics of Postgres ``@>``."""
+    if isinstance(expected, dict):
+        return isinstance(actual, dict) and all(
+            key in actual and _contains(actual[key], value) for key, value in expected.items()
+        )
+    if isinstance(expected, list):
+        return isinstance(actual, list) and all(
+            any(_contains(candidate, value) for candidate in actual) for value in expected
+        )
+    return _equals(actual, expected)
+
+
+def _like_pattern(pattern: str) -> re.Pattern[str]:
+    """Translate a SQL ``ilike`` pattern into a regular expression."""
+    parts = []
+    for char in pattern:
+        if char == "%":
+            parts.append(".*")
+        elif char == "_":
+            parts.append(".")
+        else:
+            parts.append(re.escape(char))
+    return re.compile("".join(parts), re.IGNORECASE | re.DOTALL)
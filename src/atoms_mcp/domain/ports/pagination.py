@@ -0,0 +1,187 @@
+"""
+Keyset (cursor) pagination primitives.
+
+This module defines the page type returned by ``Repository.list_page`` and
+the opaque cursor format shared by every adapter. A cursor records the
+sort value and ID of a boundary row, so the next page is selected with
+``(field, id) > (value, id)`` instead of an offset. Pure Python with no
+external dependencies.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Callable, Generic, Optional, TypeVar
+from uuid import UUID
+
+T = TypeVar("T")
+
+# Page size used by ``iter_all`` scans when the caller does not choose one
+DEFAULT_SCAN_PAGE_SIZE = 500
+
+
+@dataclass
+class KeysetPage(Generic[T]):
+    """
+    One page of a keyset-paginated listing.
+
+    Attributes:
+        items: Items on this page, in listing order
+        next_cursor: Cursor for the following page, None on the last page
+        prev_cursor: Cursor for the preceding page, None on the first page
+    """
+
+    items: list[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+
+def keyset_value(value: Any) -> Any:
+    """
+    Normalize a sort value to the JSON form stored in cursors.
+
+    Args:
+        value: Raw attribute or column value
+
+    Returns:
+        JSON-compatible value that orders the same way as the original
+    """
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def encode_cursor(value: Any, entity_id: str) -> str:
+    """
+    Encode a boundary row as an opaque cursor.
+
+    Args:
+        value: Sort field value of the row
+        entity_id: ID of the row (tie-breaker)
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps([keyset_value(value), str(entity_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[Any, str]:
+    """
+    Decode a cursor produced by ``encode_cursor``.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        Tuple of (sort value, entity ID)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value, entity_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    if not isinstance(entity_id, str):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return value, entity_id
+
+
+def parse_order_by(order_by: Optional[str], id_field: str = "id") -> tuple[str, bool]:
+    """
+    Split an ``order_by`` spec into field name and direction.
+
+    Args:
+        order_by: Field name, prefixed with '-' for descending (None = ID)
+        id_field: Name of the ID field used when no order is given
+
+    Returns:
+        Tuple of (field name, descending)
+    """
+    if not order_by:
+        return id_field, False
+    return order_by.lstrip("-"), order_by.startswith("-")
+
+
+def paginate_keyset(
+    items: list[T],
+    limit: int,
+    order_by: Optional[str],
+    after: Optional[str],
+    before: Optional[str],
+    value_of: Callable[[T, str], Any],
+    id_of: Callable[[T], str],
+) -> KeysetPage[T]:
+    """
+    Keyset-paginate an in-memory list.
+
+    Used by repositories without native keyset support. Items are ordered
+    by ``(field, id)``; None values sort after all others in ascending
+    order.
+
+    Args:
+        items: All items matching the listing filters
+        limit: Maximum number of items on the page
+        order_by: Field to order by (prefix with '-' for descending)
+        after: Return the page following this cursor
+        before: Return the page preceding this cursor
+        value_of: Callable returning an item's value for a field
+        id_of: Callable returning an item's ID
+
+    Returns:
+        Requested page with neighbouring cursors
+
+    Raises:
+        ValueError: If a cursor is malformed
+    """
+    field_name, descending = parse_order_by(order_by)
+
+    def sort_key(value: Any, entity_id: str) -> tuple[Any, ...]:
+        value = keyset_value(value)
+        return (value is None, value if value is not None else "", entity_id)
+
+    keyed = sorted(
+        ((sort_key(value_of(item, field_name), id_of(item)), item) for item in items),
+        key=lambda pair: pair[0],
+        reverse=descending,
+    )
+
+    token = before or after
+    if token:
+        boundary = sort_key(*decode_cursor(token))
+        if (before is None) != descending:
+            keyed = [pair for pair in keyed if pair[0] > boundary]
+        else:
+            keyed = [pair for pair in keyed if pair[0] < boundary]
+
+    if before is not None:
+        window = keyed[-limit:] if limit else []
+        has_more = len(keyed) > len(window)
+    else:
+        window = keyed[:limit]
+        has_more = len(keyed) > len(window)
+
+    page_items = [item for _, item in window]
+    page: KeysetPage[T] = KeysetPage(items=page_items)
+    if page_items:
+        first, last = page_items[0], page_items[-1]
+        first_cursor = encode_cursor(value_of(first, field_name), id_of(first))
+        last_cursor = encode_cursor(value_of(last, field_name), id_of(last))
+        if before is not None:
+            page.prev_cursor = first_cursor if has_more else None
+            page.next_cursor = last_cursor
+        else:
+            page.next_cursor = last_cursor if has_more else None
+            page.prev_cursor = first_cursor if after else None
+    return page
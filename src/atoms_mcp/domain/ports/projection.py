@@ -0,0 +1,86 @@
+"""
+Column projection primitives.
+
+Projected reads return plain dictionaries holding only the requested
+columns instead of full entities, so large blobs such as document content
+or metadata are never transferred when a caller needs a few fields. This
+module validates column lists and projects in-memory entities for
+repositories without native projection. Pure Python with no external
+dependencies.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Optional
+
+from .pagination import keyset_value
+
+# Column names accepted in projections; keeps them safe to embed in queries
+_COLUMN_NAME = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def validate_column(column: Any) -> str:
+    """
+    Check that a column name is a plain identifier.
+
+    Args:
+        column: Column name to check
+
+    Returns:
+        The column name
+
+    Raises:
+        ValueError: If the name is not an identifier
+    """
+    if not isinstance(column, str) or not _COLUMN_NAME.match(column):
+        raise ValueError(f"Invalid column name: {column!r}")
+    return column
+
+
+def normalize_columns(columns: Optional[list[str]], id_field: str = "id") -> list[str]:
+    """
+    Validate a projection and make sure it includes the ID field.
+
+    Args:
+        columns: Requested column names
+        id_field: Name of the ID field, always returned first
+
+    Returns:
+        Column names with the ID field first and duplicates removed
+
+    Raises:
+        ValueError: If the projection is empty or a column name is invalid
+    """
+    if not columns:
+        raise ValueError("columns must name at least one column")
+
+    for column in columns:
+        validate_column(column)
+
+    return list(dict.fromkeys([id_field, *columns]))
+
+
+def project(entity: Any, columns: list[str], id_field: str = "id") -> dict[str, Any]:
+    """
+    Project an entity onto a list of columns.
+
+    Values are normalized the way they come back from a database row:
+    enums become their values and datetimes ISO strings. Unknown columns
+    map to None.
+
+    Args:
+        entity: Entity to project
+        columns: Column names to keep
+        id_field: Name of the ID field, always included
+
+    Returns:
+        Dictionary with one entry per column
+
+    Raises:
+        ValueError: If the projection is invalid
+    """
+    return {
+        column: keyset_value(getattr(entity, column, None))
+        for column in normalize_columns(columns, id_field)
+    }
@@ -7,11 +7,138 @@ implementations must satisfy. Pure ABC with no external dependencies.
 
 from __future__ import annotations
 
+import copy
 from abc import ABC, abstractmethod
-from typing import Any, Generic, Optional, TypeVar
+from contextlib import contextmanager
+from dataclasses import dataclass, field, is_dataclass
+from enum import Enum
+from itertools import groupby
+from typing import Any, Generic, Iterator, Optional, TypeVar
+
+from ..models.entity import entity_fields
+from .aggregation import Metric, TimeBucket, aggregate_items
+from .filters import FilterExpr
+from .pagination import DEFAULT_SCAN_PAGE_SIZE, KeysetPage, keyset_value, paginate_keyset, parse_order_by
+from .projection import normalize_columns, project
 
 T = TypeVar("T")
 
+# Fields no patch may change: the identity, and the revision writes manage
+UNPATCHABLE_FIELDS = frozenset({"id", "revision"})
+
+
+class WriteMode(str, Enum):
+    """How a save treats existing rows."""
+
+    UPSERT = "upsert"
+    INSERT_ONLY = "insert_only"
+    UPDATE_ONLY = "update_only"
+
+
+class SearchMode(str, Enum):
+    """How a ranked search matches text."""
+
+    AUTO = "auto"
+    FULLTEXT = "fulltext"
+    TRIGRAM = "trigram"
+    SUBSTRING = "substring"
+
+
+class CountMode(str, Enum):
+    """How a count is computed."""
+
+    EXACT = "exact"
+    PLANNED = "planned"
+    CACHED = "cached"
+
+
+@dataclass(frozen=True)
+class BatchWrite:
+    """
+    One write of a ``WriteBatch``.
+
+    Attributes:
+        entity_id: ID of the entity written or deleted
+        mode: Write mode of a save (None for a delete)
+        entity: Entity to save (None for a delete)
+        hard: Whether a delete removes the entity instead of soft deleting it
+        expected_revision: Revision the stored entity must have for the save
+            to apply (None = unconditional); like every write of an existing
+            entity, the save increments it
+    """
+
+    entity_id: str
+    mode: Optional[WriteMode] = None
+    entity: Any = None
+    hard: bool = False
+    expected_revision: Optional[int] = None
+
+    @property
+    def is_delete(self) -> bool:
+        """Whether this write deletes an entity."""
+        return self.mode is None
+
+
+@dataclass
+class WriteBatch(Generic[T]):
+    """
+    Writes collected by ``Repository.transaction`` and committed together.
+
+    Attributes:
+        writes: Pending writes, in the order they were added
+        results: One result per write once committed: the saved entity
+            for saves, whether the entity was found for deletes
+    """
+
+    writes: list[BatchWrite] = field(default_factory=list)
+    results: list[Any] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.writes)
+
+    def save(
+        self,
+        entity: T,
+        mode: WriteMode = WriteMode.UPSERT,
+        expected_revision: Optional[int] = None,
+    ) -> None:
+        """
+        Queue a save.
+
+        Args:
+            entity: Entity to save
+            mode: UPSERT (default), INSERT_ONLY or UPDATE_ONLY
+            expected_revision: Revision the stored entity must have
+                (None = unconditional)
+
+        Raises:
+            RepositoryError: If the entity has no ID
+        """
+        entity_id = getattr(entity, "id", None)
+        if not entity_id:
+            raise RepositoryError("Cannot save an entity without an ID")
+        self.writes.append(
+            BatchWrite(str(entity_id), mode=WriteMode(mode), entity=entity, expected_revision=expected_revision)
+        )
+
+    def insert(self, entity: T) -> None:
+        """Queue the insert of a new entity."""
+        self.save(entity, WriteMode.INSERT_ONLY)
+
+    def update(self, entity: T, expected_revision: Optional[int] = None) -> None:
+        """Queue the update of an existing entity, optionally conditional on its revision."""
+        self.save(entity, WriteMode.UPDATE_ONLY, expected_revision)
+
+    def delete(self, entity_id: str, hard: bool = False) -> None:
+        """
+        Queue a delete.
+
+        Args:
+            entity_id: Unique identifier of the entity
+            hard: If True, remove the entity; if False, soft delete (default)
+        """
+        self.writes.append(BatchWrite(str(entity_id), hard=hard))
+
 
 class Repository(ABC, Generic[T]):
     """
@@ -151,8 +278,699 @@ class Repository(ABC, Generic[T]):
         """
         pass
 
+    def count_planned(self, filters: Optional[dict[str, Any]] = None) -> int:
+        """
+        Estimate the number of entities matching filters.
+
+        Adapters backed by a database should return the query planner's
+        row estimate, which avoids scanning the matching rows. The default
+        returns the exact ``count``.
+
+        Args:
+            filters: Dictionary of field:value filters
+
+        Returns:
+            Estimated number of entities matching criteria
+
+        Raises:
+            RepositoryError: If count operation fails
+        """
+        return self.count(filters=filters)
+
+    def list_page(
+        self,
+        filters: Optional[dict[str, Any]] = None,
+        limit: int = 20,
+        order_by: Optional[str] = None,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        where: Optional[FilterExpr] = None,
+    ) -> KeysetPage[T]:
+        """
+        List one page of entities using keyset (cursor) pagination.
+
+        Pages are keyed on ``(order_by field, id)``, so cost does not grow
+        with depth and rows inserted concurrently do not shift later pages.
+        The default implementation loads every match through ``list`` and
+        slices in memory; adapters backed by a database should override it.
+
+        Args:
+            filters: Dictionary of field:value filters
+            limit: Maximum number of results to return
+            order_by: Field name to order by (prefix with '-' for descending);
+                defaults to the ID, which is creation order for time-ordered IDs
+            after: Cursor of the page to continue after
+            before: Cursor of the page to go back from
+            where: Filter expression applied on top of ``filters``
+
+        Returns:
+            Page of entities with next/previous cursors
+
+        Raises:
+            ValueError: If a cursor is malformed
+            RepositoryError: If list operation fails
+        """
+        entities = self.list(filters=filters)
+        if where is not None:
+            entities = [entity for entity in entities if where.matches(entity)]
+        return paginate_keyset(
+            entities,
+            limit,
+            order_by,
+            after,
+            before,
+            value_of=lambda entity, name: getattr(entity, name, None),
+            id_of=lambda entity: str(entity.id),
+        )
+
+    def iter_all(
+        self,
+        filters: Optional[dict[str, Any]] = None,
+        page_size: int = DEFAULT_SCAN_PAGE_SIZE,
+        where: Optional[FilterExpr] = None,
+    ) -> Iterator[T]:
+        """
+        Lazily iterate over every entity matching the filters.
+
+        Walks the table with ``list_page`` in ID order and yields entities
+        one page at a time, so at most ``page_size`` entities are held in
+        memory. Use this instead of an unbounded ``list`` for full scans.
+        Repositories that keep the default in-memory ``list_page`` already
+        hold every match, so they are sorted once and yielded directly.
+
+        Args:
+            filters: Dictionary of field:value filters
+            page_size: Number of entities fetched per request
+            where: Filter expression applied on top of ``filters``
+
+        Yields:
+            Matching entities in ID order
+
+        Raises:
+            ValueError: If page_size is less than 1
+            RepositoryError: If a page fails to load
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be >= 1")
+
+        if type(self).list_page is Repository.list_page:
+            entities = sorted(self.list(filters=filters), key=lambda e: str(e.id))
+            if where is not None:
+                entities = [entity for entity in entities if where.matches(entity)]
+            yield from entities
+            return
+
+        after: Optional[str] = None
+        while True:
+            page = self.list_page(filters=filters, limit=page_size, after=after, where=where)
+            yield from page.items
+            if page.next_cursor is None:
+                return
+            after = page.next_cursor
+
+    def list_where(
+        self,
+        where: FilterExpr,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[str] = None,
+    ) -> list[T]:
+        """
+        List entities matching a filter expression.
+
+        Adapters backed by a database should translate the expression into
+        their query language; the default scans with ``iter_all`` and
+        evaluates it in memory.
+
+        Args:
+            where: Filter expression
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+            order_by: Field name to order by (prefix with '-' for descending)
+
+        Returns:
+            List of matching entities
+
+        Raises:
+            RepositoryError: If list operation fails
+        """
+        entities = list(self.iter_all(where=where))
+        if order_by:
+            field_name, descending = parse_order_by(order_by)
+
+            def sort_key(entity: T) -> tuple[bool, Any]:
+                value = keyset_value(getattr(entity, field_name, None))
+                return value is None, value if value is not None else ""
+
+            entities.sort(key=sort_key, reverse=descending)
+        start = offset or 0
+        return entities[start : start + limit] if limit is not None else entities[start:]
+
+    def count_where(self, where: FilterExpr) -> int:
+        """
+        Count entities matching a filter expression.
+
+        Args:
+            where: Filter expression
+
+        Returns:
+            Number of matching entities
+
+        Raises:
+            RepositoryError: If count operation fails
+        """
+        return sum(1 for _ in self.iter_all(where=where))
+
+    def aggregate(
+        self,
+        group_by: Optional[list[str]] = None,
+        metrics: Optional[list[Metric]] = None,
+        filters: Optional[dict[str, Any]] = None,
+        time_bucket: Optional[TimeBucket] = None,
+        time_field: str = "created_at",
+        where: Optional[FilterExpr] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Aggregate entities per group, optionally bucketed by time.
+
+        Adapters with native aggregation override this to run one
+        ``GROUP BY`` query; the default streams matching entities through
+        ``iter_all`` and aggregates them in memory.
+
+        Args:
+            group_by: Group keys: column names or ``column.key`` JSON paths
+            metrics: Metrics to compute (None = row count)
+            filters: Dictionary of field:value filters
+            time_bucket: Bucket rows by ``time_field`` truncated to this size
+            time_field: Datetime field used for bucketing
+            where: Filter expression applied on top of ``filters``
+
+        Returns:
+            One row per group holding the group values, the ISO start of
+            the bucket under ``"bucket"`` and one entry per metric alias
+
+        Raises:
+            ValueError: If a group key or metric is invalid
+            RepositoryError: If the aggregation fails
+        """
+        return aggregate_items(
+            self.iter_all(filters=filters, where=where), group_by, metrics, time_bucket, time_field
+        )
+
+    def insert(self, entity: T) -> T:
+        """
+        Save an entity that is known to be new.
+
+        Adapters that support write modes override this to skip conflict
+        handling; the default delegates to ``save``.
+
+        Args:
+            entity: Entity to insert
+
+        Returns:
+            Saved entity (may include generated fields)
+
+        Raises:
+            RepositoryError: If the entity already exists or the insert fails
+        """
+        return self.save(entity)
+
+    def update(self, entity: T) -> T:
+        """
+        Save an entity that is known to exist.
+
+        Adapters that support write modes override this to skip conflict
+        handling; the default delegates to ``save``.
+
+        Args:
+            entity: Entity to update
+
+        Returns:
+            Saved entity
+
+        Raises:
+            RepositoryError: If the entity does not exist or the update fails
+        """
+        return self.save(entity)
+
+    def patch(
+        self,
+        entity_id: str,
+        changes: dict[str, Any],
+        expected_revision: Optional[int] = None,
+    ) -> Optional[T]:
+        """
+        Update only the given fields of an entity.
+
+        Like every write of an existing entity, a patch increments the
+        revision. With ``expected_revision`` the update is conditional: it
+        only applies if the stored entity still has that revision. This
+        gives optimistic concurrency control without locks.
+
+        Adapters backed by a remote store should override this to send just
+        the changed columns in one conditional update that returns the row.
+        The default loads the entity, applies the changes and updates it.
+
+        Args:
+            entity_id: Unique identifier of the entity
+            changes: Mapping of field name to new value, e.g. from
+                ``Entity.get_changes``
+            expected_revision: Revision the stored entity must have
+                (None = unconditional update)
+
+        Returns:
+            Updated entity, or None if not found
+
+        Raises:
+            ValueError: If a field is not a field of the entity, or is its
+                ID or revision
+            ConcurrencyError: If the stored revision differs from ``expected_revision``
+            RepositoryError: If the update fails
+        """
+        entity = self.get(entity_id)
+        if entity is None:
+            return None
+        revision = getattr(entity, "revision", None)
+        apply_patch(entity, entity_id, changes, expected_revision)
+        bump_revision(entity, revision)
+        return self.update(entity)
+
+    def update_where(
+        self,
+        filters: Optional[dict[str, Any]],
+        changes: dict[str, Any],
+        where: Optional[FilterExpr] = None,
+    ) -> int:
+        """
+        Set the given fields on every entity matching the filters.
+
+        Adapters backed by a database should override this with a single
+        set-based ``UPDATE ... WHERE``; the default loads the matching
+        entities with ``iter_all`` and writes them back with ``save_many``.
+        The revision of every updated entity is incremented.
+
+        Args:
+            filters: Dictionary of field:value filters
+            changes: Mapping of field name to new value
+            where: Filter expression applied on top of ``filters``
+
+        Returns:
+            Number of entities updated
+
+        Raises:
+            ValueError: If no filter is given or a field cannot be updated
+            RepositoryError: If the update fails
+        """
+        require_update_filter(filters, where)
+        entities = list(self.iter_all(filters=filters, where=where))
+        for entity in entities:
+            revision = getattr(entity, "revision", None)
+            apply_patch(entity, getattr(entity, "id", ""), changes)
+            bump_revision(entity, revision)
+        return len(self.save_many(entities)) if entities else 0
+
+    # Projected reads. They return dictionaries holding only the requested
+    # columns (plus the ID). Defaults load full entities and project them in
+    # memory; adapters backed by a remote store should select the columns.
+
+    def get_projected(self, entity_id: str, columns: list[str]) -> Optional[dict[str, Any]]:
+        """
+        Retrieve selected columns of an entity by ID.
+
+        Args:
+            entity_id: Unique identifier of the entity
+            columns: Column names to return
+
+        Returns:
+            Dictionary of the requested columns, or None if not found
+
+        Raises:
+            ValueError: If the projection is invalid
+            RepositoryError: If retrieval operation fails
+        """
+        normalize_columns(columns)
+        entity = self.get(entity_id)
+        return project(entity, columns) if entity is not None else None
+
+    def list_projected(
+        self,
+        columns: list[str],
+        filters: Optional[dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[str] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        List selected columns of entities with optional filtering and pagination.
+
+        Args:
+            columns: Column names to return
+            filters: Dictionary of field:value filters
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+            order_by: Field name to order by (prefix with '-' for descending)
+
+        Returns:
+            One dictionary of the requested columns per matching entity
+
+        Raises:
+            ValueError: If the projection is invalid
+            RepositoryError: If list operation fails
+        """
+        normalize_columns(columns)
+        entities = self.list(filters=filters, limit=limit, offset=offset, order_by=order_by)
+        return [project(entity, columns) for entity in entities]
+
+    def search_projected(
+        self,
+        query: str,
+        columns: list[str],
+        fields: Optional[list[str]] = None,
+        limit: Optional[int] = None,
+        mode: SearchMode = SearchMode.AUTO,
+        where: Optional[FilterExpr] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Search entities and return selected columns.
+
+        Args:
+            query: Search query string
+            columns: Column names to return
+            fields: List of field names to search in (None = search all text fields)
+            limit: Maximum number of results to return
+            mode: How query text is matched (see ``search_ranked``)
+            where: Filter expression the results must also match
+
+        Returns:
+            One dictionary of the requested columns per matching entity
+
+        Raises:
+            ValueError: If the projection is invalid
+            RepositoryError: If search operation fails
+        """
+        normalize_columns(columns)
+        entities = self.search_ranked(query, fields=fields, limit=limit, mode=mode, where=where)
+        return [project(entity, columns) for entity in entities]
+
+    def search_ranked(
+        self,
+        query: str,
+        fields: Optional[list[str]] = None,
+        limit: Optional[int] = None,
+        mode: SearchMode = SearchMode.AUTO,
+        where: Optional[FilterExpr] = None,
+    ) -> list[T]:
+        """
+        Search entities, most relevant first.
+
+        Adapters with a text index should rank full-text matches in a single
+        query and use trigram matching for queries too short to tokenize.
+        The default ignores ``mode``, returns ``search`` results in
+        repository order and applies ``where`` in memory.
+
+        Args:
+            query: Search query string
+            fields: List of field names to search in (None = search all text fields)
+            limit: Maximum number of results to return
+            mode: How query text is matched
+            where: Filter expression the results must also match
+
+        Returns:
+            List of matching entities ordered by relevance
+
+        Raises:
+            RepositoryError: If search operation fails
+        """
+        if where is None:
+            return self.search(query, fields=fields, limit=limit)
+        entities = [entity for entity in self.search(query, fields=fields) if where.matches(entity)]
+        return entities[:limit] if limit else entities
+
+    # Batch operations. These defaults fall back to one call per item so
+    # every repository supports them; adapters backed by a remote store
+    # should override them with set-based queries.
+
+    def get_many(self, entity_ids: list[str]) -> list[T]:
+        """
+        Retrieve several entities by ID.
+
+        Args:
+            entity_ids: Identifiers of the entities to retrieve
+
+        Returns:
+            Entities that were found, in the order of ``entity_ids``.
+            Missing IDs are skipped.
+
+        Raises:
+            RepositoryError: If retrieval operation fails
+        """
+        entities = []
+        for entity_id in entity_ids:
+            entity = self.get(entity_id)
+            if entity is not None:
+                entities.append(entity)
+        return entities
+
+    def save_many(self, entities: list[T]) -> list[T]:
+        """
+        Save several entities.
+
+        Args:
+            entities: Entities to save
+
+        Returns:
+            Saved entities, in input order
+
+        Raises:
+            RepositoryError: If save operation fails
+        """
+        return [self.save(entity) for entity in entities]
+
+    def delete_many(self, entity_ids: list[str], hard: bool = False) -> int:
+        """
+        Delete several entities by ID.
+
+        The default implementation delegates to ``delete`` and therefore
+        uses that method's delete semantics regardless of ``hard``.
+
+        Args:
+            entity_ids: Identifiers of the entities to delete
+            hard: If True, perform hard delete; if False, soft delete
+
+        Returns:
+            Number of entities deleted
+
+        Raises:
+            RepositoryError: If delete operation fails
+        """
+        return sum(1 for entity_id in entity_ids if self.delete(entity_id))
+
+    # Transactions. Writes queued on a batch are committed together when
+    # the ``transaction`` block exits; adapters with database transactions
+    # override ``commit`` so the batch is atomic.
+
+    @contextmanager
+    def transaction(self) -> Iterator[WriteBatch[T]]:
+        """
+        Collect writes and commit them as one batch.
+
+        Nothing is written until the block exits. If the block raises, the
+        batch is discarded; if the commit fails, ``RepositoryError`` is
+        raised and none of the writes are kept (see ``commit`` for adapters
+        without transactions). Results are available on the batch
+        afterwards::
+
+            with repository.transaction() as batch:
+                batch.insert(entity)
+                batch.delete(other_id)
+            saved = batch.results[0]
+
+        Yields:
+            Empty write batch
+
+        Raises:
+            RepositoryError: If the commit fails
+        """
+        batch: WriteBatch[T] = WriteBatch()
+        yield batch
+        batch.results = self.commit(batch) if batch.writes else []
+
+    def commit(self, batch: WriteBatch[T]) -> list[Any]:
+        """
+        Apply the writes of a batch.
+
+        The default is not atomic: consecutive saves go through
+        ``save_many`` and consecutive deletes through ``delete_many``, and
+        if a write fails the touched entities are put back from a snapshot
+        taken up front. If putting them back fails too, the error names
+        the entities left changed. Adapters backed by a database override
+        this to apply the batch in one transaction.
+
+        Args:
+            batch: Writes to apply
+
+        Returns:
+            One result per write (see ``WriteBatch.results``)
+
+        Raises:
+            ConcurrencyError: If a conditional save finds another revision
+            RepositoryError: If a write fails (e.g. an insert finds an
+                existing entity or an update a missing one), or the batch
+                could not be rolled back
+        """
+        touched = list(dict.fromkeys(write.entity_id for write in batch.writes))
+        snapshot = {str(entity.id): copy.deepcopy(entity) for entity in self.get_many(touched)}
+        live = {entity_id: getattr(entity, "revision", None) for entity_id, entity in snapshot.items()}
+        results: list[Any] = []
+        try:
+            for (is_delete, hard), group in groupby(batch.writes, key=lambda w: (w.is_delete, w.hard)):
+                writes = list(group)
+                if is_delete:
+                    results.extend(write.entity_id in live for write in writes)
+                    self.delete_many([write.entity_id for write in writes], hard=hard)
+                    for write in writes:
+                        live.pop(write.entity_id, None)
+                    continue
+                for write in writes:
+                    check_write_mode(write, write.entity_id in live, live.get(write.entity_id))
+                    if write.entity_id in live:
+                        bump_revision(write.entity, live[write.entity_id])
+                    live[write.entity_id] = getattr(write.entity, "revision", None)
+                results.extend(self.save_many([write.entity for write in writes]))
+        except Exception as e:
+            restore = [snapshot[entity_id] for entity_id in touched if entity_id in snapshot]
+            created = [entity_id for entity_id in touched if entity_id not in snapshot]
+            failed: list[str] = []
+            if created:
+                try:
+                    self.delete_many(created, hard=True)
+                except Exception:
+                    failed.extend(created)
+            if restore:
+                try:
+                    self.save_many(restore)
+                except Exception:
+                    failed.extend(str(entity.id) for entity in restore)
+            if failed:
+                raise RepositoryError(
+                    f"Batch failed ({e}) and could not be rolled back for entities: {', '.join(failed)}"
+                ) from e
+            raise
+        return results
+
 
 class RepositoryError(Exception):
     """Exception raised for repository operation errors."""
 
     pass
+
+
+class ConcurrencyError(RepositoryError):
+    """
+    Exception raised when a conditional write finds a newer revision.
+
+    Attributes:
+        entity_id: ID of the entity that was written
+        expected_revision: Revision the writer based its changes on
+        current_revision: Revision found in the repository, if known
+    """
+
+    def __init__(self, entity_id: str, expected_revision: int, current_revision: Optional[int] = None) -> None:
+        self.entity_id = entity_id
+        self.expected_revision = expected_revision
+        self.current_revision = current_revision
+        found = f", found revision {current_revision}" if current_revision is not None else ""
+        super().__init__(
+            f"Entity {entity_id} was modified concurrently (expected revision {expected_revision}{found})"
+        )
+
+
+def check_write_mode(write: BatchWrite, exists: bool, revision: Optional[int] = None) -> None:
+    """
+    Check a batched save against the stored state of its entity.
+
+    Args:
+        write: Batched save
+        exists: Whether the entity exists when the write is applied
+        revision: Stored revision of the entity at that point
+
+    Raises:
+        ConcurrencyError: If a conditional save finds another revision
+        RepositoryError: If an insert finds the entity or an update does not
+    """
+    if write.mode == WriteMode.INSERT_ONLY and exists:
+        raise RepositoryError(f"Entity {write.entity_id} already exists")
+    if write.expected_revision is not None and exists and revision != write.expected_revision:
+        raise ConcurrencyError(write.entity_id, write.expected_revision, revision)
+    if write.mode == WriteMode.UPDATE_ONLY and not exists:
+        raise RepositoryError(f"Entity {write.entity_id} not found for update")
+
+
+def require_update_filter(filters: Optional[dict[str, Any]], where: Optional[FilterExpr]) -> None:
+    """
+    Reject a bulk update that would match every entity.
+
+    Args:
+        filters: Dictionary of field:value filters (None values are ignored)
+        where: Filter expression
+
+    Raises:
+        ValueError: If neither a filter value nor an expression is given
+    """
+    if where is None and not any(value is not None for value in (filters or {}).values()):
+        raise ValueError("update_where requires at least one filter")
+
+
+def apply_patch(
+    entity: Any,
+    entity_id: str,
+    changes: dict[str, Any],
+    expected_revision: Optional[int] = None,
+) -> None:
+    """
+    Apply a patch to a loaded entity in place.
+
+    Used by adapters that patch by rewriting the whole entity. Checks
+    ``expected_revision``; the revision itself is left to the write (see
+    ``bump_revision``). Dataclass entities only accept their own fields.
+
+    Args:
+        entity: Entity as currently stored
+        entity_id: ID of the entity, for error reporting
+        changes: Mapping of field name to new value
+        expected_revision: Revision the entity must have (None = unconditional)
+
+    Raises:
+        ValueError: If a field is not a field of the entity, or is its ID or revision
+        ConcurrencyError: If the entity's revision differs from ``expected_revision``
+    """
+    protected = UNPATCHABLE_FIELDS.intersection(changes)
+    if protected:
+        raise ValueError(f"Cannot patch fields: {sorted(protected)}")
+    if is_dataclass(entity):
+        unknown = set(changes) - entity_fields(type(entity))
+        if unknown:
+            raise ValueError(f"Unknown fields for {type(entity).__name__}: {sorted(unknown)}")
+    if expected_revision is not None:
+        current = getattr(entity, "revision", None)
+        if current != expected_revision:
+            raise ConcurrencyError(entity_id, expected_revision, current)
+    for name, value in changes.items():
+        setattr(entity, name, value)
+
+
+def bump_revision(entity: Any, stored_revision: Optional[int]) -> None:
+    """
+    Give an entity the revision its write of an existing entity stores.
+
+    Every write of an existing entity (save, patch, set-based update, soft
+    delete) stores the stored revision plus one, so any write invalidates
+    concurrent conditional updates based on the previous revision.
+
+    Args:
+        entity: Entity about to be written
+        stored_revision: Revision currently stored (None leaves the entity
+            unchanged, e.g. for an insert or an entity without revisions)
+    """
+    if stored_revision is not None and hasattr(entity, "revision"):
+        entity.revision = stored_revision + 1
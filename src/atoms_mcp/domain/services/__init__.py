@@ -4,12 +4,41 @@ Domain services package.
 Exports all service classes for business logic operations.
 """
 
+from .async_entity_service import AsyncEntityService
+from .async_relationship_service import AsyncRelationshipService
+from .entity_loader import EntityLoader, batching_window, current_loader
 from .entity_service import EntityService
 from .relationship_service import RelationshipService
+from .single_flight import AsyncSingleFlight, FlightStats, SingleFlight, flight_key
+from .unit_of_work import (
+    AsyncUnitOfWorkRepository,
+    RepositoryAttribute,
+    UnitOfWork,
+    UnitOfWorkRepository,
+    async_unit_of_work,
+    current_unit_of_work,
+    unit_of_work,
+)
 from .workflow_service import WorkflowService
 
 __all__ = [
+    "AsyncEntityService",
+    "AsyncRelationshipService",
     "EntityService",
     "RelationshipService",
+    "AsyncSingleFlight",
+    "EntityLoader",
+    "batching_window",
+    "current_loader",
+    "FlightStats",
+    "SingleFlight",
+    "flight_key",
+    "AsyncUnitOfWorkRepository",
+    "RepositoryAttribute",
+    "UnitOfWork",
+    "UnitOfWorkRepository",
+    "async_unit_of_work",
+    "current_unit_of_work",
+    "unit_of_work",
     "WorkflowService",
 ]
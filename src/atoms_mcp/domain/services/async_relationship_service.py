@@ -0,0 +1,371 @@
+"""
+Async relationship service - non-blocking relationship operations.
+
+This module mirrors RelationshipService on top of the AsyncRepository port,
+including graph construction and cycle checks.
+"""
+
+from typing import Any, Optional
+
+from ..models.relationship import (
+    Relationship,
+    RelationshipGraph,
+    RelationshipStatus,
+    RelationType,
+)
+from ..ports.async_repository import AsyncRepository
+from ..ports.cache import Cache
+from ..ports.logger import Logger
+from .relationship_service import HIERARCHICAL_RELATIONSHIP_TYPES
+from .unit_of_work import RepositoryAttribute, current_unit_of_work
+
+
+class AsyncRelationshipService:
+    """
+    Asynchronous service for managing relationship business logic.
+
+    Implements the same rules as RelationshipService; only persistence
+    calls are awaited. Inside a unit of work the repository is the unit's
+    view of it (see ``EntityService``).
+
+    Attributes:
+        repository: Async repository for relationship persistence
+        logger: Logger for recording events
+        cache: Cache for performance optimization
+    """
+
+    repository = RepositoryAttribute()
+
+    def __init__(
+        self,
+        repository: AsyncRepository[Relationship],
+        logger: Logger,
+        cache: Optional[Cache] = None,
+    ):
+        """
+        Initialize async relationship service.
+
+        Args:
+            repository: Async repository for relationship persistence
+            logger: Logger for recording events
+            cache: Optional cache for performance
+        """
+        self.repository = repository
+        self.logger = logger
+        self.cache = cache
+
+    async def add_relationship(
+        self,
+        source_id: str,
+        target_id: str,
+        relationship_type: RelationType,
+        properties: Optional[dict[str, Any]] = None,
+        bidirectional: bool = False,
+        created_by: Optional[str] = None,
+    ) -> Relationship:
+        """
+        Add a relationship between two entities.
+
+        Args:
+            source_id: Source entity ID
+            target_id: Target entity ID
+            relationship_type: Type of relationship
+            properties: Optional relationship properties
+            bidirectional: Whether to create inverse relationship
+            created_by: ID of user creating the relationship
+
+        Returns:
+            Created relationship
+
+        Raises:
+            ValueError: If relationship is invalid
+            RepositoryError: If persistence fails
+        """
+        self.logger.info(
+            f"Adding {relationship_type.value} relationship: {source_id} -> {target_id}"
+        )
+
+        relationship = Relationship(
+            source_id=source_id,
+            target_id=target_id,
+            relationship_type=relationship_type,
+            properties=properties or {},
+            created_by=created_by,
+        )
+
+        if relationship_type in HIERARCHICAL_RELATIONSHIP_TYPES:
+            if await self._would_create_cycle(source_id, target_id):
+                raise ValueError("Relationship would create a cycle")
+
+        inverse = relationship.create_inverse() if bidirectional else None
+        if inverse:
+            created, _ = await self.repository.save_many([relationship, inverse])
+            self.logger.debug("Created inverse relationship")
+        else:
+            created = await self.repository.insert(relationship)
+
+        self._invalidate_relationship_cache(source_id, target_id)
+
+        self.logger.info(f"Relationship {created.id} added successfully")
+        return created
+
+    async def remove_relationship(
+        self,
+        relationship_id: str,
+        remove_inverse: bool = False,
+    ) -> bool:
+        """
+        Remove a relationship.
+
+        Args:
+            relationship_id: ID of relationship to remove
+            remove_inverse: Whether to also remove inverse relationship
+
+        Returns:
+            True if relationship was removed
+        """
+        self.logger.info(f"Removing relationship {relationship_id}")
+
+        relationship = await self.repository.get(relationship_id)
+        if not relationship:
+            self.logger.warning(f"Relationship {relationship_id} not found")
+            return False
+
+        relationship.delete()
+        await self.repository.update(relationship)
+
+        if remove_inverse:
+            inverse_type = relationship.get_inverse_type()
+            if inverse_type:
+                inverses = await self.get_relationships(
+                    source_id=relationship.target_id,
+                    target_id=relationship.source_id,
+                    relationship_type=inverse_type,
+                )
+                for inv in inverses:
+                    inv.delete()
+                    await self.repository.update(inv)
+
+        self._invalidate_relationship_cache(
+            relationship.source_id, relationship.target_id
+        )
+
+        self.logger.info(f"Relationship {relationship_id} removed successfully")
+        return True
+
+    async def get_relationships(
+        self,
+        source_id: Optional[str] = None,
+        target_id: Optional[str] = None,
+        relationship_type: Optional[RelationType] = None,
+        status: RelationshipStatus = RelationshipStatus.ACTIVE,
+    ) -> list[Relationship]:
+        """
+        Get relationships matching criteria.
+
+        Args:
+            source_id: Filter by source entity ID
+            target_id: Filter by target entity ID
+            relationship_type: Filter by relationship type
+            status: Filter by status
+
+        Returns:
+            List of matching relationships
+        """
+        filters = {"status": status.value}
+
+        if source_id:
+            filters["source_id"] = source_id
+        if target_id:
+            filters["target_id"] = target_id
+        if relationship_type:
+            filters["relationship_type"] = relationship_type.value
+
+        relationships = await self.repository.list(filters=filters)
+
+        self.logger.debug(
+            f"Found {len(relationships)} relationships matching filters"
+        )
+        return relationships
+
+    async def get_related_entities(
+        self,
+        entity_id: str,
+        relationship_type: Optional[RelationType] = None,
+        direction: str = "outgoing",
+    ) -> list[str]:
+        """
+        Get IDs of entities related to the given entity.
+
+        Args:
+            entity_id: Entity ID to get related entities for
+            relationship_type: Optional filter by relationship type
+            direction: "outgoing", "incoming", or "both"
+
+        Returns:
+            List of related entity IDs
+        """
+        related_ids = []
+
+        # Only the ID column of each relationship is needed
+        if direction in ("outgoing", "both"):
+            related_ids.extend(
+                await self._related_ids("source_id", "target_id", entity_id, relationship_type)
+            )
+
+        if direction in ("incoming", "both"):
+            related_ids.extend(
+                await self._related_ids("target_id", "source_id", entity_id, relationship_type)
+            )
+
+        return list(set(related_ids))
+
+    async def build_graph(
+        self,
+        entity_ids: Optional[list[str]] = None,
+        relationship_type: Optional[RelationType] = None,
+    ) -> RelationshipGraph:
+        """
+        Build a relationship graph.
+
+        Args:
+            entity_ids: Optional list of entity IDs to include (None = all)
+            relationship_type: Optional filter by relationship type
+
+        Returns:
+            RelationshipGraph instance
+        """
+        self.logger.debug("Building relationship graph")
+
+        graph = RelationshipGraph()
+
+        filters = {"status": RelationshipStatus.ACTIVE.value}
+        if relationship_type:
+            filters["relationship_type"] = relationship_type.value
+
+        entity_id_set = set(entity_ids) if entity_ids else None
+        async for rel in self.repository.iter_all(filters=filters):
+            if entity_id_set is None or (
+                rel.source_id in entity_id_set or rel.target_id in entity_id_set
+            ):
+                graph.add_edge(rel)
+
+        self.logger.debug(
+            f"Built graph with {len(graph.nodes)} nodes and {len(graph.edges)} edges"
+        )
+        return graph
+
+    async def find_path(
+        self,
+        start_id: str,
+        end_id: str,
+        max_depth: int = 10,
+    ) -> Optional[list[Relationship]]:
+        """
+        Find a path between two entities.
+
+        Args:
+            start_id: Starting entity ID
+            end_id: Target entity ID
+            max_depth: Maximum path length
+
+        Returns:
+            List of relationships forming the path, or None if no path exists
+        """
+        self.logger.debug(f"Finding path from {start_id} to {end_id}")
+
+        graph = await self.build_graph()
+        return graph.find_path(start_id, end_id, max_depth)
+
+    async def get_descendants(
+        self,
+        entity_id: str,
+        relationship_type: RelationType = RelationType.PARENT_OF,
+        max_depth: int = 10,
+    ) -> set[str]:
+        """
+        Get all descendant entities.
+
+        Args:
+            entity_id: Root entity ID
+            relationship_type: Type of parent-child relationship
+            max_depth: Maximum depth to traverse
+
+        Returns:
+            Set of descendant entity IDs
+        """
+        self.logger.debug(f"Getting descendants of {entity_id}")
+
+        graph = await self.build_graph(relationship_type=relationship_type)
+        return graph.get_descendants(entity_id, max_depth)
+
+    async def _related_ids(
+        self,
+        match_column: str,
+        id_column: str,
+        entity_id: str,
+        relationship_type: Optional[RelationType],
+    ) -> list[str]:
+        """
+        Read one ID column of the active relationships touching an entity.
+
+        Args:
+            match_column: Column that must equal ``entity_id``
+            id_column: Column holding the related entity ID
+            entity_id: Entity ID to match
+            relationship_type: Optional filter by relationship type
+
+        Returns:
+            Related entity IDs
+        """
+        filters = {"status": RelationshipStatus.ACTIVE.value, match_column: entity_id}
+        if relationship_type:
+            filters["relationship_type"] = relationship_type.value
+
+        rows = await self.repository.list_projected([id_column], filters=filters)
+        return [row[id_column] for row in rows]
+
+    async def _would_create_cycle(
+        self,
+        source_id: str,
+        target_id: str,
+    ) -> bool:
+        """
+        Check if adding a relationship would create a cycle.
+
+        Args:
+            source_id: Source entity ID
+            target_id: Target entity ID
+
+        Returns:
+            True if adding relationship would create a cycle
+        """
+        graph = await self.build_graph()
+        return graph.find_path(target_id, source_id) is not None
+
+    def _invalidate_relationship_cache(
+        self, source_id: str, target_id: str
+    ) -> None:
+        """
+        Invalidate relationship cache for entities.
+
+        Inside a unit of work the entries are dropped again once the
+        writes are committed.
+
+        Args:
+            source_id: Source entity ID
+            target_id: Target entity ID
+        """
+        if not self.cache:
+            return
+        cache = self.cache
+        keys = [f"relationships:outgoing:{source_id}", f"relationships:incoming:{target_id}", "relationships:graph"]
+
+        def invalidate() -> None:
+            for key in keys:
+                cache.delete(key)
+
+        invalidate()
+        unit = current_unit_of_work()
+        if unit is not None:
+            unit.after_commit(invalidate)
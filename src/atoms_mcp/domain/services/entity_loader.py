@@ -0,0 +1,203 @@
+"""
+Batched loading of entities by ID (DataLoader pattern).
+
+Building DTOs, expanding relationships and checking access often read
+entities one ID at a time, which costs one query per ID. An
+``EntityLoader`` collects the ``load`` calls made during one event-loop
+tick and reads them with a single ``get_many`` call (one ``in`` query on
+adapters with batch reads), then hands each caller its entity. Results are
+memoized for the lifetime of the loader, so loaders are meant to live for
+one request.
+
+Request-local loaders are kept in a batching window opened with
+``batching_window``; the DI ``Scope`` opens one while it is entered (the
+MCP server enters a scope for every tool call) and drains the loaders'
+pending reads when it exits. ``current_loader`` returns the loader of a
+repository for the active window, or None outside of one.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Generic, Optional, TypeVar
+
+from ..ports.async_repository import AsyncRepository
+
+T = TypeVar("T")
+
+# Loaders of the active batching window, keyed by repository identity
+_window: ContextVar[Optional[dict[int, "EntityLoader[Any]"]]] = ContextVar("atoms_loader_window", default=None)
+
+
+class EntityLoader(Generic[T]):
+    """
+    Coalesces ``get(id)`` calls into batched ``get_many`` reads.
+
+    Attributes:
+        repository: Async repository the entities are read from
+        batches: Number of ``get_many`` calls issued
+        loaded: Number of IDs requested from the repository
+    """
+
+    def __init__(self, repository: AsyncRepository[T]):
+        """
+        Initialize loader.
+
+        Args:
+            repository: Async repository the entities are read from
+        """
+        self.repository = repository
+        self.batches = 0
+        self.loaded = 0
+        self._results: dict[str, asyncio.Future[Optional[T]]] = {}
+        self._queue: list[tuple[str, asyncio.Future[Optional[T]]]] = []
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def load(self, entity_id: str) -> Optional[T]:
+        """
+        Load an entity, batched with the other loads of this tick.
+
+        Args:
+            entity_id: Entity ID to retrieve
+
+        Returns:
+            Entity if found, None otherwise
+
+        Raises:
+            RepositoryError: If the batched read fails
+        """
+        result = self._results.get(entity_id)
+        if result is None:
+            loop = asyncio.get_running_loop()
+            result = self._results[entity_id] = loop.create_future()
+            if not self._queue:
+                loop.call_soon(self._dispatch)
+            self._queue.append((entity_id, result))
+        # Shielded so one caller's cancellation does not fail the others
+        return await asyncio.shield(result)
+
+    async def load_many(self, entity_ids: list[str]) -> list[Optional[T]]:
+        """
+        Load several entities in one batch.
+
+        Args:
+            entity_ids: Entity IDs to retrieve
+
+        Returns:
+            Entity or None for each ID, in the order of ``entity_ids``
+        """
+        return list(await asyncio.gather(*(self.load(entity_id) for entity_id in entity_ids)))
+
+    def prime(self, entity: T) -> None:
+        """
+        Seed the loader with an entity that is already known.
+
+        Args:
+            entity: Entity to serve for its ID
+        """
+        entity_id = entity.id
+        result = self._results.get(entity_id)
+        if result is None or result.done():
+            result = self._results[entity_id] = asyncio.get_running_loop().create_future()
+            result.set_result(entity)
+
+    def clear(self, entity_id: Optional[str] = None) -> None:
+        """
+        Forget loaded entities, e.g. after a write.
+
+        Loads still in flight resolve for the callers already waiting on
+        them, but later loads read the entity again.
+
+        Args:
+            entity_id: Entity to forget (None = all)
+        """
+        if entity_id is None:
+            self._results.clear()
+        else:
+            self._results.pop(entity_id, None)
+
+    async def drain(self) -> None:
+        """Wait for the batched reads that are queued or in flight."""
+        if self._queue:
+            self._dispatch()
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _dispatch(self) -> None:
+        """Start the batched read of the IDs queued during this tick."""
+        waiting, self._queue = self._queue, []
+        if not waiting:
+            # Already dispatched by ``drain``
+            return
+        entity_ids = list(dict.fromkeys(entity_id for entity_id, _ in waiting))
+        self.batches += 1
+        self.loaded += len(entity_ids)
+        task = asyncio.get_running_loop().create_task(self._fetch(entity_ids, waiting))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _fetch(self, entity_ids: list[str], waiting: list[tuple[str, asyncio.Future[Optional[T]]]]) -> None:
+        """Read a batch and resolve the callers waiting for it."""
+        try:
+            entities = await self.repository.get_many(entity_ids)
+        except Exception as e:
+            for entity_id, result in waiting:
+                # Failed loads are not memoized so a later call can retry
+                if self._results.get(entity_id) is result:
+                    del self._results[entity_id]
+                if not result.done():
+                    result.set_exception(e)
+                    result.exception()
+            return
+
+        found = {entity.id: entity for entity in entities}
+        for entity_id, result in waiting:
+            if not result.done():
+                result.set_result(found.get(entity_id))
+
+
+@contextmanager
+def batching_window(
+    loaders: Optional[dict[int, EntityLoader[Any]]] = None,
+) -> Iterator[dict[int, EntityLoader[Any]]]:
+    """
+    Open a batching window for the current context.
+
+    Tasks started inside the window share its loaders; ``current_loader``
+    returns None once it is closed.
+
+    Args:
+        loaders: Storage for the window's loaders (default: a new dict)
+
+    Yields:
+        The window's loaders, keyed by repository identity
+    """
+    loaders = {} if loaders is None else loaders
+    token = _window.set(loaders)
+    try:
+        yield loaders
+    finally:
+        _window.reset(token)
+
+
+def current_loader(repository: AsyncRepository[T]) -> Optional[EntityLoader[T]]:
+    """
+    Get the loader of a repository for the active batching window.
+
+    Args:
+        repository: Async repository the entities are read from
+
+    Returns:
+        The window's loader for the repository (created on first use), or
+        None when no window is open
+    """
+    loaders = _window.get()
+    if loaders is None:
+        return None
+    loader = loaders.get(id(repository))
+    if loader is None:
+        loader = loaders[id(repository)] = EntityLoader(repository)
+    return loader
@@ -5,12 +5,96 @@ This module implements the core business logic for managing entities.
 Uses dependency injection for ports (repository, logger, cache).
 """
 
-from typing import Any, Optional
-
-from ..models.entity import Entity, EntityStatus, EntityType
+import json
+import random
+import time
+from datetime import datetime
+from typing import Any, Callable, Iterator, Optional, TypeVar, Union
+
+from ..models.entity import Entity, EntityStatus, EntityType, entity_fields
+from ..ports.aggregation import Metric, TimeBucket
 from ..ports.cache import Cache
+from ..ports.filters import FilterExpr, in_
 from ..ports.logger import Logger
-from ..ports.repository import Repository
+from ..ports.pagination import DEFAULT_SCAN_PAGE_SIZE, KeysetPage
+from ..ports.projection import project
+from ..ports.repository import ConcurrencyError, CountMode, Repository, SearchMode
+from .single_flight import SingleFlight, flight_key
+from .unit_of_work import RepositoryAttribute, current_unit_of_work
+
+R = TypeVar("R")
+
+# Seconds a CACHED count may be reused before it is recomputed
+COUNT_CACHE_TTL = 30
+
+# Times a read-modify-write is attempted before a concurrent write wins
+PATCH_ATTEMPTS = 5
+
+# Base delay (seconds) of the jittered exponential backoff between attempts
+PATCH_BACKOFF = 0.002
+
+# Maximum IDs per set-based status update
+STATUS_BATCH_SIZE = 500
+
+# Fields updates cannot set: the identity and the repository-managed revision
+PROTECTED_FIELDS = frozenset({"id", "revision"})
+
+
+def count_cache_key(filters: Optional[dict[str, Any]]) -> str:
+    """
+    Generate the cache key for a count, one per filter signature.
+
+    Args:
+        filters: Dictionary of field:value filters
+
+    Returns:
+        Cache key string
+    """
+    return f"count:{json.dumps(filters or {}, sort_keys=True, default=str)}"
+
+
+def check_updates(updates: dict[str, Any]) -> None:
+    """
+    Reject field updates of protected fields.
+
+    Args:
+        updates: Dictionary of field updates
+
+    Raises:
+        ValueError: If the updates set ``id`` or ``revision``
+    """
+    protected = PROTECTED_FIELDS.intersection(updates)
+    if protected:
+        raise ValueError(f"Fields cannot be updated: {', '.join(sorted(protected))}")
+
+
+def retry_delay(attempt: int) -> float:
+    """
+    Pick the pause before retrying a read-modify-write that lost a race.
+
+    Full jitter spreads writers that collided apart, so the next attempt
+    is unlikely to collide again.
+
+    Args:
+        attempt: Number of the attempt that failed, from 1
+
+    Returns:
+        Delay in seconds
+    """
+    return random.uniform(0, PATCH_BACKOFF * 2 ** (attempt - 1))
+
+
+def status_changes(status: EntityStatus) -> dict[str, Any]:
+    """
+    Field changes of a status transition, as made by ``Entity.archive`` etc.
+
+    Args:
+        status: New status
+
+    Returns:
+        Changes suitable for ``Repository.patch`` and ``update_where``
+    """
+    return {"status": status, "updated_at": datetime.utcnow()}
 
 
 class EntityService:
@@ -20,17 +104,26 @@ class EntityService:
     This service implements entity-related business rules and operations,
     using injected dependencies for persistence, logging, and caching.
 
+    Inside a unit of work (see ``unit_of_work``) the repository is the
+    unit's view of it: entities loaded by ID are kept for the request and
+    writes are committed together when the request ends.
+
     Attributes:
         repository: Repository for entity persistence
         logger: Logger for recording events
         cache: Cache for performance optimization
+        single_flight: Coalesces concurrent identical reads (and the cache
+            fills that follow them) into one repository call
     """
 
+    repository = RepositoryAttribute()
+
     def __init__(
         self,
         repository: Repository[Entity],
         logger: Logger,
         cache: Optional[Cache] = None,
+        single_flight: Optional[SingleFlight] = None,
     ):
         """
         Initialize entity service.
@@ -39,10 +132,13 @@ class EntityService:
             repository: Repository for entity persistence
             logger: Logger for recording events
             cache: Optional cache for performance
+            single_flight: Optional coalescing group, e.g. one shared by
+                several services (default: a group of its own)
         """
         self.repository = repository
         self.logger = logger
         self.cache = cache
+        self.single_flight = single_flight or SingleFlight()
 
     def create_entity(
         self,
@@ -69,12 +165,9 @@ class EntityService:
             self._validate_entity(entity)
 
         # Save to repository
-        created_entity = self.repository.save(entity)
+        created_entity = self.repository.insert(entity)
 
-        # Cache the entity if cache is available
-        if self.cache:
-            cache_key = self._get_cache_key(created_entity.id)
-            self.cache.set(cache_key, created_entity, ttl=300)
+        self._cache_entity(created_entity)
 
         self.logger.info(f"Entity {created_entity.id} created successfully")
         return created_entity
@@ -96,33 +189,75 @@ class EntityService:
         """
         self.logger.debug(f"Retrieving entity {entity_id}")
 
-        # Check cache first if enabled
-        if use_cache and self.cache:
+        # Check cache first if enabled; a request with queued writes reads its own state
+        if use_cache and self.cache and not self._has_pending_writes():
             cache_key = self._get_cache_key(entity_id)
             cached = self.cache.get(cache_key)
             if cached:
                 self.logger.debug(f"Entity {entity_id} found in cache")
                 return cached
 
-        # Fetch from repository
-        entity = self.repository.get(entity_id)
+        # Fetch from repository, sharing the fetch with concurrent callers;
+        # inside a unit of work the identity map answers repeated loads
+        if current_unit_of_work() is not None:
+            entity = self._fetch_entity(entity_id)
+        else:
+            entity = self.single_flight.do(flight_key("get", entity_id), lambda: self._fetch_entity(entity_id))
 
         if entity:
-            # Cache for future use
-            if self.cache:
-                cache_key = self._get_cache_key(entity_id)
-                self.cache.set(cache_key, entity, ttl=300)
             self.logger.debug(f"Entity {entity_id} retrieved successfully")
         else:
             self.logger.warning(f"Entity {entity_id} not found")
 
         return entity
 
+    def get_entity_projected(
+        self,
+        entity_id: str,
+        columns: list[str],
+        use_cache: bool = True,
+    ) -> Optional[dict[str, Any]]:
+        """
+        Retrieve selected columns of an entity by ID.
+
+        A cached entity is projected in memory; otherwise only the requested
+        columns are read from the repository.
+
+        Args:
+            entity_id: Entity ID to retrieve
+            columns: Column names to return
+            use_cache: Whether to check cache first
+
+        Returns:
+            Dictionary of the requested columns, or None if not found
+
+        Raises:
+            ValueError: If the projection is invalid
+        """
+        self.logger.debug(f"Retrieving columns {columns} of entity {entity_id}")
+
+        if use_cache and self.cache:
+            cached = self.cache.get(self._get_cache_key(entity_id))
+            if cached:
+                self.logger.debug(f"Entity {entity_id} found in cache")
+                return project(cached, columns)
+
+        row = self._shared(
+            flight_key("get_projected", entity_id, columns),
+            lambda: self.repository.get_projected(entity_id, columns),
+        )
+
+        if row is None:
+            self.logger.warning(f"Entity {entity_id} not found")
+
+        return row
+
     def update_entity(
         self,
         entity_id: str,
         updates: dict[str, Any],
         validate: bool = True,
+        expected_revision: Optional[int] = None,
     ) -> Optional[Entity]:
         """
         Update an existing entity.
@@ -131,45 +266,31 @@ class EntityService:
             entity_id: ID of entity to update
             updates: Dictionary of field updates
             validate: Whether to validate after update
+            expected_revision: Revision the caller's copy of the entity has;
+                the update fails instead of overwriting newer changes
 
         Returns:
             Updated entity if found, None otherwise
 
         Raises:
-            ValueError: If validation fails
+            ValueError: If the updates set ``id`` or ``revision``, or
+                validation fails
+            ConcurrencyError: If the entity no longer has ``expected_revision``
             RepositoryError: If persistence fails
         """
+        check_updates(updates)
         self.logger.info(f"Updating entity {entity_id}")
 
-        # Retrieve existing entity
-        entity = self.repository.get(entity_id)
-        if not entity:
+        updated_entity = self._patch_entity(
+            entity_id,
+            lambda entity: self._apply_updates(entity, updates, validate),
+            expected_revision,
+        )
+        if updated_entity is None:
             self.logger.warning(f"Entity {entity_id} not found for update")
             return None
 
-        # Apply updates
-        for field, value in updates.items():
-            if hasattr(entity, field):
-                setattr(entity, field, value)
-            else:
-                self.logger.warning(
-                    f"Field {field} does not exist on entity {entity_id}"
-                )
-
-        # Mark as updated
-        entity.mark_updated()
-
-        # Validate if requested
-        if validate:
-            self._validate_entity(entity)
-
-        # Save to repository
-        updated_entity = self.repository.save(entity)
-
-        # Invalidate cache
-        if self.cache:
-            cache_key = self._get_cache_key(entity_id)
-            self.cache.delete(cache_key)
+        self._invalidate(entity_id)
 
         self.logger.info(f"Entity {entity_id} updated successfully")
         return updated_entity
@@ -194,23 +315,16 @@ class EntityService:
         )
 
         if soft_delete:
-            entity = self.repository.get(entity_id)
-            if not entity:
+            if self._set_status(entity_id, EntityStatus.DELETED) is None:
                 self.logger.warning(f"Entity {entity_id} not found for deletion")
                 return False
-
-            entity.delete()
-            self.repository.save(entity)
         else:
             result = self.repository.delete(entity_id)
             if not result:
                 self.logger.warning(f"Entity {entity_id} not found for deletion")
                 return False
 
-        # Invalidate cache
-        if self.cache:
-            cache_key = self._get_cache_key(entity_id)
-            self.cache.delete(cache_key)
+        self._invalidate(entity_id)
 
         self.logger.info(f"Entity {entity_id} deleted successfully")
         return True
@@ -238,61 +352,275 @@ class EntityService:
             f"Listing entities with filters={filters}, limit={limit}"
         )
 
-        entities = self.repository.list(
-            filters=filters,
-            limit=limit,
-            offset=offset,
-            order_by=order_by,
+        entities = self._shared(
+            flight_key("list", filters, limit, offset, order_by),
+            lambda: self.repository.list(
+                filters=filters,
+                limit=limit,
+                offset=offset,
+                order_by=order_by,
+            ),
         )
 
         self.logger.debug(f"Found {len(entities)} entities")
         return entities
 
+    def list_entities_projected(
+        self,
+        columns: list[str],
+        filters: Optional[dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[str] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        List selected columns of entities with filtering and pagination.
+
+        Args:
+            columns: Column names to return
+            filters: Dictionary of field:value filters
+            limit: Maximum number of results
+            offset: Number of results to skip
+            order_by: Field to order by
+
+        Returns:
+            One dictionary of the requested columns per matching entity
+
+        Raises:
+            ValueError: If the projection is invalid
+        """
+        self.logger.debug(
+            f"Listing columns {columns} with filters={filters}, limit={limit}"
+        )
+
+        rows = self._shared(
+            flight_key("list_projected", columns, filters, limit, offset, order_by),
+            lambda: self.repository.list_projected(
+                columns,
+                filters=filters,
+                limit=limit,
+                offset=offset,
+                order_by=order_by,
+            ),
+        )
+
+        self.logger.debug(f"Found {len(rows)} entities")
+        return rows
+
+    def list_entities_page(
+        self,
+        filters: Optional[dict[str, Any]] = None,
+        limit: int = 20,
+        order_by: Optional[str] = None,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+    ) -> KeysetPage[Entity]:
+        """
+        List one page of entities using cursor pagination.
+
+        Args:
+            filters: Dictionary of field:value filters
+            limit: Maximum number of results
+            order_by: Field to order by (prefix with '-' for descending)
+            after: Cursor of the page to continue after
+            before: Cursor of the page to go back from
+
+        Returns:
+            Page of entities with next/previous cursors
+
+        Raises:
+            ValueError: If a cursor is malformed
+        """
+        self.logger.debug(
+            f"Listing entity page with filters={filters}, limit={limit}"
+        )
+
+        page = self._shared(
+            flight_key("list_page", filters, limit, order_by, after, before),
+            lambda: self.repository.list_page(
+                filters=filters,
+                limit=limit,
+                order_by=order_by,
+                after=after,
+                before=before,
+            ),
+        )
+
+        self.logger.debug(f"Found {len(page.items)} entities")
+        return page
+
+    def iter_entities(
+        self,
+        filters: Optional[dict[str, Any]] = None,
+        page_size: int = DEFAULT_SCAN_PAGE_SIZE,
+        where: Optional[FilterExpr] = None,
+    ) -> Iterator[Entity]:
+        """
+        Lazily iterate over all entities matching the filters.
+
+        Args:
+            filters: Dictionary of field:value filters
+            page_size: Number of entities fetched per request
+            where: Filter expression entities must also satisfy
+
+        Yields:
+            Matching entities, one page in memory at a time
+        """
+        self.logger.debug(f"Scanning entities with filters={filters}")
+        yield from self.repository.iter_all(filters=filters, page_size=page_size, where=where)
+
     def search_entities(
         self,
         query: str,
         fields: Optional[list[str]] = None,
         limit: Optional[int] = None,
+        mode: SearchMode = SearchMode.AUTO,
+        where: Optional[FilterExpr] = None,
     ) -> list[Entity]:
         """
-        Search entities using text search.
+        Search entities using text search, most relevant first.
 
         Args:
             query: Search query string
             fields: Fields to search in
             limit: Maximum number of results
+            mode: How query text is matched
+            where: Filter expression matches must also satisfy
 
         Returns:
             List of entities matching search criteria
         """
         self.logger.debug(f"Searching entities with query='{query}'")
 
-        entities = self.repository.search(
-            query=query,
-            fields=fields,
-            limit=limit,
+        entities = self._shared(
+            flight_key("search", query, fields, limit, mode, where),
+            lambda: self.repository.search_ranked(
+                query=query,
+                fields=fields,
+                limit=limit,
+                mode=mode,
+                where=where,
+            ),
         )
 
         self.logger.debug(f"Found {len(entities)} entities matching search")
         return entities
 
+    def search_entities_projected(
+        self,
+        query: str,
+        columns: list[str],
+        fields: Optional[list[str]] = None,
+        limit: Optional[int] = None,
+        mode: SearchMode = SearchMode.AUTO,
+        where: Optional[FilterExpr] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Search entities and return selected columns.
+
+        Args:
+            query: Search query string
+            columns: Column names to return
+            fields: Fields to search in
+            limit: Maximum number of results
+            mode: How query text is matched
+            where: Filter expression matches must also satisfy
+
+        Returns:
+            One dictionary of the requested columns per matching entity
+
+        Raises:
+            ValueError: If the projection is invalid
+        """
+        self.logger.debug(f"Searching columns {columns} with query='{query}'")
+
+        rows = self._shared(
+            flight_key("search_projected", query, columns, fields, limit, mode, where),
+            lambda: self.repository.search_projected(
+                query,
+                columns,
+                fields=fields,
+                limit=limit,
+                mode=mode,
+                where=where,
+            ),
+        )
+
+        self.logger.debug(f"Found {len(rows)} entities matching search")
+        return rows
+
     def count_entities(
         self,
         filters: Optional[dict[str, Any]] = None,
+        mode: CountMode = CountMode.EXACT,
     ) -> int:
         """
         Count entities matching filters.
 
         Args:
             filters: Dictionary of field:value filters
+            mode: EXACT counts matching rows, PLANNED uses the repository's
+                estimate and CACHED reuses an exact count for up to
+                ``COUNT_CACHE_TTL`` seconds (exact when no cache is set)
 
         Returns:
             Number of entities matching criteria
         """
-        count = self.repository.count(filters=filters)
+        cache_key = None
+        if mode == CountMode.CACHED and self.cache:
+            cache_key = count_cache_key(filters)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                self.logger.debug(f"Cache hit for count with filters={filters}")
+                return cached
+
+        count = self._shared(
+            flight_key("count", filters, mode), lambda: self._fetch_count(filters, mode, cache_key)
+        )
+
         self.logger.debug(f"Counted {count} entities with filters={filters}")
         return count
 
+    def aggregate_entities(
+        self,
+        group_by: Optional[list[str]] = None,
+        metrics: Optional[list[Metric]] = None,
+        filters: Optional[dict[str, Any]] = None,
+        time_bucket: Optional[TimeBucket] = None,
+        where: Optional[FilterExpr] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Aggregate entities per group, optionally bucketed by creation time.
+
+        Args:
+            group_by: Group keys: column names or ``column.key`` JSON paths
+            metrics: Metrics to compute (None = row count)
+            filters: Dictionary of field:value filters
+            time_bucket: Bucket entities by ``created_at`` truncated to this size
+            where: Filter expression entities must also satisfy
+
+        Returns:
+            One row per group with the group values and metrics
+
+        Raises:
+            ValueError: If a group key or metric is invalid
+        """
+        self.logger.debug(f"Aggregating entities by {group_by} with filters={filters}")
+
+        rows = self._shared(
+            flight_key("aggregate", group_by, metrics, filters, time_bucket, where),
+            lambda: self.repository.aggregate(
+                group_by=group_by,
+                metrics=metrics,
+                filters=filters,
+                time_bucket=time_bucket,
+                where=where,
+            ),
+        )
+
+        self.logger.debug(f"Aggregated entities into {len(rows)} groups")
+        return rows
+
     def archive_entity(self, entity_id: str) -> Optional[Entity]:
         """
         Archive an entity.
@@ -305,18 +633,12 @@ class EntityService:
         """
         self.logger.info(f"Archiving entity {entity_id}")
 
-        entity = self.repository.get(entity_id)
-        if not entity:
+        archived_entity = self._set_status(entity_id, EntityStatus.ARCHIVED)
+        if archived_entity is None:
             self.logger.warning(f"Entity {entity_id} not found for archiving")
             return None
 
-        entity.archive()
-        archived_entity = self.repository.save(entity)
-
-        # Invalidate cache
-        if self.cache:
-            cache_key = self._get_cache_key(entity_id)
-            self.cache.delete(cache_key)
+        self._invalidate(entity_id)
 
         self.logger.info(f"Entity {entity_id} archived successfully")
         return archived_entity
@@ -333,22 +655,206 @@ class EntityService:
         """
         self.logger.info(f"Restoring entity {entity_id}")
 
-        entity = self.repository.get(entity_id)
-        if not entity:
+        restored_entity = self._set_status(entity_id, EntityStatus.ACTIVE)
+        if restored_entity is None:
             self.logger.warning(f"Entity {entity_id} not found for restoration")
             return None
 
-        entity.restore()
-        restored_entity = self.repository.save(entity)
-
-        # Invalidate cache
-        if self.cache:
-            cache_key = self._get_cache_key(entity_id)
-            self.cache.delete(cache_key)
+        self._invalidate(entity_id)
 
         self.logger.info(f"Entity {entity_id} restored successfully")
         return restored_entity
 
+    def create_entities(
+        self,
+        entities: list[Entity],
+        validate: bool = True,
+        atomic: bool = False,
+    ) -> list[Entity]:
+        """
+        Create several entities in one batch write.
+
+        Args:
+            entities: Entities to create
+            validate: Whether to validate entities before creation
+            atomic: Insert all entities in one repository transaction, so
+                either all are created or none (an existing ID fails the batch)
+
+        Returns:
+            Created entities, in input order
+
+        Raises:
+            ValueError: If validation fails (nothing is written)
+            RepositoryError: If persistence fails
+        """
+        self.logger.info(f"Creating {len(entities)} entities")
+
+        if validate:
+            for entity in entities:
+                self._validate_entity(entity)
+
+        if atomic:
+            with self.repository.transaction() as batch:
+                for entity in entities:
+                    batch.insert(entity)
+            created_entities = batch.results
+        else:
+            created_entities = self.repository.save_many(entities)
+
+        for created_entity in created_entities:
+            self._cache_entity(created_entity)
+
+        self.logger.info(f"{len(created_entities)} entities created successfully")
+        return created_entities
+
+    def get_entities(
+        self,
+        entity_ids: list[str],
+        use_cache: bool = True,
+    ) -> list[Entity]:
+        """
+        Retrieve several entities, fetching cache misses in one batch read.
+
+        Args:
+            entity_ids: Entity IDs to retrieve
+            use_cache: Whether to check cache first
+
+        Returns:
+            Entities that were found, in the order of ``entity_ids``
+        """
+        self.logger.debug(f"Retrieving {len(entity_ids)} entities")
+
+        found: dict[str, Entity] = {}
+        if use_cache and self.cache:
+            for entity_id in entity_ids:
+                cached = self.cache.get(self._get_cache_key(entity_id))
+                if cached:
+                    found[entity_id] = cached
+
+        missing = [entity_id for entity_id in entity_ids if entity_id not in found]
+        if missing:
+            for entity in self.repository.get_many(missing):
+                found[entity.id] = entity
+                self._cache_entity(entity)
+
+        return [found[entity_id] for entity_id in entity_ids if entity_id in found]
+
+    def update_entities(
+        self,
+        changes: dict[str, dict[str, Any]],
+        validate: Union[bool, dict[str, bool]] = True,
+        atomic: bool = False,
+        expected_revisions: Optional[dict[str, int]] = None,
+    ) -> list[Entity]:
+        """
+        Update several entities with one batch read and one batch write.
+
+        Args:
+            changes: Mapping of entity ID to field updates
+            validate: Whether to validate after update, for all entities
+                or per entity ID (IDs not listed are validated)
+            atomic: Fail on the first concurrent change instead of reading
+                the entities again and retrying
+            expected_revisions: Revisions the caller's copies of some
+                entities have; the update fails instead of overwriting
+                newer changes
+
+        Returns:
+            Updated entities; IDs that were not found are skipped
+
+        Raises:
+            ValueError: If updates set ``id`` or ``revision``, or validation
+                fails (nothing is written)
+            ConcurrencyError: If an entity no longer has its expected
+                revision (nothing is written)
+            RepositoryError: If persistence fails
+        """
+        for updates in changes.values():
+            check_updates(updates)
+        self.logger.info(f"Updating {len(changes)} entities")
+
+        def change(entity: Entity) -> None:
+            checked = validate if isinstance(validate, bool) else validate.get(entity.id, True)
+            self._apply_updates(entity, changes[entity.id], checked)
+
+        updated_entities = self._rewrite_entities(list(changes), change, atomic, expected_revisions)
+
+        for entity in updated_entities:
+            self._invalidate(entity.id)
+
+        self.logger.info(f"{len(updated_entities)} entities updated successfully")
+        return updated_entities
+
+    def delete_entities(
+        self,
+        entity_ids: list[str],
+        soft_delete: bool = True,
+        atomic: bool = False,
+    ) -> list[str]:
+        """
+        Delete several entities with batch statements.
+
+        Args:
+            entity_ids: IDs of entities to delete
+            soft_delete: Whether to soft delete (mark as deleted) or hard delete
+            atomic: Delete all entities in one repository transaction, so
+                either all are deleted or none; a soft delete also fails on
+                the first concurrent change instead of retrying
+
+        Returns:
+            IDs of the entities that were found and deleted
+        """
+        self.logger.info(
+            f"Deleting {len(entity_ids)} entities (soft={soft_delete})"
+        )
+
+        ids = list(dict.fromkeys(entity_ids))
+        if soft_delete:
+            deleted_ids = [entity.id for entity in self._rewrite_entities(ids, lambda entity: entity.delete(), atomic)]
+        else:
+            deleted_ids = [entity.id for entity in self.repository.get_many(ids)]
+            if atomic and deleted_ids:
+                with self.repository.transaction() as batch:
+                    for entity_id in deleted_ids:
+                        batch.delete(entity_id, hard=True)
+            elif deleted_ids:
+                self.repository.delete_many(deleted_ids, hard=True)
+
+        for entity_id in deleted_ids:
+            self._invalidate(entity_id)
+
+        self.logger.info(f"{len(deleted_ids)} entities deleted successfully")
+        return deleted_ids
+
+    def set_status(self, entity_ids: list[str], status: EntityStatus) -> int:
+        """
+        Move several entities to a status with set-based updates.
+
+        Each batch of IDs is one ``update_where`` statement; entities are
+        not read first.
+
+        Args:
+            entity_ids: IDs of entities to update
+            status: New status
+
+        Returns:
+            Number of entities updated; missing IDs are skipped
+        """
+        ids = list(dict.fromkeys(entity_ids))
+        self.logger.info(f"Setting status of {len(ids)} entities to {status.value}")
+
+        updated = 0
+        changes = status_changes(status)
+        for start in range(0, len(ids), STATUS_BATCH_SIZE):
+            batch = ids[start : start + STATUS_BATCH_SIZE]
+            updated += self.repository.update_where(None, changes, where=in_("id", batch))
+
+        for entity_id in ids:
+            self._invalidate(entity_id)
+
+        self.logger.info(f"{updated} entities moved to {status.value}")
+        return updated
+
     def _validate_entity(self, entity: Entity) -> None:
         """
         Validate an entity.
@@ -365,6 +871,215 @@ class EntityService:
         # Additional validation can be added here
         # For example, checking required fields based on entity type
 
+    def _patch_entity(
+        self,
+        entity_id: str,
+        change: Callable[[Entity], None],
+        expected_revision: Optional[int] = None,
+    ) -> Optional[Entity]:
+        """
+        Read an entity, change it and write back only the changed fields.
+
+        The write is conditional on the revision that was read, so no
+        concurrent update is lost. If another writer got in first, the
+        read-modify-write is retried after a jittered backoff, unless the
+        caller pinned ``expected_revision``: then its copy is stale and the
+        conflict is raised.
+
+        Args:
+            entity_id: ID of entity to change
+            change: Applies the change to the loaded entity in place
+            expected_revision: Revision the caller's copy of the entity has
+
+        Returns:
+            Updated entity, or None if not found
+
+        Raises:
+            ConcurrencyError: If the entity does not have ``expected_revision``,
+                or keeps changing for ``PATCH_ATTEMPTS`` attempts
+        """
+        for attempt in range(1, PATCH_ATTEMPTS + 1):
+            entity = self.repository.get(entity_id)
+            if entity is None:
+                return None
+            revision = entity.revision
+            if expected_revision is not None and revision != expected_revision:
+                raise ConcurrencyError(entity_id, expected_revision, revision)
+
+            entity.mark_clean()
+            change(entity)
+            try:
+                return self.repository.patch(entity_id, entity.get_changes(), expected_revision=revision)
+            except ConcurrencyError:
+                if expected_revision is not None or attempt == PATCH_ATTEMPTS:
+                    raise
+                self.logger.debug(f"Entity {entity_id} changed concurrently, retrying")
+                time.sleep(retry_delay(attempt))
+        return None
+
+    def _rewrite_entities(
+        self,
+        entity_ids: list[str],
+        change: Callable[[Entity], None],
+        atomic: bool,
+        expected_revisions: Optional[dict[str, int]] = None,
+    ) -> list[Entity]:
+        """
+        Read several entities, change them and write them back in one batch.
+
+        Every write is conditional on the revision that was read, so no
+        concurrent update is lost. If another writer got in first, nothing
+        is written and the read-modify-write is retried after a jittered
+        backoff, unless the batch is atomic: then the conflict is raised.
+
+        Args:
+            entity_ids: Distinct IDs of the entities to change
+            change: Applies the change to a loaded entity in place
+            atomic: Whether to raise the first conflict instead of retrying
+            expected_revisions: Revisions the caller's copies of some
+                entities have
+
+        Returns:
+            Updated entities; IDs that were not found are skipped
+
+        Raises:
+            ConcurrencyError: If an entity does not have its expected
+                revision, or the entities keep changing for
+                ``PATCH_ATTEMPTS`` attempts
+        """
+        pinned = expected_revisions or {}
+        for attempt in range(1, PATCH_ATTEMPTS + 1):
+            entities = self.repository.get_many(entity_ids)
+            for entity in entities:
+                expected_revision = pinned.get(entity.id)
+                if expected_revision is not None and entity.revision != expected_revision:
+                    raise ConcurrencyError(entity.id, expected_revision, entity.revision)
+            if not entities:
+                return []
+            loaded = [(entity, entity.revision) for entity in entities]
+            for entity in entities:
+                change(entity)
+            try:
+                with self.repository.transaction() as batch:
+                    for entity, revision in loaded:
+                        batch.update(entity, expected_revision=revision)
+                return batch.results
+            except ConcurrencyError:
+                if atomic or attempt == PATCH_ATTEMPTS:
+                    raise
+                self.logger.debug(f"{len(loaded)} entities changed concurrently, retrying")
+                time.sleep(retry_delay(attempt))
+        return []
+
+    def _set_status(self, entity_id: str, status: EntityStatus) -> Optional[Entity]:
+        """
+        Move an entity to a status with one conditional update.
+
+        The update only matches a live entity and returns the new row, so
+        the entity is not read first. It is not conditional: a status change
+        wins over concurrent writes, which still see the revision move on.
+
+        Args:
+            entity_id: ID of entity to update
+            status: New status
+
+        Returns:
+            Updated entity, or None if not found
+        """
+        return self.repository.patch(entity_id, status_changes(status))
+
+    def _apply_updates(
+        self,
+        entity: Entity,
+        updates: dict[str, Any],
+        validate: bool,
+    ) -> None:
+        """
+        Apply field updates to an entity in place.
+
+        Keys that are not fields of the entity are skipped; protected
+        fields are rejected by ``check_updates`` before this runs.
+
+        Args:
+            entity: Entity to modify
+            updates: Dictionary of field updates
+            validate: Whether to validate after update
+
+        Raises:
+            ValueError: If validation fails
+        """
+        names = entity_fields(type(entity))
+        for field, value in updates.items():
+            if field in names:
+                setattr(entity, field, value)
+            else:
+                self.logger.warning(
+                    f"Field {field} does not exist on entity {entity.id}"
+                )
+
+        # Mark as updated
+        entity.mark_updated()
+
+        if validate:
+            self._validate_entity(entity)
+
+    def _shared(self, key: str, fetch: Callable[[], R]) -> R:
+        """
+        Run a read through the single-flight group.
+
+        A request with writes queued in its unit of work reads on its own:
+        it must see those writes, and concurrent callers must not.
+
+        Args:
+            key: Call key (see ``flight_key``)
+            fetch: Function producing the result
+
+        Returns:
+            Result of the fetch
+        """
+        if self._has_pending_writes():
+            return fetch()
+        return self.single_flight.do(key, fetch)
+
+    def _has_pending_writes(self) -> bool:
+        """Whether the request's unit of work has queued writes."""
+        unit = current_unit_of_work()
+        return unit is not None and unit.pending > 0
+
+    def _cache_entity(self, entity: Entity) -> None:
+        """
+        Cache an entity; inside a unit of work, once its writes are committed.
+
+        Args:
+            entity: Entity to cache
+        """
+        if not self.cache:
+            return
+        cache, key = self.cache, self._get_cache_key(entity.id)
+        unit = current_unit_of_work()
+        if unit is None:
+            cache.set(key, entity, ttl=300)
+        else:
+            unit.after_commit(lambda: cache.set(key, entity, ttl=300))
+
+    def _invalidate(self, entity_id: str) -> None:
+        """
+        Drop an entity from the cache after a write.
+
+        Inside a unit of work the entry is dropped again once the write is
+        committed, so a read in between cannot leave the old state cached.
+
+        Args:
+            entity_id: Entity ID
+        """
+        if not self.cache:
+            return
+        cache, key = self.cache, self._get_cache_key(entity_id)
+        cache.delete(key)
+        unit = current_unit_of_work()
+        if unit is not None:
+            unit.after_commit(lambda: cache.delete(key))
+
     def _get_cache_key(self, entity_id: str) -> str:
         """
         Generate cache key for an entity.
@@ -376,3 +1091,39 @@ class EntityService:
             Cache key string
         """
         return f"entity:{entity_id}"
+
+    def _fetch_entity(self, entity_id: str) -> Optional[Entity]:
+        """
+        Read an entity from the repository and fill the cache.
+
+        Args:
+            entity_id: Entity ID to retrieve
+
+        Returns:
+            Entity if found, None otherwise
+        """
+        entity = self.repository.get(entity_id)
+        if entity:
+            self._cache_entity(entity)
+        return entity
+
+    def _fetch_count(self, filters: Optional[dict[str, Any]], mode: CountMode, cache_key: Optional[str]) -> int:
+        """
+        Count entities in the repository and fill the count cache.
+
+        Args:
+            filters: Dictionary of field:value filters
+            mode: Count mode (see ``count_entities``)
+            cache_key: Key to cache the count under (None = do not cache)
+
+        Returns:
+            Number of entities matching criteria
+        """
+        if mode == CountMode.PLANNED:
+            count = self.repository.count_planned(filters=filters)
+        else:
+            count = self.repository.count(filters=filters)
+
+        if cache_key:
+            self.cache.set(cache_key, count, ttl=COUNT_CACHE_TTL)
+        return count
@@ -16,6 +16,17 @@ from ..models.relationship import (
 from ..ports.cache import Cache
 from ..ports.logger import Logger
 from ..ports.repository import Repository
+from .unit_of_work import RepositoryAttribute, current_unit_of_work
+
+# Relationship types that form a hierarchy and must stay acyclic
+HIERARCHICAL_RELATIONSHIP_TYPES = frozenset(
+    {
+        RelationType.PARENT_OF,
+        RelationType.CHILD_OF,
+        RelationType.CONTAINS,
+        RelationType.CONTAINED_BY,
+    }
+)
 
 
 class RelationshipService:
@@ -25,12 +36,17 @@ class RelationshipService:
     This service implements relationship-related business rules and operations,
     including graph traversal and relationship constraints.
 
+    Inside a unit of work the repository is the unit's view of it (see
+    ``EntityService``).
+
     Attributes:
         repository: Repository for relationship persistence
         logger: Logger for recording events
         cache: Cache for performance optimization
     """
 
+    repository = RepositoryAttribute()
+
     def __init__(
         self,
         repository: Repository[Relationship],
@@ -95,14 +111,13 @@ class RelationshipService:
                 raise ValueError("Relationship would create a cycle")
 
         # Save relationship
-        created = self.repository.save(relationship)
-
-        # Create inverse if bidirectional
-        if bidirectional:
-            inverse = relationship.create_inverse()
-            if inverse:
-                self.repository.save(inverse)
-                self.logger.debug("Created inverse relationship")
+        # Save together with the inverse in one batch if bidirectional
+        inverse = relationship.create_inverse() if bidirectional else None
+        if inverse:
+            created, _ = self.repository.save_many([relationship, inverse])
+            self.logger.debug("Created inverse relationship")
+        else:
+            created = self.repository.insert(relationship)
 
         # Invalidate cache
         self._invalidate_relationship_cache(source_id, target_id)
@@ -134,7 +149,7 @@ class RelationshipService:
 
         # Mark as deleted
         relationship.delete()
-        self.repository.save(relationship)
+        self.repository.update(relationship)
 
         # Remove inverse if requested
         if remove_inverse:
@@ -147,7 +162,7 @@ class RelationshipService:
                 )
                 for inv in inverses:
                     inv.delete()
-                    self.repository.save(inv)
+                    self.repository.update(inv)
 
         # Invalidate cache
         self._invalidate_relationship_cache(
@@ -249,17 +264,16 @@ class RelationshipService:
         """
         related_ids = []
 
+        # Only the ID column of each relationship is needed
         if direction in ("outgoing", "both"):
-            outgoing = self.get_outgoing_relationships(
-                entity_id, relationship_type
+            related_ids.extend(
+                self._related_ids("source_id", "target_id", entity_id, relationship_type)
             )
-            related_ids.extend([rel.target_id for rel in outgoing])
 
         if direction in ("incoming", "both"):
-            incoming = self.get_incoming_relationships(
-                entity_id, relationship_type
+            related_ids.extend(
+                self._related_ids("target_id", "source_id", entity_id, relationship_type)
             )
-            related_ids.extend([rel.source_id for rel in incoming])
 
         return list(set(related_ids))
 
@@ -287,21 +301,13 @@ class RelationshipService:
         if relationship_type:
             filters["relationship_type"] = relationship_type.value
 
-        relationships = self.repository.list(filters=filters)
-
-        # Filter by entity IDs if provided
-        if entity_ids:
-            entity_id_set = set(entity_ids)
-            relationships = [
-                rel
-                for rel in relationships
-                if rel.source_id in entity_id_set
-                or rel.target_id in entity_id_set
-            ]
-
-        # Build graph
-        for rel in relationships:
-            graph.add_edge(rel)
+        # Stream relationships into the graph, filtering by entity IDs if provided
+        entity_id_set = set(entity_ids) if entity_ids else None
+        for rel in self.repository.iter_all(filters=filters):
+            if entity_id_set is None or (
+                rel.source_id in entity_id_set or rel.target_id in entity_id_set
+            ):
+                graph.add_edge(rel)
 
         self.logger.debug(
             f"Built graph with {len(graph.nodes)} nodes and {len(graph.edges)} edges"
@@ -362,6 +368,32 @@ class RelationshipService:
         self.logger.debug(f"Found {len(descendants)} descendants")
         return descendants
 
+    def _related_ids(
+        self,
+        match_column: str,
+        id_column: str,
+        entity_id: str,
+        relationship_type: Optional[RelationType],
+    ) -> list[str]:
+        """
+        Read one ID column of the active relationships touching an entity.
+
+        Args:
+            match_column: Column that must equal ``entity_id``
+            id_column: Column holding the related entity ID
+            entity_id: Entity ID to match
+            relationship_type: Optional filter by relationship type
+
+        Returns:
+            Related entity IDs
+        """
+        filters = {"status": RelationshipStatus.ACTIVE.value, match_column: entity_id}
+        if relationship_type:
+            filters["relationship_type"] = relationship_type.value
+
+        rows = self.repository.list_projected([id_column], filters=filters)
+        return [row[id_column] for row in rows]
+
     def _would_create_cycle(
         self,
         source_id: str,
@@ -394,13 +426,7 @@ class RelationshipService:
         Returns:
             True if relationship is hierarchical
         """
-        hierarchical_types = {
-            RelationType.PARENT_OF,
-            RelationType.CHILD_OF,
-            RelationType.CONTAINS,
-            RelationType.CONTAINED_BY,
-        }
-        return relationship_type in hierarchical_types
+        return relationship_type in HIERARCHICAL_RELATIONSHIP_TYPES
 
     def _invalidate_relationship_cache(
         self, source_id: str, target_id: str
@@ -408,11 +434,23 @@ class RelationshipService:
         """
         Invalidate relationship cache for entities.
 
+        Inside a unit of work the entries are dropped again once the
+        writes are committed.
+
         Args:
             source_id: Source entity ID
             target_id: Target entity ID
         """
-        if self.cache:
-            self.cache.delete(f"relationships:outgoing:{source_id}")
-            self.cache.delete(f"relationships:incoming:{target_id}")
-            self.cache.delete(f"relationships:graph")
+        if not self.cache:
+            return
+        cache = self.cache
+        keys = [f"relationships:outgoing:{source_id}", f"relationships:incoming:{target_id}", "relationships:graph"]
+
+        def invalidate() -> None:
+            for key in keys:
+                cache.delete(key)
+
+        invalidate()
+        unit = current_unit_of_work()
+        if unit is not None:
+            unit.after_commit(invalidate)
@@ -0,0 +1,194 @@
+"""
+Request coalescing (single-flight) for concurrent identical reads.
+
+When several callers ask for the same data at the same time (for example
+many sessions opening the same project), only the first one runs the
+fetch; the others wait for it and receive the same result, or the same
+exception. Calls are keyed by operation and arguments with ``flight_key``.
+Nothing is cached: once the fetch completes, the next call runs a new one.
+
+``SingleFlight`` coalesces calls across threads and ``AsyncSingleFlight``
+across tasks of an event loop. Both count executed and coalesced calls in
+``FlightStats``. Pure Python with no external dependencies.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+R = TypeVar("R")
+
+
+def flight_key(operation: str, *args: Any, **kwargs: Any) -> str:
+    """
+    Build the coalescing key of a call.
+
+    Args:
+        operation: Name of the operation, e.g. ``get`` or ``count``
+        *args: Positional arguments of the call
+        **kwargs: Keyword arguments of the call
+
+    Returns:
+        Key string, equal for calls with equal arguments
+    """
+    return f"{operation}:{json.dumps([args, kwargs], sort_keys=True, default=str)}"
+
+
+@dataclass
+class FlightStats:
+    """
+    Counters of a single-flight group.
+
+    Attributes:
+        executed: Calls that ran their fetch
+        coalesced: Calls that shared another call's in-flight fetch
+        coalesced_by_operation: Coalesced calls per operation name
+    """
+
+    executed: int = 0
+    coalesced: int = 0
+    coalesced_by_operation: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def calls(self) -> int:
+        """Total number of calls."""
+        return self.executed + self.coalesced
+
+    def record(self, key: str, coalesced: bool) -> None:
+        """
+        Count one call.
+
+        Args:
+            key: Call key (see ``flight_key``)
+            coalesced: Whether the call shared an in-flight fetch
+        """
+        if not coalesced:
+            self.executed += 1
+            return
+        self.coalesced += 1
+        operation = key.partition(":")[0]
+        self.coalesced_by_operation[operation] = self.coalesced_by_operation.get(operation, 0) + 1
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the counters as a dictionary."""
+        return {
+            "calls": self.calls,
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "coalesced_by_operation": dict(self.coalesced_by_operation),
+        }
+
+
+class _Call:
+    """An in-flight fetch shared by the callers of one key."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesces concurrent identical calls made from different threads."""
+
+    def __init__(self) -> None:
+        """Initialize an empty group."""
+        self.stats = FlightStats()
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+
+    def do(self, key: str, fetch: Callable[[], R]) -> R:
+        """
+        Run ``fetch`` unless a call with the same key is already in flight.
+
+        Args:
+            key: Call key (see ``flight_key``)
+            fetch: Function producing the result
+
+        Returns:
+            Result of the fetch, shared by all callers of the key
+
+        Raises:
+            Exception: Whatever the shared fetch raised
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            self.stats.record(key, coalesced=not leader)
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fetch()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    @property
+    def in_flight(self) -> int:
+        """Number of keys currently being fetched."""
+        return len(self._calls)
+
+
+class AsyncSingleFlight:
+    """
+    Coalesces concurrent identical calls made from tasks of an event loop.
+
+    The fetch runs in its own task, so cancelling one caller does not
+    cancel the fetch other callers are waiting for.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty group."""
+        self.stats = FlightStats()
+        self._calls: dict[str, asyncio.Future[Any]] = {}
+
+    async def do(self, key: str, fetch: Callable[[], Awaitable[R]]) -> R:
+        """
+        Await ``fetch`` unless a call with the same key is already in flight.
+
+        Args:
+            key: Call key (see ``flight_key``)
+            fetch: Coroutine function producing the result
+
+        Returns:
+            Result of the fetch, shared by all callers of the key
+
+        Raises:
+            Exception: Whatever the shared fetch raised
+        """
+        task = self._calls.get(key)
+        self.stats.record(key, coalesced=task is not None)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(fetch())
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Future[Any]) -> None:
+        """Forget a completed fetch, marking its error as retrieved."""
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of keys currently being fetched."""
+        return len(self._calls)
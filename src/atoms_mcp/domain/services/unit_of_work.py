@@ -0,0 +1,812 @@
+"""
+Request-scoped unit of work with an identity map.
+
+Handling one request often loads the same entity several times (the
+command handler, the service and the relationship checks each call
+``get``) and writes rows one statement at a time. A ``UnitOfWork`` keeps
+every entity loaded by ID during the request in an identity map, so
+repeated loads return the same object without a query, and queues writes
+instead of issuing them. ``commit`` flushes the queued writes with one
+``Repository.transaction`` per repository, at the end of the request.
+
+Services hold their repositories in ``RepositoryAttribute`` descriptors:
+inside a unit (opened with ``unit_of_work``, or ``async_unit_of_work`` on
+an event loop; the DI ``Scope`` opens one while it is entered, and the
+MCP server enters a scope for every tool call) the attribute returns the
+unit's view of the repository, outside it the repository itself, so
+service code is the same in both cases. Sync repositories get a
+``UnitOfWorkRepository`` view and async ones an
+``AsyncUnitOfWorkRepository``; ``UnitOfWork.commit_async`` flushes both
+without blocking the event loop.
+
+Queued updates of entities that were loaded through the unit are
+conditional on the revision that was loaded whenever the service asked
+for a conditional patch, so a request that read a stale entity fails at
+commit with ``ConcurrencyError`` instead of overwriting newer changes.
+A queued update already shows the revision its commit stores (the loaded
+revision plus one), so responses built before the commit are current.
+Queries (list, search, count, set-based updates, ...) go to the
+repository after the unit's pending writes for it have been flushed, so
+they always see the request's own changes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import dataclasses
+import inspect
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Any, Generic, Optional, TypeVar
+
+from ..ports.async_repository import AsyncRepository
+from ..ports.filters import FilterExpr
+from ..ports.repository import BatchWrite, Repository, WriteBatch, WriteMode, apply_patch, bump_revision
+
+T = TypeVar("T")
+
+# Unit of work of the current request
+_current: ContextVar[Optional["UnitOfWork"]] = ContextVar("atoms_unit_of_work", default=None)
+
+# Marks an ID known to have no live entity in the identity map
+_MISSING = object()
+
+
+class _UnitOfWorkView(Generic[T]):
+    """
+    Identity map and queued writes of one repository in a unit of work.
+
+    Holds the bookkeeping shared by the sync and async views; the views
+    add the repository calls.
+
+    Attributes:
+        repository: Repository the view reads from and writes to
+        unit: Unit of work the view belongs to
+    """
+
+    def __init__(self, unit: UnitOfWork, repository: Any):
+        """
+        Initialize view.
+
+        Args:
+            unit: Unit of work the view belongs to
+            repository: Repository the view reads from and writes to
+        """
+        self.unit = unit
+        self.repository = repository
+        self._identity: dict[str, Any] = {}
+        self._loaded_revisions: dict[str, Optional[int]] = {}
+        self._pending: list[BatchWrite] = []
+        # Index in _pending of the last queued save of each ID
+        self._last_save: dict[str, int] = {}
+
+    @property
+    def pending(self) -> int:
+        """Number of queued writes."""
+        return len(self._pending)
+
+    def clear(self) -> None:
+        """Forget loaded entities and discard queued writes."""
+        self._identity.clear()
+        self._loaded_revisions.clear()
+        self._pending = []
+        self._last_save = {}
+
+    def _lookup(self, entity_id: str) -> Any:
+        """
+        Look an ID up in the identity map, counting hits.
+
+        Returns:
+            The entity, ``_MISSING`` if it is known not to exist, or None
+            if the ID was not loaded
+        """
+        entity = self._identity.get(entity_id)
+        if entity is not None:
+            self.unit.hits += 1
+        return entity
+
+    def _unloaded(self, entity_ids: list[str]) -> list[str]:
+        """Distinct IDs not in the identity map, counting the others as hits."""
+        missing = list(dict.fromkeys(entity_id for entity_id in entity_ids if entity_id not in self._identity))
+        self.unit.hits += len(entity_ids) - len(missing)
+        self.unit.loads += len(missing)
+        return missing
+
+    def _remember_many(self, entity_ids: list[str], entities: list[T]) -> None:
+        """Put the entities read for some IDs (or their absence) in the identity map."""
+        found = {str(entity.id): entity for entity in entities}
+        for entity_id in entity_ids:
+            self._remember(entity_id, found.get(entity_id))
+
+    def _mapped(self, entity_ids: list[str]) -> list[T]:
+        """Entities of the identity map for some IDs, skipping missing ones."""
+        entities = (self._identity[entity_id] for entity_id in entity_ids)
+        return [entity for entity in entities if entity is not _MISSING]
+
+    def _queue_patch(self, entity: T, entity_id: str, changes: dict[str, Any], expected_revision: Optional[int]) -> T:
+        """Change fields of a loaded entity and queue its update (see ``UnitOfWorkRepository.patch``)."""
+        apply_patch(entity, entity_id, changes, expected_revision)
+        condition = self._loaded_revisions.get(str(entity_id)) if expected_revision is not None else None
+        self._queue_save(entity, WriteMode.UPDATE_ONLY, condition)
+        return entity
+
+    def _queue_delete(self, entity_id: str, hard: bool) -> None:
+        """Queue the delete of an entity known to exist."""
+        self._pending.append(BatchWrite(entity_id, hard=hard))
+        self._last_save.pop(entity_id, None)
+        self._identity[entity_id] = _MISSING
+
+    def _take_pending(self) -> list[BatchWrite]:
+        """Hand over the queued writes for a flush."""
+        writes, self._pending, self._last_save = self._pending, [], {}
+        return writes
+
+    def _settle(self, writes: list[BatchWrite], results: list[Any]) -> None:
+        """
+        Record the revisions stored by flushed writes, the base of later updates.
+
+        Written entities are copied again, since adapters such as the
+        in-memory one may now store the very objects that were flushed.
+        """
+        self.unit.flushed += len(writes)
+        for write, result in zip(writes, results, strict=True):
+            if write.is_delete:
+                self._loaded_revisions.pop(write.entity_id, None)
+            elif result is not None:
+                self._remember(write.entity_id, result)
+
+    def _remember(self, entity_id: str, entity: Optional[T]) -> Optional[T]:
+        """Put a copy of a loaded entity (or its absence) in the identity map."""
+        if entity is None:
+            self._identity[entity_id] = _MISSING
+            return None
+        entity = self._identity[entity_id] = copy.deepcopy(entity)
+        self._loaded_revisions[entity_id] = getattr(entity, "revision", None)
+        return entity
+
+    def _queue_save(self, entity: T, mode: WriteMode, expected_revision: Optional[int]) -> None:
+        """
+        Queue a save, merging it into an earlier save of the same entity.
+
+        A merged write keeps the earlier insert mode and revision
+        condition, so an entity created or conditionally updated earlier
+        in the request is still written that way.
+        """
+        write = BatchWrite(str(entity.id), mode=mode, entity=entity, expected_revision=expected_revision)
+        if mode != WriteMode.INSERT_ONLY:
+            bump_revision(entity, self._loaded_revisions.get(write.entity_id))
+        self._identity[write.entity_id] = entity
+        index = self._last_save.get(write.entity_id)
+        if index is None:
+            self._last_save[write.entity_id] = len(self._pending)
+            self._pending.append(write)
+            return
+        earlier = self._pending[index]
+        self._pending[index] = dataclasses.replace(
+            write,
+            mode=mode if earlier.mode == WriteMode.UPDATE_ONLY else earlier.mode,
+            expected_revision=(
+                earlier.expected_revision if earlier.expected_revision is not None else expected_revision
+            ),
+        )
+
+
+class UnitOfWorkRepository(_UnitOfWorkView[T]):
+    """
+    View of a repository through a unit of work.
+
+    Reads by ID are served from the unit's identity map and writes are
+    queued until the unit commits. Loaded entities are copies, so changes
+    stay private to the unit until they are committed (adapters such as
+    the in-memory one hand out their stored objects). Every other
+    repository method flushes the queued writes of this repository first
+    and is then delegated.
+
+    Attributes:
+        repository: Repository the view reads from and writes to
+        unit: Unit of work the view belongs to
+    """
+
+    repository: Repository[T]
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate other repository methods once pending writes are flushed."""
+        attribute = getattr(self.repository, name)
+        if not callable(attribute):
+            return attribute
+
+        def delegate(*args: Any, **kwargs: Any) -> Any:
+            self.flush()
+            return attribute(*args, **kwargs)
+
+        return delegate
+
+    # Reads by ID
+
+    def get(self, entity_id: str) -> Optional[T]:
+        """
+        Retrieve an entity, from the identity map if it was loaded before.
+
+        Args:
+            entity_id: Unique identifier of the entity
+
+        Returns:
+            Entity if found, None otherwise
+        """
+        entity_id = str(entity_id)
+        entity = self._lookup(entity_id)
+        if entity is not None:
+            return None if entity is _MISSING else entity
+        self.unit.loads += 1
+        return self._remember(entity_id, self.repository.get(entity_id))
+
+    def get_many(self, entity_ids: list[str]) -> list[T]:
+        """
+        Retrieve several entities, reading only those not loaded before.
+
+        Args:
+            entity_ids: Identifiers of the entities to retrieve
+
+        Returns:
+            Entities that were found, in the order of ``entity_ids``
+        """
+        entity_ids = [str(entity_id) for entity_id in entity_ids]
+        missing = self._unloaded(entity_ids)
+        if missing:
+            self._remember_many(missing, self.repository.get_many(missing))
+        return self._mapped(entity_ids)
+
+    def exists(self, entity_id: str) -> bool:
+        """
+        Check if an entity exists, without a query if it was loaded before.
+
+        Args:
+            entity_id: Unique identifier of the entity
+
+        Returns:
+            True if the entity exists, False otherwise
+        """
+        entity = self._lookup(str(entity_id))
+        if entity is not None:
+            return entity is not _MISSING
+        return self.get(entity_id) is not None
+
+    # Queued writes
+
+    def save(self, entity: T, mode: WriteMode = WriteMode.UPSERT) -> T:
+        """
+        Queue a save and put the entity in the identity map.
+
+        Conflicts (an insert of an existing ID, an update of a missing
+        entity) are reported by ``UnitOfWork.commit``.
+
+        Args:
+            entity: Entity to save
+            mode: UPSERT (default), INSERT_ONLY or UPDATE_ONLY
+
+        Returns:
+            The entity
+        """
+        self._queue_save(entity, WriteMode(mode), None)
+        return entity
+
+    def insert(self, entity: T) -> T:
+        """Queue the insert of a new entity."""
+        return self.save(entity, WriteMode.INSERT_ONLY)
+
+    def update(self, entity: T) -> T:
+        """Queue the update of an existing entity."""
+        return self.save(entity, WriteMode.UPDATE_ONLY)
+
+    def patch(
+        self,
+        entity_id: str,
+        changes: dict[str, Any],
+        expected_revision: Optional[int] = None,
+    ) -> Optional[T]:
+        """
+        Change fields of an entity in the identity map and queue its update.
+
+        With ``expected_revision`` the revision is checked against the
+        identity map, and the queued update is conditional on the revision
+        the entity had when the unit loaded it. The repository increments
+        the revision once, when the unit commits.
+
+        Args:
+            entity_id: Unique identifier of the entity
+            changes: Mapping of field name to new value
+            expected_revision: Revision the entity must have (None = unconditional)
+
+        Returns:
+            Updated entity, or None if not found
+
+        Raises:
+            ConcurrencyError: If the entity's revision differs from ``expected_revision``
+        """
+        entity = self.get(entity_id)
+        if entity is None:
+            return None
+        return self._queue_patch(entity, entity_id, changes, expected_revision)
+
+    def delete(self, entity_id: str, hard: bool = False) -> bool:
+        """
+        Queue a delete.
+
+        Args:
+            entity_id: Unique identifier of the entity
+            hard: If True, remove the entity; if False, soft delete (default)
+
+        Returns:
+            True if the entity existed, False otherwise
+        """
+        entity_id = str(entity_id)
+        if self.get(entity_id) is None:
+            return False
+        self._queue_delete(entity_id, hard)
+        return True
+
+    def save_many(self, entities: list[T]) -> list[T]:
+        """Queue several saves."""
+        return [self.save(entity) for entity in entities]
+
+    def delete_many(self, entity_ids: list[str], hard: bool = False) -> int:
+        """Queue several deletes."""
+        return sum(self.delete(entity_id, hard=hard) for entity_id in entity_ids)
+
+    @contextmanager
+    def transaction(self) -> Iterator[WriteBatch[T]]:
+        """
+        Collect writes into the unit; they commit with it, atomically per repository.
+
+        Yields:
+            Empty write batch
+        """
+        batch: WriteBatch[T] = WriteBatch()
+        yield batch
+        batch.results = self.commit(batch)
+
+    def commit(self, batch: WriteBatch[T]) -> list[Any]:
+        """Queue the writes of a batch (see ``Repository.commit``)."""
+        results: list[Any] = []
+        for write in batch.writes:
+            if write.is_delete:
+                results.append(self.delete(write.entity_id, hard=write.hard))
+            else:
+                self._queue_save(write.entity, write.mode or WriteMode.UPSERT, write.expected_revision)
+                results.append(write.entity)
+        return results
+
+    def update_where(
+        self,
+        filters: Optional[dict[str, Any]],
+        changes: dict[str, Any],
+        where: Optional[FilterExpr] = None,
+    ) -> int:
+        """
+        Run a set-based update after flushing, then forget loaded entities.
+
+        Entities in the identity map may be among the updated rows, so
+        they are reloaded on next use.
+        """
+        self.flush()
+        updated = self.repository.update_where(filters, changes, where=where)
+        self.clear()
+        return updated
+
+    # Unit of work internals
+
+    def flush(self) -> list[Any]:
+        """
+        Write the queued writes in one repository transaction.
+
+        Returns:
+            One result per flushed write (see ``WriteBatch.results``)
+
+        Raises:
+            ConcurrencyError: If a conditional update finds another revision
+            RepositoryError: If a write fails; none of the queued writes are kept
+        """
+        if not self._pending:
+            return []
+        writes = self._take_pending()
+        with self.repository.transaction() as batch:
+            batch.writes.extend(writes)
+        self._settle(writes, batch.results)
+        return batch.results
+
+
+class AsyncUnitOfWorkRepository(_UnitOfWorkView[T]):
+    """
+    View of an async repository through a unit of work.
+
+    The awaitable counterpart of ``UnitOfWorkRepository``: the same
+    identity map and queued writes, with the repository calls awaited.
+    Other coroutine methods (and async iterators such as ``iter_all``)
+    flush the queued writes of this repository first and are then
+    delegated.
+
+    Attributes:
+        repository: Async repository the view reads from and writes to
+        unit: Unit of work the view belongs to
+    """
+
+    repository: AsyncRepository[T]
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate other repository methods once pending writes are flushed."""
+        attribute = getattr(self.repository, name)
+        if inspect.isasyncgenfunction(attribute):
+
+            async def iterate(*args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+                await self.flush()
+                async for item in attribute(*args, **kwargs):
+                    yield item
+
+            return iterate
+        if not inspect.iscoroutinefunction(attribute):
+            return attribute
+
+        async def delegate(*args: Any, **kwargs: Any) -> Any:
+            await self.flush()
+            return await attribute(*args, **kwargs)
+
+        return delegate
+
+    # Reads by ID
+
+    async def get(self, entity_id: str) -> Optional[T]:
+        """Retrieve an entity, from the identity map if it was loaded before."""
+        entity_id = str(entity_id)
+        entity = self._lookup(entity_id)
+        if entity is not None:
+            return None if entity is _MISSING else entity
+        self.unit.loads += 1
+        return self._remember(entity_id, await self.repository.get(entity_id))
+
+    async def get_many(self, entity_ids: list[str]) -> list[T]:
+        """Retrieve several entities, reading only those not loaded before."""
+        entity_ids = [str(entity_id) for entity_id in entity_ids]
+        missing = self._unloaded(entity_ids)
+        if missing:
+            self._remember_many(missing, await self.repository.get_many(missing))
+        return self._mapped(entity_ids)
+
+    async def exists(self, entity_id: str) -> bool:
+        """Check if an entity exists, without a query if it was loaded before."""
+        entity = self._lookup(str(entity_id))
+        if entity is not None:
+            return entity is not _MISSING
+        return await self.get(entity_id) is not None
+
+    # Queued writes
+
+    async def save(self, entity: T) -> T:
+        """Queue a save and put the entity in the identity map."""
+        self._queue_save(entity, WriteMode.UPSERT, None)
+        return entity
+
+    async def insert(self, entity: T) -> T:
+        """Queue the insert of a new entity."""
+        self._queue_save(entity, WriteMode.INSERT_ONLY, None)
+        return entity
+
+    async def update(self, entity: T) -> T:
+        """Queue the update of an existing entity."""
+        self._queue_save(entity, WriteMode.UPDATE_ONLY, None)
+        return entity
+
+    async def patch(
+        self,
+        entity_id: str,
+        changes: dict[str, Any],
+        expected_revision: Optional[int] = None,
+    ) -> Optional[T]:
+        """
+        Change fields of an entity in the identity map and queue its update.
+
+        See ``UnitOfWorkRepository.patch``.
+
+        Raises:
+            ConcurrencyError: If the entity's revision differs from ``expected_revision``
+        """
+        entity = await self.get(entity_id)
+        if entity is None:
+            return None
+        return self._queue_patch(entity, entity_id, changes, expected_revision)
+
+    async def delete(self, entity_id: str, hard: bool = False) -> bool:
+        """Queue a delete; returns whether the entity existed."""
+        entity_id = str(entity_id)
+        if await self.get(entity_id) is None:
+            return False
+        self._queue_delete(entity_id, hard)
+        return True
+
+    async def save_many(self, entities: list[T]) -> list[T]:
+        """Queue several saves."""
+        return [await self.save(entity) for entity in entities]
+
+    async def delete_many(self, entity_ids: list[str], hard: bool = False) -> int:
+        """Queue several deletes."""
+        return sum([await self.delete(entity_id, hard=hard) for entity_id in entity_ids])
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[WriteBatch[T]]:
+        """
+        Collect writes into the unit; they commit with it, atomically per repository.
+
+        Yields:
+            Empty write batch
+        """
+        batch: WriteBatch[T] = WriteBatch()
+        yield batch
+        batch.results = await self.commit(batch)
+
+    async def commit(self, batch: WriteBatch[T]) -> list[Any]:
+        """Queue the writes of a batch (see ``AsyncRepository.commit``)."""
+        results: list[Any] = []
+        for write in batch.writes:
+            if write.is_delete:
+                results.append(await self.delete(write.entity_id, hard=write.hard))
+            else:
+                self._queue_save(write.entity, write.mode or WriteMode.UPSERT, write.expected_revision)
+                results.append(write.entity)
+        return results
+
+    async def update_where(
+        self,
+        filters: Optional[dict[str, Any]],
+        changes: dict[str, Any],
+        where: Optional[FilterExpr] = None,
+    ) -> int:
+        """Run a set-based update after flushing, then forget loaded entities."""
+        await self.flush()
+        updated = await self.repository.update_where(filters, changes, where=where)
+        self.clear()
+        return updated
+
+    # Unit of work internals
+
+    async def flush(self) -> list[Any]:
+        """
+        Write the queued writes in one repository transaction.
+
+        Returns:
+            One result per flushed write (see ``WriteBatch.results``)
+
+        Raises:
+            ConcurrencyError: If a conditional update finds another revision
+            RepositoryError: If a write fails; none of the queued writes are kept
+        """
+        if not self._pending:
+            return []
+        writes = self._take_pending()
+        async with self.repository.transaction() as batch:
+            batch.writes.extend(writes)
+        self._settle(writes, batch.results)
+        return batch.results
+
+
+class UnitOfWork:
+    """
+    Identity maps and queued writes of one request.
+
+    Attributes:
+        hits: Reads by ID served from an identity map
+        loads: IDs read from a repository
+        flushed: Writes sent to repositories
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty unit of work."""
+        self.hits = 0
+        self.loads = 0
+        self.flushed = 0
+        self._views: dict[int, _UnitOfWorkView[Any]] = {}
+        self._after_commit: list[Callable[[], None]] = []
+
+    def bind(self, repository: Any) -> Any:
+        """
+        Get the unit's view of a repository.
+
+        Args:
+            repository: Repository (sync or async) to read from and write to
+
+        Returns:
+            View shared by every use of the repository in this unit: an
+            ``AsyncUnitOfWorkRepository`` for an ``AsyncRepository``, a
+            ``UnitOfWorkRepository`` otherwise
+        """
+        if isinstance(repository, _UnitOfWorkView):
+            return repository
+        view = self._views.get(id(repository))
+        if view is None:
+            view_type = AsyncUnitOfWorkRepository if isinstance(repository, AsyncRepository) else UnitOfWorkRepository
+            view = self._views[id(repository)] = view_type(self, repository)
+        return view
+
+    @property
+    def pending(self) -> int:
+        """Number of queued writes, over all repositories."""
+        return sum(view.pending for view in self._views.values())
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """
+        Run a callback once the queued writes are committed.
+
+        Used for side effects that must not precede the writes, such as
+        cache invalidation. Callbacks are dropped on rollback.
+
+        Args:
+            callback: Function to call without arguments
+        """
+        self._after_commit.append(callback)
+
+    def commit(self) -> int:
+        """
+        Flush the queued writes, one transaction per repository.
+
+        Repositories are flushed in the order they were bound. A failing
+        repository transaction is rolled back and raised; repositories
+        flushed before it keep their writes.
+
+        Returns:
+            Number of writes flushed
+
+        Raises:
+            ConcurrencyError: If a conditional update finds another revision
+            RepositoryError: If a write fails
+            RuntimeError: If writes to an async repository are queued (use
+                ``commit_async``)
+        """
+        flushed = 0
+        for view in self._views.values():
+            if isinstance(view, AsyncUnitOfWorkRepository):
+                if view.pending:
+                    raise RuntimeError("Unit of work has async writes queued; use commit_async")
+                continue
+            flushed += len(view.flush())
+        self._run_after_commit()
+        return flushed
+
+    async def commit_async(self) -> int:
+        """
+        Flush the queued writes without blocking the event loop.
+
+        Like ``commit``, but async repositories are awaited and sync ones
+        are flushed in a worker thread.
+
+        Returns:
+            Number of writes flushed
+
+        Raises:
+            ConcurrencyError: If a conditional update finds another revision
+            RepositoryError: If a write fails
+        """
+        flushed = 0
+        for view in self._views.values():
+            if isinstance(view, AsyncUnitOfWorkRepository):
+                flushed += len(await view.flush())
+            elif view.pending:
+                flushed += len(await asyncio.to_thread(view.flush))
+        self._run_after_commit()
+        return flushed
+
+    def rollback(self) -> None:
+        """Discard the queued writes and forget loaded entities."""
+        for view in self._views.values():
+            view.clear()
+        self._after_commit = []
+
+    def _run_after_commit(self) -> None:
+        """Run the callbacks registered with ``after_commit``."""
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            callback()
+
+
+class RepositoryAttribute:
+    """
+    Service attribute holding a repository.
+
+    Reading the attribute inside a unit of work returns the unit's view
+    of the repository; outside one, the repository itself::
+
+        class EntityService:
+            repository = RepositoryAttribute()
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = f"_{name}"
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        repository = instance.__dict__[self._name]
+        unit = _current.get()
+        return repository if unit is None else unit.bind(repository)
+
+    def __set__(self, instance: Any, repository: Any) -> None:
+        instance.__dict__[self._name] = repository
+
+
+@contextmanager
+def unit_of_work(unit: Optional[UnitOfWork] = None) -> Iterator[UnitOfWork]:
+    """
+    Open a unit of work for the current context.
+
+    The unit commits when the block exits normally and rolls back when it
+    raises. Inside an open unit, the block joins it instead: the outer
+    block commits.
+
+    Args:
+        unit: Unit to open (default: a new one)
+
+    Yields:
+        The active unit of work
+
+    Raises:
+        ConcurrencyError: If a conditional update finds another revision at commit
+        RepositoryError: If the commit fails
+    """
+    active = _current.get()
+    if active is not None:
+        yield active
+        return
+
+    unit = UnitOfWork() if unit is None else unit
+    token = _current.set(unit)
+    try:
+        yield unit
+        unit.commit()
+    except BaseException:
+        unit.rollback()
+        raise
+    finally:
+        _current.reset(token)
+
+
+@asynccontextmanager
+async def async_unit_of_work(unit: Optional[UnitOfWork] = None) -> AsyncIterator[UnitOfWork]:
+    """
+    Open a unit of work for the current context from async code.
+
+    Like ``unit_of_work``, but the unit commits with ``commit_async``.
+
+    Args:
+        unit: Unit to open (default: a new one)
+
+    Yields:
+        The active unit of work
+
+    Raises:
+        ConcurrencyError: If a conditional update finds another revision at commit
+        RepositoryError: If the commit fails
+    """
+    active = _current.get()
+    if active is not None:
+        yield active
+        return
+
+    unit = UnitOfWork() if unit is None else unit
+    token = _current.set(unit)
+    try:
+        yield unit
+        await unit.commit_async()
+    except BaseException:
+        unit.rollback()
+        raise
+    finally:
+        _current.reset(token)
+
+
+def current_unit_of_work() -> Optional[UnitOfWork]:
+    """
+    Get the unit of work of the current context.
+
+    Returns:
+        The active unit, or None outside of one
+    """
+    return _current.get()
@@ -18,6 +18,7 @@ from ..models.workflow import (
 )
 from ..ports.logger import Logger
 from ..ports.repository import Repository
+from .unit_of_work import RepositoryAttribute
 
 
 class WorkflowService:
@@ -27,12 +28,19 @@ class WorkflowService:
     This service implements workflow execution, validation, and scheduling
     using pure business logic without external dependencies.
 
+    Inside a unit of work both repositories are the unit's views of them
+    (see ``EntityService``), so the progress saves of an execution are
+    written once, when the request ends.
+
     Attributes:
         workflow_repository: Repository for workflow definitions
         execution_repository: Repository for workflow executions
         logger: Logger for recording events
     """
 
+    workflow_repository = RepositoryAttribute()
+    execution_repository = RepositoryAttribute()
+
     def __init__(
         self,
         workflow_repository: Repository[Workflow],
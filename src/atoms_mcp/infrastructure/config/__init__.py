@@ -3,6 +3,7 @@
 from .settings import (
     Settings,
     DatabaseSettings,
+    StorageSettings,
     VertexAISettings,
     WorkOSSettings,
     PhenoSDKSettings,
@@ -12,6 +13,7 @@ from .settings import (
     LogLevel,
     LogFormat,
     CacheBackend,
+    RepositoryBackend,
     get_settings,
     reset_settings,
 )
@@ -19,6 +21,7 @@ from .settings import (
 __all__ = [
     "Settings",
     "DatabaseSettings",
+    "StorageSettings",
     "VertexAISettings",
     "WorkOSSettings",
     "PhenoSDKSettings",
@@ -28,6 +31,7 @@ __all__ = [
     "LogLevel",
     "LogFormat",
     "CacheBackend",
+    "RepositoryBackend",
     "get_settings",
     "reset_settings",
 ]
@@ -41,6 +41,14 @@ class CacheBackend(str, Enum):
     REDIS = "redis"
 
 
+class RepositoryBackend(str, Enum):
+    """Repository storage backend."""
+
+    SUPABASE = "supabase"
+    SQLITE = "sqlite"
+    MEMORY = "memory"
+
+
 class DatabaseSettings(BaseSettings):
     """Database configuration (Supabase)."""
 
@@ -80,6 +88,77 @@ class DatabaseSettings(BaseSettings):
         default=False,
         description="Echo SQL queries (for debugging)",
     )
+    health_check_interval: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds between background connection health probes",
+    )
+    circuit_failure_threshold: int = Field(
+        default=5,
+        ge=1,
+        description="Consecutive connection failures before the circuit opens",
+    )
+    circuit_reset_timeout: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds the circuit stays open before allowing a trial request",
+    )
+    replica_urls: list[str] = Field(
+        default_factory=list,
+        description="Read replica URLs; repository reads are spread across them",
+    )
+    read_your_writes_window: float = Field(
+        default=5.0,
+        ge=0,
+        description="Seconds a session that wrote keeps reading from the primary",
+    )
+
+    # Existence filters (Bloom filters of live IDs answering lookups of missing IDs)
+    existence_filter_tables: list[str] = Field(
+        default_factory=list,
+        description="Tables whose repositories keep an existence filter of their IDs",
+    )
+    existence_filter_capacity: int = Field(
+        default=100_000,
+        ge=1,
+        description="Minimum number of IDs an existence filter is sized for",
+    )
+    existence_filter_error_rate: float = Field(
+        default=0.01,
+        gt=0,
+        lt=1,
+        description="Target false-positive rate of the existence filters",
+    )
+    existence_filter_rebuild_interval: float = Field(
+        default=3600.0,
+        gt=0,
+        description="Seconds after which an existence filter is rebuilt from a scan of its table",
+    )
+
+    # Query stats and slow-query log
+    query_stats_enabled: bool = Field(
+        default=True,
+        description="Record latency, rows and bytes per query shape",
+    )
+    slow_query_threshold: float = Field(
+        default=0.5,
+        gt=0,
+        description="Seconds after which a query is logged as slow",
+    )
+    query_stats_max_shapes: int = Field(
+        default=500,
+        ge=1,
+        description="Maximum number of distinct query shapes tracked",
+    )
+    query_stats_path: Optional[Path] = Field(
+        default=None,
+        description="File the query stats are exported to for `atoms admin queries` (none: no export)",
+    )
+    query_stats_export_interval: float = Field(
+        default=60.0,
+        gt=0,
+        description="Seconds between exports of the query stats",
+    )
 
     model_config = SettingsConfigDict(
         env_prefix="SUPABASE_",
@@ -95,6 +174,43 @@ class DatabaseSettings(BaseSettings):
         return v
 
 
+class StorageSettings(BaseSettings):
+    """Repository storage configuration."""
+
+    backend: RepositoryBackend = Field(
+        default=RepositoryBackend.SUPABASE,
+        description="Repository backend (supabase, sqlite or memory)",
+    )
+
+    # SQLite-specific settings
+    sqlite_path: Path = Field(
+        default=Path("data/atoms.db"),
+        description="SQLite database file path (':memory:' for a private in-memory database)",
+    )
+    sqlite_pool_size: int = Field(
+        default=4,
+        ge=1,
+        le=64,
+        description="Maximum number of pooled SQLite connections",
+    )
+    sqlite_busy_timeout: float = Field(
+        default=5.0,
+        ge=0,
+        description="Seconds a SQLite statement waits for a lock held by another connection",
+    )
+
+    # Identifier generation
+    id_version: Literal[4, 7] = Field(
+        default=7,
+        description="UUID version of new IDs (7: time-ordered, 4: random, for compatibility)",
+    )
+
+    model_config = SettingsConfigDict(
+        env_prefix="STORAGE_",
+        case_sensitive=False,
+    )
+
+
 class VertexAISettings(BaseSettings):
     """Vertex AI configuration for embeddings and AI operations."""
 
@@ -413,6 +529,10 @@ class Settings(BaseSettings):
         default_factory=DatabaseSettings,
         description="Database configuration",
     )
+    storage: StorageSettings = Field(
+        default_factory=StorageSettings,
+        description="Repository storage configuration",
+    )
     vertex_ai: VertexAISettings = Field(
         default_factory=VertexAISettings,
         description="Vertex AI configuration",
@@ -5,8 +5,12 @@ This module provides a simple DI container for managing application
 dependencies using factory pattern without complex frameworks.
 """
 
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
 from typing import Any, Callable, Optional, TypeVar
 
+from ...domain.ports.async_repository import AsyncRepository
+from ...domain.services.entity_loader import EntityLoader, batching_window
+from ...domain.services.unit_of_work import UnitOfWork, async_unit_of_work, unit_of_work
 from ..cache.provider import create_cache_provider
 from ..config.settings import Settings, get_settings
 from ..logging.logger import get_logger
@@ -168,7 +172,14 @@ class Scope:
     Dependency scope for request-scoped dependencies.
 
     Provides a way to create short-lived dependency instances
-    that are cleaned up after the scope is exited.
+    that are cleaned up after the scope is exited. While entered (with
+    ``with`` or ``async with``), the scope is also the batching window of
+    entity loaders: get-by-ID reads issued by async services in the same
+    event-loop tick are batched per repository and memoized until exit.
+    It also opens a unit of work for the services: entities loaded by ID
+    are kept in an identity map and writes are committed on a clean exit
+    (discarded if the block raises). Entered with ``async with``, the unit
+    commits without blocking the event loop.
     """
 
     def __init__(self, container: Container):
@@ -180,6 +191,11 @@ class Scope:
         """
         self._container = container
         self._scoped_instances: dict[str, Any] = {}
+        self._loaders: dict[int, EntityLoader[Any]] = {}
+        self._window: Optional[AbstractContextManager[Any]] = None
+        self.unit: Optional[UnitOfWork] = None
+        self._unit: Optional[AbstractContextManager[UnitOfWork]] = None
+        self._async_unit: Optional[AbstractAsyncContextManager[UnitOfWork]] = None
 
     def get(self, key: str) -> Any:
         """
@@ -208,16 +224,85 @@ class Scope:
         """
         self._scoped_instances[key] = instance
 
+    def loader(self, repository: AsyncRepository[T]) -> EntityLoader[T]:
+        """
+        Get the scope's batching loader for a repository.
+
+        Args:
+            repository: Async repository the entities are read from
+
+        Returns:
+            Loader shared by all reads of the repository in this scope
+        """
+        loader = self._loaders.get(id(repository))
+        if loader is None:
+            loader = self._loaders[id(repository)] = EntityLoader(repository)
+        return loader
+
     def clear(self) -> None:
-        """Clear scoped instances."""
+        """Clear scoped instances and loaders."""
         self._scoped_instances.clear()
+        self._loaders.clear()
 
     def __enter__(self) -> "Scope":
-        """Enter scope context."""
+        """Enter scope context, open its loader batching window and unit of work."""
+        self._open_window()
+        self._unit = unit_of_work()
+        self.unit = self._unit.__enter__()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Exit scope context and clear instances."""
+        """
+        Exit scope context: commit (or roll back) the unit of work, close
+        the batching window and clear instances.
+
+        Raises:
+            RepositoryError: If the unit of work fails to commit
+        """
+        try:
+            if self._unit is not None:
+                unit, self._unit, self.unit = self._unit, None, None
+                unit.__exit__(exc_type, exc_val, exc_tb)
+        finally:
+            self._close_window(exc_type, exc_val, exc_tb)
+
+    async def __aenter__(self) -> "Scope":
+        """Enter scope context from async code."""
+        self._open_window()
+        self._async_unit = async_unit_of_work()
+        self.unit = await self._async_unit.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """
+        Exit scope context from async code: wait for the loaders' pending
+        reads, commit (or roll back) the unit of work without blocking the
+        event loop, close the batching window and clear instances.
+
+        Raises:
+            RepositoryError: If the unit of work fails to commit
+        """
+        try:
+            for loader in list(self._loaders.values()):
+                await loader.drain()
+        finally:
+            try:
+                if self._async_unit is not None:
+                    unit, self._async_unit, self.unit = self._async_unit, None, None
+                    await unit.__aexit__(exc_type, exc_val, exc_tb)
+            finally:
+                self._close_window(exc_type, exc_val, exc_tb)
+
+    def _open_window(self) -> None:
+        """Open the scope's loader batching window."""
+        self._window = batching_window(self._loaders)
+        self._window.__enter__()
+
+    def _close_window(self, exc_type, exc_val, exc_tb) -> None:
+        """Close the batching window and clear instances."""
+        if self._window is not None:
+            self._window.__exit__(exc_type, exc_val, exc_tb)
+            self._window = None
         self.clear()
 
 
@@ -138,6 +138,59 @@ class RepositoryProvider:
             "Supabase repository implementation is in adapters layer"
         )
 
+    @staticmethod
+    def create_sqlite_repository(
+        settings: Settings,
+        table_name: str,
+        entity_type: type,
+        logger: Optional[Logger] = None,
+        pool: Optional[Any] = None,
+    ) -> Any:
+        """
+        Create a SQLite repository instance.
+
+        Repositories on the same database should share one connection
+        pool; create it with ``create_sqlite_pool`` and pass it in.
+
+        Args:
+            settings: Application settings
+            table_name: Name of the table
+            entity_type: Type of entities stored in the repository
+            logger: Logger instance (optional)
+            pool: Connection pool (default: a new pool from settings)
+
+        Returns:
+            SQLite repository instance
+        """
+        # Import here to avoid circular dependencies
+        from ...adapters.secondary.sqlite import SqliteRepository
+
+        return SqliteRepository(
+            table_name,
+            entity_type,
+            pool=pool or RepositoryProvider.create_sqlite_pool(settings),
+            logger=logger,
+        )
+
+    @staticmethod
+    def create_sqlite_pool(settings: Settings) -> Any:
+        """
+        Create a SQLite connection pool from the storage settings.
+
+        Args:
+            settings: Application settings
+
+        Returns:
+            SQLite connection pool
+        """
+        from ...adapters.secondary.sqlite import SqliteConnectionPool
+
+        return SqliteConnectionPool(
+            settings.storage.sqlite_path,
+            size=settings.storage.sqlite_pool_size,
+            busy_timeout=settings.storage.sqlite_busy_timeout,
+        )
+
     @staticmethod
     def create_mock_repository(logger: Logger) -> Any:
         """
@@ -1,5 +1,6 @@
 """Serialization module."""
 
+from .codecs import EntityCodec, encode_value, get_codec, register_codec
 from .json import (
     DomainJSONEncoder,
     deserialize_from_cache,
@@ -22,4 +23,8 @@ __all__ = [
     "serialize_for_cache",
     "deserialize_from_cache",
     "is_json",
+    "EntityCodec",
+    "encode_value",
+    "get_codec",
+    "register_codec",
 ]
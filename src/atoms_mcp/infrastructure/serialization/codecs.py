@@ -0,0 +1,303 @@
+"""
+Precompiled row codecs for domain dataclasses.
+
+Generic serialization inspects every value at runtime (``isinstance``
+chains, ``__dict__`` copies, ``model_dump``/``model_validate``). A codec
+instead reads the dataclass type hints once and generates a dedicated
+``encode``/``decode`` function pair for the type, with the conversion of
+each field (enum, datetime, date, UUID, nested dataclass, list of nested
+dataclasses) inlined, so a row is converted in a single pass.
+
+Encoding produces JSON-ready dictionaries: enums become their values,
+datetimes ISO strings and nested dataclasses dictionaries, while dict and
+list fields are passed through for ``jsonb`` columns. Decoding reverses
+this, accepts values that are already converted, and also parses JSON
+strings found in dict/list fields (rows written by older serializers).
+Unknown row keys are ignored and missing ones take the field default.
+
+Codecs for the core domain models are generated when this module is
+imported; other dataclasses get theirs on first use.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import threading
+import types
+import typing
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Generic, Optional, TypeVar
+from uuid import UUID
+
+from atoms_mcp.domain.models.entity import DocumentEntity, Entity, ProjectEntity, TaskEntity, WorkspaceEntity
+from atoms_mcp.domain.models.relationship import Relationship
+from atoms_mcp.domain.models.workflow import Workflow, WorkflowExecution
+
+T = TypeVar("T")
+
+# (encode template, decode template); "{}" stands for a non-None value
+_Converter = tuple[str, str]
+
+
+@dataclass(frozen=True)
+class EntityCodec(Generic[T]):
+    """
+    Generated encoder/decoder pair for one dataclass.
+
+    Attributes:
+        entity_type: Dataclass converted by the codec
+        fields: Names of the fields encoded, in declaration order
+        encode: Converts an instance into a JSON-ready dictionary
+        decode: Builds an instance from a row dictionary
+        source: Generated Python source, kept for debugging
+    """
+
+    entity_type: type[T]
+    fields: tuple[str, ...]
+    encode: Callable[[T], dict[str, Any]]
+    decode: Callable[[dict[str, Any]], T]
+    source: str
+
+
+_codecs: dict[type, EntityCodec[Any]] = {}
+_lock = threading.RLock()
+
+
+def register_codec(entity_type: type[T]) -> EntityCodec[T]:
+    """
+    Generate and register the codec of a dataclass.
+
+    Args:
+        entity_type: Dataclass to compile a codec for
+
+    Returns:
+        The registered codec
+
+    Raises:
+        TypeError: If ``entity_type`` is not a dataclass
+    """
+    if not (isinstance(entity_type, type) and dataclasses.is_dataclass(entity_type)):
+        raise TypeError(f"Cannot build a codec for {entity_type!r}: not a dataclass")
+    with _lock:
+        codec = _codecs.get(entity_type)
+        if codec is None:
+            codec = _codecs[entity_type] = _compile(entity_type)
+        return codec
+
+
+def get_codec(entity_type: Any) -> Optional[EntityCodec[Any]]:
+    """
+    Look up the codec of a type, generating it for unregistered dataclasses.
+
+    Args:
+        entity_type: Type whose instances are converted
+
+    Returns:
+        The codec, or None if the type is not a dataclass
+    """
+    codec = _codecs.get(entity_type)
+    if codec is not None:
+        return codec
+    if isinstance(entity_type, type) and dataclasses.is_dataclass(entity_type):
+        return register_codec(entity_type)
+    return None
+
+
+def encode_value(value: Any) -> Any:
+    """
+    Convert one field value the way generated encoders do.
+
+    Used for partial writes, where only some fields of an entity are
+    encoded and the field types are not known up front.
+
+    Args:
+        value: Field value
+
+    Returns:
+        JSON-ready value
+    """
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, list):
+        return [encode_value(item) for item in value]
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return register_codec(type(value)).encode(value)
+    return value
+
+
+def _load_json(value: Any) -> Any:
+    """Parse JSON text stored in a dict/list field; other values pass through."""
+    return json.loads(value) if isinstance(value, str) else value
+
+
+class _Namespace:
+    """Globals of a generated module; objects are bound under unique names."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, Any] = {
+            "_load_json": _load_json,
+            "_MISSING": dataclasses.MISSING,
+            "_new": object.__new__,
+            "datetime": datetime,
+            "date": date,
+        }
+        self._names: dict[int, str] = {}
+
+    def bind(self, value: Any) -> str:
+        name = self._names.get(id(value))
+        if name is None:
+            name = self._names[id(value)] = f"_g{len(self._names)}"
+            self.values[name] = value
+        return name
+
+
+def _converter(hint: Any, namespace: _Namespace) -> Optional[_Converter]:
+    """
+    Build the conversion templates of one type hint.
+
+    Args:
+        hint: Resolved type hint of a field or list item
+        namespace: Globals of the generated module
+
+    Returns:
+        Encode/decode templates, or None if values pass through unchanged
+    """
+    origin = typing.get_origin(hint)
+    if origin in (typing.Union, types.UnionType):
+        members = [arg for arg in typing.get_args(hint) if arg is not type(None)]
+        # Optional[X]: None is handled by the caller; other unions pass through
+        return _converter(members[0], namespace) if len(members) == 1 else None
+
+    if origin is list:
+        (item,) = typing.get_args(hint) or (Any,)
+        converter = _converter(item, namespace)
+        if converter is None:
+            return "{}", "_load_json({})"
+        encode, decode = converter
+        return (
+            f"[{encode.format('x')} for x in {{}}]",
+            f"[{decode.format('x')} for x in _load_json({{}})]",
+        )
+    if origin is dict or hint is dict:
+        return "{}", "_load_json({})"
+
+    if not isinstance(hint, type):
+        return None
+    if issubclass(hint, Enum):
+        # Members are looked up by value directly; the call handles aliases and errors
+        members = namespace.bind(hint._value2member_map_)
+        return "{}.value", f"({members}[{{0}}] if {{0}} in {members} else {namespace.bind(hint)}({{0}}))"
+    if issubclass(hint, datetime):
+        return "{}.isoformat()", "(datetime.fromisoformat({0}) if isinstance({0}, str) else {0})"
+    if issubclass(hint, date):
+        return "{}.isoformat()", "(date.fromisoformat({0}) if isinstance({0}, str) else {0})"
+    if issubclass(hint, UUID):
+        return "str({})", f"{namespace.bind(UUID)}(str({{}}))"
+    if dataclasses.is_dataclass(hint):
+        codec = register_codec(hint)
+        return (
+            f"{namespace.bind(codec.encode)}({{}})",
+            f"{namespace.bind(codec.decode)}(_load_json({{}}))",
+        )
+    return None
+
+
+def _compile(entity_type: type[T]) -> EntityCodec[T]:
+    """
+    Generate the codec of a dataclass (see ``register_codec``).
+
+    Decoding fills the instance ``__dict__`` directly instead of calling
+    the generated ``__init__``; ``__post_init__`` still runs, so entity
+    validation is kept. Slotted dataclasses go through the constructor.
+    Decoded entities with change tracking are marked clean.
+    """
+    hints = typing.get_type_hints(entity_type)
+    namespace = _Namespace()
+    cls = namespace.bind(entity_type)
+    direct = "__slots__" not in vars(entity_type)
+
+    encoded: list[str] = []
+    decoded: list[str] = []
+    fields: list[str] = []
+    for field in dataclasses.fields(entity_type):
+        name = field.name
+        converter = _converter(hints.get(name, Any), namespace)
+        encode, decode = converter or ("{}", "{}")
+        fields.append(name)
+        if encode == "{}":
+            encoded.append(f"        {name!r}: obj.{name},")
+        else:
+            encoded.append(f"        {name!r}: (None if (v := obj.{name}) is None else {encode.format('v')}),")
+
+        if field.default is not dataclasses.MISSING:
+            fallback = namespace.bind(field.default)
+        elif field.default_factory is not dataclasses.MISSING:
+            fallback = f"{namespace.bind(field.default_factory)}()"
+        elif field.init:
+            # Required field: decoding fails with KeyError when it is absent
+            fallback = f"row[{name!r}]"
+        else:
+            continue
+        if not (field.init or direct):
+            continue
+        if converter is None and field.default is not dataclasses.MISSING:
+            decoded.append(f"        {name!r}: get({name!r}, {fallback}),")
+        else:
+            decoded.append(
+                f"        {name!r}: {fallback} if (v := get({name!r}, _missing)) is _missing"
+                f" else None if v is None else {decode.format('v')},"
+            )
+
+    if not direct:
+        build = [f"    obj = {cls}(**{{", *decoded, "    })"]
+    else:
+        build = ["    obj = _new(" + cls + ")", "    obj.__dict__.update({", *decoded, "    })"]
+        if hasattr(entity_type, "__post_init__"):
+            build.append("    obj.__post_init__()")
+    if hasattr(entity_type, "mark_clean"):
+        # A stored row has no pending changes
+        build.append("    obj.mark_clean()")
+    build.append("    return obj")
+
+    source = "\n".join(
+        [
+            "def encode(obj):",
+            "    return {",
+            *encoded,
+            "    }",
+            "",
+            "def decode(row, _missing=_MISSING):",
+            "    get = row.get",
+            *build,
+        ]
+    )
+    code = compile(source, f"<codec {entity_type.__module__}.{entity_type.__qualname__}>", "exec")
+    exec(code, namespace.values)  # noqa: S102 - source is generated from the type hints above
+    return EntityCodec(
+        entity_type=entity_type,
+        fields=tuple(fields),
+        encode=namespace.values["encode"],
+        decode=namespace.values["decode"],
+        source=source,
+    )
+
+
+for _entity_type in (
+    Entity,
+    WorkspaceEntity,
+    ProjectEntity,
+    TaskEntity,
+    DocumentEntity,
+    Relationship,
+    Workflow,
+    WorkflowExecution,
+):
+    register_codec(_entity_type)
@@ -0,0 +1,25 @@
+-- Revision column used for optimistic concurrency by the entity tables,
+-- incremented by a trigger on every update.
+-- Source: REVISION_FUNCTION_SQL and REVISION_COLUMN_SQL in
+-- src/atoms_mcp/adapters/secondary/supabase/repository.py
+
+create or replace function atoms_bump_revision() returns trigger
+language plpgsql
+as $$
+begin
+    new.revision := old.revision + 1;
+    return new;
+end;
+$$;
+
+alter table entities add column if not exists revision bigint not null default 0;
+
+drop trigger if exists entities_bump_revision on entities;
+create trigger entities_bump_revision before update on entities
+    for each row execute function atoms_bump_revision();
+
+alter table relationships add column if not exists revision bigint not null default 0;
+
+drop trigger if exists relationships_bump_revision on relationships;
+create trigger relationships_bump_revision before update on relationships
+    for each row execute function atoms_bump_revision();
@@ -0,0 +1,76 @@
+-- Ranked full-text search for the Supabase repositories (Repository.search).
+-- Source: SEARCH_FUNCTION_SQL in src/atoms_mcp/adapters/secondary/supabase/search.py
+
+create extension if not exists pg_trgm;
+
+-- Superseded by the signature below, which adds p_filter
+drop function if exists atoms_search(text, text, text[], integer, text, text[]);
+
+-- Searches the text columns of one table in a single statement.
+-- Rows are returned as JSON objects, best match first. p_filter keeps
+-- rows whose JSON form contains it (equality filters). Recommended index
+-- per table (adjust the column list to the table):
+--   create index on <table> using gin (to_tsvector('english',
+--     coalesce(name, '') || ' ' || coalesce(description, '')));
+--   create index on <table> using gin (
+--     (coalesce(name, '') || ' ' || coalesce(description, '')) gin_trgm_ops);
+create or replace function atoms_search(
+    p_table text,
+    p_query text,
+    p_fields text[],
+    p_limit integer default null,
+    p_mode text default 'auto',
+    p_columns text[] default null,
+    p_filter jsonb default null
+) returns setof jsonb
+language plpgsql stable
+as $$
+declare
+    v_fields text[];
+    v_document text;
+    v_mode text := p_mode;
+    v_row text := 'to_jsonb(t)';
+begin
+    -- Ignore requested fields the table does not have
+    select array_agg(column_name::text) into v_fields
+    from information_schema.columns
+    where table_schema = 'public' and table_name = p_table and column_name = any(p_fields);
+    if v_fields is null then
+        return;
+    end if;
+
+    select string_agg(format('coalesce(t.%I::text, '''')', f), ' || '' '' || ')
+    into v_document from unnest(v_fields) as f;
+
+    if p_columns is not null then
+        v_row := '(select jsonb_object_agg(key, value) from jsonb_each(to_jsonb(t))'
+              || ' where key = any($3))';
+    end if;
+
+    if v_mode = 'auto' then
+        v_mode := case
+            when char_length(btrim(p_query)) < 3
+              or numnode(websearch_to_tsquery('english', p_query)) = 0 then 'trigram'
+            else 'fulltext'
+        end;
+    end if;
+
+    if v_mode = 'fulltext' then
+        return query execute format(
+            'select %s from %I t, websearch_to_tsquery(''english'', $1) q'
+            ' where not t.is_deleted and to_tsvector(''english'', %s) @@ q'
+            ' and ($4::jsonb is null or to_jsonb(t) @> $4)'
+            ' order by ts_rank(to_tsvector(''english'', %s), q) desc limit $2',
+            v_row, p_table, v_document, v_document)
+        using p_query, p_limit, p_columns, p_filter;
+    else
+        return query execute format(
+            'select %s from %I t'
+            ' where not t.is_deleted and (%s) ilike ''%%'' || $1 || ''%%'''
+            ' and ($4::jsonb is null or to_jsonb(t) @> $4)'
+            ' order by word_similarity($1, %s) desc limit $2',
+            v_row, p_table, v_document, v_document)
+        using p_query, p_limit, p_columns, p_filter;
+    end if;
+end;
+$$;
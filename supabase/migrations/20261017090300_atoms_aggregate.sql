@@ -0,0 +1,105 @@
+-- Server-side aggregation for the Supabase repositories (Repository.aggregate).
+-- Source: AGGREGATE_FUNCTION_SQL in src/atoms_mcp/adapters/secondary/supabase/aggregate.py
+
+-- Compiles a JSON filter tree ({"and": [...]}, {"or": [...]} or
+-- {"field": ..., "op": ..., "value": ...}) into a predicate on alias t.
+create or replace function atoms_filter_sql(p_filter jsonb) returns text
+language plpgsql immutable
+as $$
+declare
+    v_parts text[];
+    v_column text;
+    v_values text;
+begin
+    if p_filter is null then
+        return 'true';
+    end if;
+
+    if p_filter ? 'and' or p_filter ? 'or' then
+        select array_agg(atoms_filter_sql(member)) into v_parts
+        from jsonb_array_elements(coalesce(p_filter->'and', p_filter->'or')) as member;
+        return '(' || array_to_string(
+            coalesce(v_parts, array[(p_filter ? 'and')::text]),
+            case when p_filter ? 'and' then ' and ' else ' or ' end
+        ) || ')';
+    end if;
+
+    v_column := format('t.%I', p_filter->>'field');
+    case p_filter->>'op'
+        when 'eq' then return format('%s = %L', v_column, p_filter->>'value');
+        when 'neq' then return format('%s <> %L', v_column, p_filter->>'value');
+        when 'gt' then return format('%s > %L', v_column, p_filter->>'value');
+        when 'gte' then return format('%s >= %L', v_column, p_filter->>'value');
+        when 'lt' then return format('%s < %L', v_column, p_filter->>'value');
+        when 'lte' then return format('%s <= %L', v_column, p_filter->>'value');
+        when 'ilike' then return format('%s::text ilike %L', v_column, p_filter->>'value');
+        when 'contains' then return format('%s @> %L::jsonb', v_column, p_filter->'value');
+        when 'is_null' then
+            return v_column || case when (p_filter->>'value')::boolean
+                then ' is null' else ' is not null' end;
+        when 'in' then
+            select string_agg(quote_literal(value), ', ') into v_values
+            from jsonb_array_elements_text(p_filter->'value') as value;
+            return coalesce(format('%s in (%s)', v_column, v_values), 'false');
+        else
+            raise exception 'unsupported filter operator: %', p_filter->>'op';
+    end case;
+end;
+$$;
+
+-- Aggregates one table in a single statement, one JSON object per group.
+-- Group keys are columns or column.key JSON paths; metrics are
+-- {"func", "field", "alias"} objects.
+create or replace function atoms_aggregate(
+    p_table text,
+    p_group_by text[] default '{}',
+    p_metrics jsonb default '[{"func": "count", "alias": "count"}]',
+    p_filter jsonb default null,
+    p_time_bucket text default null,
+    p_time_field text default 'created_at'
+) returns setof jsonb
+language plpgsql stable
+as $$
+declare
+    v_select text[] := '{}';
+    v_group text[] := '{}';
+    v_key text;
+    v_expr text;
+    v_metric jsonb;
+begin
+    foreach v_key in array p_group_by loop
+        if position('.' in v_key) > 0 then
+            v_expr := format('t.%I->>%L', split_part(v_key, '.', 1), split_part(v_key, '.', 2));
+        else
+            v_expr := format('t.%I', v_key);
+        end if;
+        v_select := v_select || format('%s as %I', v_expr, v_key);
+        v_group := v_group || v_expr;
+    end loop;
+
+    if p_time_bucket is not null then
+        v_expr := format('date_trunc(%L, t.%I)', p_time_bucket, p_time_field);
+        v_select := v_select || (v_expr || ' as bucket');
+        v_group := v_group || v_expr;
+    end if;
+
+    for v_metric in select * from jsonb_array_elements(p_metrics) loop
+        if v_metric->>'func' not in ('count', 'sum', 'avg', 'min', 'max') then
+            raise exception 'unsupported aggregate: %', v_metric->>'func';
+        end if;
+        v_select := v_select || format('%s(%s) as %I',
+            v_metric->>'func',
+            case when v_metric->>'field' is null then '*'
+                 else format('t.%I', v_metric->>'field') end,
+            v_metric->>'alias');
+    end loop;
+
+    return query execute format(
+        'select to_jsonb(r) from (select %s from %I t where %s%s) r',
+        array_to_string(v_select, ', '),
+        p_table,
+        atoms_filter_sql(p_filter),
+        case when cardinality(v_group) > 0
+            then ' group by ' || array_to_string(v_group, ', ') else '' end);
+end;
+$$;
@@ -297,6 +297,44 @@ class TestAnalyticsQueryHandlerEntityCount:
         assert result.data == {"project": 1, "task": 1}
         assert result.total_count == 2
 
+    def test_handle_entity_count_by_type_and_date_in_one_aggregate(
+        self, mock_repository, mock_logger, mock_cache
+    ):
+        """Test entity type and date range are pushed into a single aggregate."""
+        base_date = datetime(2024, 1, 1)
+        entities = [
+            Entity(status=EntityStatus.ACTIVE, created_at=base_date, metadata={"entity_type": "task"}),
+            Entity(status=EntityStatus.ARCHIVED, created_at=base_date, metadata={"entity_type": "task"}),
+            Entity(status=EntityStatus.ACTIVE, created_at=base_date, metadata={"entity_type": "project"}),
+            Entity(
+                status=EntityStatus.ACTIVE,
+                created_at=base_date - timedelta(days=30),
+                metadata={"entity_type": "task"},
+            ),
+        ]
+        for entity in entities:
+            mock_repository.add_entity(entity)
+        aggregate = mock_repository.aggregate
+        calls = []
+
+        def record(**kwargs):
+            calls.append(kwargs)
+            return aggregate(**kwargs)
+
+        mock_repository.aggregate = record
+        handler = AnalyticsQueryHandler(mock_repository, mock_logger, mock_cache)
+        query = EntityCountQuery(
+            group_by="status",
+            entity_type="task",
+            start_date=base_date - timedelta(days=1),
+            end_date=base_date + timedelta(days=1),
+        )
+        result = handler.handle_entity_count(query)
+
+        assert result.data == {"active": 1, "archived": 1}
+        assert len(calls) == 1
+        assert calls[0]["group_by"] == ["status"]
+
     def test_handle_entity_count_caching_first_call(
         self, mock_repository, mock_logger, mock_cache
     ):
@@ -353,7 +391,7 @@ class TestAnalyticsQueryHandlerEntityCount:
     ):
         """Test entity count with repository error."""
         mock_repo = Mock()
-        mock_repo.list.side_effect = RepositoryError("Database error")
+        mock_repo.aggregate.side_effect = RepositoryError("Database error")
 
         handler = AnalyticsQueryHandler(mock_repo, mock_logger, mock_cache)
         query = EntityCountQuery(group_by="type")
@@ -367,7 +405,7 @@ class TestAnalyticsQueryHandlerEntityCount:
     ):
         """Test entity count with unexpected error."""
         mock_repo = Mock()
-        mock_repo.list.side_effect = ValueError("Unexpected error")
+        mock_repo.aggregate.side_effect = ValueError("Unexpected error")
 
         handler = AnalyticsQueryHandler(mock_repo, mock_logger, mock_cache)
         query = EntityCountQuery(group_by="type")
@@ -504,7 +542,7 @@ class TestAnalyticsQueryHandlerWorkspaceStats:
     ):
         """Test workspace stats with repository error."""
         mock_repo = Mock()
-        mock_repo.list.side_effect = RepositoryError("Database error")
+        mock_repo.aggregate.side_effect = RepositoryError("Database error")
 
         handler = AnalyticsQueryHandler(mock_repo, mock_logger, mock_cache)
         query = WorkspaceStatsQuery()
@@ -724,7 +762,7 @@ class TestAnalyticsQueryHandlerActivity:
     ):
         """Test activity query with repository error."""
         mock_repo = Mock()
-        mock_repo.list.side_effect = RepositoryError("Database error")
+        mock_repo.aggregate.side_effect = RepositoryError("Database error")
 
         handler = AnalyticsQueryHandler(mock_repo, mock_logger, mock_cache)
         query = ActivityQuery()
@@ -398,6 +398,27 @@ class TestEntityCommandHandler:
         assert update_result.data is not None
         assert "entity_id" in update_result.metadata
 
+    def test_handle_update_entity_stale_revision_conflicts(self, handler):
+        """Should return a conflict when the entity changed since it was read."""
+        create_result = handler.handle_create_entity(
+            CreateEntityCommand(entity_type="workspace", name="Original Name")
+        )
+        entity_id = create_result.data.id
+        assert create_result.data.revision == 0
+
+        first = handler.handle_update_entity(
+            UpdateEntityCommand(entity_id=entity_id, updates={"name": "First"}, expected_revision=0)
+        )
+        assert first.status == ResultStatus.SUCCESS
+        assert first.data.revision == 1
+
+        stale = handler.handle_update_entity(
+            UpdateEntityCommand(entity_id=entity_id, updates={"name": "Second"}, expected_revision=0)
+        )
+        assert stale.status == ResultStatus.CONFLICT
+        assert stale.is_conflict and stale.is_error
+        assert stale.metadata["current_revision"] == 1
+
     def test_handle_update_entity_not_found(self, handler):
         """Should return error when updating non-existent entity."""
         command = UpdateEntityCommand(
@@ -30,7 +30,8 @@ from atoms_mcp.domain.models.entity import (
     DocumentEntity,
     EntityStatus,
 )
-from atoms_mcp.domain.ports.repository import RepositoryError
+from atoms_mcp.domain.ports.pagination import encode_cursor
+from atoms_mcp.domain.ports.repository import CountMode, RepositoryError, SearchMode
 
 from conftest import MockRepository, MockLogger, MockCache
 
@@ -125,6 +126,37 @@ class TestListEntitiesQueryValidation:
         query = ListEntitiesQuery(page=3, page_size=20, offset=100)
         assert query.get_offset() == 100
 
+    def test_validate_rejects_after_and_before(self):
+        """Should reject paging in both directions at once."""
+        cursor = encode_cursor("a", "1")
+        query = ListEntitiesQuery(after=cursor, before=cursor)
+        with pytest.raises(EntityQueryValidationError, match="after and before"):
+            query.validate()
+
+    def test_validate_rejects_cursor_with_page(self):
+        """Should reject mixing cursors with offset pagination."""
+        query = ListEntitiesQuery(after=encode_cursor("a", "1"), page=2)
+        with pytest.raises(EntityQueryValidationError, match="cursor pagination"):
+            query.validate()
+
+    def test_validate_rejects_invalid_columns(self):
+        """Should reject projections naming invalid columns."""
+        query = ListEntitiesQuery(columns=["name;drop"])
+        with pytest.raises(EntityQueryValidationError, match="Invalid column name"):
+            query.validate()
+
+    def test_validate_rejects_columns_with_cursor(self):
+        """Should reject projections combined with cursor pagination."""
+        query = ListEntitiesQuery(keyset=True, columns=["name"])
+        with pytest.raises(EntityQueryValidationError, match="columns"):
+            query.validate()
+
+    def test_validate_rejects_malformed_cursor(self):
+        """Should raise validation error for a cursor that cannot be decoded."""
+        query = ListEntitiesQuery(after="not-a-cursor")
+        with pytest.raises(EntityQueryValidationError, match="Invalid cursor"):
+            query.validate()
+
 
 class TestSearchEntitiesQueryValidation:
     """Tests for SearchEntitiesQuery validation."""
@@ -181,6 +213,15 @@ class TestSearchEntitiesQueryValidation:
         query = SearchEntitiesQuery(query="test", page_size=50, limit=100)
         assert query.get_limit() == 100
 
+    def test_validate_search_mode(self):
+        """Should accept known search modes and reject others."""
+        assert SearchEntitiesQuery(query="test").get_mode() == SearchMode.AUTO
+        SearchEntitiesQuery(query="test", mode="trigram").validate()  # Should not raise
+
+        query = SearchEntitiesQuery(query="test", mode="regex")
+        with pytest.raises(EntityQueryValidationError, match="mode must be one of"):
+            query.validate()
+
 
 class TestCountEntitiesQueryValidation:
     """Tests for CountEntitiesQuery validation."""
@@ -195,6 +236,16 @@ class TestCountEntitiesQueryValidation:
         query = CountEntitiesQuery(filters={"status": "active"})
         query.validate()  # Should not raise
 
+    def test_validate_count_mode(self):
+        """Should default to exact counts and reject unknown count modes."""
+        assert CountEntitiesQuery().get_count_mode() == CountMode.EXACT
+        assert ListEntitiesQuery().get_count_mode() == CountMode.EXACT
+        assert ListEntitiesQuery(count_mode="planned").get_count_mode() == CountMode.PLANNED
+
+        for query in (CountEntitiesQuery(count_mode="fast"), ListEntitiesQuery(count_mode="fast")):
+            with pytest.raises(EntityQueryValidationError, match="count_mode must be one of"):
+                query.validate()
+
 
 class TestEntityQueryHandler:
     """Tests for EntityQueryHandler."""
@@ -394,6 +445,72 @@ class TestEntityQueryHandler:
         assert result.status == ResultStatus.SUCCESS
         assert result.data is not None  # Should find matches
 
+    def test_handle_queries_with_projection(self, handler):
+        """Should return partial DTOs holding only the requested columns."""
+        entity = WorkspaceEntity(name="Python Project", description="Python workspace")
+        handler.entity_service.repository.save(entity)
+
+        got = handler.handle_get_entity(
+            GetEntityQuery(entity_id=entity.id, use_cache=False, columns=["name", "status"])
+        )
+        listed = handler.handle_list_entities(ListEntitiesQuery(columns=["name"]))
+        found = handler.handle_search_entities(
+            SearchEntitiesQuery(
+                query="Python",
+                fields=["name"],
+                columns=["description"],
+                filters={"name": "Python Project"},
+            )
+        )
+
+        assert got.data == {"id": entity.id, "name": "Python Project", "status": "active"}
+        assert listed.data == [{"id": entity.id, "name": "Python Project"}]
+        assert listed.metadata["columns"] == ["name"]
+        assert found.data == [{"id": entity.id, "description": "Python workspace"}]
+
+    def test_handle_search_entities_passes_mode(self, handler):
+        """Should run the search in the requested mode."""
+        entity = WorkspaceEntity(name="Python Project")
+        handler.entity_service.repository.save(entity)
+        repository = handler.entity_service.repository
+        modes = []
+        search_ranked = repository.search_ranked
+
+        def record(query, fields=None, limit=None, mode=SearchMode.AUTO, where=None):
+            modes.append(mode)
+            return search_ranked(query, fields=fields, limit=limit, mode=mode, where=where)
+
+        repository.search_ranked = record
+        result = handler.handle_search_entities(
+            SearchEntitiesQuery(query="Py", fields=["name"], mode="trigram")
+        )
+
+        assert modes == [SearchMode.TRIGRAM]
+        assert [dto.id for dto in result.data] == [entity.id]
+        assert result.metadata["mode"] == "trigram"
+
+    def test_handle_search_entities_with_filter_operators(self, handler):
+        """Should hand operator filters to the repository and reject bad ones."""
+        old = WorkspaceEntity(name="Python Old", created_at=datetime(2020, 1, 1))
+        new = WorkspaceEntity(name="Python New", created_at=datetime(2024, 1, 1))
+        handler.entity_service.repository.save(old)
+        handler.entity_service.repository.save(new)
+
+        result = handler.handle_search_entities(
+            SearchEntitiesQuery(
+                query="Python",
+                fields=["name"],
+                filters={"created_at": {"gte": "2023-01-01"}, "status": "active"},
+            )
+        )
+        invalid = handler.handle_search_entities(
+            SearchEntitiesQuery(query="Python", filters={"created_at": {"in": "2023"}})
+        )
+
+        assert [dto.id for dto in result.data] == [new.id]
+        assert invalid.status == ResultStatus.ERROR
+        assert "Invalid filters" in invalid.error
+
     def test_handle_search_entities_no_results(self, handler):
         """Should handle search with no results."""
         # Create some entities
@@ -491,6 +608,34 @@ class TestQueryResultPagination:
         # Total would be 15, so (2 * 10) = 20, which is >= 15
         assert result.has_more_pages is False
 
+    def test_keyset_walk_forward_and_back(self, handler):
+        """Should visit every entity once with cursors and page back."""
+        for i in range(25):
+            handler.entity_service.repository.save(WorkspaceEntity(name=f"Workspace {i:02d}"))
+
+        seen = []
+        pages = []
+        query = ListEntitiesQuery(page_size=10, order_by="name", keyset=True)
+        while True:
+            result = handler.handle_list_entities(query)
+            assert result.status == ResultStatus.SUCCESS
+            assert result.total_count == 25
+            pages.append(result)
+            seen.extend(dto.name for dto in result.data)
+            if result.next_cursor is None:
+                break
+            query = ListEntitiesQuery(page_size=10, order_by="name", after=result.next_cursor)
+
+        assert seen == [f"Workspace {i:02d}" for i in range(25)]
+        assert pages[0].prev_cursor is None
+        assert [len(page.data) for page in pages] == [10, 10, 5]
+
+        back = handler.handle_list_entities(
+            ListEntitiesQuery(page_size=10, order_by="name", before=pages[2].prev_cursor)
+        )
+        assert [dto.name for dto in back.data] == [dto.name for dto in pages[1].data]
+        assert back.to_dict()["next_cursor"] == back.next_cursor
+
 
 class TestQueryErrorHandling:
     """Tests for query error handling."""
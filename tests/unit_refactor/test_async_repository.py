@@ -0,0 +1,416 @@
+"""
+Unit tests for the async repository port and async domain services.
+
+Tests ThreadedAsyncRepository, AsyncEntityService, AsyncRelationshipService
+and the ``*_async`` application handlers against the in-memory mocks.
+"""
+
+import asyncio
+
+import pytest
+
+from atoms_mcp.application.commands.entity_commands import (
+    CreateEntityCommand,
+    DeleteEntityCommand,
+    EntityCommandHandler,
+    UpdateEntityCommand,
+)
+from atoms_mcp.application.commands.relationship_commands import (
+    CreateRelationshipCommand,
+    RelationshipCommandHandler,
+)
+from atoms_mcp.application.dto import ResultStatus
+from atoms_mcp.application.queries.entity_queries import (
+    EntityQueryHandler,
+    GetEntityQuery,
+    ListEntitiesQuery,
+)
+from atoms_mcp.domain.models.entity import WorkspaceEntity
+from atoms_mcp.domain.models.relationship import RelationType
+from atoms_mcp.domain.ports.async_repository import (
+    AsyncRepository,
+    ThreadedAsyncRepository,
+)
+from atoms_mcp.domain.ports.repository import Repository, RepositoryError
+from atoms_mcp.domain.services.async_entity_service import AsyncEntityService
+from atoms_mcp.domain.services.async_relationship_service import (
+    AsyncRelationshipService,
+)
+from atoms_mcp.domain.services.entity_loader import EntityLoader, batching_window, current_loader
+
+
+class TestThreadedAsyncRepository:
+    """Test the thread-offloading AsyncRepository adapter."""
+
+    def test_is_async_repository(self, mock_repository):
+        """Test adapter implements the async port."""
+        repo = ThreadedAsyncRepository(mock_repository)
+
+        assert isinstance(repo, AsyncRepository)
+        assert repo.repository is mock_repository
+
+    def test_round_trip(self, mock_repository):
+        """Test save/get/exists/count/delete delegate to the sync repository."""
+        repo = ThreadedAsyncRepository(mock_repository)
+        entity = WorkspaceEntity(name="Async Workspace")
+
+        async def run():
+            await repo.save(entity)
+            fetched = await repo.get(entity.id)
+            exists = await repo.exists(entity.id)
+            count = await repo.count()
+            listed = await repo.list(limit=10)
+            found = await repo.search("Async", fields=["name"])
+            deleted = await repo.delete(entity.id)
+            return fetched, exists, count, listed, found, deleted
+
+        fetched, exists, count, listed, found, deleted = asyncio.run(run())
+
+        assert fetched is entity
+        assert exists is True
+        assert count == 1
+        assert listed == [entity]
+        assert found == [entity]
+        assert deleted is True
+        assert mock_repository.get(entity.id) is None
+
+    def test_batch_defaults(self, mock_repository):
+        """Test batch methods fall back to per-item calls on the sync port."""
+        repo = ThreadedAsyncRepository(mock_repository)
+        entities = [WorkspaceEntity(name=f"WS {i}") for i in range(3)]
+
+        async def run():
+            saved = await repo.save_many(entities)
+            fetched = await repo.get_many([entities[2].id, "missing", entities[0].id])
+            deleted = await repo.delete_many([entities[0].id, "missing"])
+            return saved, fetched, deleted
+
+        saved, fetched, deleted = asyncio.run(run())
+
+        assert saved == entities
+        assert fetched == [entities[2], entities[0]]
+        assert deleted == 1
+
+    def test_iter_all_streams_in_pages(self, mock_repository):
+        """Test scans yield every entity once, fetched page by page."""
+        from tests.unit_refactor.conftest import MockRepository
+
+        class KeysetRepository(MockRepository):
+            """Mock repository with a native list_page that records page sizes."""
+
+            def __init__(self):
+                super().__init__()
+                self.pages: list[int] = []
+
+            def list_page(self, filters=None, limit=20, order_by=None, after=None, before=None, where=None):
+                page = Repository.list_page(self, filters, limit, order_by, after, before, where)
+                self.pages.append(len(page.items))
+                return page
+
+        repository = KeysetRepository()
+        entities = [WorkspaceEntity(name=f"WS {i}") for i in range(5)]
+        for entity in entities:
+            repository.add_entity(entity)
+
+        async def run():
+            return [e async for e in ThreadedAsyncRepository(repository).iter_all(page_size=2)]
+
+        expected = sorted(entities, key=lambda e: e.id)
+        assert list(repository.iter_all(page_size=2)) == expected
+        assert repository.pages == [2, 2, 1]
+        assert asyncio.run(run()) == expected
+        assert list(mock_repository.iter_all()) == []
+        with pytest.raises(ValueError):
+            next(repository.iter_all(page_size=0))
+
+
+class TestAsyncEntityService:
+    """Test AsyncEntityService business logic."""
+
+    def test_create_and_get_uses_cache(self, mock_repository, mock_logger, mock_cache):
+        """Test created entities are cached and served from cache."""
+        service = AsyncEntityService(
+            ThreadedAsyncRepository(mock_repository), mock_logger, mock_cache
+        )
+        entity = WorkspaceEntity(name="Cached")
+
+        async def run():
+            await service.create_entity(entity)
+            return await service.get_entity(entity.id)
+
+        result = asyncio.run(run())
+
+        assert result is entity
+        assert mock_cache.get(f"entity:{entity.id}") is entity
+
+    def test_update_missing_entity_returns_none(self, mock_repository, mock_logger):
+        """Test updating an unknown entity returns None."""
+        service = AsyncEntityService(ThreadedAsyncRepository(mock_repository), mock_logger)
+
+        result = asyncio.run(service.update_entity("missing", {"name": "x"}))
+
+        assert result is None
+
+    def test_soft_delete_marks_entity(self, mock_repository, mock_logger):
+        """Test soft delete keeps the row and marks it deleted."""
+        service = AsyncEntityService(ThreadedAsyncRepository(mock_repository), mock_logger)
+        entity = WorkspaceEntity(name="Doomed")
+        mock_repository.add_entity(entity)
+
+        assert asyncio.run(service.delete_entity(entity.id)) is True
+        assert mock_repository.get(entity.id).is_deleted()
+
+    def test_batch_update_and_delete(self, mock_repository, mock_logger):
+        """Test batch update applies changes and batch delete reports found IDs."""
+        service = AsyncEntityService(ThreadedAsyncRepository(mock_repository), mock_logger)
+        entities = [WorkspaceEntity(name=f"WS {i}") for i in range(2)]
+        for entity in entities:
+            mock_repository.add_entity(entity)
+
+        async def run():
+            updated = await service.update_entities(
+                {entity.id: {"description": "bulk"} for entity in entities}
+            )
+            deleted = await service.delete_entities([entities[0].id, "missing"])
+            return updated, deleted
+
+        updated, deleted = asyncio.run(run())
+
+        assert [e.description for e in updated] == ["bulk", "bulk"]
+        assert deleted == [entities[0].id]
+        assert mock_repository.get(entities[0].id).is_deleted()
+
+    def test_concurrent_gets_share_one_fetch(self, mock_repository, mock_logger):
+        """Test concurrent identical reads await a single repository call."""
+        entity = WorkspaceEntity(name="Shared")
+        mock_repository.add_entity(entity)
+        repository = ThreadedAsyncRepository(mock_repository)
+        calls = []
+        original_get = repository.get
+
+        async def slow_get(entity_id):
+            calls.append(entity_id)
+            await asyncio.sleep(0.01)
+            return await original_get(entity_id)
+
+        repository.get = slow_get
+        service = AsyncEntityService(repository, mock_logger)
+
+        async def run():
+            first = asyncio.ensure_future(service.get_entity(entity.id))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await asyncio.gather(*(service.get_entity(entity.id) for _ in range(4)))
+
+        results = asyncio.run(run())
+
+        assert results == [entity] * 4
+        assert calls == [entity.id]
+        assert service.single_flight.stats.coalesced == 4
+        assert service.single_flight.in_flight == 0
+
+    def test_gets_in_one_tick_are_batched_within_a_window(self, mock_repository, mock_logger):
+        """Test per-ID reads issued together in a batching window become one get_many call."""
+        entities = [WorkspaceEntity(name=f"WS {i}") for i in range(3)]
+        for entity in entities:
+            mock_repository.add_entity(entity)
+        repository = ThreadedAsyncRepository(mock_repository)
+        batches = []
+        original_get_many = repository.get_many
+
+        async def recording_get_many(entity_ids):
+            batches.append(list(entity_ids))
+            return await original_get_many(entity_ids)
+
+        repository.get_many = recording_get_many
+        service = AsyncEntityService(repository, mock_logger)
+        ids = [entity.id for entity in entities] + ["missing"]
+
+        async def run():
+            with batching_window():
+                found = await asyncio.gather(*(service.get_entity(entity_id) for entity_id in ids))
+                loader = current_loader(repository)
+                again = await loader.load(entities[0].id)
+            return found, again, loader
+
+        found, again, loader = asyncio.run(run())
+
+        assert found == [*entities, None]
+        assert again is entities[0]
+        assert batches == [ids]
+        assert (loader.batches, loader.loaded) == (1, 4)
+
+    def test_loader_failures_reach_every_caller_and_are_retried(self, mock_logger):
+        """Test a failed batch fails each waiting load and is not memoized."""
+        attempts = []
+
+        class FlakyRepository:
+            async def get_many(self, entity_ids):
+                attempts.append(list(entity_ids))
+                if len(attempts) == 1:
+                    raise RepositoryError("down")
+                return [WorkspaceEntity(id=entity_id, name=entity_id) for entity_id in entity_ids]
+
+        loader = EntityLoader(FlakyRepository())
+
+        async def run():
+            failed = await asyncio.gather(loader.load("a"), loader.load("b"), return_exceptions=True)
+            return failed, await loader.load_many(["a", "b"])
+
+        failed, loaded = asyncio.run(run())
+
+        assert [str(error) for error in failed] == ["down", "down"]
+        assert [entity.id for entity in loaded] == ["a", "b"]
+        assert attempts == [["a", "b"], ["a", "b"]]
+
+
+    def test_loads_after_a_write_in_the_window_read_again(self, mock_repository, mock_logger):
+        """Test creating or updating an entity drops what the window's loader memoized for it."""
+        existing = WorkspaceEntity(name="Before")
+        mock_repository.add_entity(existing)
+        created = WorkspaceEntity(name="Created")
+        repository = ThreadedAsyncRepository(mock_repository)
+        service = AsyncEntityService(repository, mock_logger)
+
+        async def run():
+            with batching_window():
+                missing = await service.get_entity(created.id)
+                await service.get_entity(existing.id)
+                await service.create_entity(created)
+                await service.update_entity(existing.id, {"name": "After"})
+                return missing, await service.get_entity(created.id), await service.get_entity(existing.id)
+
+        missing, found, updated = asyncio.run(run())
+
+        assert missing is None
+        assert found.id == created.id
+        assert updated.name == "After"
+
+    def test_clear_during_a_batch_still_resolves_waiting_loads(self):
+        """Test clearing an ID that is queued or in flight resolves its callers and refetches later loads."""
+        calls = []
+
+        class Repository:
+            async def get_many(self, entity_ids):
+                calls.append(list(entity_ids))
+                batch = len(calls)
+                await asyncio.sleep(0.01)
+                return [WorkspaceEntity(id=entity_id, name=f"{entity_id}{batch}") for entity_id in entity_ids]
+
+        loader = EntityLoader(Repository())
+
+        async def run():
+            first = asyncio.ensure_future(loader.load("a"))
+            while not calls:
+                await asyncio.sleep(0)
+            loader.clear("a")
+            second = await loader.load("a")
+            return await first, second
+
+        first, second = asyncio.run(run())
+
+        assert (first.name, second.name) == ("a1", "a2")
+        assert calls == [["a"], ["a"]]
+
+    def test_drain_waits_for_pending_batches(self):
+        """Test drain dispatches queued loads and waits for the batches in flight."""
+        calls = []
+
+        class Repository:
+            async def get_many(self, entity_ids):
+                await asyncio.sleep(0.01)
+                calls.append(list(entity_ids))
+                return []
+
+        loader = EntityLoader(Repository())
+
+        async def run():
+            pending = [asyncio.ensure_future(loader.load(entity_id)) for entity_id in ("a", "b")]
+            await asyncio.sleep(0)
+            await loader.drain()
+            assert calls == [["a", "b"]]
+            assert not loader._tasks
+            return await asyncio.gather(*pending)
+
+        assert asyncio.run(run()) == [None, None]
+
+class TestAsyncRelationshipService:
+    """Test AsyncRelationshipService business logic."""
+
+    def test_rejects_hierarchical_cycle(self, mock_logger):
+        """Test adding a relationship that closes a hierarchy cycle fails."""
+        from tests.unit_refactor.conftest import MockRepository
+
+        service = AsyncRelationshipService(
+            ThreadedAsyncRepository(MockRepository()), mock_logger
+        )
+
+        async def run():
+            await service.add_relationship("a", "b", RelationType.PARENT_OF)
+            await service.add_relationship("b", "a", RelationType.PARENT_OF)
+
+        with pytest.raises(ValueError, match="cycle"):
+            asyncio.run(run())
+
+
+class TestAsyncHandlers:
+    """Test the async application handler entry points."""
+
+    def test_entity_command_and_query_round_trip(
+        self, mock_repository, mock_logger, mock_cache
+    ):
+        """Test async create, update, get, list and delete handlers."""
+        commands = EntityCommandHandler(mock_repository, mock_logger, mock_cache)
+        queries = EntityQueryHandler(mock_repository, mock_logger, mock_cache)
+
+        async def run():
+            created = await commands.handle_create_entity_async(
+                CreateEntityCommand(entity_type="workspace", name="WS")
+            )
+            entity_id = created.data.id
+            updated = await commands.handle_update_entity_async(
+                UpdateEntityCommand(entity_id=entity_id, updates={"name": "WS2"})
+            )
+            fetched = await queries.handle_get_entity_async(
+                GetEntityQuery(entity_id=entity_id, use_cache=False)
+            )
+            listed = await queries.handle_list_entities_async(ListEntitiesQuery())
+            deleted = await commands.handle_delete_entity_async(
+                DeleteEntityCommand(entity_id=entity_id, soft_delete=False)
+            )
+            return created, updated, fetched, listed, deleted
+
+        created, updated, fetched, listed, deleted = asyncio.run(run())
+
+        assert created.status == ResultStatus.SUCCESS
+        assert updated.data.name == "WS2"
+        assert fetched.data.id == created.data.id
+        assert listed.total_count == 1
+        assert deleted.data is True
+
+    def test_entity_command_validation_error(self, mock_repository, mock_logger):
+        """Test async handlers map validation failures to error results."""
+        commands = EntityCommandHandler(mock_repository, mock_logger)
+
+        result = asyncio.run(
+            commands.handle_create_entity_async(
+                CreateEntityCommand(entity_type="workspace", name="")
+            )
+        )
+
+        assert result.status == ResultStatus.ERROR
+        assert "Validation error" in result.error
+
+    def test_relationship_invalid_type(self, mock_repository, mock_logger):
+        """Test async relationship creation rejects unknown types."""
+        handler = RelationshipCommandHandler(mock_repository, mock_logger)
+
+        result = asyncio.run(
+            handler.handle_create_relationship_async(
+                CreateRelationshipCommand(
+                    source_id="a", target_id="b", relationship_type="bogus"
+                )
+            )
+        )
+
+        assert result.status == ResultStatus.ERROR
@@ -15,12 +15,14 @@ Tests cover:
 
 import pytest
 from datetime import datetime
+from unittest.mock import Mock
 from uuid import uuid4
 
 from atoms_mcp.application.workflows.bulk_operations import (
     BulkCreateEntitiesWorkflow,
     BulkUpdateEntitiesWorkflow,
     BulkDeleteEntitiesWorkflow,
+    BulkStatusUpdateWorkflow,
     BulkOperationsHandler,
     BulkOperationError,
     BulkOperationValidationError,
@@ -32,6 +34,7 @@ from atoms_mcp.application.commands.entity_commands import (
 )
 from atoms_mcp.application.dto import ResultStatus
 from atoms_mcp.domain.models.entity import WorkspaceEntity, ProjectEntity, EntityStatus
+from atoms_mcp.domain.ports.repository import RepositoryError
 from conftest import MockRepository, MockLogger, MockCache
 
 
@@ -438,6 +441,27 @@ class TestBulkUpdateHandler:
         assert result.status == ResultStatus.ERROR
         assert "rolled_back" in result.metadata
 
+    def test_handle_bulk_update_same_entity_in_order(self, handler):
+        """Should apply several commands for one entity in order and validate per entity."""
+        bulk_handler, repository = handler
+        first, second = repository.list()[:2]
+        bulk_handler.entity_handler.entity_service._validate_entity = Mock()
+        commands = [
+            UpdateEntityCommand(entity_id=first.id, updates={"name": "One", "description": "kept"}),
+            UpdateEntityCommand(entity_id=second.id, updates={"name": "Other"}, validate_updates=False),
+            UpdateEntityCommand(entity_id=first.id, updates={"name": "Two"}, validate_updates=False),
+        ]
+
+        result = bulk_handler.handle_bulk_update(BulkUpdateEntitiesWorkflow(updates=commands))
+
+        assert result.status == ResultStatus.SUCCESS
+        assert result.metadata["updated"] == 3
+        stored = repository.get(first.id)
+        assert (stored.name, stored.description) == ("Two", "kept")
+        assert repository.get(second.id).name == "Other"
+        validated = bulk_handler.entity_handler.entity_service._validate_entity.call_args_list
+        assert [call.args[0].id for call in validated] == [first.id]
+
     def test_handle_bulk_update_large_dataset(self, handler):
         """Should handle updating 100+ entities efficiently."""
         bulk_handler, repository = handler
@@ -756,6 +780,204 @@ class TestBulkOperationsErrorHandling:
         assert len(result.data) == 2  # Two valid entities created
 
 
+# =============================================================================
+# BATCHED PERSISTENCE TESTS
+# =============================================================================
+
+
+class CountingRepository(MockRepository):
+    """MockRepository that counts single-row and batch calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = {"save": 0, "save_many": 0, "get_many": 0, "delete_many": 0}
+
+    def save(self, entity):
+        self.calls["save"] += 1
+        return super().save(entity)
+
+    def save_many(self, entities):
+        self.calls["save_many"] += 1
+        return [super(CountingRepository, self).save(entity) for entity in entities]
+
+    def get_many(self, entity_ids):
+        self.calls["get_many"] += 1
+        return [self._store[i] for i in entity_ids if i in self._store]
+
+    def delete_many(self, entity_ids, hard=False):
+        self.calls["delete_many"] += 1
+        return sum(1 for i in entity_ids if self._store.pop(i, None) is not None)
+
+
+class TestBulkOperationsBatching:
+    """Tests that bulk workflows use batch repository calls."""
+
+    def test_bulk_create_uses_one_batch_save(self):
+        """Should persist all entities with a single save_many call."""
+        repository = CountingRepository()
+        handler = BulkOperationsHandler(repository, MockLogger())
+        commands = [
+            CreateEntityCommand(entity_type="workspace", name=f"Workspace {i}")
+            for i in range(20)
+        ]
+
+        result = handler.handle_bulk_create(BulkCreateEntitiesWorkflow(entities=commands))
+
+        assert result.status == ResultStatus.SUCCESS
+        assert repository.calls["save_many"] == 1
+        assert repository.calls["save"] == 0
+
+    def test_bulk_create_transaction_failure_writes_nothing(self):
+        """Should not touch the repository when validation fails in transaction mode."""
+        repository = CountingRepository()
+        handler = BulkOperationsHandler(repository, MockLogger())
+        commands = [
+            CreateEntityCommand(entity_type="workspace", name="Valid"),
+            CreateEntityCommand(entity_type="workspace", name=""),
+        ]
+
+        result = handler.handle_bulk_create(BulkCreateEntitiesWorkflow(entities=commands))
+
+        assert result.status == ResultStatus.ERROR
+        assert repository.calls["save_many"] == 0
+        assert repository.count() == 0
+
+    def test_bulk_create_transaction_commit_failure_writes_nothing(self):
+        """Should leave no entity behind when the batch write fails part way."""
+        repository = CountingRepository()
+        save_many = repository.save_many
+
+        def failing_save_many(entities):
+            save_many(entities[:2])
+            raise RepositoryError("connection lost")
+
+        repository.save_many = failing_save_many
+        handler = BulkOperationsHandler(repository, MockLogger())
+        commands = [
+            CreateEntityCommand(entity_type="workspace", name=f"Workspace {i}")
+            for i in range(5)
+        ]
+
+        result = handler.handle_bulk_create(BulkCreateEntitiesWorkflow(entities=commands))
+
+        assert result.status == ResultStatus.ERROR
+        assert "connection lost" in result.error
+        assert repository.count() == 0
+
+    def test_default_commit_names_entities_it_cannot_roll_back(self):
+        """Should report the entities left changed when undoing a failed batch fails too."""
+        repository = CountingRepository()
+        existing = WorkspaceEntity(name="Existing")
+        repository._store[existing.id] = existing
+        created = WorkspaceEntity(name="Created")
+
+        def failing_save_many(entities):
+            raise RepositoryError("connection lost")
+
+        def failing_delete_many(entity_ids, hard=False):
+            raise RepositoryError("still down")
+
+        repository.save_many = failing_save_many
+        repository.delete_many = failing_delete_many
+
+        with pytest.raises(RepositoryError) as error:
+            with repository.transaction() as batch:
+                batch.update(existing)
+                batch.insert(created)
+
+        assert "could not be rolled back" in str(error.value)
+        assert existing.id in str(error.value) and created.id in str(error.value)
+        assert "connection lost" in str(error.value.__cause__)
+
+    def test_bulk_update_uses_batch_read_and_write(self):
+        """Should load and save targets with batch calls only."""
+        repository = CountingRepository()
+        entities = [WorkspaceEntity(name=f"Workspace {i}") for i in range(10)]
+        for entity in entities:
+            repository._store[entity.id] = entity
+        handler = BulkOperationsHandler(repository, MockLogger())
+        commands = [
+            UpdateEntityCommand(entity_id=entity.id, updates={"description": "batched"})
+            for entity in entities
+        ]
+
+        result = handler.handle_bulk_update(
+            BulkUpdateEntitiesWorkflow(updates=commands, transaction=False)
+        )
+
+        assert result.metadata["updated"] == 10
+        # The second batch read is the snapshot of the repository's default commit
+        assert repository.calls == {"save": 0, "save_many": 1, "get_many": 2, "delete_many": 0}
+        assert all(entity.description == "batched" for entity in entities)
+        assert all(entity.revision == 1 for entity in entities)
+
+    def test_bulk_update_checks_expected_revision(self):
+        """Should write nothing when a command expects a revision the entity no longer has."""
+        repository = CountingRepository()
+        entities = [WorkspaceEntity(name=f"Workspace {i}") for i in range(3)]
+        for entity in entities:
+            repository._store[entity.id] = entity
+        entities[1].revision = 4
+        handler = BulkOperationsHandler(repository, MockLogger())
+        commands = [
+            UpdateEntityCommand(entity_id=entity.id, updates={"description": "stale"}, expected_revision=3)
+            if entity is entities[1]
+            else UpdateEntityCommand(entity_id=entity.id, updates={"description": "stale"})
+            for entity in entities
+        ]
+
+        result = handler.handle_bulk_update(
+            BulkUpdateEntitiesWorkflow(updates=commands, transaction=False)
+        )
+
+        assert result.status == ResultStatus.ERROR
+        assert repository.calls["save_many"] == 0
+        assert all(entity.description != "stale" for entity in entities)
+
+    def test_bulk_hard_delete_uses_batch_delete(self):
+        """Should hard delete with a single delete_many call."""
+        repository = CountingRepository()
+        entities = [WorkspaceEntity(name=f"Workspace {i}") for i in range(5)]
+        for entity in entities:
+            repository._store[entity.id] = entity
+        handler = BulkOperationsHandler(repository, MockLogger())
+
+        result = handler.handle_bulk_delete(
+            BulkDeleteEntitiesWorkflow(
+                entity_ids=[entity.id for entity in entities] + ["missing"],
+                soft_delete=False,
+            )
+        )
+
+        assert result.data["deleted_count"] == 5
+        assert result.data["failed_ids"] == ["missing"]
+        assert repository.calls["delete_many"] == 1
+        assert repository.count() == 0
+
+    def test_bulk_status_update_is_one_set_based_write(self):
+        """Should move all entities with one update_where and no per-entity reads."""
+        repository = CountingRepository()
+        entity_ids = [repository.save(WorkspaceEntity(name=f"Workspace {i}")).id for i in range(5)]
+        repository.update_where = Mock(wraps=repository.update_where)
+        handler = BulkOperationsHandler(repository, MockLogger())
+
+        result = handler.handle_bulk_status_update(
+            BulkStatusUpdateWorkflow(entity_ids=[*entity_ids, "missing"], new_status="archived")
+        )
+
+        assert result.status == ResultStatus.PARTIAL_SUCCESS
+        assert result.data == {"updated_count": 5, "failed_count": 1}
+        assert repository.update_where.call_count == 1
+        assert repository.calls["get_many"] == 0
+        assert all(repository.get(i).status == EntityStatus.ARCHIVED for i in entity_ids)
+
+        invalid = handler.handle_bulk_status_update(
+            BulkStatusUpdateWorkflow(entity_ids=entity_ids, new_status="bogus")
+        )
+        assert invalid.status == ResultStatus.ERROR
+        assert "Validation error" in invalid.error
+
+
 __all__ = [
     "TestBulkCreateWorkflowValidation",
     "TestBulkUpdateWorkflowValidation",
@@ -766,4 +988,5 @@ __all__ = [
     "TestBulkDeleteHandler",
     "TestBulkOperationsPerformance",
     "TestBulkOperationsErrorHandling",
+    "TestBulkOperationsBatching",
 ]
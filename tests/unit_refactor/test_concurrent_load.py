@@ -28,6 +28,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
 from atoms_mcp.domain.models.entity import Entity, EntityStatus, WorkspaceEntity
 from atoms_mcp.domain.models.relationship import Relationship, RelationType
+from atoms_mcp.domain.ports.repository import Repository
 from atoms_mcp.domain.services.entity_service import EntityService
 from atoms_mcp.domain.services.relationship_service import RelationshipService
 from atoms_mcp.infrastructure.di.container import Container
@@ -102,7 +103,7 @@ def executor() -> ConcurrentExecutor:
 # =============================================================================
 
 
-class ThreadSafeMockRepository:
+class ThreadSafeMockRepository(Repository[Entity]):
     """Thread-safe mock repository for concurrent tests."""
 
     def __init__(self):
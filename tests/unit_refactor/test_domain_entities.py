@@ -6,8 +6,8 @@ and edge cases.
 """
 
 import pytest
-from datetime import datetime, timedelta
-from uuid import uuid4
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
 
 from atoms_mcp.domain.models.entity import (
     Entity,
@@ -18,6 +18,7 @@ from atoms_mcp.domain.models.entity import (
     TaskEntity,
     DocumentEntity,
 )
+from atoms_mcp.domain.models.ids import get_id_version, id_timestamp, new_id, set_id_version, uuid7
 
 
 class TestBaseEntity:
@@ -141,6 +142,110 @@ class TestBaseEntity:
         assert entity.metadata["key"] == "new_value"
 
 
+class TestEntityIds:
+    """Test generation of entity IDs."""
+
+    @pytest.fixture(autouse=True)
+    def restore_id_version(self):
+        """Restore the ID version changed by a test."""
+        version = get_id_version()
+        yield
+        set_id_version(version)
+
+    def test_default_ids_are_time_ordered_uuid7(self):
+        """Test new entities get increasing version 7 UUIDs."""
+        ids = [Entity().id for _ in range(1000)]
+
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
+        assert all(UUID(entity_id).version == 7 for entity_id in ids)
+        assert UUID(ids[0]).variant == "specified in RFC 4122"
+
+    def test_id_timestamp(self):
+        """Test the creation time is decoded from version 7 IDs only."""
+        before = datetime.now(timezone.utc) - timedelta(milliseconds=1)
+        created = id_timestamp(Entity().id)
+
+        assert before <= created <= datetime.now(timezone.utc)
+        assert id_timestamp(str(uuid7(timestamp_ms=1_700_000_000_000))) == datetime(
+            2023, 11, 14, 22, 13, 20, tzinfo=timezone.utc
+        )
+        assert id_timestamp(str(uuid4())) is None
+        assert id_timestamp("not-a-uuid") is None
+
+    def test_uuid4_compatibility_mode(self):
+        """Test random version 4 IDs can still be generated."""
+        set_id_version(4)
+
+        assert UUID(new_id()).version == 4
+        assert UUID(Entity().id).version == 4
+
+    def test_unsupported_id_version(self):
+        """Test unsupported ID versions are rejected."""
+        with pytest.raises(ValueError, match="Unsupported ID version"):
+            set_id_version(1)
+
+
+class TestChangeTracking:
+    """Test recording of changed fields."""
+
+    def test_new_entity_counts_every_field_as_changed(self):
+        """Test a constructed entity reports all its fields."""
+        task = TaskEntity(title="Task")
+
+        assert {"id", "title", "status", "tags"} <= task.changed_fields
+
+    def test_assignments_are_recorded_after_mark_clean(self):
+        """Test only fields assigned since mark_clean are changes."""
+        task = TaskEntity(title="Task")
+        task.mark_clean()
+        assert task.get_changes() == {}
+
+        task.title = "Renamed"
+        task.complete()
+
+        changes = task.get_changes()
+        assert set(changes) == {"title", "status", "updated_at"}
+        assert changes["status"] == EntityStatus.COMPLETED
+
+    def test_in_place_edits_through_methods_are_recorded(self):
+        """Test list and dict fields edited by entity methods are changes."""
+        task = TaskEntity(title="Task")
+        task.mark_clean()
+
+        task.add_dependency("other")
+        task.set_metadata("key", "value")
+
+        assert task.changed_fields == {"dependencies", "metadata", "updated_at"}
+
+    def test_only_dataclass_fields_are_recorded(self):
+        """Test assignments of other attributes are not changes."""
+        task = TaskEntity(title="Task")
+        task.mark_clean()
+
+        task.note = "scratch"
+        task._cached = True
+
+        assert task.changed_fields == frozenset()
+
+    def test_decoded_entity_starts_clean(self):
+        """Test an entity decoded from a stored row has no changes."""
+        from atoms_mcp.infrastructure.serialization.codecs import get_codec
+
+        codec = get_codec(TaskEntity)
+        task = codec.decode(codec.encode(TaskEntity(title="Task", project_id="p1")))
+
+        assert task.changed_fields == frozenset()
+
+    def test_change_tracking_does_not_affect_equality(self):
+        """Test tracked changes are not part of the dataclass fields."""
+        entity = Entity(id="same", created_at=datetime(2024, 1, 1), updated_at=datetime(2024, 1, 1))
+        other = Entity(id="same", created_at=datetime(2024, 1, 1), updated_at=datetime(2024, 1, 1))
+        entity.mark_clean()
+
+        assert entity == other
+
+
 class TestWorkspaceEntity:
     """Test WorkspaceEntity class."""
 
@@ -5,6 +5,9 @@ Tests EntityService, RelationshipService, and WorkflowService with full
 error handling, caching, and logging verification.
 """
 
+import threading
+import time
+
 import pytest
 from datetime import datetime
 from unittest.mock import Mock
@@ -18,7 +21,22 @@ from atoms_mcp.domain.models.entity import (
     TaskEntity,
 )
 from atoms_mcp.domain.services.entity_service import EntityService
-from atoms_mcp.domain.ports.repository import RepositoryError
+from atoms_mcp.domain.services.single_flight import SingleFlight, flight_key
+from atoms_mcp.domain.ports.aggregation import AggregateFunc, Metric, TimeBucket, aggregate_items
+from atoms_mcp.domain.ports.filters import (
+    and_,
+    contains,
+    eq,
+    gte,
+    ilike,
+    in_,
+    is_null,
+    lt,
+    neq,
+    or_,
+    parse_filters,
+)
+from atoms_mcp.domain.ports.repository import ConcurrencyError, CountMode, RepositoryError
 
 
 class TestEntityService:
@@ -186,6 +204,34 @@ class TestEntityService:
         assert result.description == "New description"
         assert mock_repository.save_called
 
+    def test_update_entity_patches_only_changed_fields(self, mock_repository, mock_logger):
+        """Test entity update writes just the changed fields."""
+        service = EntityService(mock_repository, mock_logger)
+        entity = WorkspaceEntity(name="Original Name")
+        mock_repository.add_entity(entity)
+        mock_repository.patch = Mock(wraps=mock_repository.patch)
+
+        service.update_entity(entity.id, {"name": "Updated Name"})
+        service.archive_entity(entity.id)
+
+        first, second = (call.args for call in mock_repository.patch.call_args_list)
+        assert first[0] == entity.id and set(first[1]) == {"name", "updated_at"}
+        assert set(second[1]) == {"status", "updated_at"}
+
+    def test_status_transitions_write_without_reading(self, mock_repository, mock_logger):
+        """Test archive and restore are a single patch, with no read first."""
+        service = EntityService(mock_repository, mock_logger)
+        entity = WorkspaceEntity(name="Test")
+        mock_repository.get = Mock(wraps=mock_repository.get)
+        mock_repository.patch = Mock(return_value=entity)
+
+        assert service.archive_entity(entity.id) is entity
+        assert service.restore_entity(entity.id) is entity
+
+        statuses = [call.args[1]["status"] for call in mock_repository.patch.call_args_list]
+        assert statuses == [EntityStatus.ARCHIVED, EntityStatus.ACTIVE]
+        mock_repository.get.assert_not_called()
+
     def test_update_entity_not_found(self, mock_repository, mock_logger):
         """Test updating non-existent entity."""
         service = EntityService(mock_repository, mock_logger)
@@ -209,6 +255,61 @@ class TestEntityService:
         warnings = mock_logger.get_logs("WARNING")
         assert any("does not exist" in log["message"] for log in warnings)
 
+    def test_update_entity_skips_non_field_attributes(self, mock_repository, mock_logger):
+        """Test updates naming methods or properties are skipped, not assigned."""
+        service = EntityService(mock_repository, mock_logger)
+        entity = WorkspaceEntity(name="Test")
+        mock_repository.add_entity(entity)
+
+        result = service.update_entity(entity.id, {"archive": "value", "changed_fields": "value"})
+
+        assert callable(result.archive)
+        assert result.status == EntityStatus.ACTIVE
+        warnings = mock_logger.get_logs("WARNING")
+        assert sum("does not exist" in log["message"] for log in warnings) == 2
+
+    @pytest.mark.parametrize("field", ["id", "revision"])
+    def test_update_entity_rejects_protected_fields(self, mock_repository, mock_logger, field):
+        """Test updates of the ID or revision fail before the entity is read."""
+        service = EntityService(mock_repository, mock_logger)
+        entity = WorkspaceEntity(name="Test")
+        mock_repository.add_entity(entity)
+        mock_repository.get = Mock(wraps=mock_repository.get)
+
+        with pytest.raises(ValueError, match=field):
+            service.update_entity(entity.id, {field: 5, "name": "Renamed"})
+        with pytest.raises(ValueError, match=field):
+            service.update_entities({entity.id: {field: 5}})
+
+        mock_repository.get.assert_not_called()
+        assert mock_repository.get(entity.id).name == "Test"
+
+    @pytest.mark.parametrize("atomic", [False, True])
+    def test_update_entities_writes_conditionally(self, mock_repository, mock_logger, atomic):
+        """Test a batch update retries a concurrent change unless it is atomic."""
+        service = EntityService(mock_repository, mock_logger)
+        entity = WorkspaceEntity(name="Test")
+        mock_repository.add_entity(entity)
+        commit = mock_repository.commit
+        writes = []
+
+        def racing_commit(batch):
+            writes.append([(write.entity_id, write.expected_revision) for write in batch.writes])
+            if len(writes) == 1:
+                raise ConcurrencyError(entity.id, 0, 1)
+            return commit(batch)
+
+        mock_repository.commit = racing_commit
+
+        if atomic:
+            with pytest.raises(ConcurrencyError):
+                service.update_entities({entity.id: {"name": "Renamed"}}, atomic=True)
+            assert writes == [[(entity.id, 0)]]
+        else:
+            updated = service.update_entities({entity.id: {"name": "Renamed"}})
+            assert [e.name for e in updated] == ["Renamed"]
+            assert writes == [[(entity.id, 0)], [(entity.id, 0)]]
+
     def test_update_entity_invalidates_cache(
         self, mock_repository, mock_logger, mock_cache
     ):
@@ -377,6 +478,24 @@ class TestEntityService:
 
         assert len(result) <= 3
 
+    def test_search_and_iter_entities_with_where(self, mock_repository, mock_logger):
+        """Test filter expressions narrow searches and scans."""
+        service = EntityService(mock_repository, mock_logger)
+        active = ProjectEntity(name="Active Project", priority=1)
+        archived = ProjectEntity(name="Archived Project", status=EntityStatus.ARCHIVED, priority=1)
+        for i in range(3):
+            mock_repository.add_entity(ProjectEntity(name=f"Other {i}", priority=5))
+        mock_repository.add_entity(active)
+        mock_repository.add_entity(archived)
+
+        found = service.search_entities(
+            "Project", fields=["name"], limit=1, where=eq("status", "active")
+        )
+        scanned = list(service.iter_entities(where=lt("priority", 3), page_size=2))
+
+        assert [entity.id for entity in found] == [active.id]
+        assert {entity.id for entity in scanned} == {active.id, archived.id}
+
     def test_count_entities_no_filters(self, mock_repository, mock_logger):
         """Test counting all entities."""
         service = EntityService(mock_repository, mock_logger)
@@ -408,6 +527,21 @@ class TestEntityService:
 
         assert count == 3
 
+    def test_count_entities_modes(self, mock_repository, mock_logger, mock_cache):
+        """Test planned counts use the estimate and cached counts are reused."""
+        service = EntityService(mock_repository, mock_logger, mock_cache)
+        mock_repository.count_planned = Mock(return_value=1000)
+        mock_repository.add_entity(WorkspaceEntity(name="First"))
+
+        assert service.count_entities(mode=CountMode.PLANNED) == 1000
+        assert service.count_entities(mode=CountMode.CACHED) == 1
+
+        mock_repository.add_entity(WorkspaceEntity(name="Second"))
+
+        assert service.count_entities(mode=CountMode.CACHED) == 1
+        assert service.count_entities(mode=CountMode.EXACT) == 2
+        assert service.count_entities({"status": "active"}, mode=CountMode.CACHED) == 2
+
     def test_archive_entity_success(self, mock_repository, mock_logger):
         """Test archiving entity."""
         service = EntityService(mock_repository, mock_logger)
@@ -533,3 +667,185 @@ class TestEntityService:
 # Additional test classes for RelationshipService and WorkflowService
 # would follow similar patterns with comprehensive coverage of all methods,
 # error paths, caching behavior, and logging.
+
+
+class TestFilterExpressions:
+    """Test filter expression parsing and in-memory evaluation."""
+
+    def test_conditions_match_like_sql(self):
+        """Test each operator, with comparisons against null never matching."""
+        row = {
+            "status": "active",
+            "priority": 2,
+            "name": "Quarterly Report",
+            "created_at": datetime(2024, 3, 1),
+            "metadata": {"entity_type": "task", "tags": ["a", "b"]},
+            "owner": None,
+        }
+
+        assert eq("status", "active").matches(row)
+        assert neq("status", "archived").matches(row)
+        assert in_("priority", [1, 2]).matches(row)
+        assert gte("created_at", "2024-01-01").matches(row)
+        assert not lt("priority", 2).matches(row)
+        assert ilike("name", "%report").matches(row)
+        assert is_null("owner").matches(row)
+        assert not is_null("name").matches(row)
+        assert not neq("owner", "someone").matches(row)
+        assert contains("metadata", {"tags": ["b"]}).matches(row)
+        assert and_(eq("status", "active"), or_(eq("priority", 9), ilike("name", "q%"))).matches(row)
+
+    def test_parse_filters(self):
+        """Test plain values, operator maps and nested groups."""
+        where = parse_filters(
+            {
+                "status": "active",
+                "owner": None,
+                "priority": {"gte": 1, "lt": 3},
+                "or": [{"name": {"ilike": "%report%"}}, {"type": "task"}],
+            }
+        )
+
+        assert where == and_(
+            eq("status", "active"),
+            gte("priority", 1),
+            lt("priority", 3),
+            or_(ilike("name", "%report%"), eq("type", "task")),
+        )
+        assert parse_filters({}) is None
+        assert parse_filters({"metadata": {"team": "core"}}) == eq("metadata", {"team": "core"})
+
+    def test_parse_filters_rejects_invalid_input(self):
+        """Test bad field names, operands and groups raise ValueError."""
+        for filters in (
+            {"bad name": 1},
+            {"status": {"in": "active"}},
+            {"or": {"status": "active"}},
+            ["status"],
+        ):
+            with pytest.raises(ValueError):
+                parse_filters(filters)
+
+
+class TestAggregation:
+    """Test in-memory aggregation used by repositories without GROUP BY."""
+
+    def test_group_by_with_metrics(self):
+        """Test grouping by a column and a JSON path with several metrics."""
+        entities = [
+            ProjectEntity(name="A", priority=1, metadata={"entity_type": "project"}),
+            ProjectEntity(name="B", priority=3, metadata={"entity_type": "project"}),
+            ProjectEntity(name="C", priority=5, status=EntityStatus.ARCHIVED),
+        ]
+
+        rows = aggregate_items(
+            entities,
+            group_by=["status", "metadata.entity_type"],
+            metrics=[Metric(), Metric(AggregateFunc.AVG, "priority"), Metric("max", "priority")],
+        )
+
+        assert rows == [
+            {"status": "active", "metadata.entity_type": "project", "count": 2,
+             "avg_priority": 2, "max_priority": 3},
+            {"status": "archived", "metadata.entity_type": None, "count": 1,
+             "avg_priority": 5, "max_priority": 5},
+        ]
+
+    def test_time_buckets_and_empty_input(self):
+        """Test date_trunc-style buckets and the single row of an ungrouped aggregate."""
+        entities = [
+            WorkspaceEntity(name="A", created_at=datetime(2024, 1, 3, 10, 30)),
+            WorkspaceEntity(name="B", created_at=datetime(2024, 1, 7, 23, 0)),
+            WorkspaceEntity(name="C", created_at=datetime(2024, 1, 8, 0, 0)),
+        ]
+
+        weekly = aggregate_items(entities, time_bucket=TimeBucket.WEEK)
+
+        assert weekly == [
+            {"bucket": "2024-01-01T00:00:00", "count": 2},
+            {"bucket": "2024-01-08T00:00:00", "count": 1},
+        ]
+        assert aggregate_items([]) == [{"count": 0}]
+        assert aggregate_items([], group_by=["status"]) == []
+
+    def test_invalid_metric_and_group_key(self):
+        """Test metrics other than count need a field and keys must be identifiers."""
+        with pytest.raises(ValueError):
+            Metric(AggregateFunc.SUM)
+        with pytest.raises(ValueError):
+            aggregate_items([], group_by=["metadata.a.b"])
+
+
+class TestSingleFlight:
+    """Test coalescing of concurrent identical reads."""
+
+    def _run_concurrently(self, flight, calls, target):
+        """Start ``calls`` threads running ``target`` and release them once all but one wait."""
+        results, errors = [], []
+
+        def worker():
+            try:
+                results.append(target())
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(calls)]
+        for thread in threads:
+            thread.start()
+        deadline = time.monotonic() + 5
+        while flight.stats.calls < calls and time.monotonic() < deadline:
+            time.sleep(0.001)
+        return threads, results, errors
+
+    def test_concurrent_gets_share_one_fetch(self, mock_logger, mock_cache):
+        """Test parallel cache misses issue one repository read and one cache fill."""
+        entity = WorkspaceEntity(name="Shared")
+        release = threading.Event()
+        repository = Mock()
+        repository.get.side_effect = lambda entity_id: release.wait(5) and entity
+        service = EntityService(repository, mock_logger, mock_cache)
+
+        threads, results, errors = self._run_concurrently(
+            service.single_flight, 5, lambda: service.get_entity(entity.id)
+        )
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert errors == []
+        assert results == [entity] * 5
+        repository.get.assert_called_once_with(entity.id)
+        assert service.single_flight.stats.to_dict() == {
+            "calls": 5,
+            "executed": 1,
+            "coalesced": 4,
+            "coalesced_by_operation": {"get": 4},
+        }
+        assert service.single_flight.in_flight == 0
+
+    def test_errors_are_shared_and_not_remembered(self):
+        """Test waiters receive the leader's error and later calls fetch again."""
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def failing():
+            release.wait(5)
+            raise RepositoryError("down")
+
+        threads, results, errors = self._run_concurrently(
+            flight, 3, lambda: flight.do("get:x", failing)
+        )
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert results == []
+        assert [str(e) for e in errors] == ["down"] * 3
+        assert flight.do("get:x", lambda: "fresh") == "fresh"
+        assert flight.stats.executed == 2
+
+    def test_flight_key_depends_on_operation_and_arguments(self):
+        """Test keys are equal only for the same operation and arguments."""
+        assert flight_key("list", {"a": 1, "b": 2}, 10) == flight_key("list", {"b": 2, "a": 1}, 10)
+        assert flight_key("list", {"a": 1}, 10) != flight_key("list", {"a": 1}, 20)
+        assert flight_key("count", {"a": 1}) != flight_key("list", {"a": 1})
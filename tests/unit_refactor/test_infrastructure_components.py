@@ -10,12 +10,18 @@ Tests cover:
 - Dependency providers
 """
 
+import asyncio
 import time
 from pathlib import Path
 from typing import Any, Optional
 
 import pytest
 
+from atoms_mcp.domain.models.entity import WorkspaceEntity
+from atoms_mcp.domain.models.ids import get_id_version
+from atoms_mcp.domain.ports.repository import Repository
+from atoms_mcp.domain.services.entity_loader import current_loader
+from atoms_mcp.domain.services.unit_of_work import current_unit_of_work
 from atoms_mcp.infrastructure.cache.provider import (
     InMemoryCacheProvider,
     create_cache_provider,
@@ -34,6 +40,7 @@ from atoms_mcp.infrastructure.config.settings import (
     LoggingSettings,
     MCPServerSettings,
     Settings,
+    StorageSettings,
     VertexAISettings,
     WorkOSSettings,
     get_settings,
@@ -354,6 +361,14 @@ class TestDIContainerBasics:
         container.initialize()
         assert container._initialized is True
 
+    def test_initialize_leaves_id_version_alone(self, container):
+        """Should not change the process-wide ID version (set once at startup)."""
+        settings = Settings(storage=StorageSettings(id_version=4))
+
+        container.initialize(settings)
+
+        assert get_id_version() == 7
+
     def test_register_singleton(self, container):
         """Should register and retrieve singleton."""
         container.initialize()
@@ -578,6 +593,73 @@ class TestDIScope:
         scope.__exit__(None, None, None)
         assert len(scope._scoped_instances) == 0
 
+    def test_scope_is_loader_batching_window(self, container):
+        """Should batch get-by-ID reads made inside the scope and stop batching after exit."""
+        calls = []
+
+        class Repository:
+            async def get_many(self, entity_ids):
+                calls.append(list(entity_ids))
+                return [WorkspaceEntity(id=entity_id, name=entity_id) for entity_id in entity_ids]
+
+        repository = Repository()
+
+        async def run():
+            async with container.create_scope() as scope:
+                assert current_loader(repository) is scope.loader(repository)
+                entities = await asyncio.gather(*(current_loader(repository).load(i) for i in ("a", "b", "a")))
+            return entities, current_loader(repository)
+
+        entities, loader_after_exit = asyncio.run(run())
+
+        assert [entity.id for entity in entities] == ["a", "b", "a"]
+        assert calls == [["a", "b"]]
+        assert loader_after_exit is None
+
+    def test_scope_commits_unit_of_work_on_exit(self, container):
+        """Should queue writes made inside the scope and commit them on a clean exit only."""
+
+        class DictRepository(Repository):
+            def __init__(self):
+                self.rows = {}
+
+            def save(self, entity):
+                self.rows[entity.id] = entity
+                return entity
+
+            def get(self, entity_id):
+                return self.rows.get(entity_id)
+
+            def delete(self, entity_id):
+                return self.rows.pop(entity_id, None) is not None
+
+            def list(self, filters=None, limit=None, offset=None, order_by=None):
+                return list(self.rows.values())
+
+            def search(self, query, fields=None, limit=None):
+                return []
+
+            def count(self, filters=None):
+                return len(self.rows)
+
+            def exists(self, entity_id):
+                return entity_id in self.rows
+
+        repository = DictRepository()
+
+        with container.create_scope() as scope:
+            assert current_unit_of_work() is scope.unit
+            scope.unit.bind(repository).save(WorkspaceEntity(id="kept", name="Kept"))
+            assert repository.get("kept") is None
+        assert repository.get("kept").name == "Kept"
+        assert current_unit_of_work() is None
+
+        with pytest.raises(RuntimeError):
+            with container.create_scope() as scope:
+                scope.unit.bind(repository).save(WorkspaceEntity(id="dropped", name="Dropped"))
+                raise RuntimeError("request failed")
+        assert repository.get("dropped") is None
+
 
 class TestGlobalContainer:
     """Tests for global container instance."""
@@ -0,0 +1,208 @@
+"""
+Tests for the MCP request middleware.
+
+Covers the consistency session opened per tool call (writes pin the
+calling client only, the token is returned in the tool result, and a
+token sent back in the request meta restores the pin) and the request
+scope each tool call runs in.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from fastmcp import Client, FastMCP
+
+from atoms_mcp.adapters.primary.mcp.middleware import CONSISTENCY_TOKEN_KEY, RequestScopeMiddleware
+from atoms_mcp.adapters.primary.mcp.server import create_server
+from atoms_mcp.adapters.secondary.memory import InMemoryRepository
+from atoms_mcp.adapters.secondary.supabase.routing import ReadRouter, consistency_session
+from atoms_mcp.domain.models.entity import WorkspaceEntity
+from atoms_mcp.domain.ports.async_repository import ThreadedAsyncRepository
+from atoms_mcp.domain.services.async_entity_service import AsyncEntityService
+from atoms_mcp.domain.services.entity_loader import current_loader
+from atoms_mcp.domain.services.unit_of_work import AsyncUnitOfWorkRepository, current_unit_of_work
+
+
+@pytest.fixture
+def router():
+    """Read router shared by the test tools."""
+    return ReadRouter(replica_count=1, pin_window=60)
+
+
+@pytest.fixture
+def mcp(router):
+    """FastMCP server with one writing and one reading tool."""
+    server = FastMCP("test")
+    server.add_middleware(RequestScopeMiddleware())
+
+    @server.tool
+    def write() -> dict:
+        router.record_write()
+        return {"written": True}
+
+    @server.tool
+    def read() -> dict:
+        return {"pinned": router.is_pinned()}
+
+    return server
+
+
+def run(coro):
+    """Run a coroutine to completion."""
+    return asyncio.run(coro)
+
+
+class TestConsistencySession:
+    """Every tool call runs in the session of its client."""
+
+    def test_write_returns_token_and_pins_client(self, mcp):
+        """
+        Given a client that calls a writing tool
+        When it reads afterwards
+        Then the write result carries a token and the read is pinned
+        """
+
+        async def scenario():
+            async with Client(mcp) as client:
+                before = await client.call_tool("read", {})
+                written = await client.call_tool("write", {})
+                after = await client.call_tool("read", {})
+            return before, written, after
+
+        before, written, after = run(scenario())
+
+        assert before.structured_content == {"pinned": False}
+        assert written.structured_content["written"] is True
+        assert written.structured_content[CONSISTENCY_TOKEN_KEY]
+        assert after.structured_content["pinned"] is True
+
+    def test_other_clients_are_not_pinned(self, mcp):
+        """
+        Given one client that has written
+        When another client reads
+        Then the other client is not pinned
+        """
+
+        async def scenario():
+            async with Client(mcp) as writer, Client(mcp) as reader:
+                await writer.call_tool("write", {})
+                return await reader.call_tool("read", {})
+
+        result = run(scenario())
+
+        assert result.structured_content == {"pinned": False}
+
+    def test_token_in_request_meta_restores_pin(self, mcp):
+        """
+        Given a token returned by another server process
+        When a new client sends it in the request meta
+        Then its reads are pinned
+        """
+        other = ReadRouter(replica_count=1, pin_window=60)
+        with consistency_session("elsewhere"):
+            token = other.record_write().encode()
+
+        async def scenario():
+            async with Client(mcp) as client:
+                plain = await client.call_tool("read", {})
+                carried = await client.session.call_tool("read", {}, meta={CONSISTENCY_TOKEN_KEY: token})
+            return plain, carried
+
+        plain, carried = run(scenario())
+
+        assert plain.structured_content == {"pinned": False}
+        assert carried.structuredContent["pinned"] is True
+
+
+class TestRequestScope:
+    """Every tool call runs in its own request scope."""
+
+    def test_loads_in_a_tool_call_are_batched_per_call(self):
+        """
+        Given a tool that loads several entities by ID
+        When it is called twice
+        Then each call reads its entities with one batch of its own
+        """
+        batches = []
+
+        class Repository:
+            async def get_many(self, entity_ids):
+                batches.append(list(entity_ids))
+                return [WorkspaceEntity(id=entity_id, name=entity_id) for entity_id in entity_ids]
+
+        repository = Repository()
+        server = FastMCP("test")
+        server.add_middleware(RequestScopeMiddleware())
+
+        @server.tool
+        async def names(ids: list[str]) -> dict:
+            loader = current_loader(repository)
+            entities = await asyncio.gather(*(loader.load(entity_id) for entity_id in ids))
+            return {"names": [entity.name for entity in entities]}
+
+        async def scenario():
+            async with Client(server) as client:
+                first = await client.call_tool("names", {"ids": ["a", "b", "a"]})
+                second = await client.call_tool("names", {"ids": ["a"]})
+            return first, second
+
+        first, second = run(scenario())
+
+        assert first.structured_content == {"names": ["a", "b", "a"]}
+        assert second.structured_content == {"names": ["a"]}
+        assert batches == [["a", "b"], ["a"]]
+        assert current_loader(repository) is None
+
+    def test_tool_calls_run_in_a_unit_of_work(self, mock_logger):
+        """
+        Given a tool that updates an entity twice through an async service
+        When it is called
+        Then the service works on the unit's view and one commit follows the call
+        """
+        repository = InMemoryRepository()
+        repository.save(WorkspaceEntity(id="ws", name="Before"))
+        service = AsyncEntityService(ThreadedAsyncRepository(repository), mock_logger)
+        server = FastMCP("test")
+        server.add_middleware(RequestScopeMiddleware())
+
+        @server.tool
+        async def rename(name: str) -> dict:
+            assert isinstance(service.repository, AsyncUnitOfWorkRepository)
+            await service.update_entity("ws", {"name": name})
+            await service.update_entity("ws", {"description": "renamed"})
+            return {"pending": current_unit_of_work().pending, "stored": repository.get("ws").name}
+
+        async def scenario():
+            async with Client(server) as client:
+                return await client.call_tool("rename", {"name": "After"})
+
+        result = run(scenario())
+
+        assert result.structured_content == {"pending": 1, "stored": "Before"}
+        stored = repository.get("ws")
+        assert (stored.name, stored.description, stored.revision) == ("After", "renamed", 1)
+
+    def test_tool_writes_commit_with_the_request(self, monkeypatch):
+        """
+        Given the server on the memory backend
+        When a client creates and updates an entity
+        Then each write is committed before its response, which shows the stored revision
+        """
+        monkeypatch.setenv("STORAGE_BACKEND", "memory")
+        server = create_server(use_cache=False)
+
+        async def scenario():
+            async with Client(server.mcp) as client:
+                created = await client.call_tool("create_entity", {"entity_type": "workspace", "name": "W"})
+                entity_id = created.structured_content["data"]["id"]
+                updated = await client.call_tool("update_entity", {"entity_id": entity_id, "updates": {"name": "W2"}})
+                loaded = await client.call_tool("get_entity", {"entity_id": entity_id})
+            return entity_id, updated.structured_content["data"], loaded.structured_content["data"]
+
+        entity_id, updated, loaded = run(scenario())
+
+        assert (updated["name"], updated["revision"]) == ("W2", 1)
+        assert (loaded["name"], loaded["revision"]) == ("W2", 1)
+        assert server.entity_repository.get(entity_id).revision == 1
@@ -15,6 +15,7 @@ This module tests the FastMCP server implementation including:
 Estimated tests: 42 tests for complete coverage
 """
 
+import asyncio
 import pytest
 import os
 import sys
@@ -22,11 +23,16 @@ from unittest.mock import Mock, MagicMock, patch, call, ANY
 from datetime import datetime
 from uuid import uuid4
 
+from mcp.shared.exceptions import McpError
+from mcp.types import INVALID_PARAMS, ErrorData
+
 from atoms_mcp.adapters.primary.mcp.server import (
     AtomsServer,
     create_server,
     main,
 )
+from atoms_mcp.adapters.secondary.memory import InMemoryRepository
+from atoms_mcp.domain.models.entity import Entity
 
 
 # =============================================================================
@@ -200,8 +206,7 @@ class TestRepositoryInitialization:
         # Check entity repository
         entity_call = mock_supabase_repo.call_args_list[0]
         assert entity_call[1]["table_name"] == "entities"
-        assert entity_call[1]["supabase_url"] == "https://test.supabase.co"
-        assert entity_call[1]["supabase_key"] == "test_key"
+        assert entity_call[1]["entity_type"] is Entity
 
         # Check relationship repository
         rel_call = mock_supabase_repo.call_args_list[1]
@@ -419,19 +424,16 @@ class TestErrorHandling:
     @patch('atoms_mcp.adapters.primary.mcp.server.FastMCP')
     @patch('atoms_mcp.adapters.primary.mcp.server.SupabaseRepository')
     def test_handle_request_error(self, mock_repo, mock_fastmcp_class):
-        """Test handling RequestError."""
-        from fastmcp.exceptions import RequestError
-
+        """Test handling McpError."""
         mock_fastmcp_class.return_value = MagicMock()
         server = AtomsServer()
 
-        error = RequestError("Invalid request")
-        error.code = "INVALID_PARAMS"
+        error = McpError(ErrorData(code=INVALID_PARAMS, message="Invalid request"))
         result = server.handle_error(error)
 
         assert result["error"] == "request_error"
         assert result["message"] == "Invalid request"
-        assert result["code"] == "INVALID_PARAMS"
+        assert result["code"] == INVALID_PARAMS
 
     @patch('atoms_mcp.adapters.primary.mcp.server.FastMCP')
     @patch('atoms_mcp.adapters.primary.mcp.server.SupabaseRepository')
@@ -465,13 +467,12 @@ class TestErrorHandling:
     @patch('atoms_mcp.adapters.primary.mcp.server.FastMCP')
     @patch('atoms_mcp.adapters.primary.mcp.server.SupabaseRepository')
     def test_handle_error_without_code_attribute(self, mock_repo, mock_fastmcp_class):
-        """Test handling RequestError without code attribute."""
-        from fastmcp.exceptions import RequestError
-
+        """Test handling McpError without error data."""
         mock_fastmcp_class.return_value = MagicMock()
         server = AtomsServer()
 
-        error = RequestError("Simple error")
+        error = McpError(ErrorData(code=INVALID_PARAMS, message="Simple error"))
+        error.error = None
         result = server.handle_error(error)
 
         assert result["error"] == "request_error"
@@ -523,6 +524,17 @@ class TestCreateServer:
 
         assert server.cache is None
 
+    def test_create_server_with_memory_backend(self, monkeypatch):
+        """Test create_server builds a working server on the memory backend."""
+        monkeypatch.setenv("STORAGE_BACKEND", "memory")
+
+        server = create_server()
+
+        assert isinstance(server.entity_repository, InMemoryRepository)
+        assert isinstance(server.workflow_repository, InMemoryRepository)
+        tools = asyncio.run(server.mcp.get_tools())
+        assert {"create_entity", "get_entity", "create_relationship"} <= set(tools)
+
 
 # =============================================================================
 # TEST MAIN FUNCTION
@@ -0,0 +1,238 @@
+"""
+Tests for the indexed in-memory repository adapter.
+
+Covers the Repository port contract (writes, soft deletes, filtering,
+ordering, pagination, search, aggregation) and checks that indexed
+filters and ordered listings only visit the matching entities.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from atoms_mcp.adapters.secondary.memory import HashIndex, InMemoryRepository, SortedIndex
+from atoms_mcp.domain.models.entity import EntityStatus, ProjectEntity, TaskEntity
+from atoms_mcp.domain.ports.aggregation import Metric
+from atoms_mcp.domain.ports.filters import and_, eq, gte, ilike, in_, is_null, lt, or_
+from atoms_mcp.domain.ports.repository import ConcurrencyError, RepositoryError
+
+
+def _task(index: int, project: str = "p1", **kwargs) -> TaskEntity:
+    base = datetime(2024, 1, 1)
+    kwargs.setdefault("created_at", base + timedelta(days=index))
+    return TaskEntity(id=f"task-{index:03d}", title=f"Task {index}", project_id=project, **kwargs)
+
+
+@pytest.fixture
+def repository() -> InMemoryRepository[TaskEntity]:
+    repo: InMemoryRepository[TaskEntity] = InMemoryRepository(sorted_indexes=("created_at", "priority"))
+    for index in range(10):
+        repo.save(_task(index, project="p1" if index % 2 else "p2", priority=index % 5 + 1))
+    return repo
+
+
+class TestWrites:
+    """Saves, write modes and deletes."""
+
+    def test_save_get_exists(self, repository):
+        assert repository.get("task-003").title == "Task 3"
+        assert repository.exists("task-003")
+        assert repository.get("missing") is None
+
+    def test_write_modes(self, repository):
+        with pytest.raises(RepositoryError):
+            repository.insert(_task(3))
+        with pytest.raises(RepositoryError):
+            repository.update(_task(42))
+        repository.insert(_task(42))
+        assert repository.exists("task-042")
+
+    def test_save_reindexes_changed_values(self, repository):
+        task = repository.get("task-002")
+        task.project_id = "p9"
+        task.status = EntityStatus.ARCHIVED
+        repository.save(task)
+
+        assert [t.id for t in repository.list(filters={"project_id": "p9"})] == ["task-002"]
+        assert "task-002" not in {t.id for t in repository.list(filters={"project_id": "p2"})}
+        assert repository.count(filters={"status": EntityStatus.ARCHIVED}) == 1
+
+    def test_soft_delete_hides_entity_and_keeps_id(self, repository):
+        assert repository.delete("task-001")
+        assert repository.get("task-001") is None
+        assert repository.count() == 9
+        assert not repository.delete("task-001")
+        with pytest.raises(RepositoryError):
+            repository.insert(_task(1))
+        assert repository.delete("task-001", hard=True)
+        repository.insert(_task(1))
+
+    def test_batch_operations(self, repository):
+        assert [t.id for t in repository.get_many(["task-004", "missing", "task-000"])] == ["task-004", "task-000"]
+        assert repository.delete_many(["task-004", "task-004", "task-005"]) == 2
+        repository.save_many([_task(20), _task(21)])
+        assert repository.count() == 10
+
+    def test_conditional_patch_bumps_revision(self, repository):
+        patched = repository.patch("task-003", {"title": "Renamed"}, expected_revision=0)
+        assert patched.revision == 1
+        assert repository.get("task-003").title == "Renamed"
+        with pytest.raises(ConcurrencyError) as conflict:
+            repository.patch("task-003", {"title": "Stale"}, expected_revision=0)
+        assert conflict.value.current_revision == 1
+        assert repository.get("task-003").title == "Renamed"
+        assert repository.patch("missing", {"title": "x"}, expected_revision=0) is None
+
+    def test_patch_rejects_unpatchable_fields(self, repository):
+        for changes in ({"titel": "Typo"}, {"id": "task-999"}, {"revision": 9}):
+            with pytest.raises(ValueError):
+                repository.patch("task-003", {"title": "Renamed", **changes})
+        stored = repository.get("task-003")
+        assert (stored.id, stored.title, stored.revision) == ("task-003", "Task 3", 0)
+
+    def test_every_write_bumps_revision(self, repository):
+        task = repository.get("task-001")
+        assert repository.update(task).revision == 1
+        assert repository.save(_task(1)).revision == 2
+        assert repository.update_where(None, {"title": "Done"}, where=in_("id", ["task-001", "task-002"])) == 2
+        assert [t.revision for t in repository.get_many(["task-001", "task-002"])] == [3, 1]
+        assert [t.revision for t in repository.save_many([_task(1), _task(30)])] == [4, 0]
+        with repository.transaction() as batch:
+            batch.update(repository.get("task-001"), expected_revision=4)
+        assert batch.results[0].revision == 5
+        assert repository.delete("task-001")
+        assert repository.save(_task(1)).revision == 7
+
+    def test_update_where_sets_fields_on_matches(self, repository):
+        assert repository.update_where({"project_id": "p1"}, {"status": EntityStatus.ARCHIVED}) == 5
+        assert {t.id for t in repository.list(filters={"status": EntityStatus.ARCHIVED})} == {
+            "task-001", "task-003", "task-005", "task-007", "task-009"
+        }
+        assert repository.update_where(None, {"title": "Done"}, where=in_("id", ["task-000", "missing"])) == 1
+        assert repository.get("task-000").title == "Done"
+        with pytest.raises(ValueError):
+            repository.update_where({}, {"title": "Everything"})
+
+    def test_transaction_commits_atomically(self, repository):
+        with pytest.raises(RepositoryError):
+            with repository.transaction() as batch:
+                batch.insert(_task(10))
+                batch.update(_task(1, description="Changed"))
+                batch.delete("task-002", hard=True)
+                batch.insert(_task(3))
+        assert not repository.exists("task-010")
+        assert repository.get("task-001").description != "Changed"
+        assert repository.exists("task-002")
+
+        with repository.transaction() as batch:
+            batch.insert(_task(10))
+            batch.update(_task(1, description="Changed"))
+            batch.delete("task-002")
+            batch.delete("missing")
+        assert [r.id if hasattr(r, "id") else r for r in batch.results] == ["task-010", "task-001", True, False]
+        assert repository.get("task-001").description == "Changed"
+        assert not repository.exists("task-002")
+
+
+class TestQueries:
+    """Filtering, ordering and pagination."""
+
+    def test_list_filters_in_insertion_order(self, repository):
+        tasks = repository.list(filters={"project_id": "p1", "status": "active", "assignee_id": None})
+        assert [t.id for t in tasks] == ["task-001", "task-003", "task-005", "task-007", "task-009"]
+
+    def test_list_order_offset_limit(self, repository):
+        tasks = repository.list(order_by="-created_at", offset=1, limit=3)
+        assert [t.id for t in tasks] == ["task-008", "task-007", "task-006"]
+
+    def test_ordered_listing_on_unsorted_field(self, repository):
+        tasks = repository.list(filters={"project_id": "p2"}, order_by="-title")
+        assert [t.title for t in tasks] == ["Task 8", "Task 6", "Task 4", "Task 2", "Task 0"]
+
+    def test_range_and_boolean_expressions(self, repository):
+        where = and_(gte("created_at", "2024-01-04"), lt("created_at", datetime(2024, 1, 8)), eq("project_id", "p1"))
+        assert [t.id for t in repository.list_where(where)] == ["task-003", "task-005"]
+
+        where = or_(in_("priority", [1, 5]), ilike("title", "%9"))
+        assert {t.id for t in repository.list_where(where)} == {"task-000", "task-004", "task-005", "task-009"}
+        assert repository.count_where(is_null("assignee_id")) == 10
+
+    def test_list_page_and_iter_all(self, repository):
+        page = repository.list_page(filters={"project_id": "p1"}, limit=2, order_by="created_at")
+        assert [t.id for t in page.items] == ["task-001", "task-003"]
+        following = repository.list_page(filters={"project_id": "p1"}, limit=2, order_by="created_at", after=page.next_cursor)
+        assert [t.id for t in following.items] == ["task-005", "task-007"]
+        assert [t.id for t in repository.iter_all(where=eq("project_id", "p2"))][:2] == ["task-000", "task-002"]
+
+    def test_search_and_aggregate(self, repository):
+        assert [t.id for t in repository.search("task 1")] == ["task-001"]
+        rows = repository.aggregate(group_by=["project_id"], metrics=[Metric(), Metric("sum", "priority")])
+        assert sorted((row["project_id"], row["count"], row["sum_priority"]) for row in rows) == [
+            ("p1", 5, 15),
+            ("p2", 5, 15),
+        ]
+
+    def test_indexed_filters_visit_only_matches(self, repository):
+        visited = []
+        original = repository._rows
+        repository._rows = _CountingDict(original, visited)
+
+        repository.list(filters={"project_id": "p1"})
+        assert len(visited) == 5
+        visited.clear()
+        repository.list(order_by="created_at", limit=2)
+        assert len(visited) == 2
+
+
+class TestIndexes:
+    """Hash and sorted index behaviour."""
+
+    def test_hash_index_lookup_and_removal(self):
+        index = HashIndex("status")
+        index.add("a", "active")
+        index.add("b", "active")
+        index.add("c", None)
+        assert index.lookup(["active"]) == {"a", "b"}
+        assert index.nulls() == {"c"}
+        index.remove("a", "active")
+        assert index.lookup(["active", "archived"]) == {"b"}
+
+    def test_sorted_index_parses_iso_bounds(self):
+        index = SortedIndex("created_at")
+        for day in range(1, 6):
+            index.add(f"e{day}", datetime(2024, 1, day))
+        assert index.range("2024-01-02", "2024-01-04", upper_inclusive=False) == {"e2", "e3"}
+        assert list(index.ordered(descending=True))[:2] == ["e5", "e4"]
+
+    def test_mixed_types_fall_back_to_scan(self):
+        repo: InMemoryRepository[TaskEntity] = InMemoryRepository(indexes=("project_id",))
+        repo.save(_task(1, project="p1"))
+        repo.save(_task(2, project=7))
+        assert repo._hash_indexes["project_id"].lookup(["p1"]) is None
+        assert [t.id for t in repo.list(filters={"project_id": "p1"})] == ["task-001"]
+
+    def test_create_index_backfills(self, repository):
+        repository.create_index("assignee_id")
+        repository.save(_task(30, assignee_id="u1"))
+        assert repository._hash_indexes["assignee_id"].lookup(["u1"]) == {"task-030"}
+        assert len(repository._hash_indexes["assignee_id"].nulls()) == 10
+
+    def test_project_entities_share_generic_indexes(self):
+        repo: InMemoryRepository[ProjectEntity] = InMemoryRepository()
+        repo.save(ProjectEntity(id="p1", name="One", workspace_id="w1"))
+        repo.save(ProjectEntity(id="p2", name="Two", workspace_id="w2"))
+        assert [p.id for p in repo.list(filters={"workspace_id": "w2"})] == ["p2"]
+
+
+class _CountingDict(dict):
+    """Dictionary recording which keys are read through ``__getitem__``."""
+
+    def __init__(self, data, visited):
+        super().__init__(data)
+        self.visited = visited
+
+    def __getitem__(self, key):
+        self.visited.append(key)
+        return super().__getitem__(key)
@@ -0,0 +1,109 @@
+"""
+Tests for Supabase read-replica routing.
+
+Covers round-robin replica selection, read-your-writes pinning per
+session, consistency tokens carried between requests, and the pin
+window expiring.
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from atoms_mcp.adapters.secondary.supabase.routing import (
+    ConsistencyToken,
+    ReadRouter,
+    consistency_session,
+    current_consistency_token,
+)
+
+
+class TestReadRouter:
+    """Endpoint selection."""
+
+    def test_primary_only_without_replicas(self):
+        router = ReadRouter()
+        assert [router.route_read() for _ in range(3)] == [0, 0, 0]
+        assert router.metrics()["primary_reads"] == 3
+
+    def test_reads_round_robin_over_replicas(self):
+        router = ReadRouter(replica_count=2)
+        assert [router.route_read() for _ in range(4)] == [1, 2, 1, 2]
+        assert router.metrics()["replica_reads"] == 4
+
+    def test_session_that_wrote_reads_from_primary(self):
+        router = ReadRouter(replica_count=2, pin_window=60)
+        with consistency_session("alice"):
+            router.record_write()
+            assert router.route_read() == 0
+        with consistency_session("bob"):
+            assert router.route_read() != 0
+        with consistency_session("alice"):
+            assert router.route_read() == 0
+        assert router.metrics()["pinned_reads"] == 2
+
+    def test_pin_expires_after_window(self):
+        router = ReadRouter(replica_count=1, pin_window=0.05)
+        with consistency_session("alice"):
+            router.record_write()
+            assert router.is_pinned()
+            time.sleep(0.1)
+            assert not router.is_pinned()
+            assert router.route_read() == 1
+
+    def test_writes_outside_a_session_never_pin(self):
+        router = ReadRouter(replica_count=1, pin_window=60)
+        router.record_write()
+        assert not router.is_pinned()
+        with consistency_session("alice"):
+            assert router.route_read() == 1
+        assert router.metrics()["writes"] == 1
+
+    def test_session_without_id_pins_only_its_own_context(self):
+        router = ReadRouter(replica_count=1, pin_window=60)
+        with consistency_session(None):
+            router.record_write()
+            assert router.route_read() == 0
+        with consistency_session(None):
+            assert router.route_read() == 1
+
+    def test_zero_window_never_pins(self):
+        router = ReadRouter(replica_count=1, pin_window=0)
+        router.record_write()
+        assert router.route_read() == 1
+
+    def test_invalid_configuration(self):
+        with pytest.raises(ValueError):
+            ReadRouter(replica_count=-1)
+        with pytest.raises(ValueError):
+            ReadRouter(pin_window=-1)
+
+
+class TestConsistencyToken:
+    """Tokens carry the pin across processes."""
+
+    def test_round_trip(self):
+        token = ConsistencyToken(1700000000.5)
+        assert ConsistencyToken.decode(token.encode()) == token
+        with pytest.raises(ValueError):
+            ConsistencyToken.decode("not a token")
+
+    def test_token_pins_session_on_another_router(self):
+        writer = ReadRouter(replica_count=1, pin_window=60)
+        with consistency_session("alice"):
+            writer.record_write()
+            token = current_consistency_token()
+        assert token is not None and token.active
+
+        reader = ReadRouter(replica_count=1, pin_window=60)
+        with consistency_session("alice", token=token.encode()):
+            assert reader.route_read() == 0
+        with consistency_session("alice", token="garbage"):
+            assert reader.route_read() == 1
+
+    def test_no_token_before_first_write(self):
+        assert current_consistency_token() is None
+        with consistency_session("alice"):
+            assert current_consistency_token() is None
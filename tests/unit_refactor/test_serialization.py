@@ -21,6 +21,19 @@ from typing import Any
 
 import pytest
 
+from atoms_mcp.domain.models.entity import EntityStatus, ProjectEntity, TaskEntity
+from atoms_mcp.domain.models.relationship import Relationship, RelationType
+from atoms_mcp.domain.models.workflow import (
+    Action,
+    ActionType,
+    Condition,
+    ConditionOperator,
+    Trigger,
+    TriggerType,
+    Workflow,
+    WorkflowStep,
+)
+from atoms_mcp.infrastructure.serialization.codecs import get_codec, register_codec
 from atoms_mcp.infrastructure.serialization.json import (
     DomainJSONEncoder,
     dumps,
@@ -876,3 +889,96 @@ class TestSerializationEdgeCases:
         deserialized = loads(serialized)
 
         assert deserialized == original
+
+
+class TestEntityCodecs:
+    """Test precompiled per-type entity codecs."""
+
+    def test_entity_round_trip_through_json(self):
+        """
+        Given: A task with enum, datetime and list fields
+        When: Encoding it, passing the row through JSON and decoding it
+        Then: The same task comes back with typed fields
+        """
+        codec = get_codec(TaskEntity)
+        task = TaskEntity(title="Write", status=EntityStatus.BLOCKED, due_date=datetime(2024, 3, 1, 12), tags=["x"])
+
+        row = json.loads(json.dumps(codec.encode(task)))
+        restored = codec.decode(row)
+
+        assert row["status"] == "blocked"
+        assert row["due_date"] == "2024-03-01T12:00:00"
+        assert restored == task
+        assert restored.status is EntityStatus.BLOCKED
+        assert isinstance(restored.created_at, datetime)
+
+    def test_nested_dataclasses_round_trip(self):
+        """
+        Given: A workflow with a trigger, conditions and steps
+        When: Encoding and decoding it
+        Then: Nested dataclasses and their enums are restored
+        """
+        codec = get_codec(Workflow)
+        workflow = Workflow(
+            name="Escalate",
+            trigger=Trigger(
+                trigger_type=TriggerType.ENTITY_UPDATED,
+                conditions=[Condition(field="priority", operator=ConditionOperator.GREATER_THAN, value=3)],
+            ),
+            steps=[WorkflowStep(name="notify", action=Action(action_type=ActionType.SEND_NOTIFICATION))],
+        )
+
+        row = json.loads(json.dumps(codec.encode(workflow)))
+        restored = codec.decode(row)
+
+        assert row["trigger"]["conditions"][0]["operator"] == "greater_than"
+        assert restored == workflow
+        assert restored.steps[0].action.action_type is ActionType.SEND_NOTIFICATION
+
+    def test_decode_fills_defaults_and_ignores_unknown_columns(self):
+        """
+        Given: A partial row with an extra column
+        When: Decoding it
+        Then: Missing fields take their defaults and the extra column is dropped
+        """
+        project = get_codec(ProjectEntity).decode({"name": "Atlas", "search_rank": 0.5})
+
+        assert project.name == "Atlas"
+        assert project.priority == 3
+        assert project.status is EntityStatus.ACTIVE
+        assert project.tags == []
+        assert not hasattr(project, "search_rank")
+
+    def test_decode_parses_json_text_columns(self):
+        """
+        Given: A row whose JSON fields were stored as text
+        When: Decoding it
+        Then: The text is parsed into dicts and lists
+        """
+        relationship = get_codec(Relationship).decode(
+            {"source_id": "a", "target_id": "b", "relationship_type": "depends_on", "properties": '{"weight": 2}'}
+        )
+
+        assert relationship.relationship_type is RelationType.DEPENDS_ON
+        assert relationship.properties == {"weight": 2}
+
+    def test_decode_runs_entity_validation(self):
+        """
+        Given: A row violating entity invariants
+        When: Decoding it
+        Then: The entity's validation error is raised
+        """
+        with pytest.raises(ValueError, match="title cannot be empty"):
+            get_codec(TaskEntity).decode({"title": ""})
+
+    def test_codecs_are_cached_and_limited_to_dataclasses(self):
+        """
+        Given: Dataclass and non-dataclass types
+        When: Looking up codecs
+        Then: Dataclasses share one compiled codec and other types get none
+        """
+        assert get_codec(TestDataclass) is get_codec(TestDataclass)
+        assert get_codec(TestDataclass).decode({"name": "a", "value": 1}) == TestDataclass("a", 1)
+        assert get_codec(PlainObject) is None
+        with pytest.raises(TypeError):
+            register_codec(PlainObject)
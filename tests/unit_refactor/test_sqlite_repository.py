@@ -0,0 +1,266 @@
+"""
+Tests for the SQLite repository adapter.
+
+Covers the Repository port contract (writes, soft deletes, filtering,
+ordering, keyset pagination, full-text search) against in-memory and
+file-backed WAL databases, and checks that filters on indexed fields are
+answered by the generated-column indexes.
+"""
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from atoms_mcp.adapters.secondary.sqlite import SqliteConnectionPool, SqliteRepository
+from atoms_mcp.domain.models.entity import EntityStatus, TaskEntity
+from atoms_mcp.domain.models.relationship import Relationship, RelationType
+from atoms_mcp.domain.ports.filters import and_, contains, eq, gte, ilike, in_, is_null, lt, or_
+from atoms_mcp.domain.ports.repository import ConcurrencyError, RepositoryError, SearchMode
+
+
+def _task(index: int, project: str = "p1", **kwargs) -> TaskEntity:
+    base = datetime(2024, 1, 1)
+    kwargs.setdefault("created_at", base + timedelta(days=index))
+    kwargs.setdefault("title", f"Task {index}")
+    return TaskEntity(id=f"task-{index:03d}", project_id=project, **kwargs)
+
+
+@pytest.fixture
+def repository() -> SqliteRepository[TaskEntity]:
+    repo: SqliteRepository[TaskEntity] = SqliteRepository("tasks", TaskEntity)
+    repo.save_many(
+        [_task(index, project="p1" if index % 2 else "p2", priority=index % 5 + 1) for index in range(10)]
+    )
+    return repo
+
+
+class TestWrites:
+    """Saves, write modes and deletes."""
+
+    def test_save_get_exists_round_trip(self, repository):
+        task = repository.get("task-003")
+        assert task.title == "Task 3"
+        assert task.created_at == datetime(2024, 1, 4)
+        assert task.status is EntityStatus.ACTIVE
+        assert repository.exists("task-003")
+        assert repository.get("missing") is None
+
+    def test_write_modes(self, repository):
+        with pytest.raises(RepositoryError):
+            repository.insert(_task(3))
+        with pytest.raises(RepositoryError):
+            repository.update(_task(42))
+        repository.insert(_task(42))
+        assert repository.exists("task-042")
+
+    def test_update_changes_indexed_columns(self, repository):
+        task = repository.get("task-002")
+        task.project_id = "p9"
+        task.status = EntityStatus.ARCHIVED
+        repository.update(task)
+
+        assert [t.id for t in repository.list(filters={"project_id": "p9"})] == ["task-002"]
+        assert repository.count(filters={"status": EntityStatus.ARCHIVED}) == 1
+
+    def test_soft_delete_and_upsert_revives(self, repository):
+        assert repository.delete("task-001")
+        assert repository.get("task-001") is None
+        assert repository.count() == 9
+        assert not repository.delete("task-001")
+        with pytest.raises(RepositoryError):
+            repository.insert(_task(1))
+        repository.save(_task(1))
+        assert repository.exists("task-001")
+        assert repository.delete("task-001", hard=True)
+        repository.insert(_task(1))
+
+    def test_batch_operations(self, repository):
+        assert [t.id for t in repository.get_many(["task-004", "missing", "task-000"])] == ["task-004", "task-000"]
+        assert repository.delete_many(["task-004", "task-004", "task-005"]) == 2
+        repository.save_many([_task(20), _task(21)])
+        assert repository.count() == 10
+
+    def test_conditional_patch_bumps_revision(self, repository):
+        patched = repository.patch("task-003", {"title": "Renamed"}, expected_revision=0)
+        assert patched.revision == 1
+        assert repository.get("task-003").title == "Renamed"
+        with pytest.raises(ConcurrencyError) as conflict:
+            repository.patch("task-003", {"title": "Stale"}, expected_revision=0)
+        assert conflict.value.current_revision == 1
+        assert repository.get("task-003").title == "Renamed"
+        assert repository.patch("missing", {"title": "x"}, expected_revision=0) is None
+
+    def test_patch_rejects_unpatchable_fields(self, repository):
+        for changes in ({"titel": "Typo"}, {"id": "task-999"}, {"revision": 9}):
+            with pytest.raises(ValueError):
+                repository.patch("task-003", {"title": "Renamed", **changes})
+        stored = repository.get("task-003")
+        assert (stored.id, stored.title, stored.revision) == ("task-003", "Task 3", 0)
+
+    def test_every_write_bumps_revision(self, repository):
+        task = repository.get("task-001")
+        assert repository.update(task).revision == 1
+        assert repository.save(_task(1)).revision == 2
+        assert repository.update_where(None, {"title": "Done"}, where=in_("id", ["task-001", "task-002"])) == 2
+        assert [t.revision for t in repository.get_many(["task-001", "task-002"])] == [3, 1]
+        assert [t.revision for t in repository.save_many([_task(1), _task(30)])] == [4, 0]
+        with repository.transaction() as batch:
+            batch.update(repository.get("task-001"), expected_revision=4)
+        assert batch.results[0].revision == 5
+        assert repository.delete("task-001")
+        assert repository.save(_task(1)).revision == 7
+
+    def test_update_where_sets_fields_on_matches(self, repository):
+        assert repository.update_where({"project_id": "p1"}, {"status": EntityStatus.ARCHIVED}) == 5
+        assert {t.id for t in repository.list(filters={"status": EntityStatus.ARCHIVED})} == {
+            "task-001", "task-003", "task-005", "task-007", "task-009"
+        }
+        assert repository.update_where(None, {"title": "Done"}, where=in_("id", ["task-000", "missing"])) == 1
+        assert repository.get("task-000").title == "Done"
+        with pytest.raises(ValueError):
+            repository.update_where({}, {"title": "Everything"})
+        assert [t.id for t in repository.search("Done")] == ["task-000"]
+
+    def test_transaction_commits_atomically(self, repository):
+        with pytest.raises(RepositoryError):
+            with repository.transaction() as batch:
+                batch.insert(_task(10))
+                batch.update(_task(1, description="Changed"))
+                batch.delete("task-002", hard=True)
+                batch.insert(_task(3))
+        assert not repository.exists("task-010")
+        assert repository.get("task-001").description != "Changed"
+        assert repository.exists("task-002")
+
+        with repository.transaction() as batch:
+            batch.insert(_task(10))
+            batch.update(_task(1, description="Changed"))
+            batch.delete("task-002")
+            batch.delete("missing")
+        assert [r.id if hasattr(r, "id") else r for r in batch.results] == ["task-010", "task-001", True, False]
+        assert repository.get("task-001").description == "Changed"
+        assert not repository.exists("task-002")
+
+    def test_json_columns_round_trip(self):
+        repo: SqliteRepository[Relationship] = SqliteRepository("relationships", Relationship)
+        relationship = Relationship(
+            id="r1",
+            source_id="a",
+            target_id="b",
+            relationship_type=RelationType.DEPENDS_ON,
+            metadata={"tags": ["x", "y"], "weight": 2},
+            properties={"label": "blocks"},
+        )
+        repo.save(relationship)
+
+        loaded = repo.get("r1")
+        assert loaded.metadata == {"tags": ["x", "y"], "weight": 2}
+        assert loaded.properties == {"label": "blocks"}
+        assert loaded.relationship_type is RelationType.DEPENDS_ON
+        assert [r.id for r in repo.list_where(contains("metadata", {"tags": ["y"]}))] == ["r1"]
+        assert repo.count(filters={"weight": 2}) == 1
+        assert repo.count(filters={"relationship_type": RelationType.DEPENDS_ON}) == 1
+
+
+class TestQueries:
+    """Filtering, ordering and pagination."""
+
+    def test_list_filters_in_insertion_order(self, repository):
+        tasks = repository.list(filters={"project_id": "p1", "status": "active", "assignee_id": None})
+        assert [t.id for t in tasks] == ["task-001", "task-003", "task-005", "task-007", "task-009"]
+
+    def test_list_order_offset_limit(self, repository):
+        tasks = repository.list(order_by="-created_at", offset=1, limit=3)
+        assert [t.id for t in tasks] == ["task-008", "task-007", "task-006"]
+
+    def test_range_and_boolean_expressions(self, repository):
+        where = and_(gte("created_at", "2024-01-04"), lt("created_at", datetime(2024, 1, 8)), eq("project_id", "p1"))
+        assert [t.id for t in repository.list_where(where)] == ["task-003", "task-005"]
+
+        where = or_(in_("priority", [1, 5]), ilike("title", "%9"))
+        assert {t.id for t in repository.list_where(where)} == {"task-000", "task-004", "task-005", "task-009"}
+        assert repository.count_where(is_null("assignee_id")) == 10
+
+    def test_list_page_forward_and_back(self, repository):
+        page = repository.list_page(filters={"project_id": "p1"}, limit=2, order_by="created_at")
+        assert [t.id for t in page.items] == ["task-001", "task-003"]
+        following = repository.list_page(
+            filters={"project_id": "p1"}, limit=2, order_by="created_at", after=page.next_cursor
+        )
+        assert [t.id for t in following.items] == ["task-005", "task-007"]
+        previous = repository.list_page(
+            filters={"project_id": "p1"}, limit=2, order_by="created_at", before=following.prev_cursor
+        )
+        assert [t.id for t in previous.items] == ["task-001", "task-003"]
+        assert [t.id for t in repository.iter_all(where=eq("project_id", "p2"), page_size=2)] == [
+            "task-000",
+            "task-002",
+            "task-004",
+            "task-006",
+            "task-008",
+        ]
+
+    def test_indexed_filters_use_generated_column_index(self, repository):
+        params: list = []
+        sql = repository._select(eq("project_id", "p1"), params)
+        plan = " ".join(str(row[-1]) for row in repository.pool.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+        assert "tasks_project_id_idx" in plan
+
+
+class TestSearch:
+    """Full-text and substring search."""
+
+    def test_fulltext_ranks_best_match_first(self, repository):
+        repository.save(_task(30, description="deploy the release"))
+        repository.save(_task(31, title="Release notes", description="release checklist for the release"))
+        assert [t.id for t in repository.search("release")] == ["task-031", "task-030"]
+        assert [t.id for t in repository.search("release", fields=["title"])] == ["task-031"]
+        assert [t.id for t in repository.search_ranked("release", where=eq("project_id", "nope"))] == []
+
+    def test_fts_index_follows_updates_and_deletes(self, repository):
+        task = repository.get("task-004")
+        task.description = "quarterly roadmap"
+        repository.save(task)
+        assert [t.id for t in repository.search("roadmap")] == ["task-004"]
+        repository.delete("task-004")
+        assert repository.search("roadmap") == []
+
+    def test_short_queries_and_substring_mode(self, repository):
+        assert [t.id for t in repository.search("9")] == ["task-009"]
+        assert [t.id for t in repository.search_ranked("ask 7", mode=SearchMode.SUBSTRING)] == ["task-007"]
+        assert repository.search_ranked("100%", mode=SearchMode.SUBSTRING) == []
+
+
+class TestPersistence:
+    """File-backed databases and the connection pool."""
+
+    def test_file_database_is_durable_and_wal(self, tmp_path):
+        path = tmp_path / "data" / "atoms.db"
+        pool = SqliteConnectionPool(path, size=2)
+        SqliteRepository("tasks", TaskEntity, pool=pool).save(_task(1))
+        assert pool.execute("PRAGMA journal_mode")[0][0] == "wal"
+        pool.close()
+
+        reopened = SqliteRepository("tasks", TaskEntity, pool=SqliteConnectionPool(path))
+        assert reopened.get("task-001").title == "Task 1"
+
+    def test_concurrent_writers_share_the_pool(self, tmp_path):
+        repo = SqliteRepository("tasks", TaskEntity, pool=SqliteConnectionPool(tmp_path / "atoms.db", size=4))
+
+        def write(offset: int) -> None:
+            for index in range(offset, offset + 25):
+                repo.save(_task(index))
+
+        threads = [threading.Thread(target=write, args=(offset,)) for offset in range(0, 100, 25)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert repo.count() == 100
+
+    def test_invalid_pool_size(self):
+        with pytest.raises(ValueError):
+            SqliteConnectionPool(size=0)
@@ -10,21 +10,52 @@ from __future__ import annotations
 
 import pytest
 from datetime import datetime
+from pathlib import Path
 from typing import Any, Optional
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import MagicMock, Mock, call, patch
 from uuid import uuid4
 
+from postgrest import CountMethod
+from postgrest.exceptions import APIError
+
 from atoms_mcp.adapters.secondary.supabase.connection import (
     SupabaseConnection,
     SupabaseConnectionError,
+    configure_existence_filters,
     get_connection,
+    get_connection_metrics,
     get_client,
+    get_existence_filter,
+    get_query_recorder,
     reset_connection,
 )
+from atoms_mcp.adapters.secondary.supabase.health import (
+    CircuitBreaker,
+    CircuitState,
+    ConnectionHealthMonitor,
+)
 from atoms_mcp.adapters.secondary.supabase.repository import (
+    REVISION_COLUMN_SQL,
+    REVISION_FUNCTION_SQL,
     SupabaseRepository,
 )
-from atoms_mcp.domain.ports.repository import RepositoryError
+from atoms_mcp.adapters.secondary.supabase.aggregate import AGGREGATE_FUNCTION, AGGREGATE_FUNCTION_SQL
+from atoms_mcp.adapters.secondary.supabase.batch import BATCH_FUNCTION, BATCH_FUNCTION_SQL
+from atoms_mcp.adapters.secondary.supabase.existence import BloomFilter, ExistenceFilter
+from atoms_mcp.adapters.secondary.supabase.query_stats import (
+    OVERFLOW_SHAPE,
+    QueryRecorder,
+    QueryShape,
+    load_report,
+    query_shape,
+)
+from atoms_mcp.adapters.secondary.supabase.search import SEARCH_FUNCTION, SEARCH_FUNCTION_SQL
+from atoms_mcp.domain.models.entity import EntityStatus, TaskEntity
+from atoms_mcp.domain.ports.aggregation import Metric, TimeBucket
+from atoms_mcp.domain.ports.filters import and_, contains, eq, gte, ilike, in_, is_null, or_
+from atoms_mcp.domain.ports.pagination import decode_cursor, encode_cursor
+from atoms_mcp.domain.ports.repository import RepositoryError, SearchMode, WriteMode
+from atoms_mcp.domain.services.entity_service import EntityService
 
 
 # ============================================================================
@@ -74,21 +105,34 @@ class MockSupabaseQueryBuilder:
         self._data: Optional[dict[str, Any]] = None
         self._select_fields = "*"
         self._count_type: Optional[str] = None
+        self._head: Optional[bool] = None
 
-    def select(self, fields: str = "*", count: Optional[str] = None) -> MockSupabaseQueryBuilder:
+    def select(
+        self, fields: str = "*", count: Optional[str] = None, head: Optional[bool] = None
+    ) -> MockSupabaseQueryBuilder:
         """Mock select operation."""
         self._operation = "select"
         self._select_fields = fields
         self._count_type = count
+        self._head = head
         return self
 
-    def insert(self, data: dict[str, Any]) -> MockSupabaseQueryBuilder:
+    def insert(self, data: dict[str, Any], returning: Any = None) -> MockSupabaseQueryBuilder:
         """Mock insert operation."""
         self._operation = "insert"
         self._data = data
         return self
 
-    def update(self, data: dict[str, Any]) -> MockSupabaseQueryBuilder:
+    def upsert(
+        self, data: Any, on_conflict: str = "", returning: Any = None
+    ) -> MockSupabaseQueryBuilder:
+        """Mock single or multi-row upsert operation."""
+        self._operation = "upsert"
+        self._data = data if isinstance(data, list) else [data]
+        self._on_conflict = on_conflict or "id"
+        return self
+
+    def update(self, data: dict[str, Any], returning: Any = None) -> MockSupabaseQueryBuilder:
         """Mock update operation."""
         self._operation = "update"
         self._data = data
@@ -104,6 +148,16 @@ class MockSupabaseQueryBuilder:
         self._filters[field] = value
         return self
 
+    def in_(self, field: str, values: list[Any]) -> MockSupabaseQueryBuilder:
+        """Mock membership filter."""
+        self._filters[f"{field}__in"] = [str(v) for v in values]
+        return self
+
+    def gt(self, field: str, value: Any) -> MockSupabaseQueryBuilder:
+        """Mock greater-than filter."""
+        self._filters[f"{field}__gt"] = value
+        return self
+
     def ilike(self, field: str, pattern: str) -> MockSupabaseQueryBuilder:
         """Mock case-insensitive like filter."""
         self._filters[f"{field}__ilike"] = pattern
@@ -127,6 +181,7 @@ class MockSupabaseQueryBuilder:
 
     def maybe_single(self) -> MockSupabaseQueryBuilder:
         """Mock single result."""
+        self._single = True
         return self
 
     def execute(self) -> MockSupabaseResponse:
@@ -150,6 +205,22 @@ class MockSupabaseQueryBuilder:
             table_data.append(new_record)
             return MockSupabaseResponse(data=[new_record])
 
+        elif self._operation == "upsert":
+            # Replace rows with a matching conflict key, insert the rest
+            saved = []
+            for row in self._data:
+                record = row.copy()
+                key = str(record.get(self._on_conflict))
+                for existing in table_data:
+                    if str(existing.get(self._on_conflict)) == key:
+                        existing.update(record)
+                        saved.append(existing)
+                        break
+                else:
+                    table_data.append(record)
+                    saved.append(record)
+            return MockSupabaseResponse(data=saved)
+
         elif self._operation == "update":
             # Update matching records
             updated = []
@@ -185,15 +256,21 @@ class MockSupabaseQueryBuilder:
             if self._limit is not None:
                 results = results[: self._limit]
 
+            # Apply column projection
+            if self._select_fields != "*":
+                columns = self._select_fields.split(",")
+                results = [{c: r[c] for c in columns if c in r} for r in results]
+
             # Handle maybe_single
             if hasattr(self, "_single"):
-                return MockSupabaseResponse(
-                    data=results[0] if results else None,
+                response = MockSupabaseResponse(
                     count=len(results) if self._count_type else None,
                 )
+                response.data = results[0] if results else None
+                return response
 
             return MockSupabaseResponse(
-                data=results,
+                data=[] if self._head else results,
                 count=len([r for r in table_data if self._matches_filters(r)])
                 if self._count_type
                 else None,
@@ -204,7 +281,13 @@ class MockSupabaseQueryBuilder:
     def _matches_filters(self, record: dict[str, Any]) -> bool:
         """Check if record matches all filters."""
         for key, value in self._filters.items():
-            if "__ilike" in key:
+            if key.endswith("__in"):
+                if str(record.get(key[: -len("__in")])) not in value:
+                    return False
+            elif key.endswith("__gt"):
+                if not str(record.get(key[: -len("__gt")])) > str(value):
+                    return False
+            elif "__ilike" in key:
                 field = key.replace("__ilike", "")
                 pattern = value.replace("%", "")
                 if pattern.lower() not in str(record.get(field, "")).lower():
@@ -244,6 +327,11 @@ class MockSupabaseClient:
             self._failure_error,
         )
 
+    def rpc(self, function: str, params: dict[str, Any]) -> Any:
+        """Call a database function; none are installed in the mock."""
+        self.call_log.append(("rpc", function, params))
+        raise APIError({"code": "PGRST202", "message": f"Could not find the function {function}"})
+
     def ping(self) -> bool:
         """Test connection."""
         if not self._connection_alive:
@@ -409,15 +497,12 @@ class TestSupabaseConnectionManagement:
         """
         Given: Connection with working client
         When: Getting client with retry
-        Then: Client is returned on first attempt
+        Then: Client is returned without a health-check round trip
         """
-        # Mock health check table
-        mock_client.storage["_health_check"] = []
-
         client = supabase_connection.get_client_with_retry()
 
         assert client is mock_client
-        assert len(mock_client.call_log) > 0
+        assert mock_client.call_log == []
 
     def test_get_client_with_retry_transient_failure(self, supabase_connection, mock_client, mock_settings):
         """
@@ -601,6 +686,139 @@ class TestSupabaseRepositoryCRUD:
         assert saved.value == 2
         assert len(mock_client.storage["test_entities"]) == 1
 
+    def test_save_is_single_round_trip(self, repository, mock_entity_type, mock_client):
+        """
+        Given: A new entity
+        When: Saving it twice
+        Then: Each save issues exactly one request and no existence check
+        """
+        entity = mock_entity_type(id=str(uuid4()), name="Once", value=1)
+
+        repository.save(entity)
+        repository.save(entity)
+
+        assert len(mock_client.call_log) == 2
+        assert len(mock_client.storage["test_entities"]) == 1
+
+    def test_update_only_missing_entity_raises(self, repository, mock_entity_type):
+        """
+        Given: An entity that was never stored
+        When: Saving it in update-only mode
+        Then: RepositoryError is raised
+        """
+        entity = mock_entity_type(id=str(uuid4()), name="Ghost", value=0)
+
+        with pytest.raises(RepositoryError, match="not found"):
+            repository.update(entity)
+
+    def test_patch_sends_only_changed_columns(self, repository, mock_entity_type, mock_client):
+        """
+        Given: A stored entity
+        When: Patching one field
+        Then: One update carrying only that column returns the new row
+        """
+        entity_id = str(uuid4())
+        repository.save(mock_entity_type(id=entity_id, name="Original", value=1))
+        mock_client.call_log.clear()
+
+        with patch.object(
+            MockSupabaseQueryBuilder, "update", autospec=True, side_effect=MockSupabaseQueryBuilder.update
+        ) as update:
+            patched = repository.patch(entity_id, {"name": "Patched"})
+
+        assert update.call_args.args[1] == {"name": "Patched"}
+        assert len(mock_client.call_log) == 1
+        assert patched.name == "Patched"
+        assert patched.value == 1
+        assert repository.patch(str(uuid4()), {"name": "Ghost"}) is None
+        with pytest.raises(ValueError):
+            repository.patch(entity_id, {"id": "other"})
+
+    def test_write_modes_select_statement(self, repository):
+        """
+        Given: A serialized entity with an ID
+        When: Building the save statement for each write mode
+        Then: Upsert, insert and update map to the matching PostgREST call
+        """
+        for mode, method in [
+            (WriteMode.UPSERT, "upsert"),
+            (WriteMode.INSERT_ONLY, "insert"),
+            (WriteMode.UPDATE_ONLY, "update"),
+        ]:
+            table = MagicMock()
+            repository._save_query(table, {"id": "1"}, mode)
+            assert [name for name, _, _ in table.method_calls] == [method]
+
+    def test_projected_reads_select_columns(self, repository, mock_client):
+        """
+        Given: A stored row with a large text column
+        When: Reading it through get/list/search projections
+        Then: Only the ID and requested columns are selected and returned
+        """
+        mock_client.storage["test_entities"] = [
+            {"id": "1", "name": "Alpha", "value": 1, "content": "x" * 1000, "is_deleted": False}
+        ]
+
+        assert repository.get_projected("1", ["name"]) == {"id": "1", "name": "Alpha"}
+        assert repository.list_projected(["value"]) == [{"id": "1", "value": 1}]
+        assert repository.search_projected("Alp", ["name"], fields=["name"]) == [
+            {"id": "1", "name": "Alpha"}
+        ]
+        assert repository.get_projected("missing", ["name"]) is None
+
+    def test_projection_rejects_invalid_columns(self, repository, mock_client):
+        """
+        Given: A projection with a column name that is not an identifier
+        When: Listing with that projection
+        Then: ValueError is raised before any request is sent
+        """
+        with pytest.raises(ValueError, match="Invalid column name"):
+            repository.list_projected(["name,content"])
+
+        assert mock_client.call_log == []
+
+    def test_keyset_statement(self, repository):
+        """
+        Given: A cursor for a row ordered by name
+        When: Building the keyset query for the next and previous page
+        Then: The boundary is a row comparison on (name, id) and one extra row is requested
+        """
+        cursor = encode_cursor("Beta", "7")
+
+        table = MagicMock()
+        repository._apply_keyset(table, 10, "name", cursor, None)
+        calls = [(name, args, kwargs) for name, args, kwargs in table.mock_calls]
+        assert calls[0] == ("or_", ('name.gt."Beta",and(name.eq."Beta",id.gt."7")',), {})
+        assert calls[1:] == [
+            ("or_().order", ("name",), {"desc": False}),
+            ("or_().order().order", ("id",), {"desc": False}),
+            ("or_().order().order().limit", (11,), {}),
+        ]
+
+        table = MagicMock()
+        repository._apply_keyset(table, 10, None, None, encode_cursor("7", "7"))
+        assert table.mock_calls[0] == call.lt("id", "7")
+        assert table.mock_calls[1] == call.lt().order("id", desc=True)
+
+    def test_keyset_page_cursors(self, repository):
+        """
+        Given: Rows fetched with one row more than the limit
+        When: Building the page
+        Then: The extra row is dropped and it yields a next cursor
+        """
+        rows = [{"id": str(i), "name": f"E{i}", "value": i, "is_deleted": False} for i in range(3)]
+
+        page = repository._keyset_page(rows, 2, None, None, None)
+
+        assert [e.id for e in page.items] == ["0", "1"]
+        assert decode_cursor(page.next_cursor) == ("1", "1")
+        assert page.prev_cursor is None
+
+        back = repository._keyset_page(list(reversed(rows)), 2, None, None, encode_cursor("3", "3"))
+        assert [e.id for e in back.items] == ["1", "2"]
+        assert decode_cursor(back.prev_cursor) == ("1", "1")
+        assert decode_cursor(back.next_cursor) == ("2", "2")
+
     def test_get_existing_entity(self, repository, mock_entity_type, mock_client):
         """
         Given: An entity exists in storage
@@ -822,6 +1040,28 @@ class TestSupabaseRepositoryCRUD:
 
         assert count == 2
 
+    def test_count_modes_are_head_requests(self, repository):
+        """
+        Given: A table of any size
+        When: Counting exactly and by planner estimate
+        Then: Each count is one HEAD request selecting only the ID
+        """
+        client = MagicMock()
+        select = client.table.return_value.select
+        select.return_value.eq.return_value.execute.return_value = MockSupabaseResponse(count=7)
+
+        with patch(
+            "atoms_mcp.adapters.secondary.supabase.repository.get_client_with_retry",
+            return_value=client,
+        ):
+            assert repository.count() == 7
+            assert repository.count_planned() == 7
+
+        assert select.call_args_list == [
+            call("id", count=CountMethod.exact, head=True),
+            call("id", count=CountMethod.planned, head=True),
+        ]
+
     def test_exists_entity_present(self, repository, mock_client):
         """
         Given: Entity exists in storage
@@ -879,6 +1119,284 @@ class TestSupabaseRepositoryCRUD:
         assert len(results) == 2
         assert all("Apple" in r.name for r in results)
 
+    def test_ranked_search_is_one_rpc(self, repository):
+        """
+        Given: A database with the search function installed
+        When: Searching with and without a projection
+        Then: Each search is one RPC call with equality filters pushed into
+            it, and rows keep the ranked order
+        """
+        client = MagicMock()
+        client.rpc.return_value.execute.return_value = MockSupabaseResponse(
+            data=[
+                {"id": "2", "name": "Apple Juice", "value": 2, "is_deleted": False},
+                {"id": "1", "name": "Apple Pie", "value": 1, "is_deleted": False},
+            ]
+        )
+
+        with patch(
+            "atoms_mcp.adapters.secondary.supabase.repository.get_client_with_retry",
+            return_value=client,
+        ):
+            results = repository.search_ranked(
+                "apple", fields=["name"], limit=5, where=eq("is_deleted", False)
+            )
+            rows = repository.search_projected("ap", ["name"], mode=SearchMode.TRIGRAM)
+
+        assert [r.id for r in results] == ["2", "1"]
+        assert len(rows) == 2
+        assert client.rpc.call_args_list == [
+            call(
+                SEARCH_FUNCTION,
+                {
+                    "p_table": "test_entities",
+                    "p_query": "apple",
+                    "p_fields": ["name"],
+                    "p_limit": 5,
+                    "p_mode": "auto",
+                    "p_columns": None,
+                    "p_filter": {"is_deleted": False},
+                },
+            ),
+            call(
+                SEARCH_FUNCTION,
+                {
+                    "p_table": "test_entities",
+                    "p_query": "ap",
+                    "p_fields": ["name", "description", "title", "content"],
+                    "p_limit": None,
+                    "p_mode": "trigram",
+                    "p_columns": ["id", "name"],
+                    "p_filter": None,
+                },
+            ),
+        ]
+        client.table.assert_not_called()
+
+    def test_ranked_search_falls_back_without_function(self, repository, mock_client):
+        """
+        Given: A database without the search function
+        When: Searching twice
+        Then: Substring matching is used, the RPC is only attempted once
+            and the fallback is logged and reported
+        """
+        repository._logger = MagicMock()
+        mock_client.storage["test_entities"] = [
+            {"id": "1", "name": "Apple Pie", "value": 1, "is_deleted": False},
+        ]
+
+        assert [r.id for r in repository.search("Apple", fields=["name"])] == ["1"]
+        assert [r.id for r in repository.search("Pie", fields=["name"])] == ["1"]
+
+        assert [entry[0] for entry in mock_client.call_log].count("rpc") == 1
+        assert repository.ranked_search_available is False
+        assert repository.missing_functions == [SEARCH_FUNCTION]
+        repository._logger.warning.assert_called_once()
+
+    def test_aggregate_is_one_rpc(self, repository):
+        """
+        Given: A database with the aggregate function installed
+        When: Aggregating with filters, a time bucket and a metric
+        Then: One RPC call carries the grouping and the filter tree
+        """
+        client = MagicMock()
+        client.rpc.return_value.execute.return_value = MockSupabaseResponse(
+            data=[{"status": "active", "bucket": "2024-01-01T00:00:00+00:00", "count": 3}]
+        )
+
+        with patch(
+            "atoms_mcp.adapters.secondary.supabase.repository.get_client_with_retry",
+            return_value=client,
+        ):
+            rows = repository.aggregate(
+                group_by=["status"],
+                metrics=[Metric(), Metric("sum", "value")],
+                filters={"name": "Apple"},
+                time_bucket=TimeBucket.DAY,
+                where=or_(gte("value", 2), is_null("value")),
+            )
+
+        assert rows == [{"status": "active", "bucket": "2024-01-01T00:00:00+00:00", "count": 3}]
+        client.rpc.assert_called_once_with(
+            AGGREGATE_FUNCTION,
+            {
+                "p_table": "test_entities",
+                "p_group_by": ["status"],
+                "p_metrics": [
+                    {"func": "count", "field": None, "alias": "count"},
+                    {"func": "sum", "field": "value", "alias": "sum_value"},
+                ],
+                "p_filter": {
+                    "and": [
+                        {"field": "name", "op": "eq", "value": "Apple"},
+                        {
+                            "or": [
+                                {"field": "value", "op": "gte", "value": 2},
+                                {"field": "value", "op": "is_null", "value": True},
+                            ]
+                        },
+                    ]
+                },
+                "p_time_bucket": "day",
+                "p_time_field": "created_at",
+            },
+        )
+        client.table.assert_not_called()
+
+    def test_aggregate_falls_back_without_function(self, repository, mock_client):
+        """
+        Given: A database without the aggregate function
+        When: Aggregating
+        Then: Rows are streamed and aggregated in memory, and the fallback
+            is logged and reported
+        """
+        repository._logger = MagicMock()
+        mock_client.storage["test_entities"] = [
+            {"id": "1", "name": "Apple", "value": 1, "is_deleted": False},
+            {"id": "2", "name": "Apple", "value": 2, "is_deleted": False},
+            {"id": "3", "name": "Pear", "value": 3, "is_deleted": False},
+        ]
+
+        rows = repository.aggregate(group_by=["name"], metrics=[Metric("sum", "value")])
+
+        assert sorted(rows, key=lambda row: row["name"]) == [
+            {"name": "Apple", "sum_value": 3},
+            {"name": "Pear", "sum_value": 3},
+        ]
+        assert repository.aggregate_available is False
+        assert repository.missing_functions == [AGGREGATE_FUNCTION]
+        repository._logger.warning.assert_called_once()
+
+    def test_where_translates_to_postgrest_filters(self, repository):
+        """
+        Given: A filter expression with comparisons and an or group
+        When: Applying it to a query
+        Then: Conditions become PostgREST filters and the group one or= tree
+        """
+        query = MagicMock()
+        query.filter.return_value = query
+        query.or_.return_value = query
+        where = and_(
+            gte("created_at", datetime(2024, 1, 1)),
+            in_("status", ["active", "draft"]),
+            is_null("deleted_at"),
+            contains("metadata", {"entity_type": "task"}),
+            or_(eq("priority", 1), ilike("name", "%urgent%")),
+        )
+
+        assert repository._apply_where(query, where) is query
+        assert query.filter.call_args_list == [
+            call("created_at", "gte", "2024-01-01T00:00:00"),
+            call("status", "in", '("active","draft")'),
+            call("deleted_at", "is", "null"),
+            call("metadata", "cs", '{"entity_type": "task"}'),
+        ]
+        query.or_.assert_called_once_with('priority.eq."1",name.ilike."%urgent%"')
+
+    def test_search_with_range_filter_uses_postgrest(self, repository, mock_client):
+        """
+        Given: A search filtered by more than equality
+        When: Searching
+        Then: The search function is skipped and PostgREST applies the
+            filter alongside the ilike match
+        """
+        query = MagicMock()
+        query.eq.return_value = query
+        query.filter.return_value = query
+        query.ilike.return_value = query
+        query.execute.return_value = MockSupabaseResponse(data=[])
+        client = MagicMock()
+        client.table.return_value.select.return_value = query
+
+        with patch(
+            "atoms_mcp.adapters.secondary.supabase.repository.get_client_with_retry",
+            return_value=client,
+        ):
+            repository.search_ranked("apple", fields=["name"], where=gte("value", 2))
+
+        client.rpc.assert_not_called()
+
+        query.filter.assert_called_once_with("value", "gte", "2")
+        query.ilike.assert_called_once_with("name", "%apple%")
+
+    @staticmethod
+    def _search_client(query: MagicMock) -> MagicMock:
+        """Client whose table queries all chain into ``query``."""
+        for method in ("eq", "ilike", "or_", "limit"):
+            getattr(query, method).return_value = query
+        client = MagicMock()
+        client.table.return_value.select.return_value = query
+        return client
+
+    def test_substring_search_is_one_request(self, repository):
+        """
+        Given: A substring search over two fields
+        When: Searching
+        Then: One request matches either field, and the limit applies to it
+        """
+        query = MagicMock()
+        query.execute.return_value = MockSupabaseResponse(data=[{"id": "1", "name": "Apple", "value": 1}])
+        client = self._search_client(query)
+
+        with patch(
+            "atoms_mcp.adapters.secondary.supabase.repository.get_client_with_retry",
+            return_value=client,
+        ):
+            results = repository.search_ranked(
+                "apple", fields=["name", "description"], limit=5, mode=SearchMode.SUBSTRING
+            )
+
+        assert [r.id for r in results] == ["1"]
+        query.execute.assert_called_once()
+        query.or_.assert_called_once_with('name.ilike."%apple%",description.ilike."%apple%"')
+        query.limit.assert_called_once_with(5)
+
+    def test_substring_search_skips_missing_field(self, repository):
+        """
+        Given: A table without one of the searched fields
+        When: Searching twice
+        Then: The search is retried without the field, which later searches leave out
+        """
+        query = MagicMock()
+        query.execute.side_effect = [
+            APIError({"code": "42703", "message": "column test_entities.description does not exist"}),
+            MockSupabaseResponse(data=[]),
+            MockSupabaseResponse(data=[]),
+        ]
+        client = self._search_client(query)
+        repository._logger = MagicMock()
+
+        with patch(
+            "atoms_mcp.adapters.secondary.supabase.repository.get_client_with_retry",
+            return_value=client,
+        ):
+            for _ in range(2):
+                repository.search_ranked("apple", fields=["name", "description"], mode=SearchMode.SUBSTRING)
+
+        assert query.execute.call_count == 3
+        assert query.ilike.call_args_list == [call("name", "%apple%"), call("name", "%apple%")]
+        repository._logger.warning.assert_called_once()
+
+    def test_substring_search_raises_other_errors(self, repository):
+        """
+        Given: A search filtered on a column the table does not have
+        When: Searching
+        Then: The error is raised rather than retried
+        """
+        query = MagicMock()
+        query.filter.return_value = query
+        query.execute.side_effect = APIError({"code": "42703", "message": "column test_entities.size does not exist"})
+        client = self._search_client(query)
+
+        with patch(
+            "atoms_mcp.adapters.secondary.supabase.repository.get_client_with_retry",
+            return_value=client,
+        ):
+            with pytest.raises(RepositoryError):
+                repository.search_ranked("apple", fields=["name"], where=gte("size", 2))
+
+        query.execute.assert_called_once()
+
     def test_save_returns_deserialized_entity(self, repository, mock_entity_type):
         """
         Given: Valid entity data
@@ -894,6 +1412,402 @@ class TestSupabaseRepositoryCRUD:
         assert saved.value == 42
 
 
+# ============================================================================
+# Batch Operation Tests
+# ============================================================================
+
+
+class TestSupabaseBatchOperations:
+    """Test set-based batch operations."""
+
+    @pytest.fixture
+    def repository(self, mock_client, mock_entity_type, mock_settings):
+        """Provide a repository with a small batch size."""
+        with patch("atoms_mcp.adapters.secondary.supabase.repository.get_client_with_retry") as mock_get:
+            mock_get.return_value = mock_client
+            repo = SupabaseRepository(
+                table_name="test_entities",
+                entity_type=mock_entity_type,
+                batch_size=2,
+            )
+            yield repo
+
+    def test_transaction_falls_back_without_batch_function(self, repository, mock_entity_type, mock_client):
+        """
+        Given: A database without the write batch function
+        When: Committing a transaction
+        Then: The writes are applied one by one, and the fallback is logged and reported
+        """
+        repository._logger = MagicMock()
+
+        with repository.transaction() as batch:
+            batch.save(mock_entity_type(id="1", name="One", value=1))
+
+        assert [row["id"] for row in mock_client.storage["test_entities"]] == ["1"]
+        assert repository.missing_functions == [BATCH_FUNCTION]
+        repository._logger.warning.assert_called_once()
+
+    def test_save_many_upserts_in_chunks(self, repository, mock_entity_type, mock_client):
+        """
+        Given: Five new entities and a batch size of two
+        When: Saving them with save_many
+        Then: Three upsert requests store all five rows
+        """
+        entities = [mock_entity_type(id=str(i), name=f"E{i}", value=i) for i in range(5)]
+
+        saved = repository.save_many(entities)
+
+        assert [e.id for e in saved] == ["0", "1", "2", "3", "4"]
+        assert len(mock_client.storage["test_entities"]) == 5
+        assert len(mock_client.call_log) == 3
+
+    def test_save_many_updates_existing_rows(self, repository, mock_entity_type, mock_client):
+        """
+        Given: An entity already stored
+        When: Saving a modified copy with save_many
+        Then: The row is updated rather than duplicated
+        """
+        repository.save_many([mock_entity_type(id="1", name="Original", value=1)])
+
+        repository.save_many([mock_entity_type(id="1", name="Updated", value=2)])
+
+        assert mock_client.storage["test_entities"] == [
+            {"id": "1", "name": "Updated", "value": 2, "is_deleted": False}
+        ]
+
+    def test_get_many_preserves_order_and_skips_missing(self, repository, mock_client):
+        """
+        Given: Stored rows including a soft-deleted one
+        When: Fetching several IDs with get_many
+        Then: Live rows come back in request order with one select per chunk
+        """
+        mock_client.storage["test_entities"] = [
+            {"id": str(i), "name": f"E{i}", "value": i, "is_deleted": i == 2} for i in range(4)
+        ]
+
+        result = repository.get_many(["3", "missing", "2", "0"])
+
+        assert [e.id for e in result] == ["3", "0"]
+        assert len(mock_client.call_log) == 2
+
+    def test_delete_many_soft_and_hard(self, repository, mock_client):
+        """
+        Given: Three stored rows
+        When: Soft deleting two and hard deleting one
+        Then: Counts reflect affected rows and storage is updated
+        """
+        mock_client.storage["test_entities"] = [
+            {"id": str(i), "name": f"E{i}", "value": i, "is_deleted": False} for i in range(3)
+        ]
+
+        soft = repository.delete_many(["0", "1", "missing"])
+        hard = repository.delete_many(["2"], hard=True)
+
+        assert soft == 2
+        assert hard == 1
+        assert [row["is_deleted"] for row in mock_client.storage["test_entities"]] == [True, True]
+
+    def test_empty_batches_skip_requests(self, repository, mock_client):
+        """
+        Given: Empty inputs
+        When: Calling the batch methods
+        Then: No request is issued
+        """
+        assert repository.get_many([]) == []
+        assert repository.save_many([]) == []
+        assert repository.delete_many([]) == 0
+        assert mock_client.call_log == []
+
+
+class TestSupabaseExistenceFilter:
+    """Test the existence filter in front of lookups by ID."""
+
+    @pytest.fixture
+    def repository(self, mock_client, mock_entity_type, mock_settings):
+        """Provide a repository with an existence filter and a small batch size."""
+        mock_client.storage["test_entities"] = [
+            {"id": str(i), "name": f"E{i}", "value": i, "is_deleted": i == 4} for i in range(5)
+        ]
+        with patch("atoms_mcp.adapters.secondary.supabase.repository.get_client_with_retry") as mock_get:
+            mock_get.return_value = mock_client
+            repo = SupabaseRepository(
+                table_name="test_entities",
+                entity_type=mock_entity_type,
+                batch_size=2,
+                existence_filter=ExistenceFilter(capacity=100),
+            )
+            yield repo
+
+    def test_bloom_filter_has_no_false_negatives(self):
+        """
+        Given: A Bloom filter sized for 1000 items at 1%
+        When: Adding 1000 IDs and probing 10000 others
+        Then: Every added ID is found and false positives stay near 1%
+        """
+        bloom = BloomFilter(1000, 0.01)
+        for i in range(1000):
+            bloom.add(f"id-{i}")
+
+        assert all(f"id-{i}" in bloom for i in range(1000))
+        false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+        assert false_positives < 300
+        assert bloom.estimated_error_rate == pytest.approx(0.01, rel=0.2)
+
+    def test_refresh_scans_live_ids_in_pages(self, repository, mock_client):
+        """
+        Given: Four live rows, one soft-deleted row and a batch size of two
+        When: Rebuilding the filter
+        Then: The live IDs are read in three keyset pages
+        """
+        mock_client.call_log.clear()
+
+        assert repository.refresh_existence_filter() == 4
+        assert repository.existence_filter.ready
+        assert len(mock_client.call_log) == 4  # planned count + three pages
+
+    def test_definite_misses_skip_requests(self, repository, mock_client):
+        """
+        Given: A built filter
+        When: Looking up IDs that were never stored
+        Then: get, exists and get_many answer without a request
+        """
+        repository.refresh_existence_filter()
+        mock_client.call_log.clear()
+
+        assert repository.get("missing") is None
+        assert repository.exists("missing") is False
+        assert repository.get_many(["missing", "also-missing"]) == []
+        assert mock_client.call_log == []
+        assert [e.id for e in repository.get_many(["missing", "1"])] == ["1"]
+        assert repository.existence_filter.metrics()["definite_misses"] == 5
+
+    def test_writes_update_filter(self, repository, mock_entity_type):
+        """
+        Given: A built filter
+        When: Saving a new entity and deleting an existing one
+        Then: The new ID is found and the deleted one counts as a false positive
+        """
+        repository.refresh_existence_filter()
+
+        repository.save(mock_entity_type(id="new", name="New", value=9))
+        repository.delete("1")
+
+        assert repository.exists("new") is True
+        assert repository.get("1") is None
+        metrics = repository.existence_filter.metrics()
+        assert metrics["deleted_since_build"] == 1
+        assert metrics["false_positives"] == 1
+        assert 0 < metrics["false_positive_rate"] <= 1
+
+    def test_first_lookup_builds_filter_in_background(self, repository):
+        """
+        Given: A filter that was never built
+        When: Looking up an ID
+        Then: The lookup goes to the database and a rebuild starts in the background
+        """
+        assert repository.exists("missing") is False
+        repository._existence_rebuild.join(timeout=5)
+
+        assert repository.existence_filter.metrics()["rebuilds"] == 1
+        assert repository.existence_filter.claim_rebuild() is False
+
+    def test_service_lookups_skip_requests(self, repository, mock_client, mock_logger):
+        """
+        Given: A built filter behind the entity service
+        When: Resolving IDs that were never stored, one by one and in a batch
+        Then: The service answers without a request
+        """
+        repository.refresh_existence_filter()
+        mock_client.call_log.clear()
+        service = EntityService(repository, mock_logger)
+
+        assert service.get_entity("missing") is None
+        assert service.get_entities(["missing", "also-missing"]) == []
+        assert mock_client.call_log == []
+
+    def test_settings_give_listed_tables_a_filter(self, mock_settings):
+        """
+        Given: Database settings listing one table
+        When: Configuring the existence filters
+        Then: Only that table gets a filter, sized by the settings, and its metrics are reported
+        """
+        mock_settings.database.existence_filter_tables = ["entities"]
+        mock_settings.database.existence_filter_capacity = 500
+        mock_settings.database.existence_filter_error_rate = 0.05
+        mock_settings.database.existence_filter_rebuild_interval = 60.0
+        try:
+            configure_existence_filters()
+            existence = get_existence_filter("entities")
+
+            assert (existence.capacity, existence.error_rate, existence.rebuild_interval) == (500, 0.05, 60.0)
+            assert get_existence_filter("relationships") is None
+            assert get_connection_metrics()["existence_filters"] == {"entities": existence.metrics()}
+        finally:
+            reset_connection()
+
+        assert get_existence_filter("entities") is None
+
+
+class _Params:
+    """Query parameters exposing ``multi_items`` like ``httpx.QueryParams``."""
+
+    def __init__(self, items: list[tuple[str, str]]):
+        self._items = items
+
+    def multi_items(self) -> list[tuple[str, str]]:
+        return list(self._items)
+
+
+class _Builder:
+    """Minimal stand-in for a PostgREST request builder."""
+
+    def __init__(self, path: str, method: str, params=(), headers=None, json=None):
+        self.path = path
+        self.http_method = method
+        self.params = _Params(list(params))
+        self.headers = headers or {}
+        self.json = json
+
+
+class TestSupabaseQueryStats:
+    """Test query-shape statistics and the slow-query log."""
+
+    @pytest.fixture(autouse=True)
+    def clean_recorder(self):
+        """Start and end each test with empty global query stats."""
+        get_query_recorder().reset()
+        yield
+        get_query_recorder().reset()
+
+    def test_shape_ignores_filter_values(self):
+        """
+        Given: Two selects differing only in filter values
+        When: Describing their shapes
+        Then: Both have the same shape of filtered columns, operators, order and columns
+        """
+        first = _Builder(
+            "/entities",
+            "GET",
+            [("select", "id,name"), ("status", "eq.active"), ("value", "not.is.null"),
+             ("or", "(name.ilike.*a*,title.ilike.*a*)"), ("order", "created_at.desc"), ("limit", "20")],
+        )
+        second = _Builder(
+            "/entities",
+            "GET",
+            [("select", "id,name"), ("status", "eq.done"), ("value", "not.is.null"),
+             ("or", "(name.ilike.*b*,title.ilike.*b*)"), ("order", "created_at.desc"), ("limit", "50")],
+        )
+
+        shape = query_shape(first, "entities")
+
+        assert shape == query_shape(second, "entities")
+        assert shape.filters == ("or(name.ilike)", "or(title.ilike)", "status.eq", "value.not.is")
+        assert str(shape) == (
+            "select entities where or(name.ilike), or(title.ilike), status.eq, value.not.is "
+            "order created_at.desc select id,name"
+        )
+
+    def test_shape_of_writes_and_rpcs(self):
+        """
+        Given: An upsert, a delete and an RPC call
+        When: Describing their shapes
+        Then: Operations are told apart and RPCs are keyed by function and argument names,
+              whether the builder or its request config holds the request
+        """
+        upsert = _Builder("/entities", "POST", headers={"Prefer": "resolution=merge-duplicates"})
+        delete = _Builder("/entities", "DELETE", [("id", "in.(1,2)")])
+        # Newer postgrest versions keep the request, with its full URL path, in a request config
+        rpc = Mock(request=_Builder("/rest/v1/rpc/search_entities", "POST", json={"query_text": "x", "max_results": 5}))
+
+        assert query_shape(upsert, "entities").operation == "upsert"
+        assert str(query_shape(delete, "entities")) == "delete entities where id.in"
+        assert query_shape(rpc, "entities") == QueryShape("search_entities", "rpc", ("max_results", "query_text"))
+
+    def test_recorder_tracks_latency_rows_and_bytes(self, mock_logger):
+        """
+        Given: A recorder with a 100 ms slow threshold
+        When: Recording fast and slow requests of two shapes
+        Then: Counters, percentiles and ranking reflect them, and slow requests are logged
+        """
+        recorder = QueryRecorder(slow_threshold=0.1, logger=mock_logger)
+        fast, slow = QueryShape("entities", "select", ("id.eq",)), QueryShape("entities", "select", ("name.ilike",))
+        for _ in range(99):
+            recorder.record(fast, 0.003, rows=1, payload_bytes=200)
+        recorder.record(fast, 0.04, rows=1, payload_bytes=200)
+        recorder.record(slow, 0.3, rows=50, payload_bytes=10_000)
+        recorder.record(slow, 0.01, error=True)
+
+        report = recorder.report(limit=1, sort_by="p95")
+
+        assert (report["queries"], report["errors"], report["slow_queries"]) == (102, 1, 1)
+        assert [shape["shape"] for shape in report["shapes"]] == [str(slow)]
+        fast_stats = recorder.report(sort_by="count")["shapes"][0]
+        assert (fast_stats["count"], fast_stats["rows"], fast_stats["bytes"]) == (100, 100, 20_000)
+        assert fast_stats["p50"] == 0.005
+        assert fast_stats["p99"] == 0.005
+        assert fast_stats["max_time"] == 0.04
+        warnings = mock_logger.get_logs("WARNING")
+        assert [log["query_shape"] for log in warnings] == [str(slow)]
+        assert warnings[0]["duration_ms"] == 300.0
+        with pytest.raises(ValueError, match="Unknown sort key"):
+            recorder.report(sort_by="name")
+
+    def test_shapes_beyond_limit_share_overflow_entry(self):
+        """
+        Given: A recorder tracking at most two shapes
+        When: Recording three shapes
+        Then: The third is counted under the overflow shape
+        """
+        recorder = QueryRecorder(max_shapes=2)
+        for table in ("a", "b", "c", "d"):
+            recorder.record(QueryShape(table, "select"), 0.001)
+
+        assert sorted(shape["shape"] for shape in recorder.shapes()) == [OVERFLOW_SHAPE, "select a", "select b"]
+
+    def test_export_and_load_report(self, tmp_path):
+        """
+        Given: A recorder with two shapes
+        When: Exporting it and loading the file ranked by rows
+        Then: The loaded report keeps totals and ranks the shapes
+        """
+        recorder = QueryRecorder()
+        recorder.record(QueryShape("entities", "select"), 0.01, rows=5)
+        recorder.record(QueryShape("relationships", "select"), 0.02, rows=50)
+        path = tmp_path / "stats" / "queries.json"
+
+        recorder.export(path)
+        report = load_report(path, limit=1, sort_by="rows")
+
+        assert report["queries"] == 2
+        assert report["shape_count"] == 2
+        assert [shape["table"] for shape in report["shapes"]] == ["relationships"]
+
+    def test_repository_requests_are_recorded(self, mock_client, mock_entity_type):
+        """
+        Given: A repository over a table with three rows
+        When: Listing and then failing a request
+        Then: Both requests are recorded with their rows, bytes and errors
+        """
+        mock_client.storage["test_entities"] = [
+            {"id": str(i), "name": f"E{i}", "value": i, "is_deleted": False} for i in range(3)
+        ]
+        with patch("atoms_mcp.adapters.secondary.supabase.repository.get_client_with_retry") as mock_get:
+            mock_get.return_value = mock_client
+            repo = SupabaseRepository(table_name="test_entities", entity_type=mock_entity_type)
+
+            repo.list()
+            mock_client.set_failure(True, APIError({"message": "boom"}))
+            with pytest.raises(RepositoryError):
+                repo.list()
+
+        report = get_query_recorder().report()
+        assert (report["queries"], report["errors"]) == (2, 1)
+        shape = report["shapes"][0]
+        assert shape["table"] == "test_entities"
+        assert shape["rows"] == 3
+        assert shape["bytes"] > 0
+
+
 # ============================================================================
 # Error Handling Tests (10 tests)
 # ============================================================================
@@ -1129,3 +2043,204 @@ class TestSupabaseSerialization:
         assert isinstance(result, mock_entity_type)
         assert result.name == "Test"
         assert result.value == 42
+
+    def test_dataclass_entities_use_codec(self):
+        """
+        Given: A repository of dataclass entities
+        When: Serializing an entity and deserializing the stored row
+        Then: Enums and datetimes are converted both ways and extra columns are ignored
+        """
+        repo = SupabaseRepository(table_name="tasks", entity_type=TaskEntity)
+        task = TaskEntity(title="Ship", status=EntityStatus.ARCHIVED, due_date=datetime(2024, 5, 1), tags=["a"])
+
+        row = repo._serialize_entity(task)
+        assert row["status"] == "archived"
+        assert row["due_date"] == "2024-05-01T00:00:00"
+        assert row["tags"] == ["a"]
+
+        restored = repo._deserialize_entity({**row, "is_deleted": False})
+        assert restored == task
+        assert restored.status is EntityStatus.ARCHIVED
+
+
+# ============================================================================
+# Circuit Breaker and Health Monitor Tests
+# ============================================================================
+
+
+class TestCircuitBreaker:
+    """Test circuit breaker state transitions and metrics."""
+
+    def test_opens_after_threshold(self):
+        """
+        Given: Breaker with a threshold of 2
+        When: Two consecutive failures are recorded
+        Then: Circuit opens and rejects requests
+        """
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.allow_request() is False
+        assert breaker.metrics()["rejected_requests"] == 1
+
+    def test_half_open_after_timeout_then_closes(self):
+        """
+        Given: Open breaker whose reset timeout elapsed
+        When: A request succeeds
+        Then: Circuit passes through half-open and closes
+        """
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow_request() is True
+
+        breaker.record_success()
+
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_half_open_failure_reopens(self):
+        """
+        Given: Half-open breaker
+        When: A request fails
+        Then: Circuit re-opens
+        """
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+        assert breaker.state == CircuitState.HALF_OPEN
+
+        breaker.reset_timeout = 60
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.metrics()["times_opened"] == 2
+
+    def test_metrics_state_gauge(self):
+        """
+        Given: Breaker in each state
+        When: Reading metrics
+        Then: State value encodes closed=0 and open=2
+        """
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        assert breaker.metrics()["state_value"] == 0
+
+        breaker.record_failure()
+
+        assert breaker.metrics()["state"] == "open"
+        assert breaker.metrics()["state_value"] == 2
+
+    def test_connection_fails_fast_when_open(self, supabase_connection, mock_client):
+        """
+        Given: Global breaker is open
+        When: Getting client with retry
+        Then: SupabaseConnectionError is raised without touching the client
+        """
+        from atoms_mcp.adapters.secondary.supabase.connection import get_circuit_breaker
+
+        breaker = get_circuit_breaker()
+        try:
+            for _ in range(breaker.failure_threshold):
+                breaker.record_failure()
+
+            with pytest.raises(SupabaseConnectionError, match="circuit breaker is open"):
+                supabase_connection.get_client_with_retry()
+        finally:
+            breaker.reset()
+
+
+class TestConnectionHealthMonitor:
+    """Test background health monitor probing."""
+
+    def test_check_now_records_outcome(self):
+        """
+        Given: Monitor with a failing then succeeding probe
+        When: Running checks
+        Then: Breaker reflects probe results
+        """
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        outcomes = [Exception("down"), None]
+
+        def probe():
+            outcome = outcomes.pop(0)
+            if outcome:
+                raise outcome
+
+        monitor = ConnectionHealthMonitor(probe, breaker, interval=60)
+
+        assert monitor.check_now() is False
+        assert breaker.state == CircuitState.OPEN
+        assert monitor.check_now() is True
+        assert breaker.state == CircuitState.CLOSED
+        assert monitor.metrics()["probes"] == 2
+        assert monitor.metrics()["probe_failures"] == 1
+
+    def test_start_and_stop(self):
+        """
+        Given: Monitor with a long interval
+        When: Starting and stopping it
+        Then: Thread runs and exits cleanly
+        """
+        monitor = ConnectionHealthMonitor(lambda: None, CircuitBreaker(), interval=60)
+
+        monitor.start()
+        assert monitor.running
+
+        monitor.stop()
+        assert not monitor.running
+
+
+# ============================================================================
+# Migration Tests
+# ============================================================================
+
+MIGRATIONS = Path(__file__).resolve().parents[2] / "supabase" / "migrations"
+
+
+def _migration(name: str) -> str:
+    """Read the one migration whose file name ends in ``_<name>.sql``."""
+    (path,) = MIGRATIONS.glob(f"*_{name}.sql")
+    return path.read_text()
+
+
+class TestSupabaseMigrations:
+    """Tests that the shipped migrations match the SQL the adapters rely on."""
+
+    def test_revision_migration_covers_entity_tables(self):
+        """
+        Given: The revision migration
+        When: Comparing it with the revision SQL of the repository
+        Then: It installs the trigger function and the column and trigger on each table
+        """
+        sql = _migration("atoms_revision")
+
+        assert REVISION_FUNCTION_SQL.strip() in sql
+        for table in ("entities", "relationships"):
+            assert REVISION_COLUMN_SQL.format(table=table).strip() in sql
+
+    def test_batch_migration_installs_write_batch_function(self):
+        """
+        Given: The write batch migration
+        When: Comparing it with the batch SQL of the adapter
+        Then: It installs the function the atomic commit calls
+        """
+        assert BATCH_FUNCTION_SQL.strip() in _migration("atoms_write_batch")
+
+    def test_search_migration_installs_search_function(self):
+        """
+        Given: The search migration
+        When: Comparing it with the search SQL of the adapter
+        Then: It installs the function ranked search calls
+        """
+        assert SEARCH_FUNCTION_SQL.strip() in _migration("atoms_search")
+
+    def test_aggregate_migration_installs_aggregate_functions(self):
+        """
+        Given: The aggregate migration
+        When: Comparing it with the aggregate SQL of the adapter
+        Then: It installs the aggregate function and its filter helper
+        """
+        assert AGGREGATE_FUNCTION_SQL.strip() in _migration("atoms_aggregate")
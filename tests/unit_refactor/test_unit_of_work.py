@@ -0,0 +1,295 @@
+"""
+Tests for the request-scoped unit of work.
+
+Covers the identity map (repeated loads by ID are served without a
+query), queued writes (committed once per repository, discarded on
+error), revision checks of queued updates, the services reading
+their repositories through the active unit, and the async unit that
+commits without blocking the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from atoms_mcp.adapters.secondary.memory import InMemoryRepository
+from atoms_mcp.domain.models.entity import TaskEntity
+from atoms_mcp.domain.ports.async_repository import ThreadedAsyncRepository
+from atoms_mcp.domain.ports.repository import ConcurrencyError, RepositoryError
+from atoms_mcp.domain.services.async_entity_service import AsyncEntityService
+from atoms_mcp.domain.services.entity_service import EntityService
+from atoms_mcp.domain.services.unit_of_work import (
+    AsyncUnitOfWorkRepository,
+    UnitOfWorkRepository,
+    async_unit_of_work,
+    current_unit_of_work,
+    unit_of_work,
+)
+
+
+class CountingRepository(InMemoryRepository[TaskEntity]):
+    """In-memory repository counting reads by ID and transactions."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.reads = 0
+        self.commits = 0
+        self.commit_threads: list[int] = []
+
+    def get(self, entity_id):
+        self.reads += 1
+        return super().get(entity_id)
+
+    def get_many(self, entity_ids):
+        self.reads += len(entity_ids)
+        return super().get_many(entity_ids)
+
+    def commit(self, batch):
+        self.commits += 1
+        self.commit_threads.append(threading.get_ident())
+        return super().commit(batch)
+
+
+def _task(index: int, **kwargs) -> TaskEntity:
+    return TaskEntity(id=f"task-{index}", title=f"Task {index}", project_id="p1", **kwargs)
+
+
+@pytest.fixture
+def repository() -> CountingRepository:
+    repo = CountingRepository()
+    for index in range(3):
+        repo.save(_task(index))
+    repo.reads = 0
+    return repo
+
+
+class TestIdentityMap:
+    """Reads by ID through a unit of work."""
+
+    def test_repeated_loads_are_served_from_identity_map(self, repository):
+        with unit_of_work() as unit:
+            view = unit.bind(repository)
+            first = view.get("task-0")
+            assert view.get("task-0") is first
+            assert view.exists("task-0")
+            assert [task.id for task in view.get_many(["task-0", "task-1", "task-1"])] == ["task-0", "task-1", "task-1"]
+            assert view.get("missing") is None
+            assert view.get("missing") is None
+
+        assert repository.reads == 3
+        assert (unit.loads, unit.hits) == (3, 5)
+
+    def test_loaded_entities_are_private_until_commit(self, repository):
+        with unit_of_work() as unit:
+            view = unit.bind(repository)
+            view.patch("task-0", {"description": "Changed"})
+            assert view.get("task-0").description == "Changed"
+            assert repository.get("task-0").description != "Changed"
+
+        assert repository.get("task-0").description == "Changed"
+
+    def test_bind_returns_one_view_per_repository(self, repository):
+        with unit_of_work() as unit:
+            view = unit.bind(repository)
+            assert isinstance(view, UnitOfWorkRepository)
+            assert unit.bind(repository) is view
+            assert unit.bind(view) is view
+
+
+class TestQueuedWrites:
+    """Writes are queued and committed with the unit."""
+
+    def test_writes_commit_in_one_transaction(self, repository):
+        with unit_of_work() as unit:
+            view = unit.bind(repository)
+            view.insert(_task(3))
+            view.patch("task-0", {"description": "Changed"})
+            view.patch("task-0", {"priority": 5})
+            view.delete("task-1")
+            assert view.get("task-1") is None
+            assert repository.get("task-3") is None
+            assert unit.pending == 3
+
+        assert repository.commits == 1
+        assert unit.flushed == 3
+        assert repository.get("task-3") is not None
+        assert (repository.get("task-0").description, repository.get("task-0").priority) == ("Changed", 5)
+        assert repository.get("task-1") is None
+
+    def test_error_discards_queued_writes(self, repository):
+        with pytest.raises(RuntimeError):
+            with unit_of_work() as unit:
+                unit.bind(repository).insert(_task(3))
+                raise RuntimeError("request failed")
+
+        assert repository.commits == 0
+        assert repository.get("task-3") is None
+        assert current_unit_of_work() is None
+
+    def test_conflict_at_commit_writes_nothing(self, repository):
+        with pytest.raises(RepositoryError):
+            with unit_of_work() as unit:
+                view = unit.bind(repository)
+                view.patch("task-0", {"description": "Changed"})
+                view.insert(_task(1))
+
+        assert repository.get("task-0").description != "Changed"
+
+    def test_queries_see_pending_writes(self, repository):
+        with unit_of_work() as unit:
+            view = unit.bind(repository)
+            view.insert(_task(3))
+            assert view.count() == 4
+            assert unit.pending == 0
+
+    def test_nested_block_joins_active_unit(self, repository):
+        with unit_of_work() as outer:
+            with unit_of_work() as inner:
+                inner.bind(repository).insert(_task(3))
+            assert inner is outer
+            assert repository.get("task-3") is None
+
+        assert repository.get("task-3") is not None
+
+    def test_updates_show_and_keep_the_stored_revision(self, repository):
+        with unit_of_work() as unit:
+            view = unit.bind(repository)
+            assert view.patch("task-0", {"description": "First"}, expected_revision=0).revision == 1
+            view.count()
+            assert view.patch("task-0", {"priority": 5}, expected_revision=1).revision == 2
+
+        stored = repository.get("task-0")
+        assert (stored.description, stored.priority, stored.revision) == ("First", 5, 2)
+
+    def test_after_commit_callbacks_run_once_committed(self, repository):
+        seen = []
+        with unit_of_work() as unit:
+            unit.bind(repository).insert(_task(3))
+            unit.after_commit(lambda: seen.append(repository.get("task-3") is not None))
+            assert seen == []
+
+        assert seen == [True]
+
+
+class TestServicesInUnitOfWork:
+    """Services read their repositories through the active unit."""
+
+    def test_repeated_updates_load_once_and_write_once(self, repository, mock_logger, mock_cache):
+        service = EntityService(repository, mock_logger, mock_cache)
+
+        with unit_of_work() as unit:
+            assert service.repository is unit.bind(repository)
+            service.update_entity("task-0", {"description": "First"})
+            service.update_entity("task-0", {"priority": 5})
+            assert service.get_entity("task-0").description == "First"
+
+        assert repository.reads == 1
+        assert repository.commits == 1
+        stored = repository.get("task-0")
+        assert (stored.description, stored.priority, stored.revision) == ("First", 5, 1)
+        assert service.repository is repository
+
+    def test_stale_read_fails_at_commit(self, repository, mock_logger):
+        service = EntityService(repository, mock_logger)
+
+        with pytest.raises(ConcurrencyError):
+            with unit_of_work():
+                service.update_entity("task-0", {"description": "Stale"})
+                # Another request commits first
+                repository.patch("task-0", {"priority": 4}, expected_revision=0)
+
+        stored = repository.get("task-0")
+        assert (stored.description, stored.priority) == ("", 4)
+
+    def test_cache_is_updated_after_commit(self, repository, mock_logger, mock_cache):
+        service = EntityService(repository, mock_logger, mock_cache)
+        service.get_entity("task-0")
+        key = service._get_cache_key("task-0")
+        mock_cache.set(key, repository.get("task-0"))
+
+        with unit_of_work():
+            service.update_entity("task-0", {"description": "Changed"})
+            assert mock_cache.get(key) is None
+            service.create_entity(_task(3))
+            assert mock_cache.get(service._get_cache_key("task-3")) is None
+
+        assert mock_cache.get(service._get_cache_key("task-3")) is not None
+        assert service.get_entity("task-0").description == "Changed"
+
+
+class TestAsyncUnitOfWork:
+    """Async repositories and services through a unit of work."""
+
+    def test_async_view_serves_loads_and_queues_writes(self, repository):
+        async def run():
+            async with async_unit_of_work() as unit:
+                view = unit.bind(ThreadedAsyncRepository(repository))
+                assert isinstance(view, AsyncUnitOfWorkRepository)
+                first = await view.get("task-0")
+                assert await view.get("task-0") is first
+                await view.patch("task-0", {"description": "Changed"})
+                await view.insert(_task(3))
+                assert [task.id async for task in view.iter_all()] == [f"task-{index}" for index in range(4)]
+                assert unit.pending == 0
+                await view.delete("task-1")
+                assert (unit.pending, repository.commits) == (1, 1)
+
+        asyncio.run(run())
+
+        assert repository.reads == 2
+        assert repository.commits == 2
+        assert repository.get("task-0").description == "Changed"
+        assert repository.get("task-1") is None
+
+    def test_async_services_read_through_the_unit(self, repository, mock_logger, mock_cache):
+        service = AsyncEntityService(ThreadedAsyncRepository(repository), mock_logger, mock_cache)
+
+        async def run():
+            async with async_unit_of_work():
+                await service.update_entity("task-0", {"description": "First"})
+                updated = await service.update_entity("task-0", {"priority": 5})
+                assert repository.commits == 0
+                assert mock_cache.get(service._get_cache_key("task-0")) is None
+                return updated, await service.get_entity("task-0")
+
+        updated, loaded = asyncio.run(run())
+
+        assert loaded is updated
+        assert repository.reads == 1
+        assert repository.commits == 1
+        stored = repository.get("task-0")
+        assert (stored.description, stored.priority, stored.revision) == ("First", 5, 1)
+        assert updated.revision == 1
+
+    def test_sync_writes_commit_off_the_event_loop(self, repository):
+        async def run():
+            async with async_unit_of_work() as unit:
+                unit.bind(repository).insert(_task(3))
+            return threading.get_ident()
+
+        loop_thread = asyncio.run(run())
+
+        assert repository.get("task-3") is not None
+        assert repository.commit_threads and loop_thread not in repository.commit_threads
+
+    def test_error_discards_async_writes(self, repository):
+        async def run():
+            async with async_unit_of_work() as unit:
+                await unit.bind(ThreadedAsyncRepository(repository)).insert(_task(3))
+                raise RuntimeError("request failed")
+
+        with pytest.raises(RuntimeError, match="request failed"):
+            asyncio.run(run())
+
+        assert repository.get("task-3") is None
+        assert current_unit_of_work() is None
+
+    def test_sync_commit_rejects_queued_async_writes(self, repository):
+        with pytest.raises(RuntimeError, match="commit_async"):
+            with unit_of_work() as unit:
+                asyncio.run(unit.bind(ThreadedAsyncRepository(repository)).insert(_task(3)))
+
+        assert repository.get("task-3") is None